@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """Add 'from __future__ import annotations' to Python files safely.
 
-This script walks the repository and adds the future import to all Python files
-in the correct location, respecting shebangs, encoding cookies, and module docstrings.
+This script adds the future import to all git-tracked Python files in the correct
+location, respecting shebangs, encoding cookies, and module docstrings.
 
 :Purpose:
     Enables PEP 563 postponed evaluation of annotations repo-wide, which improves
@@ -13,6 +13,11 @@ in the correct location, respecting shebangs, encoding cookies, and module docst
     at the correct location. The script is idempotent and never modifies files that
     already contain the import.
 
+    Files come from ``git ls-files`` (a directory walk is only the fallback when git
+    cannot list the repository). Each file first gets a byte-level pre-check of its
+    first 64 KiB; files that already have the import are skipped without decoding or
+    tokenizing them. Large file sets are processed in a process pool.
+
 :Usage:
     Check which files would be modified::
 
@@ -34,6 +39,12 @@ in the correct location, respecting shebangs, encoding cookies, and module docst
         Apply changes to all eligible files.
     --verbose
         Print each file that is checked or modified.
+    --jobs N
+        Worker processes (default: CPU count). The pool is only used for 64 or
+        more files; ``--jobs 1`` always runs in-process.
+    --json
+        Print a JSON summary (mode, counts, duration, changed and skipped files)
+        instead of the text summary. Exit codes are unchanged.
 
 :Exit Codes:
     0
@@ -55,8 +66,14 @@ in the correct location, respecting shebangs, encoding cookies, and module docst
 
         python3 scripts/add_future_annotations.py --apply
 
+    Machine-readable check for CI::
+
+        python3 scripts/add_future_annotations.py --check --json
+
 :Notes:
+    - Only tracked files are considered; untracked files are left alone
     - Skips virtualenvs, build directories, and git internals
+    - Files that cannot be decoded or tokenized are reported as skipped
     - Preserves shebang lines, encoding cookies, and module docstrings
     - Never creates duplicate imports
     - Never reorders existing imports except to insert this one line
@@ -66,10 +83,16 @@ from __future__ import annotations
 
 import argparse
 import io
+import json
+import os
+import re
+import subprocess
 import sys
+import time
 import tokenize
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Directories to skip when walking the repository
 SKIP_DIRS = {
@@ -86,6 +109,19 @@ SKIP_DIRS = {
     "egg-info",
 }
 
+# Bytes read by the pre-check; the import sits right after the module docstring
+PRECHECK_BYTES = 64 * 1024
+
+# Below this many files the process pool costs more than it saves
+MIN_PARALLEL_FILES = 64
+
+# Per-file statuses reported by classify_file()
+STATUS_MODIFIED = "modified"
+STATUS_HAS_IMPORT = "has_import"
+STATUS_SKIPPED = "skipped"
+
+_FUTURE_IMPORT_BYTES = re.compile(rb"from __future__ import")
+
 
 def should_skip_file(file_path: Path) -> bool:
     """Check if a file should be skipped based on path components.
@@ -239,56 +275,112 @@ def add_future_import(content: str) -> str:
     return "\n".join(lines)
 
 
-def process_file(file_path: Path, apply: bool, verbose: bool) -> bool:
-    """Process a single Python file.
+def has_future_import_prefix(file_path: Path, limit: int = PRECHECK_BYTES) -> bool:
+    """Cheaply check the head of a file for an existing future annotations import.
+
+    Only the first ``limit`` bytes are read and nothing is decoded or tokenized.
+    A line counts when it contains both ``from __future__ import`` and
+    ``annotations``, the same rule as has_future_import(), so a True result
+    never disagrees with the full check. False only means "read the whole file".
+
+    :param file_path: Path to Python file
+    :param limit: Number of bytes to inspect
+    :return: True if the import was found in the prefix
+    :raises OSError: If the file cannot be read
+    """
+    with open(file_path, "rb") as f:
+        prefix = f.read(limit)
+    for match in _FUTURE_IMPORT_BYTES.finditer(prefix):
+        line_start = prefix.rfind(b"\n", 0, match.start()) + 1
+        line_end = prefix.find(b"\n", match.end())
+        if b"annotations" in prefix[line_start : line_end if line_end != -1 else len(prefix)]:
+            return True
+    return False
+
+
+def classify_file(file_path: Path, apply: bool) -> Tuple[str, str]:
+    """Check one file and, in apply mode, add the import.
 
     :param file_path: Path to Python file
     :param apply: If True, write changes; if False, only check
-    :param verbose: If True, print status messages
-    :return: True if file was/would be modified
+    :return: Tuple of (status, reason) where status is one of STATUS_MODIFIED,
+        STATUS_HAS_IMPORT or STATUS_SKIPPED; reason is empty unless skipped
     """
     try:
+        if has_future_import_prefix(file_path):
+            return STATUS_HAS_IMPORT, ""
         with open(file_path, encoding="utf-8") as f:
             original_content = f.read()
     except UnicodeDecodeError:
         # Skip files that can't be decoded as UTF-8
-        if verbose:
-            print(f"Skipping {file_path}: Cannot decode as UTF-8")
-        return False
+        return STATUS_SKIPPED, "Cannot decode as UTF-8"
     except OSError as e:
         # OSError: File access errors (permission denied, file not found, etc.)
-        if verbose:
-            print(f"Skipping {file_path}: {e}")
-        return False
+        return STATUS_SKIPPED, str(e)
 
-    # Check if modification needed
+    # Check if modification needed (the import may sit beyond the pre-check prefix)
     if has_future_import(original_content):
-        if verbose:
-            print(f"Skipping {file_path}: Already has future import")
-        return False
+        return STATUS_HAS_IMPORT, ""
 
     # Generate modified content
-    modified_content = add_future_import(original_content)
+    try:
+        modified_content = add_future_import(original_content)
+    except (tokenize.TokenError, SyntaxError) as e:
+        return STATUS_SKIPPED, f"Cannot tokenize: {e}"
 
     if modified_content == original_content:
         # No change (shouldn't happen if has_future_import is correct)
-        return False
+        return STATUS_HAS_IMPORT, ""
 
-    # Apply or report
     if apply:
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(modified_content)
-        if verbose:
-            print(f"Modified: {file_path}")
-    else:
-        if verbose:
-            print(f"Would modify: {file_path}")
+    return STATUS_MODIFIED, ""
 
-    return True
+
+def _classify_worker(task: Tuple[str, bool]) -> Tuple[str, str, str]:
+    """Process-pool entry point for classify_file().
+
+    :param task: Tuple of (path string, apply flag)
+    :return: Tuple of (path string, status, reason)
+    """
+    path_str, apply = task
+    status, reason = classify_file(Path(path_str), apply)
+    return path_str, status, reason
+
+
+def process_file(file_path: Path, apply: bool, verbose: bool) -> bool:
+    """Process a single Python file.
+
+    :param file_path: Path to Python file
+    :param apply: If True, write changes; if False, only check
+    :param verbose: If True, print status messages
+    :return: True if file was/would be modified
+    """
+    status, reason = classify_file(file_path, apply)
+    if verbose:
+        _print_status(str(file_path), status, reason, apply)
+    return status == STATUS_MODIFIED
+
+
+def _print_status(path: str, status: str, reason: str, apply: bool) -> None:
+    """Print the verbose progress line for one file.
+
+    :param path: File path as displayed
+    :param status: Status returned by classify_file()
+    :param reason: Skip reason returned by classify_file()
+    :param apply: Whether the run writes changes
+    """
+    if status == STATUS_MODIFIED:
+        print(f"{'Modified' if apply else 'Would modify'}: {path}")
+    elif status == STATUS_HAS_IMPORT:
+        print(f"Skipping {path}: Already has future import")
+    else:
+        print(f"Skipping {path}: {reason}")
 
 
 def find_python_files(root: Path) -> List[Path]:
-    """Find all Python files in the repository.
+    """Find all Python files in the repository by walking the directory tree.
 
     :param root: Repository root path
     :return: List of Python file paths
@@ -300,9 +392,80 @@ def find_python_files(root: Path) -> List[Path]:
     return python_files
 
 
-def main() -> int:
+def find_tracked_python_files(root: Path) -> Optional[List[Path]]:
+    """List git-tracked Python files without walking the directory tree.
+
+    :param root: Repository root path
+    :return: Sorted tracked *.py paths (SKIP_DIRS still applied), or None if git
+        cannot list the repository
+    """
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--", "*.py"],
+            cwd=root,
+            capture_output=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    names = [name for name in os.fsdecode(result.stdout).split("\0") if name]
+    return sorted(path for path in (root / name for name in names) if not should_skip_file(path.relative_to(root)))
+
+
+def run(python_files: List[Path], apply: bool, verbose: bool, jobs: Optional[int] = None) -> Dict[str, object]:
+    """Classify (and optionally rewrite) files, in a process pool for large inputs.
+
+    :param python_files: Files to process
+    :param apply: If True, write changes; if False, only check
+    :param verbose: If True, print one status line per file
+    :param jobs: Worker processes (default: CPU count)
+    :return: Summary dict with counts, the changed files and the skipped files
+    """
+    start = time.perf_counter()
+    tasks = [(str(path), apply) for path in python_files]
+    workers = min(jobs or os.cpu_count() or 1, len(tasks))
+    if workers <= 1 or len(tasks) < MIN_PARALLEL_FILES:
+        outcomes = map(_classify_worker, tasks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        outcomes = executor.map(_classify_worker, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
+
+    counts = {STATUS_MODIFIED: 0, STATUS_HAS_IMPORT: 0, STATUS_SKIPPED: 0}
+    changed: List[str] = []
+    skipped: List[Dict[str, str]] = []
+    try:
+        for path, status, reason in outcomes:
+            counts[status] += 1
+            if status == STATUS_MODIFIED:
+                changed.append(path)
+            elif status == STATUS_SKIPPED:
+                skipped.append({"path": path, "reason": reason})
+            if verbose:
+                _print_status(path, status, reason, apply)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return {
+        "mode": "apply" if apply else "check",
+        "files": len(tasks),
+        "modified": counts[STATUS_MODIFIED],
+        "has_import": counts[STATUS_HAS_IMPORT],
+        "skipped": counts[STATUS_SKIPPED],
+        "workers": workers if executor is not None else 1,
+        "duration_s": round(time.perf_counter() - start, 3),
+        "changed_files": changed,
+        "skipped_files": skipped,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point.
 
+    :param argv: Command-line arguments (default: sys.argv[1:])
     :return: Exit code
     """
     parser = argparse.ArgumentParser(description="Add 'from __future__ import annotations' to Python files")
@@ -321,8 +484,19 @@ def main() -> int:
         action="store_true",
         help="Print detailed progress",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count; 1 disables the process pool)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print a machine-readable JSON summary instead of the text summary",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate arguments
     if not args.check and not args.apply:
@@ -333,6 +507,10 @@ def main() -> int:
         print("Error: Cannot specify both --check and --apply", file=sys.stderr)
         return 2
 
+    if args.jobs is not None and args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        return 2
+
     # Find repository root (current directory or walk up to find .git)
     root = Path.cwd()
     while root != root.parent:
@@ -344,19 +522,21 @@ def main() -> int:
         print("Error: Not in a git repository", file=sys.stderr)
         return 2
 
-    # Find Python files
-    python_files = find_python_files(root)
+    # Find Python files: tracked files from the git index, directory walk as fallback
+    python_files = find_tracked_python_files(root)
+    if python_files is None:
+        python_files = find_python_files(root)
 
-    if args.verbose:
+    if args.verbose and not args.json:
         print(f"Found {len(python_files)} Python files")
 
-    # Process files
-    modified_count = 0
-    for py_file in python_files:
-        if process_file(py_file, apply=args.apply, verbose=args.verbose):
-            modified_count += 1
+    summary = run(python_files, apply=args.apply, verbose=args.verbose and not args.json, jobs=args.jobs)
+    modified_count = summary["modified"]
 
     # Report results
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 1 if args.check and modified_count else 0
     if args.check:
         if modified_count > 0:
             print(f"{modified_count} file(s) would be modified")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Microbenchmark for the compiled gitwildmatch exclusion matcher.
+
+Filters synthetic repository path lists of increasing size against the real
+exclusion patterns from conformance/repo-lint/repo-lint-file-patterns.yaml and
+reports time per path. Linear behavior shows up as a flat ns/path column.
+
+:Purpose:
+    Demonstrates that tools.repo_lint.path_matcher filters N paths in O(N) with a
+    small constant, and compares it with the per-pattern Python loops it replaced
+    (substring checks and PurePath.match()).
+
+:Usage:
+    Run with defaults (1k, 10k and 100k paths)::
+
+        python3 scripts/benchmarks/bench_path_matcher.py
+
+    Custom sizes, machine-readable output::
+
+        python3 scripts/benchmarks/bench_path_matcher.py --sizes 1000 100000 --json
+
+:Arguments:
+    --sizes N [N ...]
+        Number of synthetic paths per run (default: 1000 10000 100000)
+    --repeat N
+        Timing repetitions per size; the fastest is reported (default: 3)
+    --skip-legacy
+        Only time the compiled matcher
+    --json
+        Print results as JSON instead of a table
+
+:Exit Codes:
+    0
+        Benchmark completed
+    2
+        Invalid arguments
+
+:Environment Variables:
+    None
+
+:Examples:
+    Quick check on 100k paths::
+
+        python3 scripts/benchmarks/bench_path_matcher.py --sizes 100000 --repeat 1
+
+:Notes:
+    - Paths are generated deterministically (fixed random seed)
+    - The legacy PurePath.match() loop is only used as a timing reference; its
+      right-anchored matching differs from gitwildmatch for `dir/**` patterns
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, List
+
+repo_root = Path(__file__).resolve().parents[2]
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
+
+# pylint: disable=wrong-import-position
+from tools.repo_lint.path_matcher import PathMatcher  # noqa: E402
+from tools.repo_lint.runners.base import get_excluded_paths  # noqa: E402
+
+TOP_LEVEL_DIRS = ["src", "tools", "scripts", "docs", "dist", "build", "node_modules", ".venv", "conformance"]
+EXTENSIONS = [".py", ".sh", ".md", ".yaml", ".pyc", ".rs", ".tmp", ".json"]
+
+
+def generate_paths(count: int, seed: int = 1234) -> List[str]:
+    """Generate deterministic repo-relative paths.
+
+    :param count: Number of paths
+    :param seed: Random seed
+    :returns: List of `/`-separated paths, 1-6 directories deep
+    """
+    rng = random.Random(seed)
+    paths = []
+    for index in range(count):
+        depth = rng.randint(0, 5)
+        parts = [rng.choice(TOP_LEVEL_DIRS)] + [f"d{rng.randint(0, 50)}" for _ in range(depth)]
+        if rng.random() < 0.05:
+            parts.insert(rng.randint(1, len(parts)), "__pycache__")
+        parts.append(f"file_{index}{rng.choice(EXTENSIONS)}")
+        paths.append("/".join(parts))
+    return paths
+
+
+def legacy_substring(paths: List[str], patterns: List[str]) -> List[str]:
+    """Reference: former common.filter_excluded_paths() loop.
+
+    :param paths: Paths to filter
+    :param patterns: Exclusion patterns
+    :returns: Paths containing none of the patterns
+    """
+    stripped = [p.rstrip("*") for p in patterns]
+    return [f for f in paths if not any(pattern in f for pattern in stripped)]
+
+
+def legacy_path_match(paths: List[str], patterns: List[str]) -> List[str]:
+    """Reference: former scripts/validate_docstrings.py PurePath.match() loop.
+
+    :param paths: Paths to filter
+    :param patterns: Exclusion patterns
+    :returns: Paths matching none of the patterns
+    """
+    return [f for f in paths if not any(PurePosixPath(f).match(pattern) for pattern in patterns)]
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    """Time a callable.
+
+    :param func: Callable to time
+    :param repeat: Number of runs
+    :returns: Fastest wall time in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(sizes: List[int], repeat: int, skip_legacy: bool) -> List[Dict[str, object]]:
+    """Run the benchmark.
+
+    :param sizes: Path counts to test
+    :param repeat: Repetitions per measurement
+    :param skip_legacy: Skip the reference loops
+    :returns: One result dict per size
+    """
+    patterns = list(get_excluded_paths())
+    compile_start = time.perf_counter()
+    matcher = PathMatcher(patterns)
+    compile_ms = (time.perf_counter() - compile_start) * 1000
+
+    results = []
+    for size in sizes:
+        paths = generate_paths(size)
+        row: Dict[str, object] = {
+            "paths": size,
+            "patterns": len(patterns),
+            "compile_ms": round(compile_ms, 3),
+            "kept": len(matcher.filter(paths)),
+        }
+        seconds = best_of(lambda paths=paths: matcher.filter(paths), repeat)
+        row["matcher_ms"] = round(seconds * 1000, 2)
+        row["matcher_ns_per_path"] = round(seconds * 1e9 / size, 1)
+        if not skip_legacy:
+            for name, func in (("substring", legacy_substring), ("path_match", legacy_path_match)):
+                seconds = best_of(lambda func=func, paths=paths: func(paths, patterns), repeat)
+                row[f"{name}_ms"] = round(seconds * 1000, 2)
+                row[f"{name}_ns_per_path"] = round(seconds * 1e9 / size, 1)
+        results.append(row)
+    return results
+
+
+def main() -> int:
+    """Parse arguments and print results.
+
+    :returns: Exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-legacy", action="store_true")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat, args.skip_legacy)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    columns = [key for key in results[0] if key.endswith(("_ms", "_per_path")) and key != "compile_ms"]
+    print(f"{len(get_excluded_paths())} patterns, compiled in {results[0]['compile_ms']} ms")
+    print(f"{'paths':>8}  " + "  ".join(f"{c:>22}" for c in columns))
+    for row in results:
+        print(f"{row['paths']:>8}  " + "  ".join(f"{row[c]:>22}" for c in columns))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Benchmark for the safe_run.py wrapper's binary discovery cache.
+
+Measures the wrapper overhead that the per-user discovery cache removes, both
+in-process (find_safe_run_binary() calls) and end to end (spawning
+``python3 safe_run.py`` against a stub safe-run binary that exits at once).
+
+:Purpose:
+    Shows the per-invocation cost of binary discovery (repo root walk, platform
+    detection, dev/CI candidate probes and the PATH scan) with and without the
+    cache, so the savings are visible on a given machine.
+
+:Usage:
+    Run with defaults::
+
+        python3 scripts/benchmarks/bench_safe_run_discovery.py
+
+    Longer PATH, machine-readable output::
+
+        python3 scripts/benchmarks/bench_safe_run_discovery.py --path-dirs 40 --json
+
+:Arguments:
+    --iterations N
+        In-process find_safe_run_binary() calls per mode (default: 2000)
+    --runs N
+        End-to-end wrapper invocations per mode (default: 30)
+    --path-dirs N
+        Empty PATH directories searched before the one holding the stub
+        binary, to model a realistic PATH (default: 20)
+    --json
+        Print results as JSON instead of a table
+
+:Exit Codes:
+    0
+        Benchmark completed
+    2
+        Invalid arguments
+
+:Environment Variables:
+    None. PATH, SAFE_RUN_CACHE_FILE and SAFE_RUN_NO_CACHE are set per run.
+
+:Examples:
+    Quick run::
+
+        python3 scripts/benchmarks/bench_safe_run_discovery.py --iterations 500 --runs 10
+
+:Notes:
+    - POSIX only (the stub binary is a shell script)
+    - The stub lives on PATH, so the uncached path exercises every discovery
+      step; a dev build in rust/target/release would be found earlier
+    - End-to-end numbers include interpreter startup, which the cache cannot
+      remove; the difference between the two modes is the saved overhead
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+repo_root = Path(__file__).resolve().parents[2]
+SAFE_RUN = repo_root / "wrappers" / "python3" / "scripts" / "safe_run.py"
+
+
+def load_safe_run():
+    """Load safe_run.py as a module.
+
+    :returns: Loaded module object
+    """
+    spec = importlib.util.spec_from_file_location("safe_run", str(SAFE_RUN))
+    mod = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def make_environment(root: Path, path_dirs: int) -> Dict[str, str]:
+    """Create a PATH with empty directories followed by a stub safe-run binary.
+
+    :param root: Temporary directory to populate
+    :param path_dirs: Number of empty PATH directories before the stub
+    :returns: Environment overrides (PATH, SAFE_RUN_CACHE_FILE)
+    """
+    dirs = []
+    for index in range(path_dirs):
+        empty = root / f"path{index:03d}"
+        empty.mkdir()
+        dirs.append(str(empty))
+    stub_dir = root / "bin"
+    stub_dir.mkdir()
+    stub = stub_dir / "safe-run"
+    stub.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+    stub.chmod(0o755)
+    # The stub needs /bin/sh itself, which it finds by absolute path
+    dirs.append(str(stub_dir))
+    return {"PATH": os.pathsep.join(dirs), "SAFE_RUN_CACHE_FILE": str(root / "cache.json")}
+
+
+def time_in_process(env: Dict[str, str], iterations: int, cached: bool) -> float:
+    """Time find_safe_run_binary() calls.
+
+    :param env: Environment overrides from make_environment()
+    :param iterations: Number of calls
+    :param cached: Use the discovery cache
+    :returns: Mean microseconds per call
+    """
+    saved = {key: os.environ.get(key) for key in ("PATH", "SAFE_RUN_CACHE_FILE", "SAFE_RUN_NO_CACHE", "SAFE_RUN_BIN")}
+    os.environ.update(env)
+    os.environ.pop("SAFE_RUN_BIN", None)
+    if cached:
+        os.environ.pop("SAFE_RUN_NO_CACHE", None)
+    else:
+        os.environ["SAFE_RUN_NO_CACHE"] = "1"
+    try:
+        mod = load_safe_run()
+        if mod.find_safe_run_binary() is None:
+            raise RuntimeError("stub safe-run binary was not discovered")
+        start = time.perf_counter()
+        for _ in range(iterations):
+            mod.find_safe_run_binary()
+        return (time.perf_counter() - start) * 1e6 / iterations
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def time_end_to_end(env: Dict[str, str], runs: int, cached: bool) -> List[float]:
+    """Time complete wrapper invocations.
+
+    :param env: Environment overrides from make_environment()
+    :param runs: Number of invocations
+    :param cached: Use the discovery cache
+    :returns: Wall times in milliseconds
+    """
+    child_env = dict(os.environ)
+    child_env.update(env)
+    child_env.pop("SAFE_RUN_BIN", None)
+    if cached:
+        child_env.pop("SAFE_RUN_NO_CACHE", None)
+    else:
+        child_env["SAFE_RUN_NO_CACHE"] = "1"
+    cmd = [sys.executable, str(SAFE_RUN), "true"]
+    # Warm-up run (fills the cache in cached mode)
+    subprocess.run(cmd, env=child_env, check=True)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, env=child_env, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run(iterations: int, runs: int, path_dirs: int) -> Dict[str, object]:
+    """Run the benchmark.
+
+    :param iterations: In-process calls per mode
+    :param runs: End-to-end invocations per mode
+    :param path_dirs: Empty PATH directories before the stub
+    :returns: Result dict
+    """
+    with tempfile.TemporaryDirectory() as td:
+        env = make_environment(Path(td), path_dirs)
+        result: Dict[str, object] = {"path_dirs": path_dirs, "iterations": iterations, "runs": runs}
+        for mode, cached in (("uncached", False), ("cached", True)):
+            result[f"{mode}_us_per_call"] = round(time_in_process(env, iterations, cached), 2)
+            timings = time_end_to_end(env, runs, cached)
+            result[f"{mode}_e2e_median_ms"] = round(statistics.median(timings), 2)
+            result[f"{mode}_e2e_min_ms"] = round(min(timings), 2)
+        result["saved_us_per_call"] = round(result["uncached_us_per_call"] - result["cached_us_per_call"], 2)
+        result["saved_e2e_median_ms"] = round(result["uncached_e2e_median_ms"] - result["cached_e2e_median_ms"], 2)
+    return result
+
+
+def main() -> int:
+    """Parse arguments and print results.
+
+    :returns: Exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--path-dirs", type=int, default=20)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+    if args.iterations < 1 or args.runs < 1 or args.path_dirs < 0:
+        parser.error("--iterations and --runs must be positive, --path-dirs non-negative")
+    if os.name != "posix":
+        parser.error("this benchmark needs a POSIX shell for the stub binary")
+
+    result = run(args.iterations, args.runs, args.path_dirs)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    print(f"PATH: {args.path_dirs} empty directories before the stub binary")
+    print(f"{'':>10}  {'us/call':>10}  {'e2e median ms':>14}  {'e2e min ms':>11}")
+    for mode in ("uncached", "cached"):
+        print(
+            f"{mode:>10}  {result[f'{mode}_us_per_call']:>10}  "
+            f"{result[f'{mode}_e2e_median_ms']:>14}  {result[f'{mode}_e2e_min_ms']:>11}"
+        )
+    print(f"{'saved':>10}  {result['saved_us_per_call']:>10}  {result['saved_e2e_median_ms']:>14}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
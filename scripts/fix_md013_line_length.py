@@ -0,0 +1,648 @@
+#!/usr/bin/env python3
+"""Markdown MD013 (line-length) fixer engine with both reflow strategies.
+
+One engine behind fix_md013_line_length_option_a.py and
+fix_md013_line_length_option_b.py: discovers Markdown files, rewrites them
+with the selected strategy across a process pool, and either writes the
+result atomically or (with --check) prints unified diffs.
+
+:Purpose:
+    Fix MD013 line-length violations by reflowing text to <= 120 characters
+    while never touching structure-sensitive markdown:
+
+    - Fenced code blocks (``` / ~~~)
+    - Indented code blocks (4 spaces or tab)
+    - Tables (header + separator detection, plus contiguous table rows)
+    - Headings (# ...)
+    - Blockquotes (> ...)
+    - Link reference definitions ([id]: url)
+    - HTML block lines (<tag>...</tag>)
+    - Any line containing backticks (inline code exemption)
+    - Any line containing URLs (http/https or <http...>)
+
+:Strategies:
+    a
+        Only reflow plain paragraph blocks; copy list blocks (bullets, numbered,
+        task lists) and their continuations unchanged.
+    b
+        Also rewrap the text payload of list items, preserving markers and
+        checkbox prefixes with a deterministic continuation indent. Multi-paragraph
+        list items and items with inline code or URLs in continuations are kept as-is.
+
+:Usage:
+    Fix every tracked Markdown file in the repository::
+
+        python3 scripts/fix_md013_line_length.py --strategy a
+
+    Check (pre-commit hook style) specific paths::
+
+        python3 scripts/fix_md013_line_length.py --strategy b --check README.md docs/
+
+:Arguments:
+    paths
+        Markdown files or directories (default: all git-tracked *.md files)
+    --strategy {a,b}
+        Reflow strategy (default: a)
+    --check
+        Do not write; print a unified diff for each file that would change
+    --jobs N
+        Worker processes (default: CPU count)
+
+:Exit Codes:
+    0
+        Success (files fixed or nothing to do; --check: no changes needed)
+    1
+        --check only: at least one file would be changed
+    2
+        Usage error, input path not found, or a file could not be processed
+
+:Environment Variables:
+    None
+
+:Examples:
+    Preview option B on the docs tree::
+
+        python3 scripts/fix_md013_line_length.py --strategy b --check docs/
+
+    Apply option A with four workers::
+
+        python3 scripts/fix_md013_line_length.py --jobs 4
+
+:Notes:
+    - Directories are expanded with `git ls-files`, so .venv, node_modules and other
+      untracked trees are never visited; outside a git checkout they are walked
+      with hidden directories and node_modules pruned
+    - Files are written via a temporary file in the same directory plus rename, so
+      an interrupted run never leaves a half-written file
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+MAX_LEN = 120
+
+STRATEGY_A = "a"
+STRATEGY_B = "b"
+
+# Below this many files, rewriting runs in-process instead of starting a pool
+MIN_PARALLEL_FILES = 8
+
+# Directory names pruned when walking a tree outside a git checkout
+WALK_SKIP_DIRS = {"node_modules", "__pycache__", "site-packages", "venv"}
+
+FENCE_RE = re.compile(r"^(?P<indent>[ \t]{0,3})(?P<fence>`{3,}|~{3,})(?P<rest>.*)$")
+HEADING_RE = re.compile(r"^\s{0,3}#{1,6}\s+")
+BLOCKQUOTE_RE = re.compile(r"^\s{0,3}>\s?")
+REF_DEF_RE = re.compile(r"^\s{0,3}\[[^\]]+\]:\s+\S+")
+HTML_BLOCK_RE = re.compile(r"^\s{0,3}<[/a-zA-Z][^>]*>\s*$")
+URL_RE = re.compile(r"(https?://\S+|<https?://[^>]+>)")
+
+# Table detection: header row + separator row.
+TABLE_ROW_RE = re.compile(r"^\s{0,3}\|.*\|\s*$")
+TABLE_SEP_RE = re.compile(r"^\s{0,3}\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)+\|?\s*$")
+
+# Lists:
+# - Bullet or numbered marker
+# - Optional task checkbox immediately after marker
+LIST_ITEM_PREFIX_RE = re.compile(r"^(?P<indent>\s{0,3})(?P<marker>[-*+]|\d{1,4}\.)\s+")
+TASK_BOX_RE = re.compile(r"^\[(?P<state>[ xX])\]\s+")
+
+# Sentinel payload for list items that must be copied unchanged (option B)
+UNSAFE_LIST_ITEM = "__UNSAFE_LIST_ITEM__"
+
+
+def _starts_fence(line: str) -> Optional[Tuple[str, int]]:
+    """Check if line starts a fenced code block.
+
+    :param line: The line to check
+    :returns: Tuple of (fence_char, fence_len) if fence detected, None otherwise
+    """
+    m = FENCE_RE.match(line)
+    if not m:
+        return None
+    fence = m.group("fence")
+    return (fence[0], len(fence))
+
+
+def _ends_fence(line: str, fence_char: str, fence_len: int) -> bool:
+    """Check if line closes a fenced code block.
+
+    :param line: The line to check
+    :param fence_char: The fence character from opening fence (` or ~)
+    :param fence_len: The length of the opening fence
+    :returns: True if this line closes the fence, False otherwise
+    """
+    m = FENCE_RE.match(line)
+    if not m:
+        return False
+    fence = m.group("fence")
+    return fence[0] == fence_char and len(fence) >= fence_len
+
+
+def _is_table_block(lines: List[str], i: int) -> bool:
+    """Detect if current line starts a table block.
+
+    :param lines: All lines in the file
+    :param i: Current line index
+    :returns: True if current and next line form a table header+separator
+    """
+    if i + 1 >= len(lines):
+        return False
+    return bool(TABLE_ROW_RE.match(lines[i]) and TABLE_SEP_RE.match(lines[i + 1]))
+
+
+def _is_indented_code(line: str) -> bool:
+    """Check if line is an indented code block (4 spaces or tab).
+
+    :param line: The line to check
+    :returns: True if line starts with 4 spaces or a tab
+    """
+    return line.startswith("    ") or line.startswith("\t")
+
+
+def _is_structural(line: str) -> bool:
+    """Check if line is a heading, blockquote, link reference or HTML block line.
+
+    :param line: The line to check
+    :returns: True if the line is structure-sensitive
+    """
+    return bool(
+        HEADING_RE.match(line) or BLOCKQUOTE_RE.match(line) or REF_DEF_RE.match(line) or HTML_BLOCK_RE.match(line)
+    )
+
+
+def _should_skip_line(line: str) -> bool:
+    """Check if line should never be reflowed.
+
+    :param line: The line to check
+    :returns: True if line should be skipped (blank, heading, code, etc.)
+    """
+    if not line.strip():
+        return True
+    if _is_structural(line):
+        return True
+    if "`" in line:  # inline-code exemption (repo decision)
+        return True
+    if URL_RE.search(line):
+        return True
+    return _is_indented_code(line)
+
+
+def _wrap_text(
+    text: str,
+    *,
+    initial_indent: str = "",
+    subsequent_indent: str = "",
+) -> List[str]:
+    """Wrap text to MAX_LEN without breaking words.
+
+    :param text: The text to wrap
+    :param initial_indent: Indent for first line
+    :param subsequent_indent: Indent for continuation lines
+    :returns: List of wrapped lines
+    """
+    wrapped = textwrap.fill(
+        text,
+        width=MAX_LEN,
+        initial_indent=initial_indent,
+        subsequent_indent=subsequent_indent,
+        break_long_words=False,
+        break_on_hyphens=False,
+    )
+    return wrapped.splitlines()
+
+
+def _parse_list_prefix(line: str) -> Optional[Tuple[str, str, str, str]]:
+    """Parse list prefix components.
+
+    :param line: The line to parse
+    :returns: Tuple of (base_indent, marker, checkbox, text) or None if not a list item
+        - base_indent: leading spaces (0..3)
+        - marker: "-", "*", "+", or "1."
+        - checkbox: "" or "[ ] " / "[x] " (including trailing space)
+        - text: remaining text after marker (+ optional checkbox)
+    """
+    m = LIST_ITEM_PREFIX_RE.match(line)
+    if not m:
+        return None
+
+    base_indent = m.group("indent")
+    marker = m.group("marker")
+    rest = line[m.end() :]
+
+    checkbox = ""
+    tb = TASK_BOX_RE.match(rest)
+    if tb:
+        checkbox = rest[: tb.end()]
+        rest = rest[tb.end() :]
+
+    return base_indent, marker, checkbox, rest.rstrip("\n")
+
+
+def _is_list_item(line: str) -> bool:
+    """Check if line starts a list item (including task lists).
+
+    :param line: The line to check
+    :returns: True if line starts a list item
+    """
+    return LIST_ITEM_PREFIX_RE.match(line) is not None
+
+
+def _copy_list_block(lines: List[str], i: int, out: List[str]) -> int:
+    """Copy a list item and its continuation lines unchanged (option A).
+
+    :param lines: All lines in the file
+    :param i: Current line index (must be a list item)
+    :param out: Output lines to append to
+    :returns: Index of the first line after the block
+    """
+    base_indent = LIST_ITEM_PREFIX_RE.match(lines[i]).group("indent")
+    out.append(lines[i])
+    i += 1
+
+    # Continuations are usually indented. We keep them until a blank line or a new list item
+    # at the same/better indent or a structural boundary.
+    while i < len(lines):
+        line = lines[i]
+        if not line.strip():
+            break
+        if _is_list_item(line) and len(line) - len(line.lstrip(" ")) <= len(base_indent):
+            break
+        if _starts_fence(line) or _is_table_block(lines, i) or _is_structural(line):
+            break
+        out.append(line)
+        i += 1
+    return i
+
+
+def _collect_list_item(lines: List[str], start: int) -> Tuple[int, str, str, str, str]:
+    """Collect a list item starting at given index (option B).
+
+    Stops at blank line (does not support multi-paragraph items).
+    Continuation lines included only if indented beyond marker prefix.
+    Stops if a new list item starts.
+
+    :param lines: All lines in the file
+    :param start: Starting line index
+    :returns: Tuple of (next_index, base_indent, marker, checkbox, payload_text);
+        payload_text is UNSAFE_LIST_ITEM if the item must be copied unchanged
+    """
+    parsed = _parse_list_prefix(lines[start])
+    if not parsed:
+        return start + 1, "", "", "", lines[start]
+
+    base_indent, marker, checkbox, first_text = parsed
+    prefix_len = len(f"{base_indent}{marker} {checkbox}")
+
+    parts: List[str] = [first_text.strip()] if first_text.strip() else []
+    i = start + 1
+
+    while i < len(lines):
+        line = lines[i]
+        if not line.strip():
+            break
+
+        # Structural boundaries => stop item
+        if _starts_fence(line) or _is_table_block(lines, i) or _is_structural(line):
+            break
+
+        # New list item (nested or at same/less indent) => stop
+        # This preserves nested list structures
+        if _is_list_item(line):
+            break
+
+        # Continuation line: must be indented sufficiently
+        if len(line) - len(line.lstrip(" ")) < prefix_len:
+            break
+        cont = line.strip()
+        # Safety: if continuation includes inline code or URL, preserve original lines.
+        if "`" in cont or URL_RE.search(cont):
+            return i, base_indent, marker, checkbox, UNSAFE_LIST_ITEM
+        parts.append(cont)
+        i += 1
+
+    payload_text = " ".join(p for p in parts if p).strip()
+    return i, base_indent, marker, checkbox, payload_text
+
+
+def _rewrap_list_item(lines: List[str], i: int, out: List[str]) -> int:
+    """Rewrap one list item's payload, preserving its marker (option B).
+
+    :param lines: All lines in the file
+    :param i: Current line index (must be a list item)
+    :param out: Output lines to append to
+    :returns: Index of the first line after the item
+    """
+    next_i, base_indent, marker, checkbox, payload = _collect_list_item(lines, i)
+
+    # If we detected unsafe content for this list item, copy original line(s) unchanged.
+    if payload == UNSAFE_LIST_ITEM:
+        out.extend(lines[i:next_i])
+        return next_i
+
+    prefix = f"{base_indent}{marker} {checkbox}"
+    if payload and (len(prefix) + 1 + len(payload) > MAX_LEN):
+        out.extend(_wrap_text(payload, initial_indent=prefix, subsequent_indent=" " * len(prefix)))
+    else:
+        # Keep item as-is (but normalize single-space after prefix)
+        out.append(f"{prefix}{payload}".rstrip())
+    return next_i
+
+
+def _collect_paragraph(lines: List[str], start: int) -> Tuple[int, List[str]]:
+    """Collect consecutive lines forming a plain paragraph block.
+
+    Stops at blank line or any structure-sensitive line.
+
+    :param lines: All lines in the file
+    :param start: Starting line index
+    :returns: Tuple of (next_index, paragraph_lines)
+    """
+    i = start
+    while i < len(lines):
+        line = lines[i]
+        if _should_skip_line(line) or TABLE_ROW_RE.match(line) or _is_list_item(line):
+            break
+        i += 1
+    return i, lines[start:i]
+
+
+def rewrite_markdown(original: str, strategy: str = STRATEGY_A) -> str:
+    """Apply MD013 reflow to Markdown text.
+
+    :param original: File content
+    :param strategy: STRATEGY_A (paragraphs only) or STRATEGY_B (paragraphs and list items)
+    :returns: Rewritten content (equal to original if nothing needed reflowing)
+    :raises ValueError: If strategy is unknown
+    """
+    if strategy not in (STRATEGY_A, STRATEGY_B):
+        raise ValueError(f"Unknown strategy: {strategy}")
+    if not original:
+        return ""
+
+    lines = original.splitlines()
+    out: List[str] = []
+
+    fence: Optional[Tuple[str, int]] = None
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+
+        # Fence open/close handling
+        if fence is None:
+            fence = _starts_fence(line)
+            if fence:
+                out.append(line)
+                i += 1
+                continue
+        else:
+            out.append(line)
+            if _ends_fence(line, *fence):
+                fence = None
+            i += 1
+            continue
+
+        # Tables: copy contiguous table block unchanged
+        if _is_table_block(lines, i):
+            out.append(lines[i])
+            out.append(lines[i + 1])
+            i += 2
+            while i < len(lines) and TABLE_ROW_RE.match(lines[i]):
+                out.append(lines[i])
+                i += 1
+            continue
+
+        if strategy == STRATEGY_A and _is_list_item(line):
+            # Option A: copy list item blocks unchanged
+            i = _copy_list_block(lines, i, out)
+        elif _should_skip_line(line):
+            # Skip lines that should never be reflowed
+            out.append(line)
+            i += 1
+            continue
+        elif _is_list_item(line):
+            # Option B: list item wrapping
+            i = _rewrap_list_item(lines, i, out)
+        else:
+            # Regular paragraph wrapping
+            next_i, para_lines = _collect_paragraph(lines, i)
+            para_text = " ".join(s.strip() for s in para_lines).strip()
+
+            # Only reflow if the paragraph is too long *and* at least one original
+            # line actually exceeds MAX_LEN, to avoid rewrapping already-compliant
+            # formatting.
+            if para_text and len(para_text) > MAX_LEN and any(len(p) > MAX_LEN for p in para_lines):
+                out.extend(_wrap_text(para_text))
+            else:
+                out.extend(para_lines)
+            i = next_i
+
+        # Preserve explicit blank line if present
+        if i < len(lines) and not lines[i].strip():
+            out.append(lines[i])
+            i += 1
+
+    # Preserve original file's trailing newline behavior
+    return "\n".join(out) + ("\n" if original.endswith("\n") else "")
+
+
+def atomic_write(path: Path, content: str) -> None:
+    """Write a file via a temporary sibling and rename, keeping its permissions.
+
+    :param path: File to replace
+    :param content: New content
+    """
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as handle:
+            handle.write(content)
+        shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def process_file(path: Path, strategy: str = STRATEGY_A, check: bool = False) -> Tuple[bool, str]:
+    """Rewrite (or check) one Markdown file.
+
+    :param path: Markdown file
+    :param strategy: Reflow strategy
+    :param check: If True, never write; return a diff instead
+    :returns: Tuple of (changed, unified diff text; empty unless check is True)
+    """
+    original = path.read_text(encoding="utf-8")
+    new = rewrite_markdown(original, strategy)
+    if new == original:
+        return False, ""
+    if check:
+        diff = difflib.unified_diff(
+            original.splitlines(keepends=True),
+            new.splitlines(keepends=True),
+            fromfile=f"a/{path.as_posix()}",
+            tofile=f"b/{path.as_posix()}",
+        )
+        return True, "".join(diff)
+    atomic_write(path, new)
+    return True, ""
+
+
+def _process_worker(task: Tuple[str, str, bool]) -> Tuple[str, bool, str, str]:
+    """Process-pool entry point for process_file().
+
+    :param task: Tuple of (path, strategy, check)
+    :returns: Tuple of (path, changed, diff, error message or "")
+    """
+    path, strategy, check = task
+    try:
+        changed, diff = process_file(Path(path), strategy, check)
+    except (OSError, UnicodeDecodeError) as e:
+        return path, False, "", str(e)
+    return path, changed, diff, ""
+
+
+def _git_markdown_files(directory: Path) -> Optional[List[Path]]:
+    """List git-tracked Markdown files under a directory.
+
+    :param directory: Directory to list
+    :returns: Sorted tracked *.md paths, or None if the directory is not in a git checkout
+    """
+    result = subprocess.run(
+        ["git", "ls-files", "-z", "--", "*.md", "*.MD"],
+        cwd=directory,
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return None
+    names = [name for name in os.fsdecode(result.stdout).split("\0") if name]
+    return sorted(directory / name for name in names)
+
+
+def _walk_markdown_files(directory: Path) -> List[Path]:
+    """Walk a directory for Markdown files, pruning hidden and dependency trees.
+
+    :param directory: Directory to walk
+    :returns: Sorted *.md paths
+    """
+    found = []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in WALK_SKIP_DIRS]
+        found.extend(Path(dirpath) / name for name in filenames if name.lower().endswith(".md"))
+    return sorted(found)
+
+
+def discover_markdown_files(paths: Iterable[Path]) -> List[Path]:
+    """Expand file and directory arguments into Markdown files.
+
+    :param paths: Files and directories
+    :returns: De-duplicated Markdown files in argument order
+    """
+    seen = set()
+    files = []
+    for path in paths:
+        if path.is_file():
+            candidates = [path] if path.suffix.lower() == ".md" else []
+        else:
+            tracked = _git_markdown_files(path)
+            candidates = tracked if tracked is not None else _walk_markdown_files(path)
+        for candidate in candidates:
+            if candidate not in seen and candidate.is_file():
+                seen.add(candidate)
+                files.append(candidate)
+    return files
+
+
+def run(files: List[Path], strategy: str, check: bool, jobs: Optional[int] = None) -> int:
+    """Rewrite or check files, printing progress, diffs and errors.
+
+    :param files: Markdown files to process
+    :param strategy: Reflow strategy
+    :param check: Print diffs instead of writing
+    :param jobs: Worker processes (default: CPU count)
+    :returns: Exit code
+    """
+    tasks = [(str(path), strategy, check) for path in files]
+    workers = min(jobs or os.cpu_count() or 1, len(tasks))
+    if workers <= 1 or len(tasks) < MIN_PARALLEL_FILES:
+        outcomes = map(_process_worker, tasks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        outcomes = executor.map(_process_worker, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
+
+    changed_count = 0
+    errors = 0
+    try:
+        for path, changed, diff, error in outcomes:
+            if error:
+                errors += 1
+                print(f"ERROR: {path}: {error}", file=sys.stderr)
+            elif changed:
+                changed_count += 1
+                if check:
+                    sys.stdout.write(diff)
+                else:
+                    print(f"Fixed: {path}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if check and changed_count:
+        print(f"{changed_count} file(s) would be reformatted", file=sys.stderr)
+    elif not changed_count:
+        print("No changes")
+    if errors:
+        return 2
+    return 1 if check and changed_count else 0
+
+
+def main(argv: Optional[List[str]] = None, strategy: Optional[str] = None) -> int:
+    """Main entry point for the script.
+
+    :param argv: Command-line arguments (default: sys.argv[1:])
+    :param strategy: Fixed strategy (used by the option_a/option_b entry points);
+        when None, --strategy selects it
+    :returns: Exit code (0 success, 1 changes needed in --check mode, 2 errors)
+    """
+    parser = argparse.ArgumentParser(description="Fix markdownlint MD013 (line-length) violations")
+    parser.add_argument("paths", nargs="*", type=Path, help="Markdown files or directories (default: tracked *.md)")
+    if strategy is None:
+        parser.add_argument("--strategy", choices=[STRATEGY_A, STRATEGY_B], default=STRATEGY_A)
+    parser.add_argument("--check", action="store_true", help="Print diffs and exit 1 instead of writing")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    if args.jobs is not None and args.jobs < 1:
+        print("ERROR: --jobs must be >= 1", file=sys.stderr)
+        return 2
+
+    paths = args.paths or [Path(".")]
+    for path in paths:
+        if not path.exists():
+            print(f"ERROR: path not found: {path}", file=sys.stderr)
+            return 2
+        if not (path.is_file() or path.is_dir()):
+            print(f"ERROR: path must be a regular file or directory: {path}", file=sys.stderr)
+            return 2
+
+    files = discover_markdown_files(paths)
+    return run(files, strategy or args.strategy, args.check, args.jobs)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
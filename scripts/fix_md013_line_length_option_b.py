@@ -40,260 +40,37 @@ both plain paragraphs and list items while preserving structure and markers.
 
         python3 fix_md013_line_length_option_b.py README.md
 
-    Process all Markdown files in a directory::
+    Process all tracked Markdown files in a directory::
 
         python3 fix_md013_line_length_option_b.py docs/
 
+    Check without writing (prints diffs, exits 1 if anything would change)::
+
+        python3 fix_md013_line_length_option_b.py --check docs/
+
 :Exit Codes:
     0
         Success (even if no changes were made)
+    1
+        --check only: at least one file would be changed
     2
-        Usage error or input path not found
+        Usage error, input path not found, or a file could not be processed
+
+:Notes:
+    Thin entry point for scripts/fix_md013_line_length.py with the strategy
+    fixed to "b"; see that module for --check, --jobs and file discovery.
 """
 
 from __future__ import annotations
 
-import re
 import sys
-import textwrap
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
-
-MAX_LEN = 120
-
-FENCE_RE = re.compile(r"^(?P<indent>[ \t]{0,3})(?P<fence>`{3,}|~{3,})(?P<rest>.*)$")
-HEADING_RE = re.compile(r"^\s{0,3}#{1,6}\s+")
-BLOCKQUOTE_RE = re.compile(r"^\s{0,3}>\s?")
-REF_DEF_RE = re.compile(r"^\s{0,3}\[[^\]]+\]:\s+\S+")
-HTML_BLOCK_RE = re.compile(r"^\s{0,3}<[/a-zA-Z][^>]*>\s*$")
-URL_RE = re.compile(r"(https?://\S+|<https?://[^>]+>)")
-
-# Table detection: header row + separator row.
-TABLE_ROW_RE = re.compile(r"^\s{0,3}\|.*\|\s*$")
-TABLE_SEP_RE = re.compile(r"^\s{0,3}\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)+\|?\s*$")
-
-# Lists:
-# - Bullet or numbered marker
-# - Optional task checkbox immediately after marker
-LIST_ITEM_PREFIX_RE = re.compile(r"^(?P<indent>\s{0,3})(?P<marker>[-*+]|\d{1,4}\.)\s+")
-TASK_BOX_RE = re.compile(r"^\[(?P<state>[ xX])\]\s+")
-
-
-def _starts_fence(line: str) -> Optional[Tuple[str, int]]:
-    """Check if line starts a fenced code block.
-
-    :param line: The line to check
-    :returns: Tuple of (fence_char, fence_len) if fence detected, None otherwise
-    """
-    m = FENCE_RE.match(line)
-    if not m:
-        return None
-    fence = m.group("fence")
-    return (fence[0], len(fence))
-
-
-def _ends_fence(line: str, fence_char: str, fence_len: int) -> bool:
-    """Check if line closes a fenced code block.
-
-    :param line: The line to check
-    :param fence_char: The fence character from opening fence (` or ~)
-    :param fence_len: The length of the opening fence
-    :returns: True if this line closes the fence, False otherwise
-    """
-    m = FENCE_RE.match(line)
-    if not m:
-        return False
-    fence = m.group("fence")
-    return fence[0] == fence_char and len(fence) >= fence_len
-
-
-def _is_table_block(lines: List[str], i: int) -> bool:
-    """Detect if current line starts a table block.
-
-    :param lines: All lines in the file
-    :param i: Current line index
-    :returns: True if current and next line form a table header+separator
-    """
-    if i + 1 >= len(lines):
-        return False
-    return bool(TABLE_ROW_RE.match(lines[i]) and TABLE_SEP_RE.match(lines[i + 1]))
-
-
-def _is_indented_code(line: str) -> bool:
-    """Check if line is an indented code block (4 spaces or tab).
-
-    :param line: The line to check
-    :returns: True if line starts with 4 spaces or a tab
-    """
-    return line.startswith("    ") or line.startswith("\t")
-
-
-def _should_skip_line(line: str) -> bool:
-    """Check if line should never be reflowed.
-
-    :param line: The line to check
-    :returns: True if line should be skipped (heading, blockquote, etc.)
-    """
-    if not line.strip():
-        return True
-    if HEADING_RE.match(line):
-        return True
-    if BLOCKQUOTE_RE.match(line):
-        return True
-    if REF_DEF_RE.match(line):
-        return True
-    if HTML_BLOCK_RE.match(line):
-        return True
-    if "`" in line:  # inline-code exemption (repo decision)
-        return True
-    if URL_RE.search(line):
-        return True
-    return False
-
-
-def _wrap_text(
-    text: str,
-    *,
-    initial_indent: str = "",
-    subsequent_indent: str = "",
-) -> List[str]:
-    """Wrap text to MAX_LEN without breaking words.
-
-    :param text: The text to wrap
-    :param initial_indent: Indent for first line
-    :param subsequent_indent: Indent for continuation lines
-    :returns: List of wrapped lines
-    """
-    wrapped = textwrap.fill(
-        text,
-        width=MAX_LEN,
-        initial_indent=initial_indent,
-        subsequent_indent=subsequent_indent,
-        break_long_words=False,
-        break_on_hyphens=False,
-    )
-    return wrapped.splitlines()
-
-
-def _parse_list_prefix(line: str) -> Optional[Tuple[str, str, str, str]]:
-    """Parse list prefix components.
-
-    :param line: The line to parse
-    :returns: Tuple of (base_indent, marker, checkbox, text) or None if not a list item
-        - base_indent: leading spaces (0..3)
-        - marker: "-", "*", "+", or "1."
-        - checkbox: "" or "[ ] " / "[x] " (including trailing space)
-        - text: remaining text after marker (+ optional checkbox)
-    """
-    m = LIST_ITEM_PREFIX_RE.match(line)
-    if not m:
-        return None
-
-    base_indent = m.group("indent")
-    marker = m.group("marker")
-    rest = line[m.end() :]
-
-    checkbox = ""
-    tb = TASK_BOX_RE.match(rest)
-    if tb:
-        checkbox = rest[: tb.end()]
-        rest = rest[tb.end() :]
-
-    return base_indent, marker, checkbox, rest.rstrip("\n")
-
-
-def _is_new_list_item(line: str) -> bool:
-    """Check if line starts a new list item.
-
-    :param line: The line to check
-    :returns: True if line starts a list item
-    """
-    return _parse_list_prefix(line) is not None
-
-
-def _collect_list_item(lines: List[str], start: int) -> Tuple[int, str, str, str, str]:
-    """Collect a list item starting at given index.
-
-    Stops at blank line (does not support multi-paragraph items).
-    Continuation lines included only if indented beyond marker prefix.
-    Stops if new list item at same-or-less indent starts.
-
-    :param lines: All lines in the file
-    :param start: Starting line index
-    :returns: Tuple of (next_index, base_indent, marker, checkbox, payload_text)
-    """
-    parsed = _parse_list_prefix(lines[start])
-    if not parsed:
-        return start + 1, "", "", "", lines[start]
-
-    base_indent, marker, checkbox, first_text = parsed
-    prefix = f"{base_indent}{marker} {checkbox}"
-    prefix_len = len(prefix)
-
-    parts: List[str] = [first_text.strip()] if first_text.strip() else []
-    i = start + 1
-
-    while i < len(lines):
-        line = lines[i]
-        if not line.strip():
-            break
-
-        # Structural boundaries => stop item
-        if _starts_fence(line) or _is_table_block(lines, i) or HEADING_RE.match(line) or BLOCKQUOTE_RE.match(line):
-            break
-        if REF_DEF_RE.match(line) or HTML_BLOCK_RE.match(line):
-            break
-
-        # New list item (nested or at same/less indent) => stop
-        # This preserves nested list structures
-        if _is_new_list_item(line):
-            break
 
-        # Continuation line: must be indented sufficiently
-        indent_len = len(line) - len(line.lstrip(" "))
-        if indent_len >= prefix_len:
-            cont = line.strip()
-            # Safety: if continuation includes inline code or URL, preserve original lines.
-            if "`" in cont or URL_RE.search(cont):
-                # Return sentinel tuple to signal unsafe content
-                return i, base_indent, marker, checkbox, "__UNSAFE_LIST_ITEM__"
-            parts.append(cont)
-            i += 1
-            continue
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-        # Anything else: stop item
-        break
-
-    payload_text = " ".join(p for p in parts if p).strip()
-    return i, base_indent, marker, checkbox, payload_text
-
-
-def _collect_paragraph(lines: List[str], start: int) -> Tuple[int, List[str]]:
-    """Collect consecutive lines forming a plain paragraph block.
-
-    Stops at blank line or any structure-sensitive line.
-
-    :param lines: All lines in the file
-    :param start: Starting line index
-    :returns: Tuple of (next_index, paragraph_lines)
-    """
-    buf: List[str] = []
-    i = start
-    while i < len(lines):
-        line = lines[i]
-        if not line.strip():
-            break
-        if _should_skip_line(line):
-            break
-        if _is_indented_code(line):
-            break
-        if TABLE_ROW_RE.match(line):
-            break
-        if _is_new_list_item(line):
-            break
-        buf.append(line)
-        i += 1
-    return i, buf
+# pylint: disable=wrong-import-position,unused-import
+from fix_md013_line_length import MAX_LEN, STRATEGY_B, _parse_list_prefix, process_file  # noqa: E402,F401
+from fix_md013_line_length import main as _engine_main  # noqa: E402
 
 
 def _rewrite_file(path: Path) -> bool:
@@ -302,150 +79,16 @@ def _rewrite_file(path: Path) -> bool:
     :param path: Path to the Markdown file
     :returns: True if file was modified, False otherwise
     """
-    original = path.read_text(encoding="utf-8")
-    lines = original.splitlines()
-
-    out: List[str] = []
-
-    in_fence = False
-    fence_char = ""
-    fence_len = 0
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Fence open/close handling
-        fence = _starts_fence(line)
-        if fence and not in_fence:
-            in_fence = True
-            fence_char, fence_len = fence
-            out.append(line)
-            i += 1
-            continue
-        if in_fence:
-            out.append(line)
-            if _ends_fence(line, fence_char, fence_len):
-                in_fence = False
-                fence_char = ""
-                fence_len = 0
-            i += 1
-            continue
-
-        # Tables: copy contiguous table block unchanged
-        if _is_table_block(lines, i):
-            out.append(lines[i])
-            out.append(lines[i + 1])
-            i += 2
-            while i < len(lines) and TABLE_ROW_RE.match(lines[i]):
-                out.append(lines[i])
-                i += 1
-            continue
-
-        # Skip lines that should never be reflowed
-        if _should_skip_line(line) or _is_indented_code(line):
-            out.append(line)
-            i += 1
-            continue
-
-        # List item wrapping
-        if _is_new_list_item(line):
-            next_i, base_indent, marker, checkbox, payload = _collect_list_item(lines, i)
-
-            # If we detected unsafe content for this list item, copy original line(s) unchanged.
-            if payload == "__UNSAFE_LIST_ITEM__":
-                out.extend(lines[i:next_i])
-                i = next_i
-
-                # Preserve following blank line if present
-                if i < len(lines) and not lines[i].strip():
-                    out.append(lines[i])
-                    i += 1
-                continue
-
-            prefix = f"{base_indent}{marker} {checkbox}"
-            subsequent = " " * len(prefix)
-
-            if payload and (len(prefix) + 1 + len(payload) > MAX_LEN):
-                out.extend(_wrap_text(payload, initial_indent=prefix, subsequent_indent=subsequent))
-            else:
-                # Keep item as-is (but normalize single-space after prefix)
-                out.append(f"{prefix}{payload}".rstrip())
-
-            i = next_i
-
-            # Preserve following blank line if present
-            if i < len(lines) and not lines[i].strip():
-                out.append(lines[i])
-                i += 1
-            continue
-
-        # Regular paragraph wrapping
-        next_i, para_lines = _collect_paragraph(lines, i)
-        para_text = " ".join(s.strip() for s in para_lines).strip()
-
-        if para_text and len(para_text) > MAX_LEN and any(len(line) > MAX_LEN for line in para_lines):
-            out.extend(_wrap_text(para_text))
-        else:
-            out.extend(para_lines)
-
-        i = next_i
-
-        # Preserve explicit blank line if present
-        if i < len(lines) and not lines[i].strip():
-            out.append(lines[i])
-            i += 1
-
-    # Handle final newline: preserve original file's trailing newline behavior
-    if original:
-        new = "\n".join(out) + ("\n" if original.endswith("\n") else "")
-    else:
-        new = ""
-    if new != original:
-        path.write_text(new, encoding="utf-8")
-        return True
-    return False
-
-
-def _iter_md_files(path: Path) -> Iterable[Path]:
-    """Iterate over Markdown files in path.
-
-    :param path: File or directory path
-    :returns: Generator yielding Path objects for each .md file
-    """
-    if path.is_file():
-        if path.suffix.lower() == ".md":
-            yield path
-        return
-    yield from sorted(path.rglob("*.md"))
+    changed, _ = process_file(path, STRATEGY_B)
+    return changed
 
 
 def main() -> int:
     """Main entry point for the script.
 
-    :returns: Exit code (0 for success, 2 for errors)
+    :returns: Exit code (0 for success, 1 for --check changes, 2 for errors)
     """
-    if len(sys.argv) != 2:
-        print("Usage: fix_md013_line_length_option_b.py <file-or-directory>", file=sys.stderr)
-        return 2
-
-    root = Path(sys.argv[1])
-    if not root.exists():
-        print(f"ERROR: path not found: {root}", file=sys.stderr)
-        return 2
-    if not (root.is_file() or root.is_dir()):
-        print(f"ERROR: path must be a regular file or directory: {root}", file=sys.stderr)
-        return 2
-
-    changed_any = False
-    for md in _iter_md_files(root):
-        changed = _rewrite_file(md)
-        if changed:
-            changed_any = True
-            print(f"Fixed: {md}")
-    if not changed_any:
-        print("No changes")
-    return 0
+    return _engine_main(strategy=STRATEGY_B)
 
 
 if __name__ == "__main__":
@@ -45,6 +45,7 @@ insertion script, covering all edge cases and insertion scenarios.
 
 from __future__ import annotations
 
+import subprocess
 import sys
 import tempfile
 import unittest
@@ -55,10 +56,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # pylint: disable=wrong-import-position  # Must modify sys.path before import
 from add_future_annotations import (  # noqa: E402
+    MIN_PARALLEL_FILES,
+    STATUS_HAS_IMPORT,
+    STATUS_MODIFIED,
+    STATUS_SKIPPED,
     add_future_import,
+    classify_file,
     find_insertion_point,
+    find_tracked_python_files,
     has_future_import,
+    has_future_import_prefix,
     process_file,
+    run,
     should_skip_file,
 )
 
@@ -356,5 +365,78 @@ def main():
         self.assertIn("def main():", result)
 
 
+class TestFastPath(unittest.TestCase):
+    """Test tracked-file discovery, the byte pre-check and pooled runs."""
+
+    def setUp(self):
+        """Create temporary directory for test files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_prefix_check_matches_full_check(self):
+        """The pre-check agrees with has_future_import() inside its prefix."""
+        path = self.temp_path / "mod.py"
+        for content in (
+            '"""Doc."""\nfrom __future__ import annotations\n',
+            "from __future__ import (\n    annotations,\n)\n",
+            "from __future__ import division\n# annotations\n",
+            "import sys\n",
+        ):
+            path.write_text(content, encoding="utf-8")
+            self.assertEqual(has_future_import_prefix(path), has_future_import(content), content)
+
+    def test_import_beyond_prefix_falls_back_to_full_read(self):
+        """An import after the pre-check window is still found."""
+        path = self.temp_path / "big.py"
+        path.write_text('"""' + "x" * 200 + '"""\nfrom __future__ import annotations\n', encoding="utf-8")
+
+        self.assertFalse(has_future_import_prefix(path, limit=64))
+        self.assertEqual(classify_file(path, apply=False), (STATUS_HAS_IMPORT, ""))
+
+    def test_classify_reports_skip_reasons(self):
+        """Undecodable and untokenizable files are skipped, not fatal."""
+        binary = self.temp_path / "latin1.py"
+        binary.write_bytes(b"x = '\xff'\n")
+        broken = self.temp_path / "broken.py"
+        broken.write_text('x = """unterminated\n', encoding="utf-8")
+
+        self.assertEqual(classify_file(binary, apply=True)[0], STATUS_SKIPPED)
+        self.assertEqual(classify_file(broken, apply=True)[0], STATUS_SKIPPED)
+        self.assertEqual(broken.read_text(encoding="utf-8"), 'x = """unterminated\n')
+
+    def test_discovery_uses_tracked_files(self):
+        """Only tracked files outside SKIP_DIRS are listed."""
+        subprocess.run(["git", "init", "-q"], cwd=self.temp_path, check=True)
+        for rel in ("pkg/mod.py", ".venv/lib/dep.py", "untracked.py"):
+            path = self.temp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("import sys\n", encoding="utf-8")
+        subprocess.run(["git", "add", "pkg/mod.py", ".venv/lib/dep.py"], cwd=self.temp_path, check=True)
+
+        self.assertEqual(find_tracked_python_files(self.temp_path), [self.temp_path / "pkg" / "mod.py"])
+
+    def test_pool_run_summary(self):
+        """A pooled apply run modifies every eligible file and summarizes the counts."""
+        files = []
+        for index in range(MIN_PARALLEL_FILES + 4):
+            path = self.temp_path / f"mod_{index:03d}.py"
+            path.write_text("from __future__ import annotations\n" if index % 4 == 0 else "import sys\n", "utf-8")
+            files.append(path)
+
+        summary = run(files, apply=True, verbose=False, jobs=2)
+
+        expected_changed = [str(f) for i, f in enumerate(files) if i % 4]
+        self.assertEqual(summary["workers"], 2)
+        self.assertEqual(summary["modified"], len(expected_changed))
+        self.assertEqual(summary[STATUS_HAS_IMPORT], len(files) - len(expected_changed))
+        self.assertEqual(summary["changed_files"], expected_changed)
+        self.assertTrue(all(has_future_import(Path(f).read_text(encoding="utf-8")) for f in expected_changed))
+        self.assertEqual(run(files, apply=False, verbose=False, jobs=2)[STATUS_MODIFIED], 0)
+
+
 if __name__ == "__main__":
     unittest.main()
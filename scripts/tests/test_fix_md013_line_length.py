@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Unit tests for the fix_md013_line_length.py engine.
+
+:Purpose:
+    Covers what the shared engine adds on top of the option A/B rewrite rules
+    (which are covered by test_fix_md013_line_length_option_a/b.py):
+    - --check mode (diffs, exit code 1, no writes)
+    - Atomic writes that keep file permissions
+    - Tracked-file discovery (untracked trees such as node_modules are skipped)
+    - Process-pool runs producing the same output as in-process runs
+
+:Environment Variables:
+    None. Tests are self-contained and use temporary directories.
+
+:Exit Codes:
+    0
+        All tests passed
+    1
+        One or more tests failed
+
+:Examples:
+    Run all tests::
+
+        python3 -m pytest scripts/tests/test_fix_md013_line_length.py -v
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import fix_md013_line_length as engine  # noqa: E402  # pylint: disable=wrong-import-position
+
+LONG_PARAGRAPH = (
+    "This paragraph is deliberately much longer than the one hundred and twenty character limit so that the "
+    "engine has to reflow it onto more than one line.\n"
+)
+LONG_LIST_ITEM = (
+    "- This list item is deliberately much longer than the one hundred and twenty character limit so that "
+    "option B rewraps it.\n"
+)
+
+
+class TestMd013Engine(unittest.TestCase):
+    """Test suite for the MD013 engine CLI and file handling."""
+
+    def setUp(self):
+        """Create temporary directory for test files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        self.temp_dir.cleanup()
+
+    def _run_main(self, *argv: str, strategy: str | None = None):
+        """Run engine.main() capturing stdout/stderr.
+
+        :param argv: Command-line arguments
+        :param strategy: Fixed strategy, as used by the option_a/option_b entry points
+        :returns: Tuple of (exit code, stdout, stderr)
+        """
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            code = engine.main(list(argv), strategy=strategy)
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_strategies_differ_only_on_lists(self):
+        """Option A keeps list items; option B rewraps them; both reflow paragraphs."""
+        text = LONG_PARAGRAPH + "\n" + LONG_LIST_ITEM
+        option_a = engine.rewrite_markdown(text, engine.STRATEGY_A)
+        option_b = engine.rewrite_markdown(text, engine.STRATEGY_B)
+
+        self.assertIn(LONG_LIST_ITEM, option_a)
+        self.assertNotIn(LONG_LIST_ITEM, option_b)
+        self.assertTrue(all(len(line) <= engine.MAX_LEN for line in option_b.splitlines()))
+        with self.assertRaises(ValueError):
+            engine.rewrite_markdown(text, "c")
+
+    def test_check_prints_diff_and_does_not_write(self):
+        """--check exits 1 with a unified diff and leaves the file untouched."""
+        md_file = self.temp_path / "doc.md"
+        md_file.write_text(LONG_PARAGRAPH, encoding="utf-8")
+
+        code, stdout, stderr = self._run_main("--check", str(md_file))
+
+        self.assertEqual(code, 1)
+        self.assertIn(f"--- a/{md_file.as_posix()}", stdout)
+        self.assertIn("+++ b/", stdout)
+        self.assertIn("1 file(s) would be reformatted", stderr)
+        self.assertEqual(md_file.read_text(encoding="utf-8"), LONG_PARAGRAPH)
+
+    def test_check_clean_file_exits_zero(self):
+        """--check exits 0 when nothing needs reflowing."""
+        md_file = self.temp_path / "clean.md"
+        md_file.write_text("Short line.\n", encoding="utf-8")
+
+        code, stdout, _ = self._run_main("--check", str(md_file))
+
+        self.assertEqual(code, 0)
+        self.assertIn("No changes", stdout)
+
+    def test_write_is_atomic_and_keeps_mode(self):
+        """Fixed files are replaced via rename with their permissions preserved."""
+        md_file = self.temp_path / "doc.md"
+        md_file.write_text(LONG_PARAGRAPH, encoding="utf-8")
+        os.chmod(md_file, 0o640)
+        inode_before = md_file.stat().st_ino
+
+        code, stdout, _ = self._run_main(str(md_file))
+
+        self.assertEqual(code, 0)
+        self.assertIn("Fixed:", stdout)
+        self.assertEqual(stat.S_IMODE(md_file.stat().st_mode), 0o640)
+        self.assertNotEqual(md_file.stat().st_ino, inode_before)
+        self.assertEqual(list(self.temp_path.iterdir()), [md_file])
+
+    def test_discovery_uses_tracked_files(self):
+        """Directories expand to git-tracked Markdown only."""
+        subprocess.run(["git", "init", "-q"], cwd=self.temp_path, check=True)
+        (self.temp_path / "docs").mkdir()
+        (self.temp_path / "node_modules" / "pkg").mkdir(parents=True)
+        tracked = self.temp_path / "docs" / "guide.md"
+        tracked.write_text(LONG_PARAGRAPH, encoding="utf-8")
+        (self.temp_path / "node_modules" / "pkg" / "README.md").write_text(LONG_PARAGRAPH, encoding="utf-8")
+        (self.temp_path / "untracked.md").write_text(LONG_PARAGRAPH, encoding="utf-8")
+        subprocess.run(["git", "add", "docs/guide.md"], cwd=self.temp_path, check=True)
+
+        self.assertEqual(engine.discover_markdown_files([self.temp_path]), [tracked])
+
+    def test_discovery_outside_git_prunes_dependency_dirs(self):
+        """Outside a git checkout, hidden and node_modules trees are not walked."""
+        for rel in ("a.md", ".venv/lib/b.md", "node_modules/c.md", "sub/d.MD", "sub/e.txt"):
+            path = self.temp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x\n", encoding="utf-8")
+
+        found = engine._walk_markdown_files(self.temp_path)  # pylint: disable=protected-access
+
+        self.assertEqual(found, [self.temp_path / "a.md", self.temp_path / "sub" / "d.MD"])
+
+    def test_pool_matches_in_process_run(self):
+        """A process-pool run rewrites every file exactly like the in-process path."""
+        files = []
+        for index in range(engine.MIN_PARALLEL_FILES + 2):
+            md_file = self.temp_path / f"doc_{index:02d}.md"
+            md_file.write_text(LONG_PARAGRAPH if index % 2 else "Short.\n", encoding="utf-8")
+            files.append(md_file)
+        expected = {f: engine.rewrite_markdown(f.read_text(encoding="utf-8")) for f in files}
+
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            code = engine.run(files, engine.STRATEGY_A, check=False, jobs=2)
+
+        self.assertEqual(code, 0)
+        self.assertEqual([f.read_text(encoding="utf-8") for f in files], [expected[f] for f in files])
+        fixed = [line for line in stdout.getvalue().splitlines() if line.startswith("Fixed:")]
+        self.assertEqual(fixed, [f"Fixed: {f}" for f in files[1::2]])
+
+    def test_fixed_strategy_entry_point(self):
+        """The option_b entry point rewraps list items without a --strategy flag."""
+        md_file = self.temp_path / "list.md"
+        md_file.write_text(LONG_LIST_ITEM, encoding="utf-8")
+
+        code, _, _ = self._run_main(str(md_file), strategy=engine.STRATEGY_B)
+
+        self.assertEqual(code, 0)
+        self.assertNotEqual(md_file.read_text(encoding="utf-8"), LONG_LIST_ITEM)
+
+    def test_missing_path_is_usage_error(self):
+        """A non-existent path exits 2."""
+        code, _, stderr = self._run_main(str(self.temp_path / "missing.md"))
+
+        self.assertEqual(code, 2)
+        self.assertIn("path not found", stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -113,7 +113,9 @@ if str(repo_root) not in sys.path:
 # Import from internal module
 # pylint: disable=wrong-import-position
 from tools.repo_lint.docstrings import ValidationError, validate_files  # noqa: E402
-from tools.repo_lint.yaml_loader import get_exclusion_patterns, get_in_scope_patterns  # noqa: E402
+from tools.repo_lint.path_matcher import compile_patterns  # noqa: E402
+from tools.repo_lint.runners.base import get_exclusion_matcher  # noqa: E402
+from tools.repo_lint.yaml_loader import get_in_scope_patterns  # noqa: E402
 
 
 def get_tracked_files(include_fixtures: bool = False) -> List[Path]:
@@ -137,50 +139,23 @@ def get_tracked_files(include_fixtures: bool = False) -> List[Path]:
         sys.exit(1)
 
     # Load patterns from YAML configuration
-    in_scope_patterns = get_in_scope_patterns()
-    exclude_patterns = get_exclusion_patterns()
-
-    # Filter files by patterns
-    repo_root_dir = Path.cwd()
-    matched_files = []
+    in_scope = compile_patterns(get_in_scope_patterns())
+    exclude_patterns = list(get_exclusion_matcher(include_fixtures=include_fixtures).patterns)
 
     # Directories to exclude (test fixtures with intentional violations)
-    exclude_dirs = [
-        Path("conformance/repo-lint/vectors/fixtures"),
-        Path("conformance/repo-lint/fixtures/violations"),
-        Path("scripts/tests/fixtures"),
-        Path("conformance/repo-lint/unsafe-fix-fixtures"),
-        Path("tools/repo_lint/tests/fixtures"),
-    ]
-
-    for file_path in all_files:
-        p = Path(file_path)
-
-        # Check if file is in an excluded directory
-        excluded = False
-        if not include_fixtures:
-            for exclude_dir in exclude_dirs:
-                if p == exclude_dir or exclude_dir in p.parents:
-                    excluded = True
-                    break
-
-        if excluded:
-            continue
-
-        # Check if file matches any exclude pattern (from YAML)
-        for exclude_pattern in exclude_patterns:
-            if p.match(exclude_pattern):
-                excluded = True
-                break
-
-        if excluded:
-            continue
-
-        # Check if file matches any in-scope pattern (from YAML)
-        for pattern in in_scope_patterns:
-            if p.match(pattern):
-                matched_files.append(repo_root_dir / p)
-                break
+    if not include_fixtures:
+        exclude_patterns += [
+            "conformance/repo-lint/vectors/fixtures/",
+            "conformance/repo-lint/fixtures/violations/",
+            "scripts/tests/fixtures/",
+            "conformance/repo-lint/unsafe-fix-fixtures/",
+            "tools/repo_lint/tests/fixtures/",
+        ]
+    excluded = compile_patterns(exclude_patterns)
+
+    # Filter files by patterns (one compiled regex each for exclusions and scope)
+    repo_root_dir = Path.cwd()
+    matched_files = [repo_root_dir / f for f in excluded.filter(all_files) if in_scope.matches(f)]
 
     return matched_files
 
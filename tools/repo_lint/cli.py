@@ -17,6 +17,8 @@
     - which: Show repo-lint environment information
     - env: Generate shell integration snippets
     - activate: Launch subshell with venv activated
+    - daemon: Long-lived server that keeps configs and file inventory warm
+    - watch: Re-lint changed files as they are saved
 
 :Features:
     - Rich-Click formatted help output with option grouping
@@ -27,6 +29,7 @@
 :Environment Variables:
     - REPO_LINT_*: Any Click option can be set via environment variables with REPO_LINT_ prefix
     - REPO_LINT_UI_THEME: Path to custom UI theme YAML file
+    - REPO_LINT_DAEMON_SOCKET: Socket path used by 'daemon' and 'check --use-daemon'
     - _REPO_LINT_COMPLETE: Used by shell completion systems (bash_source, zsh_source, fish_source)
 
 :Exit Codes:
@@ -126,6 +129,39 @@ def _resolve_language_filter(lang, only):
     return only
 
 
+def _params_to_argv(ctx, exclude=()):
+    """Rebuild a subcommand's command line from its parsed parameters.
+
+    :Purpose:
+        Lets `check --use-daemon` forward exactly the options Click parsed,
+        independent of sys.argv (which is unrelated under programmatic or
+        in-process invocation).
+
+    :param ctx: Click context of the subcommand
+    :param exclude: Parameter names to leave out (e.g. "use_daemon")
+    :returns: Argument list starting with the subcommand name
+
+    :Notes:
+        - Options left unset (None) or empty are omitted
+        - Boolean flags with an off switch (--show-files/--hide-files) are always
+          spelled out; plain flags appear only when set
+    """
+    argv = [ctx.info_name]
+    for param in ctx.command.params:
+        value = ctx.params.get(param.name)
+        if not isinstance(param, click.Option) or param.name in exclude or value is None:
+            continue
+        if param.is_flag and param.secondary_opts:
+            argv.append(param.opts[0] if value else param.secondary_opts[0])
+        elif param.is_flag:
+            if value:
+                argv.append(param.opts[0])
+        else:
+            for item in value if param.multiple else (value,):
+                argv.extend([param.opts[0], str(item)])
+    return argv
+
+
 def _escape_cmd_argument(arg: str) -> str:
     """Escape a string for safe use as a literal argument in a CMD command line.
 
@@ -428,6 +464,11 @@ def cli(ctx):
         "Can be specified multiple times."
     ),
 )
+@click.option(
+    "--use-daemon",
+    is_flag=True,
+    help="Forward to a running 'repo-lint daemon' (falls back to an in-process run if none is listening)",
+)
 # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
 def check(
     verbose,
@@ -451,6 +492,7 @@ def check(
     jobs,
     progress,
     filter_out_lang,
+    use_daemon,
 ):
     """Run linting checks without modifying files.
 
@@ -481,6 +523,10 @@ def check(
       $ repo-lint check --report report.json --format json
       Generate JSON report for CI artifacts
 
+    Example 6 — Warm daemon (editor/pre-commit integrations):
+      $ repo-lint check --use-daemon --changed-only
+      Answer from a running 'repo-lint daemon' instead of a cold start
+
     \b
     OUTPUT MODES:
     - Interactive (TTY): Rich formatting with colors, panels, and tables
@@ -531,9 +577,20 @@ def check(
     :param fail_fast: Stop after first tool failure
     :param jobs: Number of parallel jobs (default: AUTO based on CPU count, env: REPO_LINT_JOBS)
     :param progress: Show progress bar during parallel execution
+    :param use_daemon: Forward the check to a running repo-lint daemon when available
     """
     import argparse  # Local import - only needed for Namespace creation
 
+    if use_daemon:
+        from tools.repo_lint import daemon
+
+        # The daemon runs this same command in-process; never forward from inside it
+        if not daemon.is_serving():
+            argv = _params_to_argv(click.get_current_context(), exclude=("use_daemon",))
+            exit_code = daemon.forward_command(argv)
+            if exit_code is not None:
+                sys.exit(exit_code)
+
     # Resolve language filter with precedence and warning
     effective_lang = _resolve_language_filter(lang, only)
 
@@ -954,6 +1011,259 @@ def doctor(ci, output_format, report):
     sys.exit(exit_code)
 
 
+# Vectors command
+@cli.command("vectors")
+@click.option(
+    "--lang",
+    type=click.Choice(["python", "bash", "powershell", "perl"], case_sensitive=False),
+    help="Only run vectors for this language",
+)
+@click.option(
+    "--id",
+    "ids",
+    multiple=True,
+    metavar="VECTOR_ID",
+    help="Only run this vector (repeatable)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(1, None),
+    help="Vectors to run concurrently (default: CPU count)",
+)
+@click.option(
+    "--json",
+    "output_json",
+    is_flag=True,
+    help="Print a JSON report with per-vector results and timings",
+)
+@click.option(
+    "--vectors-dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory of vector files (default: conformance/repo-lint/vectors/docstrings)",
+)
+def vectors_cmd(lang, ids, jobs, output_json, vectors_dir):
+    """Run the docstring conformance vectors.
+
+    \b
+    WHAT THIS DOES:
+    Runs the docstring validator for each vector's fixture in-process, on a
+    thread pool, and compares the reported missing-docstring violations
+    (rule, path, symbol, kind, line, severity) with the vector's
+    expected_violations. Prints one line per vector with its duration.
+
+    \b
+    EXAMPLES:
+    Example 1 — Run every vector:
+      $ repo-lint vectors
+
+    Example 2 — One language, JSON report for CI artifacts:
+      $ repo-lint vectors --lang python --json > vectors.json
+
+    Example 3 — Re-run a single vector while fixing it:
+      $ repo-lint vectors --id bash-docstring-001
+
+    \b
+    EXIT CODES:
+    - 0: All vectors passed (vectors whose parser is not installed are skipped)
+    - 1: One or more vectors failed or errored
+    - 3: No vectors found, unknown --id or unreadable vector file
+
+    :param lang: Language filter
+    :param ids: Vector IDs to run
+    :param jobs: Worker threads
+    :param output_json: Print a JSON report
+    :param vectors_dir: Vector directory override
+    """
+    import argparse  # Local import
+
+    from tools.repo_lint.vectors import cmd_vectors
+
+    args = argparse.Namespace(
+        lang=lang.lower() if lang else None,
+        ids=ids,
+        jobs=jobs,
+        json=output_json,
+        vectors_dir=vectors_dir,
+    )
+    sys.exit(cmd_vectors(args))
+
+
+# Daemon command
+@cli.command("daemon")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket path (default: per-user, per-repo path in the temp dir; env: REPO_LINT_DAEMON_SOCKET)",
+)
+@click.option(
+    "--idle-timeout",
+    type=click.IntRange(0, None),
+    default=1800,
+    show_default=True,
+    metavar="SECONDS",
+    help="Exit after this many seconds without a request (0 = never)",
+)
+@click.option(
+    "--status",
+    "show_status",
+    is_flag=True,
+    help="Report whether a daemon is running for this repository and exit",
+)
+@click.option(
+    "--stop",
+    is_flag=True,
+    help="Ask a running daemon to shut down and exit",
+)
+def daemon_cmd(socket_path, idle_timeout, show_status, stop):
+    """Run a long-lived repo-lint server with warm state.
+
+    \b
+    WHAT THIS DOES:
+    Starts a foreground process listening on a local Unix socket. It keeps
+    configs, the tracked-file inventory and all repo-lint modules loaded, so
+    'repo-lint check --use-daemon' clients skip Python start-up and config
+    parsing. Caches are invalidated when config files or the git index change.
+
+    \b
+    EXAMPLES:
+    Example 1 — Start the daemon (background it with your shell or service manager):
+      $ repo-lint daemon &
+
+    Example 2 — Forward checks from an editor or pre-commit hook:
+      $ repo-lint check --use-daemon --changed-only
+
+    Example 3 — Status and shutdown:
+      $ repo-lint daemon --status
+      $ repo-lint daemon --stop
+
+    \b
+    EXIT CODES:
+    - 0: Clean shutdown, or --status/--stop found a running daemon
+    - 1: --status/--stop found no running daemon
+    - 3: Could not start (unsupported platform or socket already in use)
+
+    :param socket_path: Unix socket path override
+    :param idle_timeout: Seconds without a request before exiting
+    :param show_status: Report daemon status and exit
+    :param stop: Ask a running daemon to shut down
+    """
+    from tools.repo_lint import daemon
+
+    if show_status or stop:
+        response = daemon.send_request({"op": "shutdown" if stop else "status"}, socket_path)
+        if not response or not response.get("ok"):
+            print("No repo-lint daemon is running for this repository", file=sys.stderr)
+            sys.exit(1)
+        if stop:
+            print("repo-lint daemon stopping")
+        else:
+            print(json.dumps(response, indent=2))
+        sys.exit(0)
+
+    sys.exit(daemon.run_daemon(cli, socket_path, idle_timeout=idle_timeout))
+
+
+# Watch command
+@cli.command("watch")
+@click.option(
+    "--ci",
+    "ci_mode",
+    is_flag=True,
+    help="Plain output (no colors, no screen clearing)",
+)
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    help="Show verbose runner output",
+)
+@click.option(
+    "--lang",
+    type=click.Choice(
+        ["python", "bash", "powershell", "perl", "yaml", "toml", "json", "rust", "markdown"], case_sensitive=False
+    ),
+    help="Only re-lint files of this language",
+)
+@click.option(
+    "--tool",
+    multiple=True,
+    help="Filter to specific tool(s) - repeatable (e.g., --tool ruff)",
+)
+@click.option(
+    "--poll",
+    "force_poll",
+    is_flag=True,
+    help="Use the stdlib polling watcher even if 'watchdog' is installed",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(0.05, None),
+    default=1.0,
+    show_default=True,
+    help="Polling interval in seconds (polling watcher only)",
+)
+@click.option(
+    "--debounce",
+    type=click.FloatRange(0.0, None),
+    default=0.3,
+    show_default=True,
+    help="Seconds of quiet after a change before re-linting",
+)
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def watch_cmd(ci_mode, verbose, lang, tool, force_poll, interval, debounce):
+    """Watch tracked files and re-lint only what changed.
+
+    \b
+    WHAT THIS DOES:
+    Waits for git-tracked files to change, debounces bursts of saves, maps the
+    changed paths to the runners that own them and re-runs those runners on
+    just the changed files. The report is re-rendered after every batch.
+
+    \b
+    EXAMPLES:
+    Example 1 — Most common usage:
+      $ repo-lint watch
+
+    Example 2 — Python only, ruff only:
+      $ repo-lint watch --lang python --tool ruff
+
+    Example 3 — Network filesystems or containers without inotify:
+      $ repo-lint watch --poll --interval 2
+
+    \b
+    WATCHERS:
+    - watchdog (optional 'pip install watchdog'): event-driven, used automatically
+    - polling (stdlib): stats every tracked file each --interval seconds
+
+    \b
+    EXIT CODES:
+    - 0: Stopped with Ctrl+C
+    - 3: Internal error
+
+    :param ci_mode: Plain output
+    :param verbose: Show verbose runner output
+    :param lang: Only re-lint files of this language
+    :param tool: Filter to specific tool(s)
+    :param force_poll: Use the polling watcher
+    :param interval: Polling interval in seconds
+    :param debounce: Seconds of quiet before re-linting
+    """
+    from tools.repo_lint.watch import run_watch
+
+    exit_code = run_watch(
+        ci_mode=ci_mode,
+        verbose=verbose,
+        only=lang,
+        tool_filter=list(tool) if tool else None,
+        force_poll=force_poll,
+        interval=interval,
+        debounce=debounce,
+    )
+    sys.exit(exit_code)
+
+
 # List-langs command
 @cli.command("list-langs")
 def list_langs():
@@ -58,16 +58,9 @@ from tools.repo_lint.install.install_helpers import (
 from tools.repo_lint.logging_utils import configure_logging, set_verbose_mode
 from tools.repo_lint.policy import get_policy_summary, load_policy, validate_policy
 from tools.repo_lint.reporting import print_install_instructions, report_results
-from tools.repo_lint.runners.bash_runner import BashRunner
-from tools.repo_lint.runners.json_runner import JsonRunner
-from tools.repo_lint.runners.markdown_runner import MarkdownRunner
+from tools.repo_lint.runners.base import get_tracked_files, set_job_budget
+from tools.repo_lint.runners.language_runners import build_language_runners
 from tools.repo_lint.runners.naming_runner import NamingRunner
-from tools.repo_lint.runners.perl_runner import PerlRunner
-from tools.repo_lint.runners.powershell_runner import PowerShellRunner
-from tools.repo_lint.runners.python_runner import PythonRunner
-from tools.repo_lint.runners.rust_runner import RustRunner
-from tools.repo_lint.runners.toml_runner import TomlRunner
-from tools.repo_lint.runners.yaml_runner import YAMLRunner
 
 
 def positive_int(value):
@@ -214,23 +207,16 @@ def _run_all_runners(args: argparse.Namespace, mode: str, action_callback) -> in
                 "WARNING: Concurrency disabled via REPO_LINT_DISABLE_CONCURRENCY",
             )
 
+    # Chunked file-list tools (shellcheck, yamllint, ...) across all runners share the --jobs budget
+    set_job_budget(jobs)
+
     # Debug timing mode
     # TODO: Consider removing debug timing mode or making it development-only  # pylint: disable=fixme
     # FUTURE: Evaluate if this complexity is needed in production (Copilot review comment)
     debug_timing = os.getenv("REPO_LINT_DEBUG_TIMING", "").lower() in ("1", "true", "yes")
 
     # Define all runners
-    all_runners = [
-        ("python", "Python", PythonRunner(ci_mode=args.ci, verbose=args.verbose)),
-        ("bash", "Bash", BashRunner(ci_mode=args.ci, verbose=args.verbose)),
-        ("powershell", "PowerShell", PowerShellRunner(ci_mode=args.ci, verbose=args.verbose)),
-        ("perl", "Perl", PerlRunner(ci_mode=args.ci, verbose=args.verbose)),
-        ("yaml", "YAML", YAMLRunner(ci_mode=args.ci, verbose=args.verbose)),
-        ("toml", "TOML", TomlRunner(ci_mode=args.ci, verbose=args.verbose)),
-        ("json", "JSON/JSONC", JsonRunner(ci_mode=args.ci, verbose=args.verbose)),
-        ("rust", "Rust", RustRunner(ci_mode=args.ci, verbose=args.verbose)),
-        ("markdown", "Markdown", MarkdownRunner(ci_mode=args.ci, verbose=args.verbose)),
-    ]
+    all_runners = build_language_runners(ci_mode=args.ci, verbose=args.verbose)
 
     # Add cross-language runners (run on all files, not language-specific)
     # Naming runner runs separately after language-specific checks
@@ -801,8 +787,13 @@ def cmd_fix(args: argparse.Namespace) -> int:
         from datetime import datetime
         from pathlib import Path
 
-        from tools.repo_lint.forensics import print_forensics_summary, save_forensics
-        from tools.repo_lint.unsafe_fixers import apply_unsafe_fixes
+        from tools.repo_lint.forensics import (
+            PatchStream,
+            get_forensics_paths,
+            print_forensics_summary,
+            save_forensics_log,
+        )
+        from tools.repo_lint.unsafe_fixers import iter_unsafe_fixes
 
         # Guard: Unsafe fixes only supported for Python
         only_language = getattr(args, "only", None)
@@ -818,30 +809,19 @@ def cmd_fix(args: argparse.Namespace) -> int:
             print("", file=sys.stderr)
             return ExitCode.UNSAFE_VIOLATION
 
-        # Collect all Python files to process
+        # Collect tracked Python files to process (same inventory and exclusions as the runners)
         # At this point, only_language is either "python" or None (all languages)
         repo_root = Path.cwd()
-        all_files = []
-
-        if only_language == "python" or only_language is None:
-            all_files.extend(repo_root.rglob("*.py"))
-
-        # Filter out common non-source directories and test fixtures
-        all_files = [
-            f
-            for f in all_files
-            if not any(
-                part in f.parts
-                for part in [".venv", ".venv-lint", "venv", "__pycache__", ".git", "dist", "conformance"]
-            )
-        ]
+        all_files = [Path(f) for f in get_tracked_files(["*.py"], repo_root)]
 
+        # Fixers run in a process pool; each file's diff is streamed into the patch as it completes
         start_time = datetime.now()
-        results = apply_unsafe_fixes(all_files)
+        patch_path, log_path = get_forensics_paths(start_time)
+        with PatchStream(patch_path) as patch:
+            results = [patch.write(result) for result in iter_unsafe_fixes(all_files, jobs=getattr(args, "jobs", None))]
         end_time = datetime.now()
 
-        # Generate forensics
-        patch_path, log_path = save_forensics(results, start_time, end_time)
+        save_forensics_log(log_path, results, start_time, end_time)
         print_forensics_summary(patch_path, log_path, results)
 
         # After unsafe fixes, run normal fix to clean up formatting
@@ -154,6 +154,20 @@ class RunnerError(RepoLintError):
     """Raised when a runner encounters an error."""
 
 
+class CommandReplayError(RepoLintError):
+    """Raised when a replayed run issues a command that was not recorded."""
+
+    def __init__(self, argv: List[str], recording: str):
+        """Initialize CommandReplayError.
+
+        :param argv: Command that has no recorded result
+        :param recording: Path of the recording file
+        """
+        self.argv = argv
+        self.recording = recording
+        super().__init__(f"No recorded result for command {argv!r} in {recording}")
+
+
 # File filtering utilities
 
 
@@ -161,7 +175,7 @@ def filter_excluded_paths(files: List[str], exclude_patterns: List[str] | None =
     """Filter out files matching exclusion patterns.
 
     :param files: List of file paths to filter
-    :param exclude_patterns: List of path patterns to exclude (uses substring matching)
+    :param exclude_patterns: List of gitwildmatch patterns to exclude
     :returns: Filtered list of file paths
 
     :Examples:
@@ -172,14 +186,17 @@ def filter_excluded_paths(files: List[str], exclude_patterns: List[str] | None =
             # Result: ["src/main.py"]
 
     :Note:
-        Uses simple substring matching. A file is excluded if any pattern
-        appears anywhere in its path. This is consistent with how git pathspecs
-        work for directory exclusions.
+        Patterns use gitignore semantics via the shared compiled matcher
+        (tools.repo_lint.path_matcher): a directory pattern such as
+        "scripts/tests/fixtures/" excludes everything under that directory.
     """
+    # pylint: disable=import-outside-toplevel
+    from tools.repo_lint.path_matcher import compile_patterns
+
     if exclude_patterns is None:
         exclude_patterns = get_default_exclude_patterns()
 
-    return [f for f in files if not any(pattern in f for pattern in exclude_patterns)]
+    return compile_patterns(exclude_patterns).filter(files)
 
 
 def get_default_exclude_patterns() -> List[str]:
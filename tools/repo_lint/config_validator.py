@@ -39,6 +39,19 @@ SEMANTIC_VERSION_PATTERN = r"^\d+\.\d+\.\d+$"
 # Default allowed top-level keys in config files
 DEFAULT_ALLOWED_KEYS = ["config_type", "version", "languages", "exclusions", "validation", "settings", "description"]
 
+# libyaml-backed loader is several times faster than the pure-Python SafeLoader
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load_yaml(content: str) -> Any:
+    """Parse YAML text with the fastest available safe loader.
+
+    :param content: YAML document text
+    :returns: Parsed YAML data
+    :raises yaml.YAMLError: If YAML is invalid
+    """
+    return yaml.load(content, Loader=_YAML_SAFE_LOADER)  # nosec B506 - safe loader
+
 
 class ConfigValidationError(Exception):
     """Exception raised when config validation fails.
@@ -202,7 +215,13 @@ def _check_unknown_keys(file_path: Path, data: Dict[str, Any], allowed_keys: Lis
         )
 
 
-def validate_config_file(file_path: Path, config_type: str, allowed_keys: List[str] | None = None) -> Dict[str, Any]:
+def validate_config_file(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    file_path: Path,
+    config_type: str,
+    allowed_keys: List[str] | None = None,
+    content: str | None = None,
+    data: Any = None,
+) -> Dict[str, Any]:
     """Validate a repo_lint YAML configuration file.
 
     :Purpose:
@@ -217,24 +236,28 @@ def validate_config_file(file_path: Path, config_type: str, allowed_keys: List[s
     :param config_type: Expected config_type value (e.g., 'repo-lint-naming-rules')
     :param allowed_keys: Optional list of allowed top-level keys
                         Default: ['config_type', 'version', 'languages', 'exclusions']
+    :param content: Raw file content if the caller already read it (skips the read)
+    :param data: Parsed content if the caller already parsed it (skips the parse)
     :returns: Parsed and validated config data
     :raises ConfigValidationError: If validation fails (with detailed error message)
     :raises FileNotFoundError: If config file does not exist
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"Config file not found: {file_path}")
+    if content is None:
+        if not file_path.exists():
+            raise FileNotFoundError(f"Config file not found: {file_path}")
 
-    # Read raw content for structure validation
-    content = file_path.read_text()
+        # Read raw content for structure validation
+        content = file_path.read_text(encoding="utf-8")
 
     # Validate YAML structure (document markers, single-document)
     _validate_yaml_structure(file_path, content)
 
     # Parse YAML
-    try:
-        data = yaml.safe_load(content)
-    except yaml.YAMLError as e:
-        raise ConfigValidationError(str(file_path), f"YAML parsing error: {e}") from e
+    if data is None:
+        try:
+            data = safe_load_yaml(content)
+        except yaml.YAMLError as e:
+            raise ConfigValidationError(str(file_path), f"YAML parsing error: {e}") from e
 
     if not isinstance(data, dict):
         raise ConfigValidationError(str(file_path), f"Config must be a YAML mapping/dict, got {type(data).__name__}")
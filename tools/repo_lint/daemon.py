@@ -0,0 +1,390 @@
+"""Long-running repo-lint daemon with warm in-process state.
+
+:Purpose:
+    Every `repo-lint check` normally starts a fresh Python process that re-imports
+    the package, re-reads every YAML config and re-enumerates tracked files.
+    The daemon keeps one process alive on a local Unix socket so that those costs
+    are paid once. Thin clients (`repo-lint check --use-daemon`) forward their
+    command line to it and print the captured output.
+
+:Warm State:
+    - Parsed YAML configs (yaml_loader config cache, re-validated by file mtime/size)
+    - Tracked-file inventory (git ls-files memo, invalidated when .git/index changes)
+    - Imported runner, validator and reporting modules
+
+:Protocol:
+    One newline-terminated JSON object per connection in each direction.
+
+    Request::
+
+        {"op": "check", "argv": ["check", "--ci"], "cwd": "/path/to/repo",
+         "env": {"REPO_LINT_JOBS": "4"}}
+        {"op": "ping"} | {"op": "status"} | {"op": "shutdown"}
+
+    Response::
+
+        {"ok": true, "exit_code": 0, "stdout": "...", "stderr": "..."}
+        {"ok": false, "error": "..."}
+
+:Environment Variables:
+    REPO_LINT_DAEMON_SOCKET: Override the socket path (default: per-user, per-repo
+        socket in the system temp directory)
+
+:Exit Codes:
+    The daemon itself exits with:
+    - 0: Shut down cleanly (shutdown request or idle timeout)
+    - 3: Could not start (unsupported platform, socket already in use)
+
+:Examples:
+    Start the daemon in the foreground::
+
+        repo-lint daemon
+
+    Forward a check to it::
+
+        repo-lint check --use-daemon --ci
+
+    Stop it::
+
+        repo-lint daemon --stop
+
+:Notes:
+    - Requests are served one at a time: cmd_check redirects process-wide
+      stdout/stderr and changes directory, so concurrent requests would interleave.
+    - Output is captured to a string buffer, so results render as non-TTY (plain).
+    - A check is refused (and the client runs it in-process) unless the client's
+      REPO_LINT_* environment matches the daemon's: settings such as
+      REPO_LINT_JOBS or REPO_LINT_RECORD_COMMANDS are read from the daemon process.
+    - External tools (black, shellcheck, PPI, pwsh, ...) still run as subprocesses
+      per request; only Python-side state is kept warm.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from tools.repo_lint.common import ExitCode
+from tools.repo_lint.logging_utils import get_logger
+from tools.repo_lint.repo_utils import find_repo_root
+
+logger = get_logger(__name__)
+
+# Default idle timeout before the daemon exits on its own (seconds)
+DEFAULT_IDLE_TIMEOUT = 1800
+
+# Client-side connect/read timeout (seconds). Checks can take a while on big trees.
+CLIENT_TIMEOUT = 600
+
+# Commands a client may forward to the daemon. fix/install mutate state and
+# stay in-process on the client side.
+FORWARDABLE_COMMANDS = ("check",)
+
+# Read by get_socket_path() to find the daemon, so it may differ between client and daemon
+_ENV_IGNORED = ("REPO_LINT_DAEMON_SOCKET",)
+
+# True while run_daemon() is serving in this process (prevents self-forwarding)
+_SERVING = False
+
+
+def get_socket_path(repo_root: Path | None = None) -> Path:
+    """Get the Unix socket path for a repository's daemon.
+
+    :param repo_root: Repository root (auto-detected if None)
+    :returns: Socket path (REPO_LINT_DAEMON_SOCKET if set, else a per-user, per-repo temp path)
+
+    :Note:
+        Unix socket paths are limited to ~104 bytes, so the repository is
+        identified by a short hash instead of embedding its full path.
+    """
+    env_socket = os.environ.get("REPO_LINT_DAEMON_SOCKET")
+    if env_socket:
+        return Path(env_socket)
+
+    repo_root = (repo_root or find_repo_root()).resolve()
+    digest = hashlib.sha256(str(repo_root).encode("utf-8")).hexdigest()[:12]
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(tempfile.gettempdir()) / f"repo-lint-{uid}-{digest}.sock"
+
+
+def is_supported() -> bool:
+    """Check whether the platform supports Unix domain sockets.
+
+    :returns: True if AF_UNIX is available, False otherwise (e.g. older Windows Pythons)
+    """
+    return hasattr(socket, "AF_UNIX") and hasattr(socketserver, "UnixStreamServer")
+
+
+def is_serving() -> bool:
+    """Check whether this process is the daemon.
+
+    :returns: True while run_daemon() is serving requests in this process
+    """
+    return _SERVING
+
+
+def get_forwarded_env() -> Dict[str, str]:
+    """Get the environment variables that must agree between client and daemon.
+
+    :returns: REPO_LINT_* variables of this process, except those in _ENV_IGNORED
+    """
+    return {key: value for key, value in os.environ.items() if key.startswith("REPO_LINT_") and key not in _ENV_IGNORED}
+
+
+def _run_cli(argv: List[str], command: Any) -> Tuple[int, str, str]:
+    """Run a repo-lint CLI command in-process and capture its output.
+
+    :param argv: Command-line arguments (without program name)
+    :param command: Click command to invoke (the repo-lint CLI group)
+    :returns: Tuple of (exit_code, stdout, stderr)
+    """
+    # pylint: disable=import-outside-toplevel
+    import click
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = ExitCode.SUCCESS
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            result = command.main(
+                args=argv, prog_name="repo-lint", standalone_mode=False, auto_envvar_prefix="REPO_LINT"
+            )
+            if isinstance(result, int):
+                exit_code = result
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else ExitCode.INTERNAL_ERROR
+        except click.exceptions.Exit as e:
+            exit_code = e.exit_code
+        except click.ClickException as e:
+            e.show(file=stderr)
+            exit_code = e.exit_code
+        except Exception as e:
+            # POLICY: Broad exception catch acceptable here (daemon request boundary)
+            # One bad request must not take down the daemon; convert it to an error result.
+            # See: docs/contributing/python-exception-handling-policy.md
+            print(f"❌ Internal error: {e}", file=stderr)
+            exit_code = ExitCode.INTERNAL_ERROR
+    return int(exit_code), stdout.getvalue(), stderr.getvalue()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Read one JSON request line, dispatch it, write one JSON response line."""
+
+    def handle(self) -> None:
+        """Handle a single client connection."""
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line.decode("utf-8"))
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except (UnicodeDecodeError, ValueError) as e:
+            response: Dict[str, Any] = {"ok": False, "error": f"Malformed request: {e}"}
+        else:
+            response = self.server.dispatch(request)
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+# socketserver.UnixStreamServer is missing where AF_UNIX is unavailable; run_daemon()
+# checks is_supported() before ever instantiating the server.
+_BaseServer = getattr(socketserver, "UnixStreamServer", socketserver.TCPServer)
+
+
+class DaemonServer(_BaseServer):
+    """Unix socket server that runs repo-lint commands in a warm process.
+
+    :Purpose:
+        Serves requests sequentially, keeping configs and the file inventory
+        cached between requests, and exits after an idle timeout.
+    """
+
+    def __init__(self, socket_path: Path, repo_root: Path, command: Any, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """Bind the daemon socket.
+
+        :param socket_path: Path of the Unix socket to listen on
+        :param repo_root: Repository root the daemon serves
+        :param command: Click command that forwarded requests run (passed in by the
+            CLI so this module does not import it back)
+        :param idle_timeout: Seconds without a request before the daemon exits (0 disables)
+        """
+        self.socket_path = Path(socket_path)
+        self.repo_root = Path(repo_root).resolve()
+        self.command = command
+        self.started_at = time.time()
+        self.requests_served = 0
+        self._stop_requested = False
+        # Create the socket owner-only from the start rather than chmod-ing it after bind
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+        self.timeout = idle_timeout or None
+
+    def handle_timeout(self) -> None:
+        """Stop serving once the idle timeout elapses without a request."""
+        logger.info("repo-lint daemon idle for %ss, shutting down", self.timeout)
+        self._stop_requested = True
+
+    def serve_until_stopped(self) -> None:
+        """Serve requests until a shutdown request or idle timeout."""
+        while not self._stop_requested:
+            self.handle_request()
+
+    def server_close(self) -> None:
+        """Close the listening socket and remove the socket file."""
+        super().server_close()
+        with contextlib.suppress(OSError):
+            self.socket_path.unlink()
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a decoded request.
+
+        :param request: Request object (see module docstring for the protocol)
+        :returns: Response object
+        """
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "status":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "repo_root": str(self.repo_root),
+                "uptime": time.time() - self.started_at,
+                "requests_served": self.requests_served,
+            }
+        if op == "shutdown":
+            self._stop_requested = True
+            return {"ok": True}
+        if op != "check":
+            return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+        argv = request.get("argv")
+        if not isinstance(argv, list) or not argv or argv[0] not in FORWARDABLE_COMMANDS:
+            return {"ok": False, "error": f"Only {', '.join(FORWARDABLE_COMMANDS)} can be forwarded"}
+
+        env = request.get("env") or {}
+        daemon_env = get_forwarded_env()
+        if env != daemon_env:
+            differing = sorted(key for key in set(env) | set(daemon_env) if env.get(key) != daemon_env.get(key))
+            return {"ok": False, "error": f"Environment differs from the daemon's: {', '.join(differing)}"}
+
+        cwd = Path(request.get("cwd") or self.repo_root).resolve()
+        if cwd != self.repo_root and self.repo_root not in cwd.parents:
+            return {"ok": False, "error": f"Daemon serves {self.repo_root}, not {cwd}"}
+
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(cwd)
+            exit_code, out, err = _run_cli([str(arg) for arg in argv], self.command)
+        finally:
+            os.chdir(previous_cwd)
+        self.requests_served += 1
+        return {"ok": True, "exit_code": exit_code, "stdout": out, "stderr": err}
+
+
+def send_request(request: Dict[str, Any], socket_path: Path | None = None) -> Dict[str, Any] | None:
+    """Send one request to a running daemon.
+
+    :param request: Request object
+    :param socket_path: Socket path (defaults to get_socket_path())
+    :returns: Decoded response, or None if no daemon is listening
+    """
+    if not is_supported():
+        return None
+    socket_path = socket_path or get_socket_path()
+    if not socket_path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        # Stale socket file or daemon died mid-request
+        return None
+
+    if not line:
+        return None
+    try:
+        return json.loads(line.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError):
+        return None
+
+
+def forward_command(argv: List[str], socket_path: Path | None = None) -> int | None:
+    """Forward a CLI invocation to the daemon and replay its output.
+
+    :param argv: Command-line arguments (e.g. ["check", "--ci"])
+    :param socket_path: Socket path (defaults to get_socket_path())
+    :returns: Exit code from the daemon, or None if the command could not be forwarded,
+        e.g. because the REPO_LINT_* environment differs (the caller should then run it
+        in-process)
+    """
+    request = {"op": "check", "argv": argv, "cwd": os.getcwd(), "env": get_forwarded_env()}
+    response = send_request(request, socket_path)
+    if not response or not response.get("ok"):
+        if response:
+            logger.debug("Daemon rejected request: %s", response.get("error"))
+        return None
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stderr.flush()
+    return int(response.get("exit_code", ExitCode.INTERNAL_ERROR))
+
+
+def run_daemon(command: Any, socket_path: Path | None = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> int:
+    """Start the daemon in the foreground and serve until stopped.
+
+    :param command: Click command that forwarded requests run (the repo-lint CLI group)
+    :param socket_path: Socket path (defaults to get_socket_path())
+    :param idle_timeout: Seconds without a request before exiting (0 disables)
+    :returns: Exit code (0=clean shutdown, 3=could not start)
+    """
+    # pylint: disable=import-outside-toplevel
+    from tools.repo_lint.runners.base import set_tracked_files_cache
+
+    global _SERVING  # pylint: disable=global-statement
+
+    if not is_supported():
+        print("❌ repo-lint daemon requires Unix domain socket support", file=sys.stderr)
+        return ExitCode.INTERNAL_ERROR
+
+    repo_root = find_repo_root()
+    socket_path = socket_path or get_socket_path(repo_root)
+
+    if socket_path.exists():
+        if send_request({"op": "ping"}, socket_path):
+            print(f"❌ A repo-lint daemon is already listening on {socket_path}", file=sys.stderr)
+            return ExitCode.INTERNAL_ERROR
+        # Stale socket from a daemon that didn't shut down cleanly
+        socket_path.unlink()
+
+    server = DaemonServer(socket_path, repo_root, command, idle_timeout=idle_timeout)
+    set_tracked_files_cache(True)
+    _SERVING = True
+    print(f"repo-lint daemon listening on {socket_path} (pid {os.getpid()})", file=sys.stderr)
+    try:
+        server.serve_until_stopped()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _SERVING = False
+        server.server_close()
+        set_tracked_files_cache(False)
+    return ExitCode.SUCCESS
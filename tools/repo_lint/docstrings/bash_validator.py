@@ -32,7 +32,13 @@ import sys
 from pathlib import Path
 from typing import List
 
-from .common import ValidationError, check_pragma_ignore, check_symbol_pragma_exemption, validate_exit_codes_content
+from .common import (
+    SectionPatterns,
+    ValidationError,
+    check_pragma_ignore,
+    check_symbol_pragma_exemption,
+    validate_exit_codes_content,
+)
 
 # Import tree-sitter helper if available
 try:
@@ -65,6 +71,8 @@ class BashValidator:
 
     SECTION_NAMES = ["DESCRIPTION:", "USAGE:", "INPUTS:", "OUTPUTS:", "EXAMPLES:"]
 
+    _SECTIONS = SectionPatterns(SECTION_NAMES, REQUIRED_SECTIONS, re.IGNORECASE)
+
     @staticmethod
     def validate(file_path: Path, content: str) -> List[ValidationError]:
         """Validate Bash script header and function docstrings.
@@ -96,9 +104,8 @@ class BashValidator:
 
         :returns: ValidationError if header is missing required sections, None otherwise
         """
-        # Check for top-of-file comment block (first 100 lines)
-        lines = content.split("\n")[:100]
-        header = "\n".join(lines)
+        # Check for top-of-file comment block (first 100 lines; only those are split off)
+        header = "\n".join(content.split("\n", 100)[:100])
 
         # Check shebang
         if not content.startswith("#!/usr/bin/env bash") and not content.startswith("#!/bin/bash"):
@@ -108,16 +115,9 @@ class BashValidator:
                 "Expected '#!/usr/bin/env bash' shebang",
             )
 
-        missing = []
-        for i, pattern in enumerate(BashValidator.REQUIRED_SECTIONS):
-            section_name = BashValidator.SECTION_NAMES[i]
-
-            # Check if section is ignored via pragma
-            if check_pragma_ignore(content, section_name):
-                continue
-
-            if not re.search(pattern, header, re.IGNORECASE):
-                missing.append(section_name)
+        found = BashValidator._SECTIONS.index(header)
+        # Pragmas are only looked up for the sections that are actually missing
+        missing = [name for name in BashValidator._SECTIONS.missing(found) if not check_pragma_ignore(content, name)]
 
         # Basic content validation for exit codes (if OUTPUTS present)
         if "OUTPUTS:" not in missing:
@@ -133,6 +133,7 @@ class BashValidator:
                         str(file_path),
                         ["OUTPUTS content"],
                         f"Exit codes incomplete: {exit_codes_error}",
+                        line_number=found.get("OUTPUTS:"),
                     )
 
         if missing:
@@ -140,6 +141,7 @@ class BashValidator:
                 str(file_path),
                 missing,
                 "Expected top-of-file comment block with # prefix",
+                line_number=1,
             )
         return None
 
@@ -26,8 +26,11 @@ validators, including the ValidationError class and helper functions.
 
 from __future__ import annotations
 
+import contextlib
+import mmap
 import re
-from typing import List
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, Sequence
 
 # Module-level flag for content checks (set by command-line arg in main script)
 SKIP_CONTENT_CHECKS = False
@@ -210,3 +213,160 @@ def check_symbol_pragma_exemption(
             return True
 
     return False
+
+
+class SectionPatterns:
+    """A validator's section header patterns, compiled for single-pass lookup.
+
+    The patterns are joined into one alternation, so finding the sections a
+    text has scans it once however many sections are required, instead of
+    once per section. Each hit is then attributed to its sections by matching
+    the individual patterns at that position only. The result is the same as
+    a separate re.search() per pattern.
+
+    :ivar names: Section names, in the order missing sections are reported
+    """
+
+    def __init__(self, names: Sequence[str], patterns: Sequence[str], flags: int = 0):
+        """Compile the section patterns.
+
+        :param names: Section name for each pattern (as used in missing_sections)
+        :param patterns: Regex matching each section header
+        :param flags: re flags applied to every pattern (e.g. re.MULTILINE)
+        :raises ValueError: If names and patterns differ in length
+        """
+        if len(names) != len(patterns):
+            raise ValueError(f"Got {len(names)} section names for {len(patterns)} patterns")
+        self.names = list(names)
+        # Non-capturing groups: named groups would stop re from skipping ahead
+        # to the patterns' possible first characters
+        alternation = "|".join(f"(?:{pattern})" for pattern in patterns)
+        self._compiled = {
+            str: (re.compile(alternation, flags), [re.compile(pattern, flags) for pattern in patterns]),
+            bytes: (
+                re.compile(alternation.encode(), flags),
+                [re.compile(pattern.encode(), flags) for pattern in patterns],
+            ),
+        }
+
+    def index(self, text: str | bytes | mmap.mmap, first_line: int = 1) -> Dict[str, int]:
+        """Find the sections present in a text, in one pass.
+
+        Scanning stops as soon as every section has been seen.
+
+        :param text: Text to scan, or raw bytes (e.g. from mapped_file())
+        :param first_line: Line number of the text's first line within its file
+        :returns: Section name -> line number of its first occurrence (absent sections have no entry)
+        """
+        is_str = isinstance(text, str)
+        alternation, patterns = self._compiled[str if is_str else bytes]
+        newline = "\n" if is_str else b"\n"
+        found: Dict[str, int] = {}
+        line, position = first_line, 0
+        match = alternation.search(text)
+        while match and len(found) < len(self.names):
+            start = match.start()
+            line += text[position:start].count(newline)
+            position = start
+            for name, pattern in zip(self.names, patterns):
+                if name not in found and pattern.match(text, start):
+                    found[name] = line
+            # Resume one character on (not at the match end) so no overlapping match is skipped
+            match = alternation.search(text, start + 1)
+        return found
+
+    def missing(self, found: Dict[str, int]) -> List[str]:
+        """Get the sections absent from an index.
+
+        :param found: Result of index()
+        :returns: Missing section names, in declaration order
+        """
+        return [name for name in self.names if name not in found]
+
+
+def line_at(text: str | bytes | mmap.mmap, offset: int) -> int:
+    """Get the 1-based line number of an offset in a text.
+
+    :param text: Text, or raw bytes
+    :param offset: Character (or byte) offset into text
+    :returns: Line number containing offset
+    """
+    return text[:offset].count("\n" if isinstance(text, str) else b"\n") + 1
+
+
+_LINE_END = re.compile(rb"\r\n|\r|\n")
+_CHUNK_SIZE = 8192
+
+
+def _universal_lines(f: BinaryIO) -> Iterator[bytes]:
+    """Split a binary stream into lines on "\n", "\r\n" or a lone "\r".
+
+    :param f: Stream to read in chunks
+    :returns: Iterator over lines without their line ending
+    """
+    pending = bytearray()
+    while True:
+        chunk = f.read(_CHUNK_SIZE)
+        # Earlier bytes hold no line ending (bar a held-back "\r"), so only rescan the tail
+        searched = max(len(pending) - 1, 0)
+        pending += chunk
+        start = 0
+        for match in _LINE_END.finditer(pending, searched):
+            # A trailing "\r" may be the first half of a "\r\n" split across chunks
+            if chunk and match.end() == len(pending) and match.group() == b"\r":
+                break
+            yield bytes(pending[start : match.start()])
+            start = match.end()
+        del pending[:start]
+        if not chunk:
+            if pending:
+                yield bytes(pending)
+            return
+
+
+def read_leading_lines(
+    file_path: Path, max_lines: int | None = None, stop: Callable[[str], bool] | None = None
+) -> List[str]:
+    """Read lines from the top of a file, stopping at a header boundary.
+
+    Only the part of the file up to the boundary is read and decoded, so
+    header checks on multi-megabyte files cost the same as on small ones.
+
+    :param file_path: File to read (UTF-8)
+    :param max_lines: Stop after this many lines
+    :param stop: Stop at (and exclude) the first line for which this returns True
+    :returns: Lines without their line ending; "\n", "\r\n" and a lone "\r" all end a
+        line, as in Path.read_text() (universal newlines)
+    :raises OSError: If the file cannot be read
+    :raises UnicodeDecodeError: If the part that was read is not valid UTF-8
+    """
+    lines: List[str] = []
+    # Binary mode: only the lines consumed are decoded (a text-mode file would decode
+    # whole read buffers). UTF-8 never uses "\r" or "\n" bytes inside a character, so
+    # splitting the raw bytes gives the same lines as Path.read_text().splitlines()
+    with open(file_path, "rb") as f:
+        for raw in _universal_lines(f):
+            line = raw.decode("utf-8")
+            if stop is not None and stop(line):
+                break
+            lines.append(line)
+            if max_lines is not None and len(lines) >= max_lines:
+                break
+    return lines
+
+
+@contextlib.contextmanager
+def mapped_file(file_path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Map a file read-only for byte searches without reading it into memory.
+
+    :param file_path: File to map
+    :yields: The mapping (supports find() and bytes regex searches); b"" for empty files
+    :raises OSError: If the file cannot be opened or mapped
+    """
+    with open(file_path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            # Empty files cannot be mapped
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            yield mapping
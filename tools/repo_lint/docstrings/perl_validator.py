@@ -28,12 +28,16 @@ without executing the script (per Phase 0 Item 0.9.5).
 from __future__ import annotations
 
 import json
+import mmap
 import re
 import subprocess
 from pathlib import Path
 from typing import List
 
-from .common import ValidationError, check_symbol_pragma_exemption
+from .common import SectionPatterns, ValidationError, check_symbol_pragma_exemption, line_at, mapped_file
+
+# A carriage return that does not start a "\r\n" line ending
+_LONE_CR = re.compile(rb"\r(?!\n)")
 
 
 class PerlValidator:
@@ -61,6 +65,8 @@ class PerlValidator:
         "=head1 EXAMPLES",
     ]
 
+    _SECTIONS = SectionPatterns(SECTION_NAMES, REQUIRED_SECTIONS, re.MULTILINE)
+
     @staticmethod
     def validate(file_path: Path, content: str) -> List[ValidationError]:
         """Validate Perl script POD.
@@ -83,40 +89,75 @@ class PerlValidator:
         return errors
 
     @staticmethod
-    def _validate_file_pod(file_path: Path, content: str) -> ValidationError | None:
+    def validate_path(file_path: Path) -> List[ValidationError]:
+        """Validate Perl script POD without decoding the whole file up front.
+
+        POD often sits at the end of a script (after __END__), so the file-level
+        check searches a read-only memory map of the raw bytes instead of
+        reading a prefix. The file is decoded only if it uses lone "\r" line
+        endings or if PPI reports subroutines, whose pragma exemptions need the
+        source lines.
+
+        :param file_path: Path to Perl file to validate
+        :returns: List of validation errors (empty if all validations pass)
+        :raises OSError: If the file cannot be read
+        :raises UnicodeDecodeError: If the file has subroutines and is not valid UTF-8
+        """
+        errors = []
+
+        with mapped_file(file_path) as data:
+            if _LONE_CR.search(data):
+                # Old Mac line endings: ^ and line numbers only see "\n", so check the
+                # decoded text (universal newlines), as validate() would
+                file_error = PerlValidator._validate_file_pod(file_path, file_path.read_text(encoding="utf-8"))
+            else:
+                file_error = PerlValidator._validate_file_pod(file_path, data)
+        if file_error:
+            errors.append(file_error)
+
+        errors.extend(PerlValidator._validate_subroutines(file_path, None))
+
+        return errors
+
+    @staticmethod
+    def _validate_file_pod(file_path: Path, content: str | bytes | mmap.mmap) -> ValidationError | None:
         """Validate file-level POD documentation.
 
         :param file_path: Path to Perl file
-        :param content: File content as string
+        :param content: File content as string, or its raw bytes (e.g. from mapped_file())
 
         :returns: ValidationError if file POD is missing required sections, None otherwise
         """
+        head, cut = ("=head1", "=cut") if isinstance(content, str) else (b"=head1", b"=cut")
+
         # Check for POD block
-        if "=head1" not in content or "=cut" not in content:
+        head_offset = content.find(head)
+        if head_offset == -1 or content.find(cut) == -1:
             return ValidationError(
                 str(file_path),
                 ["POD block"],
                 "Expected POD documentation with =head1 sections and =cut",
             )
 
-        missing = []
-        for i, pattern in enumerate(PerlValidator.REQUIRED_SECTIONS):
-            if not re.search(pattern, content, re.MULTILINE):
-                missing.append(PerlValidator.SECTION_NAMES[i])
+        # One pass over the whole file finds every section
+        missing = PerlValidator._SECTIONS.missing(PerlValidator._SECTIONS.index(content))
 
         if missing:
-            return ValidationError(str(file_path), missing, "Expected POD sections")
+            return ValidationError(
+                str(file_path), missing, "Expected POD sections", line_number=line_at(content, head_offset)
+            )
         return None
 
     @staticmethod
-    def _validate_subroutines(file_path: Path, content: str) -> List[ValidationError]:
+    def _validate_subroutines(file_path: Path, content: str | None) -> List[ValidationError]:
         """Validate Perl subroutine documentation using PPI parser.
 
         Uses PPI via helper script (per Phase 0 Item 0.9.5).
         Detects subroutine definitions and checks for POD documentation.
 
         :param file_path: Path to Perl file
-        :param content: File content as string (for pragma checking)
+        :param content: File content as string (for pragma checking), or None to
+            read it only if there are subroutines to check
 
         :returns: List of validation errors for subroutines
         """
@@ -166,8 +207,10 @@ class PerlValidator:
                         )
                     )
 
-            # Split content into lines once for all pragma checks
-            lines = content.split("\n")
+            # Split content into lines once for all pragma checks (decoding it first if needed)
+            if content is None and parse_result.get("subs"):
+                content = file_path.read_text(encoding="utf-8")
+            lines = content.split("\n") if content is not None else []
 
             # Validate each subroutine
             for sub in parse_result.get("subs", []):
@@ -33,7 +33,7 @@ import subprocess
 from pathlib import Path
 from typing import List
 
-from .common import ValidationError, check_symbol_pragma_exemption
+from .common import SectionPatterns, ValidationError, check_symbol_pragma_exemption, line_at
 
 
 class PowerShellValidator:
@@ -59,6 +59,8 @@ class PowerShellValidator:
         ".NOTES",
     ]
 
+    _SECTIONS = SectionPatterns(SECTION_NAMES, REQUIRED_SECTIONS, re.IGNORECASE)
+
     @staticmethod
     def validate(file_path: Path, content: str) -> List[ValidationError]:
         """Validate PowerShell script docstring.
@@ -108,14 +110,14 @@ class PowerShellValidator:
             )
 
         help_block = match.group(1)
+        help_line = line_at(content, match.start())
 
-        missing = []
-        for i, pattern in enumerate(PowerShellValidator.REQUIRED_SECTIONS):
-            if not re.search(pattern, help_block, re.IGNORECASE):
-                missing.append(PowerShellValidator.SECTION_NAMES[i])
+        missing = PowerShellValidator._SECTIONS.missing(PowerShellValidator._SECTIONS.index(help_block, help_line))
 
         if missing:
-            return ValidationError(str(file_path), missing, "Expected PowerShell comment-based help")
+            return ValidationError(
+                str(file_path), missing, "Expected PowerShell comment-based help", line_number=help_line
+            )
         return None
 
     @staticmethod
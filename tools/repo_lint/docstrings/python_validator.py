@@ -30,7 +30,7 @@ from pathlib import Path
 from typing import List
 
 from . import common
-from .common import ValidationError, check_pragma_ignore, validate_exit_codes_content
+from .common import SectionPatterns, ValidationError, check_pragma_ignore, line_at, validate_exit_codes_content
 
 
 class PythonValidator:
@@ -49,6 +49,8 @@ class PythonValidator:
 
     SECTION_NAMES = ["Purpose", "Environment Variables", "Examples", "Exit Codes"]
 
+    _SECTIONS = SectionPatterns(SECTION_NAMES, REQUIRED_SECTIONS, re.MULTILINE)
+
     @staticmethod
     def validate(file_path: Path, content: str) -> List[ValidationError]:
         """Validate Python module and symbol docstrings.
@@ -98,17 +100,11 @@ class PythonValidator:
             )
 
         docstring = match.group(1)
+        docstring_line = line_at(content, match.start())
 
-        missing = []
-        for i, pattern in enumerate(PythonValidator.REQUIRED_SECTIONS):
-            section_name = PythonValidator.SECTION_NAMES[i]
-
-            # Check pragma ignore
-            if check_pragma_ignore(content, section_name):
-                continue
-
-            if not re.search(pattern, docstring, re.MULTILINE):
-                missing.append(section_name)
+        found = PythonValidator._SECTIONS.index(docstring, docstring_line)
+        # Pragmas are only looked up for the sections that are actually missing
+        missing = [name for name in PythonValidator._SECTIONS.missing(found) if not check_pragma_ignore(content, name)]
 
         # Basic content validation for exit codes
         if "Exit Codes" not in missing:
@@ -133,6 +129,7 @@ class PythonValidator:
                         str(file_path),
                         ["Exit Codes content"],
                         f"Exit codes incomplete: {exit_codes_error}",
+                        line_number=found.get("Exit Codes"),
                     )
 
         if missing:
@@ -140,6 +137,7 @@ class PythonValidator:
                 str(file_path),
                 missing,
                 "Expected reST-style sections in module docstring",
+                line_number=docstring_line,
             )
         return None
 
@@ -28,7 +28,7 @@ import re
 from pathlib import Path
 from typing import List
 
-from .common import ValidationError
+from .common import SectionPatterns, ValidationError, mapped_file, read_leading_lines
 
 
 class RustValidator:
@@ -48,6 +48,18 @@ class RustValidator:
 
     SECTION_NAMES = ["# Purpose", "# Examples"]
 
+    EXIT_SECTION_NAME = "# Exit Behavior or # Exit Codes"
+
+    # Required and exit sections, indexed together in one pass (any EXIT_SECTIONS pattern counts)
+    _SECTIONS = SectionPatterns(
+        SECTION_NAMES + [EXIT_SECTION_NAME],
+        REQUIRED_SECTIONS + ["|".join(EXIT_SECTIONS)],
+        re.MULTILINE | re.IGNORECASE,
+    )
+
+    # Module docs are looked for in this many lines at the top of the file
+    HEADER_LINES = 100
+
     @staticmethod
     def validate(file_path: Path, content: str) -> List[ValidationError]:
         """Validate Rust module documentation.
@@ -58,31 +70,68 @@ class RustValidator:
         """
         # Check for module-level docs (//!)
         if "//!" not in content:
-            return [
-                ValidationError(
-                    str(file_path),
-                    ["module documentation (//!)"],
-                    "Expected module-level documentation with //!",
-                )
-            ]
+            return [RustValidator._missing_module_docs(file_path)]
+
+        # Split off only the header lines, not the whole file
+        lines = content.split("\n", RustValidator.HEADER_LINES)[: RustValidator.HEADER_LINES]
+        return RustValidator._validate_module_docs(file_path, lines)
+
+    @staticmethod
+    def validate_path(file_path: Path) -> List[ValidationError]:
+        """Validate Rust module documentation, reading only the file header.
+
+        Same result as validate() on the decoded content: the first
+        HEADER_LINES lines are read and decoded with the same universal-newline
+        handling as Path.read_text(), and the rest of the file is
+        only searched (memory-mapped, undecoded) for //! when the header has none.
+
+        :param file_path: Path to Rust file to validate
+        :returns: List of validation errors (empty if all validations pass)
+        :raises OSError: If the file cannot be read
+        :raises UnicodeDecodeError: If the header is not valid UTF-8
+        """
+        lines = read_leading_lines(file_path, max_lines=RustValidator.HEADER_LINES)
+        if not any("//!" in line for line in lines):
+            with mapped_file(file_path) as data:
+                if data.find(b"//!") == -1:
+                    return [RustValidator._missing_module_docs(file_path)]
+        return RustValidator._validate_module_docs(file_path, lines)
 
-        # Extract module docs (first 100 lines)
-        lines = content.split("\n")[:100]
-        module_docs = "\n".join([line for line in lines if line.strip().startswith("//!")])
+    @staticmethod
+    def _missing_module_docs(file_path: Path) -> ValidationError:
+        """Build the error for a file without module-level documentation.
 
-        missing = []
-        for i, pattern in enumerate(RustValidator.REQUIRED_SECTIONS):
-            if not re.search(pattern, module_docs, re.MULTILINE | re.IGNORECASE):
-                missing.append(RustValidator.SECTION_NAMES[i])
+        :param file_path: Path to Rust file
+        :returns: ValidationError for the missing //! block
+        """
+        return ValidationError(
+            str(file_path),
+            ["module documentation (//!)"],
+            "Expected module-level documentation with //!",
+        )
 
-        # For main.rs, check for Exit Behavior/Exit Codes
-        if file_path.name == "main.rs":
-            has_exit = any(
-                re.search(pattern, module_docs, re.MULTILINE | re.IGNORECASE) for pattern in RustValidator.EXIT_SECTIONS
-            )
-            if not has_exit:
-                missing.append("# Exit Behavior or # Exit Codes")
+    @staticmethod
+    def _validate_module_docs(file_path: Path, lines: List[str]) -> List[ValidationError]:
+        """Check the module docs in the header lines for required sections.
+
+        :param file_path: Path to Rust file
+        :param lines: First HEADER_LINES lines of the file
+        :returns: List of validation errors (empty if all validations pass)
+        """
+        # Non-doc lines are blanked rather than dropped so that index lines are file lines
+        doc_lines = [line if line.strip().startswith("//!") else "" for line in lines]
+        found = RustValidator._SECTIONS.index("\n".join(doc_lines))
+
+        missing = RustValidator._SECTIONS.missing(found)
+        # Exit Behavior/Exit Codes is only required for main.rs
+        if file_path.name != "main.rs" and RustValidator.EXIT_SECTION_NAME in missing:
+            missing.remove(RustValidator.EXIT_SECTION_NAME)
 
         if missing:
-            return [ValidationError(str(file_path), missing, "Expected Rustdoc sections in module docs")]
+            first_doc_line = next((number for number, line in enumerate(doc_lines, 1) if line), None)
+            return [
+                ValidationError(
+                    str(file_path), missing, "Expected Rustdoc sections in module docs", line_number=first_doc_line
+                )
+            ]
         return []
@@ -42,6 +42,17 @@ from tools.repo_lint.docstrings.python_validator import PythonValidator
 from tools.repo_lint.docstrings.rust_validator import RustValidator
 from tools.repo_lint.docstrings.yaml_validator import YAMLValidator
 
+# Validators that read the file themselves: header-only checks (Rust, YAML) read a
+# bounded prefix and Perl's file-level POD check searches a memory map, so large
+# files are not decoded just to look at their first lines
+_PATH_VALIDATORS = {
+    ".rs": RustValidator,
+    ".yml": YAMLValidator,
+    ".yaml": YAMLValidator,
+    ".pl": PerlValidator,
+    ".pm": PerlValidator,
+}
+
 
 def validate_file(file_path: Path) -> List[ValidationError]:
     """Validate a single file based on its extension.
@@ -50,28 +61,24 @@ def validate_file(file_path: Path) -> List[ValidationError]:
 
     :returns: List of validation errors (empty if file passes)
     """
+    suffix = file_path.suffix.lower()
+
     try:
+        if suffix in _PATH_VALIDATORS:
+            return _PATH_VALIDATORS[suffix].validate_path(file_path)
         content = file_path.read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError) as e:
         # OSError: File access errors (permission, not found, etc.)
-        # UnicodeDecodeError: File is not valid UTF-8
+        # UnicodeDecodeError: File (or the part a validator reads) is not valid UTF-8
         return [ValidationError(str(file_path), ["read error"], str(e))]
 
-    # Dispatch to appropriate validator
-    suffix = file_path.suffix.lower()
-
+    # Dispatch to appropriate validator (these check symbols, so need the full content)
     if suffix in [".sh", ".bash", ".zsh"]:
         return BashValidator.validate(file_path, content)
     elif suffix == ".ps1":
         return PowerShellValidator.validate(file_path, content)
     elif suffix == ".py":
         return PythonValidator.validate(file_path, content)
-    elif suffix in [".pl", ".pm"]:
-        return PerlValidator.validate(file_path, content)
-    elif suffix == ".rs":
-        return RustValidator.validate(file_path, content)
-    elif suffix in [".yml", ".yaml"]:
-        return YAMLValidator.validate(file_path, content)
     else:
         # Unknown extension, skip
         return []
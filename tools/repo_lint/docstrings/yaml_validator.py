@@ -28,7 +28,7 @@ import re
 from pathlib import Path
 from typing import List
 
-from .common import ValidationError
+from .common import SectionPatterns, ValidationError, read_leading_lines
 
 
 class YAMLValidator:
@@ -56,45 +56,37 @@ class YAMLValidator:
         "Notes: or Note:",
     ]
 
+    _SECTIONS = SectionPatterns(SECTION_NAMES, REQUIRED_SECTIONS, re.MULTILINE | re.IGNORECASE)
+
+    @staticmethod
+    def _ends_header(line: str) -> bool:
+        """Check whether a line is the first one after the comment header.
+
+        Comments, blank lines and document separators (---) belong to the
+        header; the first line of actual YAML content ends it.
+
+        :param line: One line of the file
+        :returns: True if the header ends before this line
+        """
+        stripped = line.strip()
+        return not (stripped == "" or stripped.startswith("#") or stripped == "---")
+
     @staticmethod
     def _extract_header_block(content: str) -> str:
         """Extract the complete comment header block from the start of the file.
 
         The header block consists of all consecutive comment lines (starting with #)
         from the beginning of the file, stopping at the first non-comment, non-blank line.
-        YAML document separators (---) at the start are included, but subsequent ones
-        stop extraction (indicating multiple documents).
+        YAML document separators (---) before that line are included.
 
         :param content: File content as string
         :returns: The complete header block as a string
         """
-        lines = content.split("\n")
         header_lines = []
-        seen_content = False  # Track if we've seen actual YAML content yet
-
-        for line in lines:
-            stripped = line.strip()
-
-            # Always include comments and blank lines in header
-            if stripped.startswith("#") or stripped == "":
-                header_lines.append(line)
-                continue
-
-            # Handle YAML document separator (---)
-            if stripped == "---":
-                # If we haven't seen content yet, include this separator (document start)
-                # If we have seen content, stop here (multiple documents)
-                if not seen_content:
-                    header_lines.append(line)
-                    continue
-
-                # Multiple documents - stop extraction
+        for line in content.split("\n"):
+            if YAMLValidator._ends_header(line):
                 break
-
-            # First actual YAML content - set flag and stop extraction
-            seen_content = True
-            break
-
+            header_lines.append(line)
         return "\n".join(header_lines)
 
     @staticmethod
@@ -106,12 +98,32 @@ class YAMLValidator:
         :returns: List of validation errors (empty if all validations pass)
         """
         # Extract the complete header block dynamically instead of using a fixed line limit
-        header = YAMLValidator._extract_header_block(content)
+        return YAMLValidator._validate_header(file_path, YAMLValidator._extract_header_block(content))
 
-        missing = []
-        for i, pattern in enumerate(YAMLValidator.REQUIRED_SECTIONS):
-            if not re.search(pattern, header, re.MULTILINE | re.IGNORECASE):
-                missing.append(YAMLValidator.SECTION_NAMES[i])
+    @staticmethod
+    def validate_path(file_path: Path) -> List[ValidationError]:
+        """Validate YAML file documentation header, reading only the header.
+
+        Reading stops at the first line of YAML content, so the size of the
+        document below the header does not matter.
+
+        :param file_path: Path to YAML file to validate
+        :returns: List of validation errors (empty if all validations pass)
+        :raises OSError: If the file cannot be read
+        :raises UnicodeDecodeError: If the header is not valid UTF-8
+        """
+        header = "\n".join(read_leading_lines(file_path, stop=YAMLValidator._ends_header))
+        return YAMLValidator._validate_header(file_path, header)
+
+    @staticmethod
+    def _validate_header(file_path: Path, header: str) -> List[ValidationError]:
+        """Check the header block for required sections.
+
+        :param file_path: Path to YAML file
+        :param header: Comment header block
+        :returns: List of validation errors (empty if all validations pass)
+        """
+        missing = YAMLValidator._SECTIONS.missing(YAMLValidator._SECTIONS.index(header))
 
         if missing:
             return [
@@ -119,6 +131,7 @@ class YAMLValidator:
                     str(file_path),
                     missing,
                     "Expected top-of-file comment header with # prefix",
+                    line_number=1,
                 )
             ]
         return []
@@ -33,6 +33,16 @@
         print(f"Patch: {patch_path}")
         print(f"Log: {log_path}")
 
+    Stream per-file diffs into the patch while fixers run::
+
+        from tools.repo_lint.forensics import PatchStream, get_forensics_paths, save_forensics_log
+        from tools.repo_lint.unsafe_fixers import iter_unsafe_fixes
+
+        patch_path, log_path = get_forensics_paths(start_time)
+        with PatchStream(patch_path) as patch:
+            results = [patch.write(r) for r in iter_unsafe_fixes(files)]
+        save_forensics_log(log_path, results, start_time, datetime.now())
+
 :See Also:
     - docs/contributing/ai-constraints.md - AI safety constraints
     - Phase 7 Item 2 (Forensics) requirements
@@ -40,13 +50,15 @@
 
 from __future__ import annotations
 
-import difflib
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, TextIO, Tuple
 
 from tools.repo_lint.common import safe_print
-from tools.repo_lint.unsafe_fixers import UnsafeFixerResult
+from tools.repo_lint.unsafe_fixers import UnsafeFixerResult, format_unified_diff
+
+# Written instead of a patch when no unsafe fixer changed anything
+NO_CHANGES_PATCH = "# No changes made by unsafe fixers\n"
 
 
 def get_unsafe_logs_dir() -> Path:
@@ -60,6 +72,31 @@ def get_unsafe_logs_dir() -> Path:
     return logs_dir
 
 
+def _patch_header() -> List[str]:
+    """Build the header lines of an unsafe fix patch.
+
+    :returns: Header lines (without newlines)
+    """
+    return [
+        "# Unsafe Fix Patch",
+        f"# Generated: {datetime.now().isoformat()}",
+        "#",
+        "# DANGER: This patch contains unsafe transformations.",
+        "# Review carefully before applying or committing.",
+        "#",
+        "",
+    ]
+
+
+def _result_diff(result: UnsafeFixerResult) -> str:
+    """Get the unified diff for a result, computing it if the fixer did not.
+
+    :param result: Unsafe fixer result
+    :returns: Unified diff text
+    """
+    return result.diff or format_unified_diff(result)
+
+
 def generate_patch(results: List[UnsafeFixerResult]) -> str:
     """Generate unified diff patch for all unsafe fix results.
 
@@ -67,36 +104,73 @@ def generate_patch(results: List[UnsafeFixerResult]) -> str:
     :returns: Unified diff patch as string
     """
     if not results:
-        return "# No changes made by unsafe fixers\n"
-
-    patch_lines = []
-    patch_lines.append("# Unsafe Fix Patch")
-    patch_lines.append(f"# Generated: {datetime.now().isoformat()}")
-    patch_lines.append("#")
-    patch_lines.append("# DANGER: This patch contains unsafe transformations.")
-    patch_lines.append("# Review carefully before applying or committing.")
-    patch_lines.append("#")
-    patch_lines.append("")
+        return NO_CHANGES_PATCH
 
+    patch_lines = _patch_header()
     for result in results:
-        # Generate unified diff for this file
-        before_lines = result.before_content.splitlines(keepends=True)
-        after_lines = result.after_content.splitlines(keepends=True)
-
-        diff = difflib.unified_diff(
-            before_lines,
-            after_lines,
-            fromfile=f"a/{result.file_path}",
-            tofile=f"b/{result.file_path}",
-            lineterm="",
-        )
-
-        patch_lines.extend(diff)
+        patch_lines.append(_result_diff(result))
         patch_lines.append("")
 
     return "\n".join(patch_lines)
 
 
+class PatchStream:
+    """Write an unsafe fix patch incrementally, one file diff at a time.
+
+    :Purpose:
+        Lets `fix --unsafe` stream each diff to disk as soon as its file is fixed,
+        so no file contents (and no full patch string) are held in memory. The
+        output matches generate_patch() for the same results.
+    """
+
+    def __init__(self, patch_path: Path):
+        """Prepare the stream.
+
+        :param patch_path: Patch file to write
+        """
+        self.patch_path = patch_path
+        self.count = 0
+        self._handle: TextIO | None = None
+
+    def __enter__(self) -> PatchStream:
+        """Open the patch file.
+
+        :returns: This stream
+        """
+        self._handle = open(self.patch_path, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+        return self
+
+    def write(self, result: UnsafeFixerResult) -> UnsafeFixerResult:
+        """Append the diff for one result.
+
+        :param result: Unsafe fixer result
+        :returns: The same result, with its diff dropped once written
+        """
+        if self.count == 0:
+            self._handle.write("\n".join(_patch_header()) + "\n")
+        else:
+            self._handle.write("\n")
+        self._handle.write(_result_diff(result) + "\n")
+        self._handle.flush()
+        self.count += 1
+        result.diff = ""
+        result.before_content = ""
+        result.after_content = ""
+        return result
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Finish the patch (writing the no-changes marker if empty) and close it.
+
+        :param exc_type: Exception type, if any
+        :param exc: Exception instance, if any
+        :param tb: Traceback, if any
+        """
+        if self.count == 0:
+            self._handle.write(NO_CHANGES_PATCH)
+        self._handle.close()
+        self._handle = None
+
+
 def generate_log(results: List[UnsafeFixerResult], start_time: datetime, end_time: datetime) -> str:
     """Generate detailed log of unsafe fix operations.
 
@@ -158,28 +232,49 @@ def generate_log(results: List[UnsafeFixerResult], start_time: datetime, end_tim
     return "\n".join(log_lines)
 
 
-def save_forensics(results: List[UnsafeFixerResult], start_time: datetime, end_time: datetime) -> Tuple[Path, Path]:
-    """Save patch and log files for unsafe fix operations.
+def get_forensics_paths(start_time: datetime) -> Tuple[Path, Path]:
+    """Get the patch and log paths for an unsafe fix run.
 
-    :param results: List of unsafe fixer results
     :param start_time: When unsafe fix mode started
-    :param end_time: When unsafe fix mode completed
     :returns: Tuple of (patch_path, log_path)
     """
     logs_dir = get_unsafe_logs_dir()
 
     # Generate timestamp-based filename
     timestamp = start_time.strftime("%Y%m%d-%H%M%S")
-    patch_path = logs_dir / f"unsafe-fix-{timestamp}.patch"
-    log_path = logs_dir / f"unsafe-fix-{timestamp}.log"
+    return logs_dir / f"unsafe-fix-{timestamp}.patch", logs_dir / f"unsafe-fix-{timestamp}.log"
+
+
+def save_forensics_log(
+    log_path: Path, results: List[UnsafeFixerResult], start_time: datetime, end_time: datetime
+) -> Path:
+    """Save the log file for unsafe fix operations.
+
+    :param log_path: Log file to write
+    :param results: List of unsafe fixer results
+    :param start_time: When unsafe fix mode started
+    :param end_time: When unsafe fix mode completed
+    :returns: log_path
+    """
+    log_path.write_text(generate_log(results, start_time, end_time))
+    return log_path
+
+
+def save_forensics(results: List[UnsafeFixerResult], start_time: datetime, end_time: datetime) -> Tuple[Path, Path]:
+    """Save patch and log files for unsafe fix operations.
+
+    :param results: List of unsafe fixer results
+    :param start_time: When unsafe fix mode started
+    :param end_time: When unsafe fix mode completed
+    :returns: Tuple of (patch_path, log_path)
+    """
+    patch_path, log_path = get_forensics_paths(start_time)
 
     # Generate and save patch
-    patch_content = generate_patch(results)
-    patch_path.write_text(patch_content)
+    patch_path.write_text(generate_patch(results))
 
     # Generate and save log
-    log_content = generate_log(results, start_time, end_time)
-    log_path.write_text(log_content)
+    save_forensics_log(log_path, results, start_time, end_time)
 
     return patch_path, log_path
 
@@ -71,10 +71,15 @@ def load_policy() -> Dict:
     :returns: Policy dictionary
     :raises FileNotFoundError: If policy file doesn't exist
     :raises json.JSONDecodeError: If policy file is invalid JSON
+
+    :Notes:
+        Parsed policies are memoized by (path, mtime, size) in the shared config
+        cache (see yaml_loader.load_cached_file); callers must not mutate the result.
     """
-    policy_path = get_policy_path()
-    with open(policy_path, encoding="utf-8") as f:
-        return json.load(f)
+    # pylint: disable=import-outside-toplevel
+    from tools.repo_lint.yaml_loader import load_cached_file
+
+    return load_cached_file(get_policy_path(), "autofix-policy", lambda _path, content: json.loads(content))
 
 
 def is_category_allowed(policy: Dict, category: str) -> bool:
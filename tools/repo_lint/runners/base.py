@@ -11,7 +11,12 @@
     - check_tools(): Verify required tools are installed
 
 :Environment Variables:
-    None
+    REPO_LINT_RECORD_COMMANDS
+        Record every external tool command (argv, exit code, output) to
+        this JSON file (see RecordingExecutor)
+    REPO_LINT_REPLAY_COMMANDS
+        Answer external tool commands from a recording instead of running
+        them (see ReplayExecutor)
 
 :Examples:
     Implement a custom runner::
@@ -32,22 +37,56 @@
 from __future__ import annotations
 
 import inspect
+import json
+import os
 import re
 import shutil
 import subprocess
+import threading
 import traceback
 import warnings
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List, Set, Tuple
 
-from tools.repo_lint.common import LintResult, MissingToolError
+from tools.repo_lint.common import CommandReplayError, LintResult, MissingToolError
 from tools.repo_lint.logging_utils import get_logger
+from tools.repo_lint.path_matcher import PathMatcher, compile_patterns
 
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Opt-in memo of git ls-files results for long-lived processes (daemon mode).
+# Keyed by (repo_root, patterns, excludes); each entry stores the git index
+# signature it was computed against so that staging/committing invalidates it.
+_TRACKED_FILES_CACHE: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], Tuple[Tuple[int, int, int], List[str]]] = {}
+_TRACKED_FILES_CACHE_ENABLED = False
+
+# Process-wide budget for concurrent file-list tool processes (see set_job_budget()).
+# Only run_files_chunked() invocations draw from these slots.
+_JOB_BUDGET = 1
+_JOB_SLOTS = threading.BoundedSemaphore(_JOB_BUDGET)
+
+# Fallback when the platform can't report ARG_MAX (POSIX minimum is 4096; Linux default is 2 MiB)
+_ARG_MAX_FALLBACK = 131072
+
+# Windows CreateProcess command-line limit, in characters
+_WINDOWS_CMDLINE_LIMIT = 32767
+
+# Don't start a separate process for fewer files than this; tool start-up would dominate
+DEFAULT_MIN_CHUNK_FILES = 8
+
+# Fixed per-file cost (in bytes-equivalent) added to the file size when balancing chunks
+_PER_FILE_COST = 4096
+
+# Executor for external tool commands (see set_command_executor()); None until first use
+_COMMAND_EXECUTOR: CommandExecutor | None = None
+_COMMAND_EXECUTOR_LOCK = threading.Lock()
+
+# Stands in for the command's working directory in recorded argv
+_CWD_PLACEHOLDER = "{cwd}"
+
 
 # DEPRECATED (Phase 2.9): Use get_excluded_paths() instead
 # This constant is maintained for backward compatibility only
@@ -100,8 +139,254 @@ def command_exists(command: str) -> bool:
 
     :param command: Command name to check
     :returns: True if command exists, False otherwise
+
+    :Note:
+        Answered by the active command executor, so replayed runs see the
+        tool set that was installed when the recording was made.
+    """
+    return get_command_executor().which(command) is not None
+
+
+class CommandExecutor:
+    """Runs the external tool commands issued by runners.
+
+    The default executor calls subprocess.run and shutil.which directly.
+    RecordingExecutor and ReplayExecutor capture those calls into a fixture
+    file and play them back, so output parsing and orchestration can be
+    exercised and profiled without the tools installed.
+    """
+
+    def run(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        """Run a tool command.
+
+        :param cmd: Command argv
+        :param kwargs: Keyword arguments for subprocess.run
+        :returns: CompletedProcess
+        :raises FileNotFoundError: If the tool is not installed
+        """
+        # Looked up at call time so tests that patch subprocess.run still apply
+        return subprocess.run(cmd, **kwargs)  # pylint: disable=subprocess-run-check
+
+    def which(self, command: str) -> str | None:
+        """Locate a tool.
+
+        :param command: Program name
+        :returns: Path to the program, or None if it is not installed
+        """
+        return shutil.which(command)
+
+
+def _recorded_argv(cmd: List[str], cwd: Path | str | None) -> List[str]:
+    """Normalize argv so recordings don't depend on where the repository lives.
+
+    :param cmd: Command argv
+    :param cwd: Working directory the command runs in
+    :returns: argv with the working directory replaced by {cwd}
     """
-    return shutil.which(command) is not None
+    base = str(Path(cwd if cwd is not None else os.getcwd()).resolve())
+    return [str(arg).replace(base, _CWD_PLACEHOLDER) for arg in cmd]
+
+
+def _captures_text(kwargs: Dict[str, object]) -> bool:
+    """Check whether a subprocess.run call decodes its output.
+
+    :param kwargs: Keyword arguments for subprocess.run
+    :returns: True for text-mode calls
+    """
+    return bool(kwargs.get("text") or kwargs.get("universal_newlines") or kwargs.get("encoding"))
+
+
+class RecordingExecutor(CommandExecutor):
+    """Run commands for real and record argv, exit code and output to a JSON file.
+
+    :param path: Recording file (rewritten after every command)
+    :param inner: Executor that actually runs the commands (default: CommandExecutor())
+
+    :Notes:
+        The file holds {"version": 1, "tools": {name: installed},
+        "commands": [{"argv", "cwd", "returncode", "stdout", "stderr"}]}.
+        Commands are stored in completion order; with --jobs > 1 that order
+        varies between runs, which replay tolerates because it matches on argv.
+    """
+
+    def __init__(self, path: Path | str, inner: CommandExecutor | None = None) -> None:
+        """Initialize the recorder.
+
+        :param path: Recording file
+        :param inner: Executor that actually runs the commands
+        """
+        self.path = Path(path)
+        self.inner = inner or CommandExecutor()
+        self.tools: Dict[str, bool] = {}
+        self.commands: List[Dict[str, object]] = []
+        self._lock = threading.Lock()
+
+    def run(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        """Run a tool command and record its result.
+
+        :param cmd: Command argv
+        :param kwargs: Keyword arguments for subprocess.run
+        :returns: CompletedProcess from the inner executor
+        :raises FileNotFoundError: If the tool is not installed
+        """
+        result = self.inner.run(cmd, **kwargs)
+        outputs = []
+        for output in (result.stdout, result.stderr):
+            if isinstance(output, bytes):
+                output = output.decode("utf-8", errors="surrogateescape")
+            outputs.append(output or "")
+        cwd = kwargs.get("cwd")
+        entry = {
+            "argv": _recorded_argv(cmd, cwd),
+            "cwd": os.path.relpath(cwd) if cwd is not None else ".",
+            "returncode": result.returncode,
+            "stdout": outputs[0],
+            "stderr": outputs[1],
+        }
+        with self._lock:
+            self.commands.append(entry)
+            self._save()
+        return result
+
+    def which(self, command: str) -> str | None:
+        """Locate a tool and record whether it is installed.
+
+        :param command: Program name
+        :returns: Path to the program, or None if it is not installed
+        """
+        found = self.inner.which(command)
+        with self._lock:
+            self.tools[command] = found is not None
+            self._save()
+        return found
+
+    def _save(self) -> None:
+        """Write the recording atomically (caller holds the lock)."""
+        data = {"version": 1, "tools": self.tools, "commands": self.commands}
+        temp = self.path.with_name(self.path.name + ".tmp")
+        temp.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        os.replace(temp, self.path)
+
+
+class ReplayExecutor(CommandExecutor):
+    """Answer commands from a recording made by RecordingExecutor; nothing is run.
+
+    :param path: Recording file
+
+    :Notes:
+        Commands are matched on their normalized argv. A command recorded
+        several times (e.g. before and after a fix) replays its results in
+        order and then keeps returning the last one. A command that was never
+        recorded raises CommandReplayError, so a stale recording fails loudly
+        instead of reporting a clean run.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Load the recording.
+
+        :param path: Recording file
+        :raises OSError: If the file cannot be read
+        :raises ValueError: If the file is not a recording
+        """
+        self.path = Path(path)
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or data.get("version") != 1:
+            raise ValueError(f"{self.path}: not a version 1 command recording")
+        self.tools: Dict[str, bool] = dict(data.get("tools", {}))
+        self._results: Dict[Tuple[str, ...], List[Dict[str, object]]] = {}
+        for entry in data.get("commands", []):
+            self._results.setdefault(tuple(entry["argv"]), []).append(entry)
+        self._positions: Dict[Tuple[str, ...], int] = {}
+        self._lock = threading.Lock()
+
+    def run(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        """Return the recorded result of a command.
+
+        :param cmd: Command argv
+        :param kwargs: Keyword arguments for subprocess.run
+        :returns: CompletedProcess built from the recording
+        :raises CommandReplayError: If the command was not recorded
+        :raises subprocess.CalledProcessError: If check=True and the recorded exit code is non-zero
+        """
+        key = tuple(_recorded_argv(cmd, kwargs.get("cwd")))
+        entries = self._results.get(key)
+        if not entries:
+            raise CommandReplayError(list(key), str(self.path))
+        with self._lock:
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        entry = entries[min(position, len(entries) - 1)]
+
+        stdout, stderr = entry["stdout"], entry["stderr"]
+        if not _captures_text(kwargs):
+            stdout = stdout.encode("utf-8", errors="surrogateescape")
+            stderr = stderr.encode("utf-8", errors="surrogateescape")
+        captured = kwargs.get("capture_output") or kwargs.get("stdout") == subprocess.PIPE
+        result = subprocess.CompletedProcess(
+            cmd, entry["returncode"], stdout if captured else None, stderr if captured else None
+        )
+        if kwargs.get("check"):
+            result.check_returncode()
+        return result
+
+    def which(self, command: str) -> str | None:
+        """Report a tool as installed if it was installed when recording.
+
+        :param command: Program name
+        :returns: A placeholder path for recorded tools, else None
+        """
+        if command in self.tools:
+            installed = self.tools[command]
+        else:
+            installed = any(os.path.basename(key[0]) == command for key in self._results)
+        return f"<replay>/{command}" if installed else None
+
+
+def get_command_executor() -> CommandExecutor:
+    """Get the executor used for external tool commands.
+
+    :returns: The executor set with set_command_executor(), else one chosen
+        from the environment on first use (REPO_LINT_REPLAY_COMMANDS, then
+        REPO_LINT_RECORD_COMMANDS, else the default subprocess executor)
+    :raises OSError: If the replay file cannot be read
+    :raises ValueError: If the replay file is not a recording
+    """
+    global _COMMAND_EXECUTOR  # pylint: disable=global-statement
+    with _COMMAND_EXECUTOR_LOCK:
+        if _COMMAND_EXECUTOR is None:
+            replay = os.environ.get("REPO_LINT_REPLAY_COMMANDS")
+            record = os.environ.get("REPO_LINT_RECORD_COMMANDS")
+            if replay:
+                _COMMAND_EXECUTOR = ReplayExecutor(replay)
+            elif record:
+                _COMMAND_EXECUTOR = RecordingExecutor(record)
+            else:
+                _COMMAND_EXECUTOR = CommandExecutor()
+        return _COMMAND_EXECUTOR
+
+
+def set_command_executor(executor: CommandExecutor | None) -> CommandExecutor | None:
+    """Install the executor for external tool commands.
+
+    :param executor: Executor to use, or None to choose from the environment again
+    :returns: The previously installed executor (None if none was chosen yet)
+    """
+    global _COMMAND_EXECUTOR  # pylint: disable=global-statement
+    with _COMMAND_EXECUTOR_LOCK:
+        previous, _COMMAND_EXECUTOR = _COMMAND_EXECUTOR, executor
+    return previous
+
+
+def run_command(cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+    """Run an external tool through the active command executor.
+
+    :param cmd: Command argv
+    :param kwargs: Keyword arguments for subprocess.run
+    :returns: CompletedProcess
+    :raises FileNotFoundError: If the tool is not installed
+    :raises CommandReplayError: If replaying and the command was not recorded
+    """
+    return get_command_executor().run(cmd, **kwargs)
 
 
 def get_excluded_paths() -> List[str]:
@@ -129,15 +414,63 @@ def get_git_pathspec_excludes(include_fixtures: bool = False) -> List[str]:
         Updated in Phase 2.9 to use YAML configuration instead of hardcoded EXCLUDED_PATHS.
         In vector mode (include_fixtures=True), test fixtures are included in scans.
     """
-    excludes = []
+    # Git pathspec format: ':(exclude)pattern'
+    return [f":(exclude){path}" for path in _get_exclusion_patterns(include_fixtures)]
+
+
+def _get_exclusion_patterns(include_fixtures: bool = False) -> List[str]:
+    """Get the configured exclusion patterns, minus fixtures in vector mode.
+
+    :param include_fixtures: Whether to include test fixture files (vector mode)
+    :returns: List of gitwildmatch exclusion patterns
+    """
+    patterns = []
     for path in get_excluded_paths():
         # Skip fixture exclusions when in vector mode
         # Check if path is any fixture pattern (ends with fixtures/** or fixtures/)
         if include_fixtures and ("fixtures/**" in path or "fixtures/" == path.rstrip("*")):
             continue
-        # Git pathspec format: ':(exclude)pattern'
-        excludes.append(f":(exclude){path}")
-    return excludes
+        patterns.append(path)
+    return patterns
+
+
+def get_exclusion_matcher(include_fixtures: bool = False) -> PathMatcher:
+    """Get the compiled matcher for the configured lint exclusions.
+
+    :param include_fixtures: Whether to include test fixture files (vector mode)
+    :returns: PathMatcher over the exclusion patterns from repo-lint-file-patterns.yaml,
+        with git pathspec semantics so it excludes exactly what `:(exclude)` would
+    """
+    return compile_patterns(_get_exclusion_patterns(include_fixtures), pathspec=True)
+
+
+def set_tracked_files_cache(enabled: bool) -> None:
+    """Enable or disable memoization of get_tracked_files() results.
+
+    :param enabled: Whether to reuse git ls-files output while the git index is unchanged
+
+    :Purpose:
+        A one-shot CLI run gains little from caching, but the daemon answers many
+        requests from one process. With the cache enabled, repeated listings are
+        served from memory until .git/index changes (stage, commit, checkout).
+        Disabling the cache also drops every stored entry.
+    """
+    global _TRACKED_FILES_CACHE_ENABLED  # pylint: disable=global-statement
+    _TRACKED_FILES_CACHE_ENABLED = enabled
+    _TRACKED_FILES_CACHE.clear()
+
+
+def _git_index_signature(repo_root: Path) -> Tuple[int, int, int] | None:
+    """Return a cheap change signature for the repository's git index.
+
+    :param repo_root: Repository root path
+    :returns: (mtime_ns, size, inode) of .git/index, or None if it can't be stat'ed
+    """
+    try:
+        st = (Path(repo_root) / ".git" / "index").stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
 
 
 def get_tracked_files(patterns: List[str], repo_root: Path | None = None, include_fixtures: bool = False) -> List[str]:
@@ -151,23 +484,240 @@ def get_tracked_files(patterns: List[str], repo_root: Path | None = None, includ
     :Note:
         When include_fixtures=True (vector mode), test fixture files under tests/fixtures/
         are included in the results. This is used for vector-based conformance testing.
+
+        Exclusions are applied to the git ls-files output with the compiled
+        get_exclusion_matcher() rather than as one `:(exclude)` pathspec per
+        pattern, which git would evaluate pattern-by-pattern for every file.
     """
     if repo_root is None:
         repo_root = find_repo_root()
 
-    excludes = get_git_pathspec_excludes(include_fixtures=include_fixtures)
+    matcher = get_exclusion_matcher(include_fixtures=include_fixtures)
+
+    cache_key = None
+    index_signature = None
+    if _TRACKED_FILES_CACHE_ENABLED:
+        index_signature = _git_index_signature(repo_root)
+        if index_signature is not None:
+            cache_key = (str(repo_root), tuple(patterns), matcher.patterns)
+            cached = _TRACKED_FILES_CACHE.get(cache_key)
+            if cached is not None and cached[0] == index_signature:
+                return list(cached[1])
+
     result = subprocess.run(
-        ["git", "ls-files"] + patterns + excludes,
+        ["git", "ls-files"] + patterns,
         cwd=repo_root,
         capture_output=True,
         text=True,
         check=False,
     )
 
-    if not result.stdout.strip():
+    files = matcher.filter(result.stdout.strip().split("\n")) if result.stdout.strip() else []
+
+    if cache_key is not None and result.returncode == 0:
+        _TRACKED_FILES_CACHE[cache_key] = (index_signature, list(files))
+
+    return files
+
+
+def set_job_budget(jobs: int) -> None:
+    """Set how many file-list tool processes may run at once.
+
+    :param jobs: Maximum concurrent processes (the resolved --jobs value; values < 1 mean 1)
+
+    :Purpose:
+        Every run_files_chunked() process takes a slot from this budget, so
+        chunks fanned out by runners executing in parallel together never run
+        more than --jobs file-list tool processes at once.
+
+    :Notes:
+        The budget bounds only those chunked file-list tool processes. Commands
+        run directly by runners (black, ruff, pylint, cargo, ...) do not take a
+        slot, so the total number of processes can exceed --jobs.
+    """
+    global _JOB_BUDGET, _JOB_SLOTS  # pylint: disable=global-statement
+    _JOB_BUDGET = max(1, int(jobs or 1))
+    _JOB_SLOTS = threading.BoundedSemaphore(_JOB_BUDGET)
+
+
+def get_job_budget() -> int:
+    """Get the current process budget set by set_job_budget().
+
+    :returns: Maximum concurrent file-list tool processes
+    """
+    return _JOB_BUDGET
+
+
+def get_arg_limit() -> int:
+    """Get a safe byte budget for one command line.
+
+    :returns: Bytes available for argv (argument strings, terminators and pointers)
+
+    :Notes:
+        ARG_MAX covers argv and the environment together; the environment size is
+        subtracted and half of the remainder is kept as headroom.
+    """
+    if os.name == "nt":
+        return _WINDOWS_CMDLINE_LIMIT // 2
+    try:
+        arg_max = os.sysconf("SC_ARG_MAX")
+    except (AttributeError, ValueError, OSError):
+        arg_max = _ARG_MAX_FALLBACK
+    if arg_max <= 0:
+        arg_max = _ARG_MAX_FALLBACK
+    env_size = sum(len(key) + len(value) + 2 + 8 for key, value in os.environ.items())
+    return max(4096, (arg_max - env_size) // 2)
+
+
+def _arg_cost(arg: str) -> int:
+    """Get the bytes one argument occupies on an exec() command line.
+
+    :param arg: Argument string
+    :returns: Encoded length plus NUL terminator and argv pointer
+    """
+    return len(os.fsencode(arg)) + 1 + 8
+
+
+def split_file_chunks(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    cmd: List[str],
+    files: List[str],
+    max_chunks: int,
+    cwd: Path | None = None,
+    min_chunk_files: int = DEFAULT_MIN_CHUNK_FILES,
+    arg_limit: int | None = None,
+) -> List[List[str]]:
+    """Split a file list into ARG_MAX-safe, cost-balanced chunks.
+
+    :param cmd: Command prefix every chunk is appended to
+    :param files: Files to split
+    :param max_chunks: Upper bound on chunks for concurrency (ARG_MAX may force more)
+    :param cwd: Directory relative file paths are resolved against for size-based costs
+    :param min_chunk_files: Don't create chunks smaller than this for concurrency's sake
+    :param arg_limit: Command-line byte budget (default: get_arg_limit())
+    :returns: Non-empty, contiguous chunks in input order (their concatenation is
+        the input list)
+    :raises ValueError: If a single file path can't fit on a command line
+    """
+    if not files:
         return []
+    arg_limit = arg_limit or get_arg_limit()
+    budget = arg_limit - sum(_arg_cost(arg) for arg in cmd)
+
+    bins = max(1, min(max_chunks, len(files) // max(1, min_chunk_files)))
+    if bins == 1 and sum(_arg_cost(f) for f in files) <= budget:
+        return [list(files)]
+
+    # Contiguous slices with roughly equal total cost (file size): concatenating chunk
+    # outputs in order then reproduces what one invocation over the whole list would print
+    costs = []
+    for path in files:
+        try:
+            costs.append(os.stat(Path(cwd or ".") / path).st_size + _PER_FILE_COST)
+        except OSError:
+            costs.append(_PER_FILE_COST)
+    total = sum(costs)
+    slices: List[List[str]] = [[]]
+    running = 0
+    for index, cost in enumerate(costs):
+        slices[-1].append(files[index])
+        running += cost
+        remaining = len(files) - index - 1
+        if remaining and len(slices) < bins and running >= total * len(slices) / bins:
+            slices.append([])
+
+    # Split any slice that exceeds the argv budget
+    chunks: List[List[str]] = []
+    for piece in slices:
+        current: List[str] = []
+        used = 0
+        for path in piece:
+            cost = _arg_cost(path)
+            if cost > budget:
+                raise ValueError(f"Path too long for a command line: {path}")
+            if current and used + cost > budget:
+                chunks.append(current)
+                current, used = [], 0
+            current.append(path)
+            used += cost
+        chunks.append(current)
+    return chunks
+
+
+def _run_chunk(cmd: List[str], chunk: List[str], cwd: Path, env: Dict[str, str] | None) -> subprocess.CompletedProcess:
+    """Run one chunk while holding a job slot.
+
+    :param cmd: Command prefix
+    :param chunk: Files for this invocation
+    :param cwd: Working directory
+    :param env: Optional environment
+    :returns: CompletedProcess with captured text output
+    """
+    with _JOB_SLOTS:
+        return run_command(
+            cmd + chunk,
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=False,
+            env=env,
+        )
 
-    return result.stdout.strip().split("\n")
+
+def run_files_chunked(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    cmd: List[str],
+    files: List[str],
+    cwd: Path,
+    env: Dict[str, str] | None = None,
+    min_chunk_files: int = DEFAULT_MIN_CHUNK_FILES,
+    arg_limit: int | None = None,
+) -> subprocess.CompletedProcess:
+    """Run a file-list tool over many files, fanning out across the job budget.
+
+    :param cmd: Command prefix (tool and flags); files are appended
+    :param files: Files to pass to the tool
+    :param cwd: Working directory
+    :param env: Optional environment for the tool
+    :param min_chunk_files: Minimum files per concurrent chunk
+    :param arg_limit: Command-line byte budget (default: get_arg_limit())
+    :returns: One merged CompletedProcess: stdout/stderr concatenated in chunk
+        order (same order as a single invocation for tools that report files in
+        argument order) and the highest chunk exit code
+    :raises FileNotFoundError: If the tool is not installed
+
+    :Notes:
+        - Small inputs run as a single, unchunked invocation in the calling thread
+        - An empty file list runs nothing: the tool would otherwise read stdin or fail
+        - Only use for tools whose per-file results don't depend on the other
+          files on the command line (linters/formatters, not whole-program checks)
+    """
+    chunks = split_file_chunks(cmd, files, get_job_budget(), cwd, min_chunk_files, arg_limit)
+    if not chunks:
+        return subprocess.CompletedProcess(args=list(cmd), returncode=0, stdout="", stderr="")
+    if len(chunks) == 1:
+        return _run_chunk(cmd, chunks[0], cwd, env)
+
+    with ThreadPoolExecutor(max_workers=min(len(chunks), get_job_budget())) as executor:
+        completed = list(executor.map(lambda chunk: _run_chunk(cmd, chunk, cwd, env), chunks))
+
+    return subprocess.CompletedProcess(
+        args=cmd + list(files),
+        returncode=max(result.returncode for result in completed),
+        stdout=_join_output(result.stdout for result in completed),
+        stderr=_join_output(result.stderr for result in completed),
+    )
+
+
+def _join_output(outputs: Iterable[str | None]) -> str:
+    """Concatenate chunk outputs without merging a last line into the next chunk's first.
+
+    :param outputs: Captured stdout or stderr of each chunk, in chunk order
+    :returns: Combined output
+    """
+    parts = []
+    for output in outputs:
+        if output:
+            parts.append(output if output.endswith("\n") else output + "\n")
+    return "".join(parts)
 
 
 class Runner(ABC):
@@ -191,6 +741,7 @@ class Runner(ABC):
         self._tool_filter = None  # List of specific tools to run (None = run all)
         self._changed_only = False  # Only check git-changed files
         self._include_fixtures = False  # Include test fixtures in scans (vector mode)
+        self._file_scope: Set[str] | None = None  # Restrict to these repo-relative paths (watch mode)
 
     @abstractmethod
     def has_files(self) -> bool:
@@ -360,6 +911,28 @@ class Runner(ABC):
         """
         self._include_fixtures = enabled
 
+    def set_file_scope(self, files: Iterable[str] | None) -> None:
+        """Restrict the runner to an explicit set of files.
+
+        :param files: Repo-relative file paths to lint, or None to lint everything
+
+        :Purpose:
+            Used by watch mode to re-lint only the files that changed. Runners
+            pass their tracked-file listings through _scoped(), so has_files()
+            also reports False when none of the scoped files belong to the runner.
+        """
+        self._file_scope = None if files is None else {Path(f).as_posix() for f in files}
+
+    def _scoped(self, files: List[str]) -> List[str]:
+        """Apply the file scope (if any) to a tracked-file listing.
+
+        :param files: Repo-relative file paths from get_tracked_files()
+        :returns: Files restricted to the current scope (unchanged if no scope is set)
+        """
+        if self._file_scope is None:
+            return files
+        return [f for f in files if f in self._file_scope]
+
     def _should_run_tool(self, tool_name: str) -> bool:
         """Check if a specific tool should run based on tool filter.
 
@@ -27,13 +27,12 @@
 
 from __future__ import annotations
 
-import subprocess
 from typing import List
 
 from tools.repo_lint.common import LintResult, Violation, convert_validation_errors_to_violations, filter_excluded_paths
 from tools.repo_lint.docstrings import validate_files
 from tools.repo_lint.policy import is_category_allowed
-from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files
+from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files, run_files_chunked
 
 
 class BashRunner(Runner):
@@ -51,7 +50,7 @@ class BashRunner(Runner):
             return len(changed_files) > 0
 
         # Otherwise check all tracked Bash files
-        files = get_tracked_files(["**/*.sh"], self.repo_root, include_fixtures=self._include_fixtures)
+        files = self._scoped(get_tracked_files(["**/*.sh"], self.repo_root, include_fixtures=self._include_fixtures))
         return len(files) > 0
 
     def check_tools(self) -> List[str]:
@@ -128,7 +127,9 @@ class BashRunner(Runner):
         :returns:
             List of Bash file paths (empty list if none found)
         """
-        all_files = get_tracked_files(["**/*.sh"], self.repo_root, include_fixtures=self._include_fixtures)
+        all_files = self._scoped(
+            get_tracked_files(["**/*.sh"], self.repo_root, include_fixtures=self._include_fixtures)
+        )
         return filter_excluded_paths(all_files)
 
     def _run_shellcheck(self) -> LintResult:
@@ -141,14 +142,8 @@ class BashRunner(Runner):
         if not bash_files:
             return LintResult(tool="shellcheck", passed=True, violations=[])
 
-        # Run shellcheck
-        result = subprocess.run(
-            ["shellcheck", "--color=never", "--format=gcc"] + bash_files,
-            cwd=self.repo_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        # Run shellcheck (chunked across the --jobs budget)
+        result = run_files_chunked(["shellcheck", "--color=never", "--format=gcc"], bash_files, self.repo_root)
 
         if result.returncode == 0:
             return LintResult(tool="shellcheck", passed=True, violations=[])
@@ -171,13 +166,7 @@ class BashRunner(Runner):
             return LintResult(tool="shfmt", passed=True, violations=[])
 
         # Run shfmt in check mode (-d = diff, -l = list files)
-        result = subprocess.run(
-            ["shfmt", "-d", "-l"] + bash_files,
-            cwd=self.repo_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = run_files_chunked(["shfmt", "-d", "-l"], bash_files, self.repo_root)
 
         if result.returncode == 0:
             return LintResult(tool="shfmt", passed=True, violations=[])
@@ -208,13 +197,7 @@ class BashRunner(Runner):
             return LintResult(tool="shfmt", passed=True, violations=[])
 
         # Run shfmt in fix mode (-w = write)
-        result = subprocess.run(
-            ["shfmt", "-w"] + bash_files,
-            cwd=self.repo_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = run_files_chunked(["shfmt", "-w"], bash_files, self.repo_root)
 
         if result.returncode == 0:
             return LintResult(tool="shfmt", passed=True, violations=[])
@@ -27,16 +27,106 @@
     Returns LintResult objects, not exit codes directly:
     - 0: Success (LintResult.passed = True)
     - 1: Violations found (LintResult.passed = False)
+
+:Notes:
+    Metadata validation scans the root object's keys from a bounded prefix of each
+    file and only parses the whole file when no metadata key is found there, so
+    large data files are not fully deserialized. Syntax errors after the metadata
+    key are reported by Prettier rather than by json-metadata.
 """
 
 from __future__ import annotations
 
 import json
-import subprocess
+import re
+from concurrent.futures import ThreadPoolExecutor
+from json.decoder import scanstring
 from typing import List
 
 from tools.repo_lint.common import LintResult, Violation
-from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files
+from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files, run_files_chunked
+
+# Root-level keys that satisfy the JSON metadata contract ("title" is used by some schemas)
+METADATA_KEYS = ("$schema", "description", "title")
+
+# Characters read before deciding whether a full parse is needed
+METADATA_PREFIX_CHARS = 64 * 1024
+
+# Threads used to read .json files for metadata validation
+METADATA_READ_WORKERS = 8
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+_NESTED_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}]')
+_SCALAR = re.compile(r"[^,}\]\s]+")
+
+
+def _skip_value(text: str, idx: int) -> int:
+    """Skip one JSON value without decoding it.
+
+    Only the structure needed to find the end of the value is checked
+    (strings and bracket nesting); scalars are taken as-is.
+
+    :param text: JSON text (possibly a truncated prefix)
+    :param idx: Index of the first character of the value
+    :returns: Index just past the value, or -1 if it does not end inside `text`
+    """
+    if idx >= len(text):
+        return -1
+    char = text[idx]
+    if char == '"':
+        match = _STRING.match(text, idx)
+        return match.end() if match else -1
+    if char not in "[{":
+        match = _SCALAR.match(text, idx)
+        return match.end() if match and match.end() < len(text) else -1
+    depth = 0
+    for match in _NESTED_TOKEN.finditer(text, idx):
+        token = match.group()
+        if token in "[{":
+            depth += 1
+        elif token in "]}":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return -1
+
+
+def scan_root_metadata(text: str) -> bool:
+    """Look for a root-level metadata key by scanning the start of a JSON document.
+
+    Walks the keys of the root object in order, skipping over values without
+    decoding them, and stops at the first metadata key.
+
+    :param text: Start of the document (a bounded prefix or the whole file)
+    :returns: True if a metadata key was found; False if the scan could not find
+        one (missing key, non-object root, truncated prefix or malformed tokens),
+        in which case a full parse decides
+    """
+    idx = _WHITESPACE.match(text, 0).end()
+    if text[idx : idx + 1] != "{":
+        return False
+    idx += 1
+    while True:
+        idx = _WHITESPACE.match(text, idx).end()
+        if text[idx : idx + 1] != '"':
+            return False
+        try:
+            key, idx = scanstring(text, idx + 1)
+        except ValueError:
+            return False
+        if key in METADATA_KEYS:
+            return True
+        idx = _WHITESPACE.match(text, idx).end()
+        if text[idx : idx + 1] != ":":
+            return False
+        idx = _skip_value(text, _WHITESPACE.match(text, idx + 1).end())
+        if idx < 0:
+            return False
+        idx = _WHITESPACE.match(text, idx).end()
+        if text[idx : idx + 1] != ",":
+            return False
+        idx += 1
 
 
 class JsonRunner(Runner):
@@ -54,10 +144,12 @@ class JsonRunner(Runner):
             return len(changed_files) > 0
 
         # Otherwise check all tracked JSON/JSONC files
-        files = get_tracked_files(
-            ["**/*.json", "**/*.jsonc"],
-            self.repo_root,
-            include_fixtures=self._include_fixtures,
+        files = self._scoped(
+            get_tracked_files(
+                ["**/*.json", "**/*.jsonc"],
+                self.repo_root,
+                include_fixtures=self._include_fixtures,
+            )
         )
         return len(files) > 0
 
@@ -116,10 +208,12 @@ class JsonRunner(Runner):
             LintResult for Prettier
         """
         # Get all JSON/JSONC files
-        json_files = get_tracked_files(
-            ["**/*.json", "**/*.jsonc"],
-            self.repo_root,
-            include_fixtures=self._include_fixtures,
+        json_files = self._scoped(
+            get_tracked_files(
+                ["**/*.json", "**/*.jsonc"],
+                self.repo_root,
+                include_fixtures=self._include_fixtures,
+            )
         )
 
         if not json_files:
@@ -138,17 +232,8 @@ class JsonRunner(Runner):
         if config_file.exists():
             cmd.extend(["--config", str(config_file)])
 
-        # Prettier accepts multiple files
-        cmd.extend(json_files)
-
-        # Run Prettier
-        result = subprocess.run(
-            cmd,
-            cwd=self.repo_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        # Run Prettier (chunked across the --jobs budget)
+        result = run_files_chunked(cmd, json_files, self.repo_root)
 
         # Prettier exits 0 on success, 1 on violations
         if result.returncode == 0:
@@ -208,84 +293,93 @@ class JsonRunner(Runner):
         Per docs/contributing/docstring-contracts/json-jsonc.md:
         All .json files MUST have either "$schema" OR "description" at root level.
 
+        Files are read concurrently; each file is checked with a bounded-prefix
+        scan (see scan_root_metadata()) and only fully parsed when the prefix
+        cannot decide.
+
         :returns:
             LintResult for JSON metadata validation
         """
-        # Get only .json files (not .jsonc)
-        json_files = get_tracked_files(
-            ["**/*.json"],
-            self.repo_root,
-            include_fixtures=self._include_fixtures,
-        )
+        # Same listing as Prettier (shared inventory), restricted to .json (not .jsonc)
+        json_files = [
+            f
+            for f in self._scoped(
+                get_tracked_files(
+                    ["**/*.json", "**/*.jsonc"],
+                    self.repo_root,
+                    include_fixtures=self._include_fixtures,
+                )
+            )
+            if f.endswith(".json")
+        ]
 
         if not json_files:
             return LintResult(tool="json-metadata", passed=True, violations=[])
 
-        violations = []
+        if len(json_files) == 1:
+            checked = [self._check_json_metadata(json_files[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(json_files), METADATA_READ_WORKERS)) as executor:
+                checked = list(executor.map(self._check_json_metadata, json_files))
 
-        for json_file in json_files:
-            file_path = self.repo_root / json_file
+        violations = [violation for violation in checked if violation is not None]
 
-            # Skip if file doesn't exist (edge case)
-            if not file_path.exists():
-                continue
+        passed = len(violations) == 0
+        return LintResult(tool="json-metadata", passed=passed, violations=violations)
 
-            try:
-                # Read and parse JSON
-                with open(file_path, encoding="utf-8") as f:
-                    data = json.load(f)
+    def _check_json_metadata(self, json_file: str) -> Violation | None:
+        """Check one .json file for a root-level metadata field.
 
-                # Must be a dict/object at root level
-                if not isinstance(data, dict):
-                    violations.append(
-                        Violation(
+        :param json_file: Repo-relative path of the file
+        :returns: Violation if the file is invalid or lacks metadata, None otherwise
+        """
+        file_path = self.repo_root / json_file
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                text = f.read(METADATA_PREFIX_CHARS)
+                found = scan_root_metadata(text)
+                if not found:
+                    # No metadata key in the prefix: a full parse decides (and locates syntax errors)
+                    if len(text) == METADATA_PREFIX_CHARS:
+                        text += f.read()
+                    data = json.loads(text)
+                    if not isinstance(data, dict):
+                        return Violation(
                             tool="json-metadata",
                             file=json_file,
                             line=1,
                             message="JSON file must be an object at root level to contain metadata fields",
                         )
-                    )
-                    continue
-
-                # Check for required metadata fields
-                has_schema = "$schema" in data
-                has_description = "description" in data
-                has_title = "title" in data  # Some schemas use "title" instead
-
-                if not (has_schema or has_description or has_title):
-                    violations.append(
-                        Violation(
-                            tool="json-metadata",
-                            file=json_file,
-                            line=1,
-                            message=(
-                                'Missing required metadata: JSON files must have "$schema", '
-                                '"description", or "title" field. '
-                                "See docs/contributing/docstring-contracts/json-jsonc.md"
-                            ),
-                        )
-                    )
-
-            except json.JSONDecodeError as e:
-                # Invalid JSON - report parsing error
-                violations.append(
-                    Violation(
-                        tool="json-metadata",
-                        file=json_file,
-                        line=e.lineno if hasattr(e, "lineno") else 1,
-                        message=f"Invalid JSON syntax: {e.msg}",
-                    )
-                )
-            except Exception as e:  # pylint: disable=broad-except
-                # Other errors (file read errors, etc.)
-                violations.append(
-                    Violation(
-                        tool="json-metadata",
-                        file=json_file,
-                        line=1,
-                        message=f"Error reading file: {str(e)}",
-                    )
-                )
-
-        passed = len(violations) == 0
-        return LintResult(tool="json-metadata", passed=passed, violations=violations)
+                    found = any(key in data for key in METADATA_KEYS)
+        except FileNotFoundError:
+            # Skip if file doesn't exist (edge case: deleted but still tracked)
+            return None
+        except json.JSONDecodeError as e:
+            # Invalid JSON - report parsing error
+            return Violation(
+                tool="json-metadata",
+                file=json_file,
+                line=e.lineno if hasattr(e, "lineno") else 1,
+                message=f"Invalid JSON syntax: {e.msg}",
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            # Other errors (file read errors, etc.)
+            return Violation(
+                tool="json-metadata",
+                file=json_file,
+                line=1,
+                message=f"Error reading file: {str(e)}",
+            )
+
+        if found:
+            return None
+        return Violation(
+            tool="json-metadata",
+            file=json_file,
+            line=1,
+            message=(
+                'Missing required metadata: JSON files must have "$schema", '
+                '"description", or "title" field. '
+                "See docs/contributing/docstring-contracts/json-jsonc.md"
+            ),
+        )
@@ -0,0 +1,52 @@
+"""Construction of the language-specific runners.
+
+:Purpose:
+    Builds the list of per-language runners in canonical order. Shared by
+    `repo-lint check`/`fix` (cli_argparse._run_all_runners) and
+    `repo-lint watch` so that both run the same runners.
+
+:Environment Variables:
+    None
+
+:Examples:
+    Build the runners for a CI run::
+
+        from tools.repo_lint.runners.language_runners import build_language_runners
+        for key, name, runner in build_language_runners(ci_mode=True):
+            results = runner.check()
+
+:Exit Codes:
+    N/A - This is a library module, not an executable script
+"""
+
+from __future__ import annotations
+
+from tools.repo_lint.runners.bash_runner import BashRunner
+from tools.repo_lint.runners.json_runner import JsonRunner
+from tools.repo_lint.runners.markdown_runner import MarkdownRunner
+from tools.repo_lint.runners.perl_runner import PerlRunner
+from tools.repo_lint.runners.powershell_runner import PowerShellRunner
+from tools.repo_lint.runners.python_runner import PythonRunner
+from tools.repo_lint.runners.rust_runner import RustRunner
+from tools.repo_lint.runners.toml_runner import TomlRunner
+from tools.repo_lint.runners.yaml_runner import YAMLRunner
+
+
+def build_language_runners(ci_mode: bool = False, verbose: bool = False) -> list:
+    """Instantiate all language-specific runners in canonical order.
+
+    :param ci_mode: Whether runners should run in CI mode (fail if tools missing)
+    :param verbose: Whether runners should show verbose output
+    :returns: List of (key, display_name, runner) tuples
+    """
+    return [
+        ("python", "Python", PythonRunner(ci_mode=ci_mode, verbose=verbose)),
+        ("bash", "Bash", BashRunner(ci_mode=ci_mode, verbose=verbose)),
+        ("powershell", "PowerShell", PowerShellRunner(ci_mode=ci_mode, verbose=verbose)),
+        ("perl", "Perl", PerlRunner(ci_mode=ci_mode, verbose=verbose)),
+        ("yaml", "YAML", YAMLRunner(ci_mode=ci_mode, verbose=verbose)),
+        ("toml", "TOML", TomlRunner(ci_mode=ci_mode, verbose=verbose)),
+        ("json", "JSON/JSONC", JsonRunner(ci_mode=ci_mode, verbose=verbose)),
+        ("rust", "Rust", RustRunner(ci_mode=ci_mode, verbose=verbose)),
+        ("markdown", "Markdown", MarkdownRunner(ci_mode=ci_mode, verbose=verbose)),
+    ]
@@ -29,11 +29,10 @@
 
 from __future__ import annotations
 
-import subprocess
 from typing import List
 
 from tools.repo_lint.common import LintResult, Violation
-from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files
+from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files, run_files_chunked
 
 
 class MarkdownRunner(Runner):
@@ -51,7 +50,7 @@ class MarkdownRunner(Runner):
             return len(changed_files) > 0
 
         # Otherwise check all tracked Markdown files
-        files = get_tracked_files(["**/*.md"], self.repo_root, include_fixtures=self._include_fixtures)
+        files = self._scoped(get_tracked_files(["**/*.md"], self.repo_root, include_fixtures=self._include_fixtures))
         return len(files) > 0
 
     def check_tools(self) -> List[str]:
@@ -109,7 +108,7 @@ class MarkdownRunner(Runner):
         # Get all Markdown files
         # Note: markdownlint-cli2 handles exclusions via .markdownlint-cli2.jsonc
         # but we still filter by tracked files to respect git
-        md_files = get_tracked_files(["**/*.md"], self.repo_root, include_fixtures=self._include_fixtures)
+        md_files = self._scoped(get_tracked_files(["**/*.md"], self.repo_root, include_fixtures=self._include_fixtures))
 
         if not md_files:
             return LintResult(tool="markdownlint-cli2", passed=True, violations=[])
@@ -124,17 +123,8 @@ class MarkdownRunner(Runner):
         if config_file.exists():
             cmd.extend(["--config", str(config_file)])
 
-        # Add files to lint
-        cmd.extend(md_files)
-
-        # Run markdownlint-cli2
-        result = subprocess.run(
-            cmd,
-            cwd=self.repo_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        # Run markdownlint-cli2 (chunked across the --jobs budget)
+        result = run_files_chunked(cmd, md_files, self.repo_root)
 
         # markdownlint-cli2 exits 0 on success, 1 on violations
         if result.returncode == 0:
@@ -32,6 +32,7 @@ from typing import Dict, List
 
 from tools.repo_lint.common import LintResult, MissingToolError, Violation
 from tools.repo_lint.config_validator import ConfigValidationError, load_validated_config
+from tools.repo_lint.path_matcher import compile_patterns
 from tools.repo_lint.runners.base import Runner
 
 
@@ -97,8 +98,11 @@ class NamingRunner(Runner):
             print(f"Config: {self.config_file}")
             print(f"Languages: {', '.join(self.languages.keys())}")
 
-        # Scan repository for files
-        all_files = self._get_all_repo_files(repo_root)
+        # Scan repository for files (or only the scoped files in watch mode)
+        if self._file_scope is not None:
+            all_files = [repo_root / f for f in sorted(self._file_scope) if (repo_root / f).is_file()]
+        else:
+            all_files = self._get_all_repo_files(repo_root)
 
         # Filter out exclusions
         files_to_check = self._filter_exclusions(all_files, repo_root)
@@ -157,33 +161,13 @@ class NamingRunner(Runner):
         :param files: List of file paths
         :param repo_root: Repository root directory
         :returns: Filtered list of file paths
+
+        :Note:
+            Exclusions use gitignore semantics (shared compiled matcher): "build/"
+            excludes build directories at any depth, "rust/target/" only at the root.
         """
-        filtered = []
-        for file_path in files:
-            relative_path = str(file_path.relative_to(repo_root))
-            excluded = False
-
-            for exclusion in self.exclusions:
-                # Handle directory exclusions (trailing /)
-                if exclusion.endswith("/"):
-                    if relative_path.startswith(exclusion) or f"/{exclusion}" in f"/{relative_path}":
-                        excluded = True
-                        break
-                # Handle pattern exclusions (*.ext)
-                elif exclusion.startswith("*"):
-                    pattern = exclusion.replace("*", ".*")
-                    if re.search(pattern, relative_path):
-                        excluded = True
-                        break
-                # Handle exact path exclusions
-                elif relative_path == exclusion or relative_path.startswith(f"{exclusion}/"):
-                    excluded = True
-                    break
-
-            if not excluded:
-                filtered.append(file_path)
-
-        return filtered
+        matcher = compile_patterns(self.exclusions)
+        return [file_path for file_path in files if not matcher.matches(file_path.relative_to(repo_root))]
 
     def _check_file_naming(self, file_path: Path, repo_root: Path, verbose: bool = False) -> LintResult | None:
         """Check a single file against naming rules.
@@ -26,12 +26,11 @@
 
 from __future__ import annotations
 
-import subprocess
 from typing import List
 
 from tools.repo_lint.common import LintResult, Violation, convert_validation_errors_to_violations, filter_excluded_paths
 from tools.repo_lint.docstrings import validate_files
-from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files
+from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files, run_files_chunked
 
 
 class PerlRunner(Runner):
@@ -49,7 +48,7 @@ class PerlRunner(Runner):
             return len(changed_files) > 0
 
         # Otherwise check all tracked Perl files
-        files = get_tracked_files(["**/*.pl"], self.repo_root, include_fixtures=self._include_fixtures)
+        files = self._scoped(get_tracked_files(["**/*.pl"], self.repo_root, include_fixtures=self._include_fixtures))
         return len(files) > 0
 
     def check_tools(self) -> List[str]:
@@ -103,7 +102,9 @@ class PerlRunner(Runner):
         :returns:
             List of Perl file paths (empty list if none found)
         """
-        all_files = get_tracked_files(["**/*.pl"], self.repo_root, include_fixtures=self._include_fixtures)
+        all_files = self._scoped(
+            get_tracked_files(["**/*.pl"], self.repo_root, include_fixtures=self._include_fixtures)
+        )
         return filter_excluded_paths(all_files)
 
     def _run_perlcritic(self) -> LintResult:
@@ -116,14 +117,8 @@ class PerlRunner(Runner):
         if not perl_files:
             return LintResult(tool="perlcritic", passed=True, violations=[])
 
-        # Run perlcritic
-        result = subprocess.run(
-            ["perlcritic", "--verbose", "8"] + perl_files,
-            cwd=self.repo_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        # Run perlcritic (chunked across the --jobs budget)
+        result = run_files_chunked(["perlcritic", "--verbose", "8"], perl_files, self.repo_root)
 
         # perlcritic exit code 0 = no violations, 2 = violations found
         if result.returncode == 0:
@@ -26,12 +26,11 @@
 
 from __future__ import annotations
 
-import subprocess
 from typing import List
 
 from tools.repo_lint.common import LintResult, Violation, convert_validation_errors_to_violations, filter_excluded_paths
 from tools.repo_lint.docstrings import validate_files
-from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files
+from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files, run_command
 
 
 class PowerShellRunner(Runner):
@@ -49,7 +48,7 @@ class PowerShellRunner(Runner):
             return len(changed_files) > 0
 
         # Otherwise check all tracked PowerShell files
-        files = get_tracked_files(["**/*.ps1"], self.repo_root, include_fixtures=self._include_fixtures)
+        files = self._scoped(get_tracked_files(["**/*.ps1"], self.repo_root, include_fixtures=self._include_fixtures))
         return len(files) > 0
 
     def check_tools(self) -> List[str]:
@@ -64,7 +63,7 @@ class PowerShellRunner(Runner):
             missing.append("pwsh")
         else:
             # Check if PSScriptAnalyzer module is available
-            result = subprocess.run(
+            result = run_command(
                 [
                     "pwsh",
                     "-NoProfile",
@@ -125,7 +124,9 @@ class PowerShellRunner(Runner):
         :returns:
             List of PowerShell file paths (empty list if none found)
         """
-        all_files = get_tracked_files(["**/*.ps1"], self.repo_root, include_fixtures=self._include_fixtures)
+        all_files = self._scoped(
+            get_tracked_files(["**/*.ps1"], self.repo_root, include_fixtures=self._include_fixtures)
+        )
         return filter_excluded_paths(all_files)
 
     def _run_psscriptanalyzer(self) -> LintResult:
@@ -142,7 +143,7 @@ class PowerShellRunner(Runner):
         violations = []
         for ps_file in ps_files:
             # Use -File parameter to safely pass the script path
-            result = subprocess.run(
+            result = run_command(
                 [
                     "pwsh",
                     "-NoProfile",
@@ -29,13 +29,12 @@
 from __future__ import annotations
 
 import os
-import subprocess
 from typing import List
 
 from tools.repo_lint.common import LintResult, Violation, convert_validation_errors_to_violations
 from tools.repo_lint.docstrings import validate_files
 from tools.repo_lint.policy import is_category_allowed
-from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files
+from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files, run_command
 
 
 class PythonRunner(Runner):
@@ -53,7 +52,7 @@ class PythonRunner(Runner):
             return len(changed_files) > 0
 
         # Otherwise check all tracked Python files
-        files = get_tracked_files(["**/*.py"], self.repo_root, include_fixtures=self._include_fixtures)
+        files = self._scoped(get_tracked_files(["**/*.py"], self.repo_root, include_fixtures=self._include_fixtures))
         return len(files) > 0
 
     def _is_ruff_context_line(self, line: str) -> bool:
@@ -217,14 +216,28 @@ class PythonRunner(Runner):
 
         return results
 
+    def _get_format_targets(self) -> List[str]:
+        """Get path arguments for Black and Ruff.
+
+        :returns: ["."] normally (tools apply their own excludes), or the scoped
+            Python files when a file scope is set (watch mode)
+        """
+        if self._file_scope is None:
+            return ["."]
+        return self._scoped(get_tracked_files(["**/*.py"], self.repo_root, include_fixtures=self._include_fixtures))
+
     def _run_black_check(self) -> LintResult:
         """Run Black in check mode.
 
         :returns:
             LintResult for Black check
         """
-        result = subprocess.run(
-            ["black", "--check", "--diff", "."], cwd=self.repo_root, capture_output=True, text=True, check=False
+        result = run_command(
+            ["black", "--check", "--diff"] + self._get_format_targets(),
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            check=False,
         )
 
         if result.returncode == 0:
@@ -282,7 +295,9 @@ class PythonRunner(Runner):
         :returns:
             LintResult for Black fix operation
         """
-        result = subprocess.run(["black", "."], cwd=self.repo_root, capture_output=True, text=True, check=False)
+        result = run_command(
+            ["black"] + self._get_format_targets(), cwd=self.repo_root, capture_output=True, text=True, check=False
+        )
 
         if result.returncode == 0:
             return LintResult(tool="black", passed=True, violations=[])
@@ -340,8 +355,12 @@ class PythonRunner(Runner):
         :returns:
             LintResult for Ruff check
         """
-        result = subprocess.run(
-            ["ruff", "check", ".", "--no-fix"], cwd=self.repo_root, capture_output=True, text=True, check=False
+        result = run_command(
+            ["ruff", "check"] + self._get_format_targets() + ["--no-fix"],
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            check=False,
         )
 
         violations, info_message = self._parse_ruff_output(result.stdout, context="check")
@@ -359,8 +378,12 @@ class PythonRunner(Runner):
             LintResult for Ruff fix operation
         """
         # Apply safe fixes only (no --unsafe-fixes flag)
-        result = subprocess.run(
-            ["ruff", "check", ".", "--fix"], cwd=self.repo_root, capture_output=True, text=True, check=False
+        result = run_command(
+            ["ruff", "check"] + self._get_format_targets() + ["--fix"],
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            check=False,
         )
 
         violations, info_message = self._parse_ruff_output(result.stdout, context="fix")
@@ -379,13 +402,15 @@ class PythonRunner(Runner):
         if self._changed_only:
             py_files = self._get_changed_files(patterns=["*.py", "**/*.py"])
         else:
-            py_files = get_tracked_files(["**/*.py"], self.repo_root, include_fixtures=self._include_fixtures)
+            py_files = self._scoped(
+                get_tracked_files(["**/*.py"], self.repo_root, include_fixtures=self._include_fixtures)
+            )
 
         if not py_files:
             return LintResult(tool="pylint", passed=True, violations=[])
 
         # Run pylint
-        result = subprocess.run(
+        result = run_command(
             ["pylint"] + py_files,
             cwd=self.repo_root,
             capture_output=True,
@@ -425,7 +450,7 @@ class PythonRunner(Runner):
             LintResult for docstring validation
         """
         # Get Python files to validate
-        files = get_tracked_files(["**/*.py"], self.repo_root, include_fixtures=self._include_fixtures)
+        files = self._scoped(get_tracked_files(["**/*.py"], self.repo_root, include_fixtures=self._include_fixtures))
 
         if not files:
             return LintResult(tool="python-docstrings", passed=True, violations=[])
@@ -451,7 +476,7 @@ class PythonRunner(Runner):
         from tools.repo_lint.checkers.pep526_config import get_default_config
 
         # Get Python files to check
-        files = get_tracked_files(["**/*.py"], self.repo_root, include_fixtures=self._include_fixtures)
+        files = self._scoped(get_tracked_files(["**/*.py"], self.repo_root, include_fixtures=self._include_fixtures))
 
         if not files:
             return LintResult(tool="pep526", passed=True, violations=[])
@@ -13,7 +13,10 @@
     COMPLETE - Full implementation with enhanced clippy parsing and docstring validation.
 
 :Environment Variables:
-    None
+    REPO_LINT_CARGO_TARGET_DIR
+        Cargo target directory used for lint builds (default: rust/target/repo-lint).
+        Kept separate from the regular target directory so clippy builds never
+        invalidate release/debug build artifacts.
 
 :Examples:
     Use this runner::
@@ -26,18 +29,169 @@
     Returns LintResult objects, not exit codes directly:
     - 0: Success (LintResult.passed = True)
     - 1: Violations found (LintResult.passed = False)
+
+:Notes:
+    In changed-only mode, or when a file scope is set (watch mode), changed `.rs`
+    files are mapped to their owning workspace crates and cargo fmt/clippy run with
+    `-p <crate>` for those crates only. The crate map comes from
+    `cargo metadata --no-deps` and is cached per Cargo.lock hash.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
-import subprocess
-from pathlib import Path
-from typing import List
+import os
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Tuple
 
 from tools.repo_lint.common import LintResult, Violation, convert_validation_errors_to_violations
 from tools.repo_lint.docstrings import validate_files
-from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files
+from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files, run_command
+
+# Dedicated target directory for lint builds, relative to rust/
+LINT_TARGET_SUBDIR = Path("target") / "repo-lint"
+
+# Crate map cache file name inside the lint target directory
+CRATE_MAP_FILE = "crate-map.json"
+
+# In-process crate map cache: rust_dir -> (lock digest, [(crate name, manifest dir)])
+_CRATE_MAP_CACHE: Dict[str, Tuple[str, List[Tuple[str, str]]]] = {}
+
+
+def get_lint_target_dir(rust_dir: Path) -> Path:
+    """Get the cargo target directory used for lint builds.
+
+    :param rust_dir: Path to the cargo workspace (rust/)
+    :returns: REPO_LINT_CARGO_TARGET_DIR if set, else rust/target/repo-lint
+    """
+    override = os.environ.get("REPO_LINT_CARGO_TARGET_DIR")
+    return Path(override) if override else rust_dir / LINT_TARGET_SUBDIR
+
+
+def get_cargo_env(rust_dir: Path) -> Dict[str, str]:
+    """Build the environment for cargo lint invocations.
+
+    :param rust_dir: Path to the cargo workspace (rust/)
+    :returns: Copy of os.environ with CARGO_TARGET_DIR pointing at the lint target directory
+    """
+    env = os.environ.copy()
+    env["CARGO_TARGET_DIR"] = str(get_lint_target_dir(rust_dir))
+    return env
+
+
+def _lock_digest(rust_dir: Path) -> str | None:
+    """Hash Cargo.lock (or Cargo.toml when there is no lock file).
+
+    :param rust_dir: Path to the cargo workspace (rust/)
+    :returns: Hex sha256 digest, or None if neither file can be read
+    """
+    for name in ("Cargo.lock", "Cargo.toml"):
+        try:
+            return hashlib.sha256((rust_dir / name).read_bytes()).hexdigest()
+        except OSError:
+            continue
+    return None
+
+
+def _read_cargo_metadata(rust_dir: Path) -> List[Tuple[str, str]] | None:
+    """Run `cargo metadata --no-deps` and extract workspace crates.
+
+    :param rust_dir: Path to the cargo workspace (rust/)
+    :returns: (crate name, manifest dir relative to rust_dir) tuples, or None if cargo failed
+    """
+    result = run_command(
+        ["cargo", "metadata", "--format-version", "1", "--no-deps"],
+        cwd=rust_dir,
+        capture_output=True,
+        text=True,
+        check=False,
+        env=get_cargo_env(rust_dir),
+    )
+    if result.returncode != 0:
+        return None
+    try:
+        packages = json.loads(result.stdout).get("packages", [])
+    except (json.JSONDecodeError, AttributeError):
+        return None
+
+    root = rust_dir.resolve()
+    crates = []
+    for package in packages:
+        manifest_dir = Path(package["manifest_path"]).resolve().parent
+        try:
+            rel_dir = manifest_dir.relative_to(root).as_posix()
+        except ValueError:
+            continue
+        crates.append((package["name"], "" if rel_dir == "." else rel_dir))
+    return crates
+
+
+def load_crate_map(rust_dir: Path) -> List[Tuple[str, str]] | None:
+    """Get the workspace crate map, cached per Cargo.lock hash.
+
+    The map is kept in memory and in `<lint target dir>/crate-map.json`, so
+    `cargo metadata` only runs again after Cargo.lock changes.
+
+    :param rust_dir: Path to the cargo workspace (rust/)
+    :returns: (crate name, manifest dir relative to rust_dir) tuples, or None if unavailable
+    """
+    digest = _lock_digest(rust_dir)
+    if digest is None:
+        return None
+    key = str(rust_dir)
+    cached = _CRATE_MAP_CACHE.get(key)
+    if cached and cached[0] == digest:
+        return cached[1]
+
+    cache_file = get_lint_target_dir(rust_dir) / CRATE_MAP_FILE
+    crates = None
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        entries = data["crates"] if data.get("lock_sha256") == digest else None
+        # JSON stores the (name, rel_dir) pairs as lists; anything else is a corrupt cache
+        if entries is not None and all(isinstance(entry, list) and len(entry) == 2 for entry in entries):
+            crates = [tuple(entry) for entry in entries]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        crates = None
+
+    if crates is None:
+        crates = _read_cargo_metadata(rust_dir)
+        if crates is None:
+            return None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps({"lock_sha256": digest, "crates": crates}), encoding="utf-8")
+        except OSError:
+            pass  # The on-disk cache is an optimization only
+
+    _CRATE_MAP_CACHE[key] = (digest, crates)
+    return crates
+
+
+def map_files_to_crates(files: List[str], crates: List[Tuple[str, str]], rust_prefix: str = "rust") -> List[str]:
+    """Map repo-relative `.rs` files to the workspace crates that own them.
+
+    Each file belongs to the crate with the longest manifest directory containing it.
+    Files outside the workspace (or outside every crate) are ignored.
+
+    :param files: Repo-relative file paths
+    :param crates: (crate name, manifest dir relative to rust/) tuples from load_crate_map()
+    :param rust_prefix: Repo-relative path of the cargo workspace
+    :returns: Sorted, de-duplicated crate names
+    """
+    by_depth = sorted(crates, key=lambda crate: len(crate[1]), reverse=True)
+    owners = set()
+    for file_path in files:
+        try:
+            rel = PurePosixPath(file_path).relative_to(rust_prefix).as_posix()
+        except ValueError:
+            continue
+        for name, rel_dir in by_depth:
+            if not rel_dir or rel == rel_dir or rel.startswith(rel_dir + "/"):
+                owners.add(name)
+                break
+    return sorted(owners)
 
 
 class RustRunner(Runner):
@@ -60,7 +214,7 @@ class RustRunner(Runner):
             return len(changed_files) > 0
 
         # Otherwise check all tracked Rust files
-        files = get_tracked_files(["**/*.rs"], self.repo_root, include_fixtures=self._include_fixtures)
+        files = self._scoped(get_tracked_files(["**/*.rs"], self.repo_root, include_fixtures=self._include_fixtures))
         return len(files) > 0
 
     def check_tools(self) -> List[str]:
@@ -78,7 +232,7 @@ class RustRunner(Runner):
                     missing.append(tool)
             # For clippy, check if cargo clippy works
             elif tool == "clippy-driver":
-                result = subprocess.run(
+                result = run_command(
                     ["cargo", "clippy", "--version"],
                     cwd=self.repo_root,
                     capture_output=True,
@@ -129,8 +283,19 @@ class RustRunner(Runner):
                 print("  No rust/ directory found, skipping rustfmt fix")
             return [LintResult(tool="rustfmt", passed=True, violations=[])]
 
+        package_args = self._get_package_args(rust_dir)
+        if package_args is None:
+            return [LintResult(tool="rustfmt", passed=True, violations=[])]
+
         # Run rustfmt to format code
-        rustfmt_result = subprocess.run(["cargo", "fmt"], cwd=rust_dir, capture_output=True, text=True, check=False)
+        rustfmt_result = run_command(
+            ["cargo", "fmt", *package_args],
+            cwd=rust_dir,
+            capture_output=True,
+            text=True,
+            check=False,
+            env=get_cargo_env(rust_dir),
+        )
 
         if rustfmt_result.returncode != 0:
             results.append(
@@ -155,6 +320,36 @@ class RustRunner(Runner):
 
         return results
 
+    def _get_package_args(self, rust_dir: Path) -> List[str] | None:
+        """Get cargo `-p` arguments restricting fmt/clippy to crates with changed files.
+
+        :param rust_dir: Path to the cargo workspace (rust/)
+        :returns: [] to run on the whole workspace, `-p <crate>` pairs for the owning
+            crates, or None when no workspace crate is affected and cargo can be skipped
+        """
+        if not self._changed_only and self._file_scope is None:
+            return []
+        if self._changed_only:
+            files = self._scoped(self._get_changed_files(patterns=["*.rs", "**/*.rs"]))
+        else:
+            files = sorted(f for f in self._file_scope if f.endswith(".rs"))
+        if not files:
+            return None
+
+        crates = load_crate_map(rust_dir)
+        if crates is None:
+            # No crate map (cargo metadata failed): fall back to the whole workspace
+            return []
+        rust_prefix = rust_dir.relative_to(self.repo_root).as_posix()
+        owners = map_files_to_crates(files, crates, rust_prefix=rust_prefix)
+        if not owners:
+            if self.verbose:
+                print("  No workspace crate owns the changed Rust files, skipping cargo")
+            return None
+        if self.verbose:
+            print(f"  Restricting cargo to crates: {', '.join(owners)}")
+        return [arg for name in owners for arg in ("-p", name)]
+
     def _run_rustfmt_check(self) -> LintResult:
         """Run rustfmt in check mode.
 
@@ -168,8 +363,17 @@ class RustRunner(Runner):
                 print("  No rust/ directory found, skipping rustfmt check")
             return LintResult(tool="rustfmt", passed=True, violations=[])
 
-        result = subprocess.run(
-            ["cargo", "fmt", "--", "--check"], cwd=rust_dir, capture_output=True, text=True, check=False
+        package_args = self._get_package_args(rust_dir)
+        if package_args is None:
+            return LintResult(tool="rustfmt", passed=True, violations=[])
+
+        result = run_command(
+            ["cargo", "fmt", *package_args, "--", "--check"],
+            cwd=rust_dir,
+            capture_output=True,
+            text=True,
+            check=False,
+            env=get_cargo_env(rust_dir),
         )
 
         if result.returncode == 0:
@@ -196,11 +400,16 @@ class RustRunner(Runner):
                 print("  No rust/ directory found, skipping clippy check")
             return LintResult(tool="clippy", passed=True, violations=[])
 
+        package_args = self._get_package_args(rust_dir)
+        if package_args is None:
+            return LintResult(tool="clippy", passed=True, violations=[])
+
         # Run clippy with JSON output for structured parsing
-        result = subprocess.run(
+        result = run_command(
             [
                 "cargo",
                 "clippy",
+                *package_args,
                 "--all-targets",
                 "--all-features",
                 "--message-format=json",
@@ -212,6 +421,7 @@ class RustRunner(Runner):
             capture_output=True,
             text=True,
             check=False,
+            env=get_cargo_env(rust_dir),
         )
 
         if result.returncode == 0:
@@ -311,7 +521,9 @@ class RustRunner(Runner):
             return LintResult(tool="rust-docstrings", passed=True, violations=[])
 
         # Get Rust files to validate
-        rust_files = get_tracked_files(["**/*.rs"], self.repo_root, include_fixtures=self._include_fixtures)
+        rust_files = self._scoped(
+            get_tracked_files(["**/*.rs"], self.repo_root, include_fixtures=self._include_fixtures)
+        )
 
         if not rust_files:
             return LintResult(tool="rust-docstrings", passed=True, violations=[])
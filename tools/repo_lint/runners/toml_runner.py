@@ -29,11 +29,10 @@
 
 from __future__ import annotations
 
-import subprocess
 from typing import List
 
 from tools.repo_lint.common import LintResult, Violation
-from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files
+from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files, run_files_chunked
 
 
 class TomlRunner(Runner):
@@ -51,7 +50,7 @@ class TomlRunner(Runner):
             return len(changed_files) > 0
 
         # Otherwise check all tracked TOML files
-        files = get_tracked_files(["**/*.toml"], self.repo_root, include_fixtures=self._include_fixtures)
+        files = self._scoped(get_tracked_files(["**/*.toml"], self.repo_root, include_fixtures=self._include_fixtures))
         return len(files) > 0
 
     def check_tools(self) -> List[str]:
@@ -108,7 +107,9 @@ class TomlRunner(Runner):
         # Get all TOML files
         # Note: Taplo handles config exclusions via taplo.toml
         # but we still filter by tracked files to respect git
-        toml_files = get_tracked_files(["**/*.toml"], self.repo_root, include_fixtures=self._include_fixtures)
+        toml_files = self._scoped(
+            get_tracked_files(["**/*.toml"], self.repo_root, include_fixtures=self._include_fixtures)
+        )
 
         if not toml_files:
             return LintResult(tool="taplo", passed=True, violations=[])
@@ -126,17 +127,8 @@ class TomlRunner(Runner):
         if config_file.exists():
             cmd.extend(["--config", str(config_file)])
 
-        # Add files to lint/format
-        cmd.extend(toml_files)
-
-        # Run Taplo
-        result = subprocess.run(
-            cmd,
-            cwd=self.repo_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        # Run Taplo (chunked across the --jobs budget)
+        result = run_files_chunked(cmd, toml_files, self.repo_root)
 
         # Taplo exits 0 on success, 1 on violations
         if result.returncode == 0:
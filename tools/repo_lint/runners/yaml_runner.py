@@ -26,12 +26,11 @@
 
 from __future__ import annotations
 
-import subprocess
 from typing import List
 
 from tools.repo_lint.common import LintResult, Violation, convert_validation_errors_to_violations
 from tools.repo_lint.docstrings import validate_files
-from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files
+from tools.repo_lint.runners.base import Runner, command_exists, get_tracked_files, run_command, run_files_chunked
 
 
 class YAMLRunner(Runner):
@@ -49,7 +48,9 @@ class YAMLRunner(Runner):
             return len(changed_files) > 0
 
         # Otherwise check all tracked YAML files
-        files = get_tracked_files(["**/*.yml", "**/*.yaml"], self.repo_root, include_fixtures=self._include_fixtures)
+        files = self._scoped(
+            get_tracked_files(["**/*.yml", "**/*.yaml"], self.repo_root, include_fixtures=self._include_fixtures)
+        )
         return len(files) > 0
 
     def check_tools(self) -> List[str]:
@@ -118,21 +119,15 @@ class YAMLRunner(Runner):
             LintResult for yamllint
         """
         # Get all YAML files, excluding test fixtures
-        yaml_files = get_tracked_files(
-            ["**/*.yml", "**/*.yaml"], self.repo_root, include_fixtures=self._include_fixtures
+        yaml_files = self._scoped(
+            get_tracked_files(["**/*.yml", "**/*.yaml"], self.repo_root, include_fixtures=self._include_fixtures)
         )
 
         if not yaml_files:
             return LintResult(tool="yamllint", passed=True, violations=[])
 
-        # Run yamllint
-        result = subprocess.run(
-            ["yamllint", "-f", "parsable"] + yaml_files,
-            cwd=self.repo_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        # Run yamllint (chunked across the --jobs budget)
+        result = run_files_chunked(["yamllint", "-f", "parsable"], yaml_files, self.repo_root)
 
         if result.returncode == 0:
             return LintResult(tool="yamllint", passed=True, violations=[])
@@ -156,17 +151,19 @@ class YAMLRunner(Runner):
             LintResult for actionlint
         """
         # Get GitHub Actions workflow files only
-        workflow_files = get_tracked_files(
-            [".github/workflows/*.yml", ".github/workflows/*.yaml"],
-            self.repo_root,
-            include_fixtures=self._include_fixtures,
+        workflow_files = self._scoped(
+            get_tracked_files(
+                [".github/workflows/*.yml", ".github/workflows/*.yaml"],
+                self.repo_root,
+                include_fixtures=self._include_fixtures,
+            )
         )
 
         if not workflow_files:
             return LintResult(tool="actionlint", passed=True, violations=[])
 
         # Run actionlint
-        result = subprocess.run(
+        result = run_command(
             ["actionlint"] + workflow_files,
             cwd=self.repo_root,
             capture_output=True,
@@ -195,8 +192,8 @@ class YAMLRunner(Runner):
             LintResult for yaml-docstrings
         """
         # Get YAML files to validate
-        yaml_files = get_tracked_files(
-            ["**/*.yml", "**/*.yaml"], self.repo_root, include_fixtures=self._include_fixtures
+        yaml_files = self._scoped(
+            get_tracked_files(["**/*.yml", "**/*.yaml"], self.repo_root, include_fixtures=self._include_fixtures)
         )
 
         if not yaml_files:
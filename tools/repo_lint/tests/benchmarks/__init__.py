@@ -0,0 +1,18 @@
+"""Performance benchmarks for repo_lint hot paths.
+
+:Purpose:
+    Timing harnesses, synthetic repository generators and the JSON baselines
+    that benchmark results are compared against.
+
+:Environment Variables:
+    See test_hot_paths.py (REPO_LINT_BENCH_SCALE, REPO_LINT_BENCH_COMPARE,
+    REPO_LINT_BENCH_UPDATE).
+
+:Examples:
+    Run the benchmarks::
+
+        pytest tools/repo_lint/tests/benchmarks -q
+
+:Exit Codes:
+    N/A
+"""
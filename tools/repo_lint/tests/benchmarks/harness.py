@@ -0,0 +1,171 @@
+"""Timing harness and JSON baselines for repo_lint benchmarks.
+
+:Purpose:
+    Times a callable with time.perf_counter() in the manner of timeit
+    (repeated rounds, garbage collection disabled while timing) and compares
+    the results against a checked-in JSON baseline, so a slowdown shows up as
+    a failing benchmark or a baseline diff in review.
+
+:Baseline Format:
+    baselines/hot_paths.json holds one entry per benchmark::
+
+        {
+          "description": "repo_lint hot-path benchmark baseline (machine-specific); ...",
+          "schema": 1,
+          "scale": 1,
+          "machine": {"python": "3.11.7", "platform": "Linux-x86_64", "cpus": 4},
+          "benchmarks": {
+            "validate_files": {"items": 400, "median_ms": 41.2, "min_ms": 40.1, "us_per_item": 103.0}
+          }
+        }
+
+    Comparisons use min_ms, the least noisy statistic on a shared machine
+    (the same reasoning as timeit's); a baseline is only comparable when it
+    was recorded at the same scale. Baselines are machine-specific: refresh
+    them on the machine that runs the comparison.
+
+:Environment Variables:
+    None (see test_hot_paths.py)
+
+:Examples:
+    Time a callable::
+
+        stats = measure(lambda: validate_files(paths), items=len(paths), repeat=5)
+        print(stats["median_ms"], stats["us_per_item"])
+
+:Exit Codes:
+    N/A
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+BASELINE_SCHEMA = 1
+BASELINE_DESCRIPTION = (
+    "repo_lint hot-path benchmark baseline (machine-specific); "
+    "refresh with REPO_LINT_BENCH_UPDATE=1, see tools/repo_lint/tests/benchmarks/harness.py"
+)
+
+
+def measure(func: Callable[[], Any], items: int, repeat: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """Time repeated calls of func.
+
+    :param func: Callable to time (called with no arguments)
+    :param items: Work items per call (files, results, ...), for per-item cost
+    :param repeat: Timed calls
+    :param warmup: Untimed calls first (fills OS and config caches)
+    :returns: Dict with items, repeat, min_ms, median_ms, max_ms and us_per_item
+        (the per-item cost of the median call)
+    """
+    for _ in range(warmup):
+        func()
+    timings: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    median = statistics.median(timings)
+    return {
+        "items": items,
+        "repeat": repeat,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(median, 3),
+        "max_ms": round(max(timings), 3),
+        "us_per_item": round(median * 1000 / max(items, 1), 3),
+    }
+
+
+def machine_info() -> Dict[str, Any]:
+    """Describe the machine a baseline was recorded on.
+
+    :returns: Dict with python, platform and cpus
+    """
+    return {
+        "python": platform.python_version(),
+        "platform": f"{platform.system()}-{platform.machine()}",
+        "cpus": os.cpu_count() or 1,
+    }
+
+
+def load_baseline(name: str) -> Dict[str, Any]:
+    """Load a baseline file.
+
+    :param name: Baseline name (file stem under baselines/)
+    :returns: Parsed baseline, or an empty baseline if the file is missing or unreadable
+    """
+    try:
+        data = json.loads((BASELINE_DIR / f"{name}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        # OSError: Baseline not recorded yet; ValueError: Corrupt JSON (treated as missing)
+        return {"schema": BASELINE_SCHEMA, "benchmarks": {}}
+    if not isinstance(data, dict) or data.get("schema") != BASELINE_SCHEMA:
+        return {"schema": BASELINE_SCHEMA, "benchmarks": {}}
+    return data
+
+
+def save_baseline(name: str, scale: int, results: Dict[str, Dict[str, float]]) -> Path:
+    """Write benchmark results as the new baseline.
+
+    :param name: Baseline name (file stem under baselines/)
+    :param scale: Scale factor the results were recorded at
+    :param results: Benchmark name to measure() result
+    :returns: Path of the written file
+
+    :Notes:
+        Benchmarks not in results keep their previous entries, so running a
+        subset of benchmarks updates only those.
+    """
+    baseline = load_baseline(name)
+    benchmarks = baseline.get("benchmarks", {}) if baseline.get("scale") == scale else {}
+    benchmarks.update(results)
+    data = {
+        # Root-level "description" satisfies the repo's JSON metadata contract
+        "description": BASELINE_DESCRIPTION,
+        "schema": BASELINE_SCHEMA,
+        "scale": scale,
+        "machine": machine_info(),
+        "benchmarks": dict(sorted(benchmarks.items())),
+    }
+    path = BASELINE_DIR / f"{name}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def compare(baseline: Dict[str, Any], name: str, stats: Dict[str, float], scale: int, tolerance: float) -> str | None:
+    """Compare one benchmark result against its baseline entry.
+
+    :param baseline: Baseline from load_baseline()
+    :param name: Benchmark name
+    :param stats: measure() result
+    :param scale: Scale factor of the current run
+    :param tolerance: Allowed slowdown factor (2.0 = up to twice as slow)
+    :returns: Regression message, or None if within tolerance or not comparable
+    """
+    if baseline.get("scale") != scale:
+        return None
+    entry = baseline.get("benchmarks", {}).get(name)
+    if not entry or entry.get("items") != stats["items"]:
+        return None
+    limit = entry["min_ms"] * tolerance
+    if stats["min_ms"] <= limit:
+        return None
+    return (
+        f"{name}: best of {stats['repeat']} {stats['min_ms']:.1f}ms exceeds baseline {entry['min_ms']:.1f}ms "
+        f"x {tolerance} = {limit:.1f}ms"
+    )
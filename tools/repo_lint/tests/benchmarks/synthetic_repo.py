@@ -0,0 +1,328 @@
+"""Synthetic repository generator for repo_lint benchmarks.
+
+:Purpose:
+    Builds a throwaway git repository with N Python, Bash and YAML files, a
+    configurable share of which carry violations, plus the repo_lint
+    conformance configs. The generated content is deterministic for a given
+    seed, so benchmark runs are comparable across commits.
+
+:Violations:
+    A "dirty" file has, per language:
+
+    - Python: a missing module docstring section (:Exit Codes:), a module-level
+      variable without a PEP 526 annotation and a PascalCase file name
+    - Bash: a missing header section (EXAMPLES:) and a snake_case file name
+    - YAML: a missing header section (Notes:) and a camelCase file name
+
+    Clean files pass the docstring validators, the PEP 526 checker and the
+    naming rules.
+
+:Environment Variables:
+    None
+
+:Examples:
+    Create a repository with 20% dirty files::
+
+        repo = make_synthetic_repo(Path(tmp), {"python": 200, "bash": 50}, violation_density=0.2)
+        print(len(repo.files["python"]), len(repo.dirty))
+
+:Exit Codes:
+    N/A
+"""
+
+from __future__ import annotations
+
+import random
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Set
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+CONFORMANCE_DIR = REPO_ROOT / "conformance" / "repo-lint"
+
+# Files copied from conformance/repo-lint (fixtures and vectors are not needed)
+CONFIG_FILES = [
+    "repo-lint-docstring-rules.yaml",
+    "repo-lint-file-patterns.yaml",
+    "repo-lint-linting-rules.yaml",
+    "repo-lint-naming-rules.yaml",
+    "repo-lint-ui-theme.yaml",
+]
+
+PYTHON_TEMPLATE = '''"""Synthetic module {index}.
+
+:Purpose:
+    Benchmark input generated by synthetic_repo.py.
+
+:Environment Variables:
+    None
+
+:Examples:
+    Import it::
+
+        import {stem}
+{exit_codes}"""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+LIMIT: int = {index}
+{module_vars}
+
+class Record{index}:
+    """A record.
+
+    :param name: Record name
+    """
+
+    kind: str = "record"
+
+    def __init__(self, name: str) -> None:
+        """Initialize the record.
+
+        :param name: Record name
+        """
+        self.name = name
+        self.items: List[int] = []
+
+    def total(self) -> int:
+        """Sum the items.
+
+        :returns: Total of all items
+        """
+        result = 0
+        for item in self.items:
+            result += item
+        return result
+
+
+def build_{index}(count: int) -> Dict[str, int]:
+    """Build an index of records.
+
+    :param count: Number of records
+    :returns: Mapping of record name to position
+    """
+    index: Dict[str, int] = {{}}
+    for position in range(count):
+        index[f"record-{{position}}"] = position
+    return index
+'''
+
+PYTHON_EXIT_CODES = """
+:Exit Codes:
+    N/A
+"""
+
+BASH_TEMPLATE = """#!/usr/bin/env bash
+#
+# DESCRIPTION:
+#   Synthetic script {index} generated by synthetic_repo.py.
+#
+# USAGE:
+#   {name} [ARGS...]
+#
+# INPUTS:
+#   ARGS - Values to print
+#
+# OUTPUTS:
+#   Exit Codes:
+#     0  Success
+#     1  Failure
+{examples}
+set -euo pipefail
+
+# print_values - Print each argument on its own line
+#
+# Arguments:
+#   $@ - Values to print
+#
+# Returns:
+#   0 on success
+print_values() {{
+  local value
+  for value in "$@"; do
+    printf '%s\\n' "$value"
+  done
+}}
+
+print_values "$@"
+"""
+
+BASH_EXAMPLES = """#
+# EXAMPLES:
+#   {name} a b c
+#"""
+
+YAML_TEMPLATE = """---
+# File: {name}
+# Purpose: Synthetic config {index} generated by synthetic_repo.py
+# Usage: Benchmark input only
+# Inputs: None
+# Outputs: None
+{notes}
+name: synthetic-{index}
+version: "1.0.{index}"
+settings:
+  enabled: true
+  retries: {retries}
+  targets:
+    - alpha
+    - beta
+"""
+
+YAML_NOTES = "# Notes: Not loaded by any tool"
+
+
+class SyntheticRepo:
+    """A generated benchmark repository.
+
+    :param root: Repository root
+    :param files: Repository-relative paths per language ("python", "bash", "yaml")
+    :param dirty: Repository-relative paths of files generated with violations
+    """
+
+    def __init__(self, root: Path, files: Dict[str, List[str]], dirty: Set[str]) -> None:
+        """Initialize the repository description.
+
+        :param root: Repository root
+        :param files: Repository-relative paths per language
+        :param dirty: Repository-relative paths of files with violations
+        """
+        self.root = root
+        self.files = files
+        self.dirty = dirty
+
+    def paths(self, language: str) -> List[Path]:
+        """Get absolute paths of one language's files.
+
+        :param language: "python", "bash" or "yaml"
+        :returns: Absolute file paths
+        """
+        return [self.root / rel for rel in self.files[language]]
+
+    def dirty_count(self, language: str) -> int:
+        """Count the files of one language generated with violations.
+
+        :param language: "python", "bash" or "yaml"
+        :returns: Number of dirty files
+        """
+        return sum(1 for rel in self.files[language] if rel in self.dirty)
+
+    @property
+    def file_count(self) -> int:
+        """Total number of generated source files.
+
+        :returns: Number of Python, Bash and YAML files
+        """
+        return sum(len(paths) for paths in self.files.values())
+
+
+def _write_python(root: Path, index: int, dirty: bool) -> str:
+    """Write one Python module.
+
+    :param root: Repository root
+    :param index: File number
+    :param dirty: Generate the file with violations
+    :returns: Repository-relative path
+    """
+    stem = f"SyntheticModule{index}" if dirty else f"synthetic_module_{index}"
+    rel = f"src/pkg{index % 10}/{stem}.py"
+    text = PYTHON_TEMPLATE.format(
+        index=index,
+        stem=stem,
+        exit_codes="" if dirty else PYTHON_EXIT_CODES,
+        module_vars=f"cache = {{}}\nretries = {index % 5}\n" if dirty else "",
+    )
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return rel
+
+
+def _write_bash(root: Path, index: int, dirty: bool) -> str:
+    """Write one Bash script.
+
+    :param root: Repository root
+    :param index: File number
+    :param dirty: Generate the file with violations
+    :returns: Repository-relative path
+    """
+    name = f"synthetic_script_{index}.sh" if dirty else f"synthetic-script-{index}.sh"
+    rel = f"scripts/group{index % 5}/{name}"
+    text = BASH_TEMPLATE.format(index=index, name=name, examples="" if dirty else BASH_EXAMPLES.format(name=name))
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return rel
+
+
+def _write_yaml(root: Path, index: int, dirty: bool) -> str:
+    """Write one YAML config.
+
+    :param root: Repository root
+    :param index: File number
+    :param dirty: Generate the file with violations
+    :returns: Repository-relative path
+    """
+    name = f"syntheticConfig{index}.yaml" if dirty else f"synthetic-config-{index}.yaml"
+    rel = f"config/{name}"
+    text = YAML_TEMPLATE.format(index=index, name=name, notes="" if dirty else YAML_NOTES, retries=index % 7)
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return rel
+
+
+def make_synthetic_repo(
+    root: Path,
+    counts: Dict[str, int],
+    *,
+    violation_density: float = 0.0,
+    seed: int = 0,
+) -> SyntheticRepo:
+    """Generate a git repository of synthetic source files.
+
+    :param root: Empty directory to populate
+    :param counts: Number of files per language ("python", "bash", "yaml");
+        missing languages get no files
+    :param violation_density: Share of files (0.0 to 1.0) generated with violations
+    :param seed: Random seed choosing which files are dirty
+    :returns: SyntheticRepo describing the generated files
+    :raises ValueError: If violation_density is outside 0.0 to 1.0 or counts
+        names an unknown language
+    :raises subprocess.CalledProcessError: If git init or git add fails
+
+    :Notes:
+        Files are staged but not committed; git ls-files lists them either way.
+    """
+    if not 0.0 <= violation_density <= 1.0:
+        raise ValueError(f"violation_density must be between 0 and 1, got {violation_density}")
+    writers = {"python": _write_python, "bash": _write_bash, "yaml": _write_yaml}
+    unknown = sorted(set(counts) - set(writers))
+    if unknown:
+        raise ValueError(f"Unknown languages in counts: {', '.join(unknown)}")
+
+    rng = random.Random(seed)
+    root = Path(root)
+    config_dir = root / "conformance" / "repo-lint"
+    config_dir.mkdir(parents=True)
+    for name in CONFIG_FILES:
+        shutil.copyfile(CONFORMANCE_DIR / name, config_dir / name)
+
+    files: Dict[str, List[str]] = {language: [] for language in writers}
+    dirty: Set[str] = set()
+    for language, writer in writers.items():
+        count = counts.get(language, 0)
+        # Exactly round(count * density) dirty files, at seeded positions
+        dirty_indexes = set(rng.sample(range(count), round(count * violation_density)))
+        for index in range(count):
+            rel = writer(root, index, index in dirty_indexes)
+            files[language].append(rel)
+            if index in dirty_indexes:
+                dirty.add(rel)
+
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=root, check=True)
+    return SyntheticRepo(root, files, dirty)
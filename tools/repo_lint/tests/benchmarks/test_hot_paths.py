@@ -0,0 +1,305 @@
+"""Benchmarks for repo_lint hot paths on synthetic repositories.
+
+:Purpose:
+    Times the code paths every repo-lint run goes through, on generated
+    repositories with a known number of violations, and records the results
+    in baselines/hot_paths.json. Each benchmark also asserts the violation
+    counts, so a speedup that changes results fails here.
+
+:Benchmarks:
+    - get_tracked_files (uncached and with the daemon's index-keyed cache)
+    - validate_files over Python, Bash and YAML files
+    - PEP526Checker.check_file over every Python file
+    - NamingRunner.check over the whole repository
+    - report_results_json over results with thousands of violations
+    - _run_all_runners, the full check pipeline (skipped when the Python or
+      YAML runner's tools are not installed), and the same pipeline replaying
+      recorded tool output (parsing and orchestration only)
+
+:Environment Variables:
+    REPO_LINT_BENCH_SCALE
+        Multiplies the synthetic repository size (default: 1, i.e. 200 Python,
+        100 Bash and 100 YAML files; 20 Python and 10 YAML files for the pipeline)
+    REPO_LINT_BENCH_COMPARE
+        Set to 1 to fail benchmarks that are slower than the baseline
+        recorded at the same scale by more than the tolerance
+    REPO_LINT_BENCH_TOLERANCE
+        Allowed slowdown factor for REPO_LINT_BENCH_COMPARE (default: 2.0;
+        single-run timings on shared CI machines vary by more than 50%)
+    REPO_LINT_BENCH_UPDATE
+        Set to 1 to write the results to baselines/hot_paths.json
+
+:Examples:
+    Smoke-run the benchmarks (part of the normal test run)::
+
+        pytest tools/repo_lint/tests/benchmarks -q
+
+    Check for regressions, then refresh the baseline after an intended change::
+
+        REPO_LINT_BENCH_COMPARE=1 pytest tools/repo_lint/tests/benchmarks -q
+        REPO_LINT_BENCH_UPDATE=1 pytest tools/repo_lint/tests/benchmarks -q
+
+:Exit Codes:
+    N/A
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+from typing import Dict, List
+
+import pytest
+
+from tools.repo_lint import cli_argparse
+from tools.repo_lint.checkers.pep526_checker import PEP526Checker
+from tools.repo_lint.checkers.pep526_config import get_default_config
+from tools.repo_lint.common import LintResult, Violation
+from tools.repo_lint.docstrings.validator import validate_files
+from tools.repo_lint.reporting import report_results_json
+from tools.repo_lint.runners.base import (
+    RecordingExecutor,
+    ReplayExecutor,
+    get_tracked_files,
+    set_command_executor,
+    set_tracked_files_cache,
+)
+from tools.repo_lint.runners.naming_runner import NamingRunner
+from tools.repo_lint.runners.python_runner import PythonRunner
+from tools.repo_lint.runners.yaml_runner import YAMLRunner
+from tools.repo_lint.tests.benchmarks.harness import compare, load_baseline, measure, save_baseline
+from tools.repo_lint.tests.benchmarks.synthetic_repo import CONFIG_FILES, make_synthetic_repo
+
+BASELINE = "hot_paths"
+SCALE = int(os.environ.get("REPO_LINT_BENCH_SCALE", "1"))
+COMPARE = os.environ.get("REPO_LINT_BENCH_COMPARE", "") == "1"
+UPDATE = os.environ.get("REPO_LINT_BENCH_UPDATE", "") == "1"
+TOLERANCE = float(os.environ.get("REPO_LINT_BENCH_TOLERANCE", "2.0"))
+VIOLATION_DENSITY = 0.2
+
+
+@pytest.fixture(scope="module", name="repo")
+def repo_fixture(tmp_path_factory):
+    """Generate the shared synthetic repository and run from its root.
+
+    :param tmp_path_factory: pytest temporary directory factory
+    :returns: SyntheticRepo (yielded)
+    """
+    root = tmp_path_factory.mktemp("bench-repo")
+    synthetic = make_synthetic_repo(
+        root,
+        {"python": 200 * SCALE, "bash": 100 * SCALE, "yaml": 100 * SCALE},
+        violation_density=VIOLATION_DENSITY,
+        seed=1,
+    )
+    # Config lookups (exclusions, naming rules) resolve from the working directory
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(root)
+        yield synthetic
+
+
+@pytest.fixture(scope="module", name="record")
+def record_fixture():
+    """Collect benchmark results, compare them and optionally update the baseline.
+
+    :returns: Callable taking (name, stats) (yielded)
+    """
+    baseline = load_baseline(BASELINE)
+    results: Dict[str, Dict[str, float]] = {}
+
+    def _record(name: str, stats: Dict[str, float]) -> None:
+        """Store one result and compare it when REPO_LINT_BENCH_COMPARE=1.
+
+        :param name: Benchmark name
+        :param stats: measure() result
+        """
+        results[name] = stats
+        print(f"\n{name}: min {stats['min_ms']}ms, median {stats['median_ms']}ms, {stats['us_per_item']}us/item")
+        if COMPARE:
+            regression = compare(baseline, name, stats, SCALE, TOLERANCE)
+            assert regression is None, regression
+
+    yield _record
+    if UPDATE and results:
+        save_baseline(BASELINE, SCALE, results)
+
+
+def test_get_tracked_files(repo, record):
+    """git ls-files plus exclusion filtering, without and with the index-keyed cache.
+
+    :param repo: Shared synthetic repository fixture
+    :param record: Benchmark result recorder fixture
+    """
+    patterns = ["**/*.py", "**/*.sh", "**/*.yaml"]
+    expected = repo.file_count + sum(1 for name in CONFIG_FILES if name.endswith(".yaml"))
+
+    set_tracked_files_cache(False)
+    assert len(get_tracked_files(patterns, repo.root)) == expected
+    record("get_tracked_files", measure(lambda: get_tracked_files(patterns, repo.root), items=expected, repeat=10))
+
+    set_tracked_files_cache(True)
+    try:
+        record(
+            "get_tracked_files_cached",
+            measure(lambda: get_tracked_files(patterns, repo.root), items=expected, repeat=10),
+        )
+    finally:
+        set_tracked_files_cache(False)
+
+
+def test_validate_files(repo, record):
+    """Docstring validation dispatch across Python, Bash and YAML files.
+
+    :param repo: Shared synthetic repository fixture
+    :param record: Benchmark result recorder fixture
+    """
+    paths = repo.paths("python") + repo.paths("bash") + repo.paths("yaml")
+
+    assert len(validate_files(paths)) == len(repo.dirty)
+    record("validate_files", measure(lambda: validate_files(paths), items=len(paths)))
+
+
+def test_pep526_check_file(repo, record):
+    """PEP 526 AST checks on every Python file (two violations per dirty file).
+
+    :param repo: Shared synthetic repository fixture
+    :param record: Benchmark result recorder fixture
+    """
+    checker = PEP526Checker(get_default_config())
+    paths = repo.paths("python")
+
+    def check_all() -> int:
+        """Check every Python file.
+
+        :returns: Total number of violations
+        """
+        return sum(len(checker.check_file(path)) for path in paths)
+
+    assert check_all() == 2 * repo.dirty_count("python")
+    record("pep526_check_file", measure(check_all, items=len(paths)))
+
+
+def test_naming_runner_check(repo, record):
+    """Naming rules over every tracked file.
+
+    :param repo: Shared synthetic repository fixture
+    :param record: Benchmark result recorder fixture
+    """
+    runner = NamingRunner()
+    tracked = len(get_tracked_files([], repo.root))
+
+    assert sum(len(result.violations) for result in runner.check()) == len(repo.dirty)
+    record("naming_runner_check", measure(runner.check, items=tracked))
+
+
+def test_report_results_json(repo, record):
+    """JSON report rendering for many results with many violations.
+
+    :param repo: Shared synthetic repository fixture
+    :param record: Benchmark result recorder fixture
+    """
+    files = repo.files["python"] + repo.files["bash"] + repo.files["yaml"]
+    results: List[LintResult] = []
+    for tool_index in range(10):
+        tool = f"tool-{tool_index}"
+        violations = [
+            Violation(tool, path, line, f"{tool} finding on line {line}") for path in files for line in (1, 7)
+        ]
+        results.append(LintResult(tool, passed=False, violations=violations, file_count=len(files), duration=0.5))
+    total = sum(len(result.violations) for result in results)
+
+    def render() -> str:
+        """Render the JSON report.
+
+        :returns: Captured stdout
+        """
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            assert report_results_json(results, verbose=True) == 1
+        return out.getvalue()
+
+    assert json.loads(render())["summary"]["total_violations"] == total
+    record("report_results_json", measure(render, items=total))
+
+
+def test_run_all_runners_pipeline(tmp_path, monkeypatch, record):
+    """The full check pipeline on a small repository with only Python and YAML files.
+
+    :param tmp_path: pytest temporary directory
+    :param monkeypatch: pytest monkeypatch fixture
+    :param record: Benchmark result recorder fixture
+    """
+    pipeline_repo = make_synthetic_repo(
+        tmp_path, {"python": 20 * SCALE, "yaml": 10 * SCALE}, violation_density=VIOLATION_DENSITY, seed=2
+    )
+    monkeypatch.chdir(tmp_path)
+    missing = PythonRunner(repo_root=tmp_path).check_tools() + YAMLRunner(repo_root=tmp_path).check_tools()
+    if missing:
+        pytest.skip(f"pipeline benchmark needs {', '.join(missing)}")
+    args = argparse.Namespace(
+        json=True,
+        jobs=1,
+        verbose=False,
+        ci=False,
+        only=None,
+        tool=None,
+        changed_only=False,
+        include_fixtures=False,
+        fail_fast=False,
+        max_violations=None,
+        progress=False,
+    )
+
+    def pipeline() -> str:
+        """Run every runner's check() through the CLI pipeline.
+
+        :returns: Captured JSON report
+        """
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            run_all = cli_argparse._run_all_runners  # pylint: disable=protected-access
+            assert run_all(args, "Linting", lambda runner: runner.check()) == 1
+        return out.getvalue()
+
+    def violation_counts(output: str) -> Dict[str, int]:
+        """Sum violations per tool in a JSON report.
+
+        :param output: JSON report text
+        :returns: Tool name to violation count
+        """
+        counts: Dict[str, int] = {}
+        for result in json.loads(output)["results"]:
+            counts[result["tool"]] = counts.get(result["tool"], 0) + result.get("violation_count", 0)
+        return counts
+
+    counts = violation_counts(pipeline())
+    assert counts["python-docstrings"] == pipeline_repo.dirty_count("python")
+    assert counts["yaml-docstrings"] == pipeline_repo.dirty_count("yaml")
+    assert counts["naming"] == len(pipeline_repo.dirty)
+    record("run_all_runners", measure(pipeline, items=pipeline_repo.file_count, repeat=2, warmup=0))
+
+    # Same pipeline with black/ruff/pylint/yamllint answered from a recording
+    recording = tmp_path / "commands.json"
+    set_command_executor(RecordingExecutor(recording))
+    try:
+        pipeline()
+        set_command_executor(ReplayExecutor(recording))
+        assert violation_counts(pipeline()) == counts
+        record("run_all_runners_replay", measure(pipeline, items=pipeline_repo.file_count, repeat=2, warmup=0))
+    finally:
+        set_command_executor(None)
+
+
+def test_compare_flags_only_comparable_regressions():
+    """compare() reports slowdowns past the tolerance, and only against same-scale baselines."""
+    baseline = {"scale": 1, "benchmarks": {"bench": {"items": 10, "min_ms": 10.0, "median_ms": 11.0}}}
+    stats = measure(lambda: None, items=10, repeat=3)
+
+    assert compare(baseline, "bench", dict(stats, min_ms=19.0), 1, 2.0) is None
+    assert "exceeds baseline 10.0ms" in compare(baseline, "bench", dict(stats, min_ms=21.0), 1, 2.0)
+    assert compare(baseline, "bench", dict(stats, min_ms=21.0), 2, 2.0) is None
+    assert compare(baseline, "bench", dict(stats, min_ms=21.0, items=20), 1, 2.0) is None
+    assert compare(baseline, "other", stats, 1, 2.0) is None
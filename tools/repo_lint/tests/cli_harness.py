@@ -0,0 +1,318 @@
+"""In-process CLI harness and fake-tool shims for repo_lint tests.
+
+:Purpose:
+    Lets tests run the repo-lint CLI without spawning ``python -m
+    tools.repo_lint`` and without the external linters installed:
+
+    - run_cli() calls cli_argparse.main (or cli.main) in the current process
+      with sys.argv, the working directory and the environment set for the
+      run, and returns the exit code and captured output. Process-wide
+      repo_lint state (logging handlers, verbose mode, config directory,
+      --jobs budget, command executor) is restored afterwards, so runs do not leak into each
+      other or into later tests.
+    - FakeTools replaces external linters with recorded outputs. It patches
+      subprocess.run and shutil.which, so runners see the faked tools as
+      installed and get the recorded exit code and output; every other
+      command (git, real tools that are not faked) runs normally.
+
+    Both are also available as the ``repo_lint_cli`` and ``fake_tools``
+    pytest fixtures (see conftest.py). Because nothing is spawned per test,
+    the suite parallelizes cleanly with ``pytest -n auto`` (pytest-xdist runs
+    each worker in its own process, so the per-run chdir is safe).
+
+:Recordings:
+    A recording maps a command prefix to the result to return. Keys are the
+    program name, optionally followed by arguments to match more narrowly
+    ("cargo clippy" wins over "cargo"). Values are:
+
+    - a dict with any of returncode (default 0), stdout and stderr
+    - a list of such dicts, returned in call order (the last one repeats)
+    - a callable receiving the argv list and returning such a dict
+
+    Recordings can be loaded from JSON files under fake_tools/ (kept out of
+    fixtures/, which vector mode lints). A top-level "description" key in
+    those files documents the recording (the JSON metadata contract requires
+    it) and is not treated as a command prefix.
+
+:Environment Variables:
+    None
+
+:Examples:
+    Run a check with a fake shellcheck that reports one finding::
+
+        with FakeTools({"shellcheck": {"returncode": 1, "stdout": "a.sh:3:1: warning: x [SC2034]"},
+                        "shfmt": {}}) as tools:
+            result = run_cli(["check", "--only", "bash", "--json"], cwd=repo)
+        assert result.returncode == 1
+        assert tools.calls_for("shellcheck")
+
+:Exit Codes:
+    N/A
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Sequence, Set
+from unittest.mock import patch
+
+FAKE_TOOLS_DIR = Path(__file__).resolve().parent / "fake_tools"
+
+# sys.argv, sys.stdout and the working directory are process-wide
+_CLI_LOCK = threading.Lock()
+
+
+class CliResult(NamedTuple):
+    """Outcome of one in-process CLI run."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+def _exit_code(code: Any) -> int:
+    """Convert a SystemExit code to a process exit status.
+
+    :param code: SystemExit.code (None, int or message)
+    :returns: Exit status as the interpreter would report it
+    """
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    # sys.exit("message") prints the message and exits 1
+    print(code, file=sys.stderr)
+    return 1
+
+
+@contextlib.contextmanager
+def isolated_cli_state(cwd: Path | str | None = None, env: Dict[str, str] | None = None) -> Iterator[None]:
+    """Run a block with its own working directory, environment and repo_lint globals.
+
+    :param cwd: Working directory for the block (default: unchanged)
+    :param env: Environment variables to set for the block
+    :yields: None
+    """
+    # pylint: disable=import-outside-toplevel,protected-access
+    from tools.repo_lint import logging_utils, yaml_loader
+    from tools.repo_lint.runners import base
+
+    root_logger = logging.getLogger()
+    saved_logging = (root_logger.handlers[:], root_logger.level)
+    saved_globals = (
+        logging_utils._verbose_mode,
+        logging_utils._handlers_configured,
+        yaml_loader._CUSTOM_CONFIG_DIR,
+        base._TRACKED_FILES_CACHE_ENABLED,
+        base.get_job_budget(),
+    )
+    saved_cwd = os.getcwd()
+    # Let REPO_LINT_RECORD_COMMANDS / REPO_LINT_REPLAY_COMMANDS in env take effect for this run
+    saved_executor = base.set_command_executor(None)
+    # The conformance directory is resolved once per process; each run resolves its own
+    yaml_loader._resolve_conformance_dir.cache_clear()
+    try:
+        with patch.dict(os.environ, env or {}):
+            if cwd is not None:
+                os.chdir(cwd)
+            yield
+    finally:
+        os.chdir(saved_cwd)
+        yaml_loader._resolve_conformance_dir.cache_clear()
+        root_logger.handlers[:] = saved_logging[0]
+        root_logger.setLevel(saved_logging[1])
+        (
+            logging_utils._verbose_mode,
+            logging_utils._handlers_configured,
+            yaml_loader._CUSTOM_CONFIG_DIR,
+        ) = saved_globals[:3]
+        base.set_tracked_files_cache(saved_globals[3])
+        base.set_job_budget(saved_globals[4])
+        base.set_command_executor(saved_executor)
+
+
+def run_cli(
+    argv: Sequence[str],
+    cwd: Path | str | None = None,
+    env: Dict[str, str] | None = None,
+    main: Callable[[], Any] | None = None,
+) -> CliResult:
+    """Run the repo-lint CLI in-process.
+
+    :param argv: Arguments after the program name (e.g. ["check", "--ci"])
+    :param cwd: Working directory for the run (default: unchanged)
+    :param env: Environment variables to set for the run
+    :param main: Entry point (default: cli_argparse.main; pass cli.main for
+        the Click commands such as validate-config and dump-config)
+    :returns: CliResult with the exit code and captured stdout/stderr
+
+    :Notes:
+        Runs are serialized with a lock; output written by helper threads
+        (parallel runners) is captured too because sys.stdout is swapped
+        process-wide.
+    """
+    if main is None:
+        from tools.repo_lint.cli_argparse import main  # pylint: disable=import-outside-toplevel
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with _CLI_LOCK, isolated_cli_state(cwd, env), patch.object(sys, "argv", ["repo-lint", *argv]):
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                returned = main()
+                code = returned if isinstance(returned, int) else 0
+            except SystemExit as e:
+                code = _exit_code(e.code)
+    return CliResult(code, stdout.getvalue(), stderr.getvalue())
+
+
+class FakeTools:
+    """Replace external linters with recorded outputs.
+
+    :param recordings: Command prefix to recorded result (see module docstring)
+
+    :Attributes:
+        calls: argv lists of every faked invocation, in call order
+    """
+
+    def __init__(self, recordings: Dict[str, Any]) -> None:
+        """Initialize the shim.
+
+        :param recordings: Command prefix to recorded result
+        """
+        self.recordings = {tuple(key.split()): value for key, value in recordings.items()}
+        self.calls: List[List[str]] = []
+        self._positions: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+        self._patches: List[Any] = []
+        self._real_run = subprocess.run
+        self._real_which = shutil.which
+
+    @property
+    def tools(self) -> Set[str]:
+        """Program names that are faked.
+
+        :returns: First word of every recording key
+        """
+        return {prefix[0] for prefix in self.recordings}
+
+    @classmethod
+    def load(cls, *names: str) -> FakeTools:
+        """Create a shim from recording files.
+
+        :param names: File stems under fake_tools/ (later files win)
+        :returns: FakeTools instance
+        :raises FileNotFoundError: If a recording file does not exist
+        """
+        recordings: Dict[str, Any] = {}
+        for name in names:
+            data = json.loads((FAKE_TOOLS_DIR / f"{name}.json").read_text(encoding="utf-8"))
+            data.pop("description", None)
+            recordings.update(data)
+        return cls(recordings)
+
+    def calls_for(self, tool: str) -> List[List[str]]:
+        """Get the recorded invocations of one tool.
+
+        :param tool: Program name
+        :returns: argv lists whose program is tool
+        """
+        return [argv for argv in self.calls if os.path.basename(argv[0]) == tool]
+
+    def _match(self, argv: List[str]) -> tuple | None:
+        """Find the longest recording prefix matching argv.
+
+        :param argv: Command being run
+        :returns: Matching recording key, or None
+        """
+        words = (os.path.basename(argv[0]), *argv[1:])
+        best = None
+        for prefix in self.recordings:
+            if words[: len(prefix)] == prefix and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return best
+
+    def _result(self, key: tuple, argv: List[str]) -> Dict[str, Any]:
+        """Resolve the recorded result for one invocation.
+
+        :param key: Recording key from _match()
+        :param argv: Command being run
+        :returns: Dict with returncode, stdout and stderr
+        """
+        recorded = self.recordings[key]
+        if callable(recorded):
+            recorded = recorded(argv)
+        elif isinstance(recorded, list):
+            with self._lock:
+                position = self._positions.get(key, 0)
+                self._positions[key] = position + 1
+            recorded = recorded[min(position, len(recorded) - 1)]
+        return {"returncode": 0, "stdout": "", "stderr": "", **recorded}
+
+    def run(self, args, *popenargs, **kwargs):
+        """Stand-in for subprocess.run.
+
+        :param args: Command (list or string)
+        :param popenargs: Positional arguments for the real subprocess.run
+        :param kwargs: Keyword arguments for the real subprocess.run
+        :returns: CompletedProcess (recorded for faked tools)
+        :raises subprocess.CalledProcessError: If check=True and the recorded exit code is non-zero
+        """
+        argv = [str(arg) for arg in args] if isinstance(args, (list, tuple)) else str(args).split()
+        key = self._match(argv) if argv else None
+        if key is None:
+            return self._real_run(args, *popenargs, **kwargs)
+
+        with self._lock:
+            self.calls.append(argv)
+        result = self._result(key, argv)
+        stdout, stderr = result["stdout"], result["stderr"]
+        if not (kwargs.get("text") or kwargs.get("universal_newlines") or kwargs.get("encoding")):
+            stdout, stderr = stdout.encode(), stderr.encode()
+        captured = kwargs.get("capture_output") or kwargs.get("stdout") == subprocess.PIPE
+        completed = subprocess.CompletedProcess(
+            args, result["returncode"], stdout if captured else None, stderr if captured else None
+        )
+        if kwargs.get("check"):
+            completed.check_returncode()
+        return completed
+
+    def which(self, cmd, *args, **kwargs):
+        """Stand-in for shutil.which: faked tools are always found.
+
+        :param cmd: Program name
+        :param args: Positional arguments for the real shutil.which
+        :param kwargs: Keyword arguments for the real shutil.which
+        :returns: A fake path for faked tools, else the real lookup result
+        """
+        if os.path.basename(str(cmd)) in self.tools:
+            return f"/fake-tools/{os.path.basename(str(cmd))}"
+        return self._real_which(cmd, *args, **kwargs)
+
+    def __enter__(self) -> FakeTools:
+        """Install the shims.
+
+        :returns: self
+        """
+        self._patches = [patch.object(subprocess, "run", self.run), patch.object(shutil, "which", self.which)]
+        for p in self._patches:
+            p.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Remove the shims.
+
+        :param exc_info: Exception details (ignored)
+        """
+        for p in reversed(self._patches):
+            p.stop()
+        self._patches = []
@@ -0,0 +1,135 @@
+"""Shared pytest fixtures for repo_lint tests.
+
+:Purpose:
+    Exposes the in-process CLI harness and the fake-tool shims from
+    cli_harness.py as fixtures, plus a small Bash repository shared by the
+    harness and command-executor tests.
+
+:Environment Variables:
+    None
+
+:Examples:
+    Use the fixtures in a test::
+
+        def test_check(repo_lint_cli, fake_tools, tmp_path):
+            fake_tools.load("bash_clean")
+            result = repo_lint_cli(["check", "--only", "bash"], cwd=tmp_path)
+            assert result.returncode == 0
+
+:Exit Codes:
+    N/A
+"""
+
+from __future__ import annotations
+
+import contextlib
+import subprocess
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from tools.repo_lint.tests.cli_harness import FakeTools, run_cli
+
+CONFORMANCE_DIR = Path(__file__).resolve().parents[3] / "conformance" / "repo-lint"
+
+BASH_SCRIPT = """#!/usr/bin/env bash
+#
+# DESCRIPTION:
+#   Deploy helper used by the harness tests.
+#
+# USAGE:
+#   deploy.sh TARGET
+#
+# INPUTS:
+#   TARGET - Deployment target
+#
+# OUTPUTS:
+#   Exit Codes:
+#     0  Success
+#     1  Failure
+#
+# EXAMPLES:
+#   deploy.sh staging
+#
+UNUSED=1
+echo $1
+"""
+
+
+@pytest.fixture
+def bash_repo(tmp_path):
+    """Create a git repository with one Bash script and the repo-lint configs.
+
+    :param tmp_path: pytest temporary directory
+    :returns: Repository root
+    """
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "deploy.sh").write_text(BASH_SCRIPT, encoding="utf-8")
+    config_dir = tmp_path / "conformance" / "repo-lint"
+    config_dir.mkdir(parents=True)
+    for config in CONFORMANCE_DIR.glob("*.yaml"):
+        config_dir.joinpath(config.name).write_bytes(config.read_bytes())
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=tmp_path, check=True)
+    return tmp_path
+
+
+@pytest.fixture
+def repo_lint_cli():
+    """Run the repo-lint CLI in-process.
+
+    :returns: run_cli (call with argv and optional cwd, env, main)
+    """
+    return run_cli
+
+
+class _FakeToolsFixture:
+    """Installs FakeTools shims for the duration of one test."""
+
+    def __init__(self) -> None:
+        """Initialize with no shims installed."""
+        self.active: FakeTools | None = None
+        self._stack = contextlib.ExitStack()
+
+    def _install(self, tools: FakeTools) -> FakeTools:
+        """Replace the active shims.
+
+        :param tools: Shims to install
+        :returns: The installed shims
+        """
+        self.stop()
+        self.active = self._stack.enter_context(tools)
+        return self.active
+
+    def record(self, recordings: Dict[str, Any]) -> FakeTools:
+        """Fake tools with inline recordings.
+
+        :param recordings: Command prefix to recorded result
+        :returns: The installed FakeTools
+        """
+        return self._install(FakeTools(recordings))
+
+    def load(self, *names: str) -> FakeTools:
+        """Fake tools with recordings from fake_tools/*.json.
+
+        :param names: Recording file stems
+        :returns: The installed FakeTools
+        """
+        return self._install(FakeTools.load(*names))
+
+    def stop(self) -> None:
+        """Remove the active shims, if any."""
+        self._stack.close()
+        self.active = None
+
+
+@pytest.fixture
+def fake_tools():
+    """Replace external linters with recorded outputs for one test.
+
+    :returns: Object with record(dict) and load(*names) returning the installed FakeTools (yielded)
+    """
+    fixture = _FakeToolsFixture()
+    yield fixture
+    fixture.stop()
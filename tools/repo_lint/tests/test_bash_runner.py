@@ -74,7 +74,7 @@ class TestBashRunner(unittest.TestCase):
         """
         self.runner = BashRunner(repo_root=Path("/fake/repo"))
 
-    @patch("tools.repo_lint.runners.bash_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_get_bash_files_returns_list(self, mock_run):
         """Test that _get_bash_files returns file list.
 
@@ -91,7 +91,7 @@ class TestBashRunner(unittest.TestCase):
         self.assertIn("script1.sh", files)
         self.assertIn("script2.sh", files)
 
-    @patch("tools.repo_lint.runners.bash_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_get_bash_files_returns_empty(self, mock_run):
         """Test that _get_bash_files returns empty list when no files.
 
@@ -106,7 +106,7 @@ class TestBashRunner(unittest.TestCase):
 
         self.assertEqual(files, [])
 
-    @patch("tools.repo_lint.runners.bash_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_shellcheck_uses_correct_args(self, mock_run):
         """Test that _run_shellcheck uses correct arguments.
 
@@ -129,7 +129,7 @@ class TestBashRunner(unittest.TestCase):
         self.assertIn("--format=gcc", shellcheck_args)
         self.assertTrue(result.passed)
 
-    @patch("tools.repo_lint.runners.bash_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_shfmt_check_non_mutating(self, mock_run):
         """Test that _run_shfmt_check uses -d -l flags (non-mutating).
 
@@ -153,7 +153,7 @@ class TestBashRunner(unittest.TestCase):
         self.assertNotIn("-w", shfmt_args, "Check should not use -w flag (write)")
         self.assertTrue(result.passed)
 
-    @patch("tools.repo_lint.runners.bash_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_shfmt_fix_uses_write_flag(self, mock_run):
         """Test that _run_shfmt_fix uses -w flag (mutating).
 
@@ -177,7 +177,7 @@ class TestBashRunner(unittest.TestCase):
         self.assertNotIn("-l", shfmt_args, "Fix should not use -l flag")
         self.assertTrue(result.passed)
 
-    @patch("tools.repo_lint.runners.bash_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_empty_files_returns_passed(self, mock_run):
         """Test that empty file list returns passed result.
 
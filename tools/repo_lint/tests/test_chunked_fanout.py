@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position,protected-access  # Test file needs special setup
+"""Unit tests for chunked file-list tool fan-out.
+
+:Purpose:
+    Validates runners/base.py split_file_chunks(), run_files_chunked() and the
+    shared --jobs budget used by shellcheck, shfmt, yamllint, perlcritic,
+    markdownlint, prettier and taplo.
+
+:Test Coverage:
+    - Small inputs stay a single, unchunked invocation
+    - Chunks respect the command-line byte budget and keep input order
+    - Chunks are contiguous, balanced by file size and deterministic
+    - Merged results concatenate output in chunk order and keep the worst exit code
+    - Concurrency never exceeds the job budget
+
+:Usage:
+    Run tests from repository root::
+
+        python3 -m pytest tools/repo_lint/tests/test_chunked_fanout.py
+
+:Environment Variables:
+    None
+
+:Exit Codes:
+    0
+        All tests passed
+    1
+        One or more tests failed
+
+:Examples:
+    Run all tests::
+
+        python3 -m pytest tools/repo_lint/tests/test_chunked_fanout.py -v
+
+:Notes:
+    - subprocess.run is mocked; no external tools are executed
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add repo_lint parent directory to path for imports
+repo_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(repo_root))
+
+from tools.repo_lint.runners import base  # noqa: E402
+
+
+class TestSplitFileChunks(unittest.TestCase):
+    """Test split_file_chunks()."""
+
+    def test_small_input_single_chunk(self):
+        """Test fewer files than min_chunk_files never fan out."""
+        files = [f"f{i}.sh" for i in range(5)]
+        self.assertEqual(base.split_file_chunks(["tool"], files, max_chunks=8), [files])
+
+    def test_empty_input(self):
+        """Test no files means no chunks."""
+        self.assertEqual(base.split_file_chunks(["tool"], [], max_chunks=4), [])
+
+    def test_arg_limit_forces_split(self):
+        """Test chunks stay under the command-line budget even with one job."""
+        files = [f"dir/file_{i:04d}.sh" for i in range(200)]
+        limit = 2000
+        chunks = base.split_file_chunks(["shellcheck"], files, max_chunks=1, arg_limit=limit)
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            cost = sum(base._arg_cost(arg) for arg in ["shellcheck"] + chunk)
+            self.assertLessEqual(cost, limit)
+        self.assertEqual([f for chunk in chunks for f in chunk], files)
+
+    def test_balanced_by_size_and_deterministic(self):
+        """Test a large file gets its own chunk and repeated splits are identical."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            files = []
+            for i in range(16):
+                name = f"f{i:02d}.yaml"
+                (tmp / name).write_text("x" * (200_000 if i == 3 else 10), encoding="utf-8")
+                files.append(name)
+
+            chunks = base.split_file_chunks(["yamllint"], files, max_chunks=2, cwd=tmp, min_chunk_files=4)
+            self.assertEqual(
+                chunks, base.split_file_chunks(["yamllint"], files, max_chunks=2, cwd=tmp, min_chunk_files=4)
+            )
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual([f for chunk in chunks for f in chunk], files)
+        big_chunk = next(chunk for chunk in chunks if "f03.yaml" in chunk)
+        self.assertLess(len(big_chunk), 8)
+
+    def test_oversized_path_rejected(self):
+        """Test a single path longer than the budget raises ValueError."""
+        with self.assertRaises(ValueError):
+            base.split_file_chunks(["t"], ["x" * 500] * 20, max_chunks=2, min_chunk_files=1, arg_limit=400)
+
+
+class TestRunFilesChunked(unittest.TestCase):
+    """Test run_files_chunked() execution and merging."""
+
+    def tearDown(self):
+        """Restore the default job budget."""
+        base.set_job_budget(1)
+
+    @patch("tools.repo_lint.runners.base.subprocess.run")
+    def test_single_chunk_passes_through(self, mock_run):
+        """Test small inputs produce exactly one call with the full argv.
+
+        :param mock_run: Mocked subprocess.run
+        """
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+        base.set_job_budget(8)
+        base.run_files_chunked(["shellcheck", "-x"], ["a.sh", "b.sh"], repo_root)
+        mock_run.assert_called_once()
+        self.assertEqual(mock_run.call_args[0][0], ["shellcheck", "-x", "a.sh", "b.sh"])
+
+    @patch("tools.repo_lint.runners.base.subprocess.run")
+    def test_empty_file_list_runs_nothing(self, mock_run):
+        """Test an empty file list succeeds without running the tool on stdin.
+
+        :param mock_run: Mocked subprocess.run
+        """
+        result = base.run_files_chunked(["shellcheck", "-x"], [], repo_root)
+        mock_run.assert_not_called()
+        self.assertEqual((result.returncode, result.stdout, result.stderr), (0, "", ""))
+
+    @patch("tools.repo_lint.runners.base.subprocess.run")
+    def test_merge_order_and_exit_code(self, mock_run):
+        """Test merged output follows chunk order and keeps the highest exit code.
+
+        :param mock_run: Mocked subprocess.run
+        """
+
+        def fake_run(argv, **_kwargs):
+            """Echo each file; fail on the chunk containing f05.
+
+            :param argv: Command argv
+            :param _kwargs: Ignored subprocess.run keyword arguments
+            :returns: CompletedProcess echoing the files
+            """
+            files = argv[1:]
+            time.sleep(0.01 if "f00" in files else 0)  # First chunk finishes last
+            code = 2 if "f05" in files else 0
+            return subprocess.CompletedProcess(argv, code, "".join(f"{f}\n" for f in files), "")
+
+        mock_run.side_effect = fake_run
+        base.set_job_budget(4)
+        files = [f"f{i:02d}" for i in range(32)]
+        result = base.run_files_chunked(["tool"], files, repo_root)
+
+        chunks = base.split_file_chunks(["tool"], files, 4, repo_root)
+        self.assertEqual(mock_run.call_count, len(chunks))
+        self.assertEqual(result.stdout.split(), [f for chunk in chunks for f in chunk])
+        self.assertEqual(result.returncode, 2)
+        self.assertEqual(result.args, ["tool"] + files)
+
+    @patch("tools.repo_lint.runners.base.subprocess.run")
+    def test_concurrency_bounded_by_budget(self, mock_run):
+        """Test concurrent chunk processes never exceed the job budget.
+
+        :param mock_run: Mocked subprocess.run
+        """
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fake_run(argv, **_kwargs):
+            """Track how many fake processes overlap.
+
+            :param argv: Command argv
+            :param _kwargs: Ignored subprocess.run keyword arguments
+            :returns: Successful CompletedProcess
+            """
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return subprocess.CompletedProcess(argv, 0, "", "")
+
+        mock_run.side_effect = fake_run
+        base.set_job_budget(2)
+        files = [f"f{i}" for i in range(64)]
+        threads = [threading.Thread(target=base.run_files_chunked, args=(["tool"], files, repo_root)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(state["peak"], 2)
+        self.assertGreaterEqual(mock_run.call_count, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -82,12 +82,12 @@ class TestRunnerDispatch(unittest.TestCase):
         self.args_only_python = argparse.Namespace(ci=False, verbose=False, only="python")
         self.args_only_unknown = argparse.Namespace(ci=False, verbose=False, only="unknown")
 
-    @patch("tools.repo_lint.cli_argparse.PythonRunner")
-    @patch("tools.repo_lint.cli_argparse.BashRunner")
-    @patch("tools.repo_lint.cli_argparse.PowerShellRunner")
-    @patch("tools.repo_lint.cli_argparse.PerlRunner")
-    @patch("tools.repo_lint.cli_argparse.YAMLRunner")
-    @patch("tools.repo_lint.cli_argparse.RustRunner")
+    @patch("tools.repo_lint.runners.language_runners.PythonRunner")
+    @patch("tools.repo_lint.runners.language_runners.BashRunner")
+    @patch("tools.repo_lint.runners.language_runners.PowerShellRunner")
+    @patch("tools.repo_lint.runners.language_runners.PerlRunner")
+    @patch("tools.repo_lint.runners.language_runners.YAMLRunner")
+    @patch("tools.repo_lint.runners.language_runners.RustRunner")
     @patch("tools.repo_lint.cli_argparse.report_results")
     def test_only_flag_filters_runners(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
@@ -137,12 +137,12 @@ class TestRunnerDispatch(unittest.TestCase):
         # Verify success exit code
         self.assertEqual(result, ExitCode.SUCCESS)
 
-    @patch("tools.repo_lint.cli_argparse.PythonRunner")
-    @patch("tools.repo_lint.cli_argparse.BashRunner")
-    @patch("tools.repo_lint.cli_argparse.PowerShellRunner")
-    @patch("tools.repo_lint.cli_argparse.PerlRunner")
-    @patch("tools.repo_lint.cli_argparse.YAMLRunner")
-    @patch("tools.repo_lint.cli_argparse.RustRunner")
+    @patch("tools.repo_lint.runners.language_runners.PythonRunner")
+    @patch("tools.repo_lint.runners.language_runners.BashRunner")
+    @patch("tools.repo_lint.runners.language_runners.PowerShellRunner")
+    @patch("tools.repo_lint.runners.language_runners.PerlRunner")
+    @patch("tools.repo_lint.runners.language_runners.YAMLRunner")
+    @patch("tools.repo_lint.runners.language_runners.RustRunner")
     @patch("tools.repo_lint.cli_argparse.report_results")
     def test_all_runners_execute_without_only(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
@@ -192,12 +192,12 @@ class TestRunnerDispatch(unittest.TestCase):
         # Verify success exit code
         self.assertEqual(result, ExitCode.SUCCESS)
 
-    @patch("tools.repo_lint.cli_argparse.PythonRunner")
-    @patch("tools.repo_lint.cli_argparse.BashRunner")
-    @patch("tools.repo_lint.cli_argparse.PowerShellRunner")
-    @patch("tools.repo_lint.cli_argparse.PerlRunner")
-    @patch("tools.repo_lint.cli_argparse.YAMLRunner")
-    @patch("tools.repo_lint.cli_argparse.RustRunner")
+    @patch("tools.repo_lint.runners.language_runners.PythonRunner")
+    @patch("tools.repo_lint.runners.language_runners.BashRunner")
+    @patch("tools.repo_lint.runners.language_runners.PowerShellRunner")
+    @patch("tools.repo_lint.runners.language_runners.PerlRunner")
+    @patch("tools.repo_lint.runners.language_runners.YAMLRunner")
+    @patch("tools.repo_lint.runners.language_runners.RustRunner")
     def test_runners_skip_when_no_files(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         mock_rust,
@@ -259,12 +259,12 @@ class TestRunnerDispatch(unittest.TestCase):
         # Verify error exit code
         self.assertEqual(result, ExitCode.INTERNAL_ERROR)
 
-    @patch("tools.repo_lint.cli_argparse.PythonRunner")
-    @patch("tools.repo_lint.cli_argparse.BashRunner")
-    @patch("tools.repo_lint.cli_argparse.PowerShellRunner")
-    @patch("tools.repo_lint.cli_argparse.PerlRunner")
-    @patch("tools.repo_lint.cli_argparse.YAMLRunner")
-    @patch("tools.repo_lint.cli_argparse.RustRunner")
+    @patch("tools.repo_lint.runners.language_runners.PythonRunner")
+    @patch("tools.repo_lint.runners.language_runners.BashRunner")
+    @patch("tools.repo_lint.runners.language_runners.PowerShellRunner")
+    @patch("tools.repo_lint.runners.language_runners.PerlRunner")
+    @patch("tools.repo_lint.runners.language_runners.YAMLRunner")
+    @patch("tools.repo_lint.runners.language_runners.RustRunner")
     def test_no_files_for_only_language_returns_error(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         mock_rust,
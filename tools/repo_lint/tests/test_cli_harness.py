@@ -0,0 +1,123 @@
+"""Tests for the in-process CLI harness and fake-tool shims.
+
+:Purpose:
+    Validates cli_harness.run_cli() and FakeTools: full CLI runs without a
+    subprocess, recorded linter output flowing through the real runners and
+    reporters, and no repo_lint state leaking between runs.
+
+:Environment Variables:
+    None
+
+:Examples:
+    Run with pytest::
+
+        pytest tools/repo_lint/tests/test_cli_harness.py
+
+:Exit Codes:
+    N/A
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tools.repo_lint import cli, logging_utils
+from tools.repo_lint.tests.cli_harness import FakeTools, run_cli
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+CONFORMANCE_DIR = REPO_ROOT / "conformance" / "repo-lint"
+
+
+def test_check_with_recorded_violations(bash_repo, repo_lint_cli, fake_tools):
+    """Recorded shellcheck/shfmt findings go through the Bash runner and the JSON reporter.
+
+    :param bash_repo: Repository with one Bash script
+    :param repo_lint_cli: In-process CLI runner fixture
+    :param fake_tools: Fake-tool shim fixture
+    """
+    tools = fake_tools.load("bash_violations")
+
+    result = repo_lint_cli(["check", "--only", "bash", "--json", "--ci"], cwd=bash_repo)
+
+    assert result.returncode == 1, result.stderr
+    report = json.loads(result.stdout)
+    by_tool = {entry["tool"]: entry for entry in report["results"]}
+    assert by_tool["shellcheck"]["violation_count"] == 2
+    assert "SC2034" in by_tool["shellcheck"]["violations"][0]["message"]
+    assert by_tool["shfmt"]["passed"] is False
+    assert by_tool["bash-docstrings"]["passed"] is True
+    # Runners pass the tracked files to the faked tools
+    assert tools.calls_for("shellcheck")[0][-1] == "scripts/deploy.sh"
+
+
+def test_check_with_clean_recordings(bash_repo, repo_lint_cli, fake_tools):
+    """Clean recordings make the same repository pass.
+
+    :param bash_repo: Repository with one Bash script
+    :param repo_lint_cli: In-process CLI runner fixture
+    :param fake_tools: Fake-tool shim fixture
+    """
+    fake_tools.load("bash_clean")
+
+    result = repo_lint_cli(["check", "--only", "bash", "--ci"], cwd=bash_repo)
+
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_fake_tools_sequences_callables_and_passthrough():
+    """Recordings can be sequences or callables; unfaked commands run for real."""
+    tools = FakeTools(
+        {
+            "lint": [{"returncode": 1, "stdout": "first"}, {"stdout": "rest"}],
+            "lint --version": lambda argv: {"stdout": f"lint 1.0 ({len(argv)} args)"},
+            "broken": {"returncode": 3, "stderr": "boom"},
+        }
+    )
+
+    with tools:
+        outputs = [subprocess.run(["lint", "a"], capture_output=True, text=True, check=False) for _ in range(3)]
+        version = subprocess.run(["/usr/bin/lint", "--version"], capture_output=True, text=True, check=False)
+        with pytest.raises(subprocess.CalledProcessError):
+            subprocess.run(["broken"], capture_output=True, check=True)
+        real = subprocess.run([sys.executable, "-c", "print('real')"], capture_output=True, text=True, check=True)
+        assert shutil.which("lint") == "/fake-tools/lint"
+
+    assert [(o.returncode, o.stdout) for o in outputs] == [(1, "first"), (0, "rest"), (0, "rest")]
+    assert version.stdout == "lint 1.0 (2 args)"
+    assert real.stdout.strip() == "real"
+    assert len(tools.calls_for("lint")) == 4
+    assert subprocess.run is tools._real_run  # pylint: disable=protected-access
+
+
+def test_run_cli_restores_process_state(bash_repo, fake_tools):
+    """A verbose run in another directory leaves cwd, logging and verbose mode as they were.
+
+    :param bash_repo: Repository with one Bash script
+    :param fake_tools: Fake-tool shim fixture
+    """
+    fake_tools.load("bash_clean")
+    cwd = os.getcwd()
+    handlers = logging.getLogger().handlers[:]
+
+    result = run_cli(["check", "--only", "bash", "--verbose", "--ci"], cwd=bash_repo)
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert os.getcwd() == cwd
+    assert logging.getLogger().handlers == handlers
+    assert not logging_utils.is_verbose_mode()
+
+
+def test_click_entry_point():
+    """Commands that only exist in the Click CLI run through cli.main."""
+    result = run_cli(["validate-config", str(CONFORMANCE_DIR / "repo-lint-naming-rules.yaml")], main=cli.main)
+
+    assert result.returncode == 0, result.stderr
+    assert "Configuration valid" in result.stdout
@@ -0,0 +1,132 @@
+"""Unit tests for the pluggable command executor.
+
+:Purpose:
+    Validates runners/base.py CommandExecutor, RecordingExecutor and
+    ReplayExecutor: recording real commands to a fixture file, replaying
+    them without running anything, and driving a full runner (and the CLI,
+    via REPO_LINT_REPLAY_COMMANDS) from a recording.
+
+:Environment Variables:
+    None
+
+:Examples:
+    Run with pytest::
+
+        pytest tools/repo_lint/tests/test_command_executor.py
+
+:Exit Codes:
+    N/A
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tools.repo_lint.common import CommandReplayError
+from tools.repo_lint.runners import base
+from tools.repo_lint.runners.bash_runner import BashRunner
+from tools.repo_lint.tests.cli_harness import FakeTools
+
+PRINT_ARGS = "import sys; print(sys.argv[1]); print('warn', file=sys.stderr); sys.exit(3)"
+
+
+@pytest.fixture(autouse=True)
+def restore_executor():
+    """Restore the process-wide executor after each test.
+
+    :yields: None
+    """
+    previous = base.set_command_executor(None)
+    yield
+    base.set_command_executor(previous)
+
+
+def test_record_then_replay(tmp_path):
+    """A recorded command replays its exit code and output without running.
+
+    :param tmp_path: pytest temporary directory
+    """
+    recording = tmp_path / "commands.json"
+    work = tmp_path / "work"
+    work.mkdir()
+    argv = [sys.executable, "-c", PRINT_ARGS, str(work / "a.txt")]
+
+    base.set_command_executor(base.RecordingExecutor(recording))
+    recorded = base.run_command(argv, cwd=work, capture_output=True, text=True, check=False)
+    assert not base.command_exists("repo-lint-no-such-tool")
+
+    data = json.loads(recording.read_text(encoding="utf-8"))
+    assert data["tools"] == {"repo-lint-no-such-tool": False}
+    # Paths under the working directory are stored relative to it
+    assert data["commands"][0]["argv"][-1] == "{cwd}/a.txt"
+    assert data["commands"][0]["returncode"] == 3
+
+    base.set_command_executor(base.ReplayExecutor(recording))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(subprocess, "run", pytest.fail)
+        replayed = base.run_command(argv, cwd=work, capture_output=True, text=True, check=False)
+        as_bytes = base.run_command(argv, cwd=work, capture_output=True, check=False)
+
+    assert (replayed.returncode, replayed.stdout, replayed.stderr) == (3, recorded.stdout, recorded.stderr)
+    assert as_bytes.stdout == recorded.stdout.encode()
+    assert base.command_exists(Path(sys.executable).name)
+    assert not base.command_exists("repo-lint-no-such-tool")
+
+
+def test_replay_order_misses_and_check(tmp_path):
+    """Repeated commands replay in order; unrecorded commands and check=True fail like real runs.
+
+    :param tmp_path: pytest temporary directory
+    """
+    recording = tmp_path / "commands.json"
+    entry = {"argv": ["tool", "x"], "cwd": ".", "stdout": "", "stderr": ""}
+    recording.write_text(
+        json.dumps({"version": 1, "commands": [{**entry, "returncode": 1}, {**entry, "returncode": 0}]}),
+        encoding="utf-8",
+    )
+    executor = base.ReplayExecutor(recording)
+
+    codes = [executor.run(["tool", "x"], capture_output=True).returncode for _ in range(3)]
+    with pytest.raises(CommandReplayError, match="other"):
+        executor.run(["tool", "other"])
+    with pytest.raises(subprocess.CalledProcessError):
+        base.ReplayExecutor(recording).run(["tool", "x"], check=True)
+
+    assert codes == [1, 0, 0]
+    assert executor.which("tool") and not executor.which("other-tool")
+
+    recording.write_text("[]", encoding="utf-8")
+    with pytest.raises(ValueError):
+        base.ReplayExecutor(recording)
+
+
+def test_runner_replays_recorded_run(bash_repo, tmp_path, repo_lint_cli):
+    """A Bash runner check recorded against fake tools replays to the same results, also from the CLI.
+
+    :param bash_repo: Repository with one Bash script
+    :param tmp_path: pytest temporary directory
+    :param repo_lint_cli: In-process CLI runner fixture
+    """
+    recording = tmp_path / "bash.json"
+    base.set_command_executor(base.RecordingExecutor(recording))
+    with FakeTools.load("bash_violations"):
+        recorded = BashRunner(repo_root=bash_repo, ci_mode=True).check()
+
+    base.set_command_executor(base.ReplayExecutor(recording))
+    replayed = BashRunner(repo_root=bash_repo, ci_mode=True).check()
+
+    assert replayed == recorded
+    assert [(r.tool, r.passed) for r in replayed[:2]] == [("shellcheck", False), ("shfmt", False)]
+
+    base.set_command_executor(None)
+    result = repo_lint_cli(
+        ["check", "--only", "bash", "--json", "--ci"], cwd=bash_repo, env={"REPO_LINT_REPLAY_COMMANDS": str(recording)}
+    )
+    assert result.returncode == 1, result.stderr
+    by_tool = {entry["tool"]: entry for entry in json.loads(result.stdout)["results"]}
+    assert by_tool["shellcheck"]["violation_count"] == 2
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position,protected-access  # Test file needs special setup
+"""Unit tests for the repo-lint daemon.
+
+:Purpose:
+    Validates daemon.py request dispatch, the Unix socket round trip used by
+    `repo-lint check --use-daemon`, and the tracked-file cache it enables.
+
+:Test Coverage:
+    - get_socket_path() honors REPO_LINT_DAEMON_SOCKET and is stable per repo
+    - dispatch() handles ping/status/shutdown and rejects bad requests
+    - send_request()/forward_command() round trip over a real socket
+    - forward_command() returns None when no daemon is listening
+    - Checks are refused when the client's REPO_LINT_* environment differs
+    - The socket is created owner-only
+    - `check --use-daemon` forwards the parsed options, not sys.argv
+    - _run_cli() captures output and click usage-error exit codes
+    - get_tracked_files() cache is invalidated when the git index changes
+
+:Usage:
+    Run tests from repository root::
+
+        python3 -m pytest tools/repo_lint/tests/test_daemon.py
+
+:Environment Variables:
+    None. Sockets are created in temporary directories.
+
+:Exit Codes:
+    0
+        All tests passed
+    1
+        One or more tests failed
+
+:Examples:
+    Run all tests::
+
+        python3 -m pytest tools/repo_lint/tests/test_daemon.py -v
+
+:Notes:
+    - Socket tests are skipped on platforms without AF_UNIX
+    - The in-process CLI call is mocked for dispatch tests to avoid running linters
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+# Add repo_lint parent directory to path for imports
+repo_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(repo_root))
+
+from tools.repo_lint import daemon  # noqa: E402
+from tools.repo_lint.cli import cli  # noqa: E402
+from tools.repo_lint.runners import base  # noqa: E402
+
+
+@unittest.skipUnless(daemon.is_supported(), "Unix domain sockets not supported")
+class TestDaemonServer(unittest.TestCase):
+    """Test DaemonServer dispatch and socket round trips."""
+
+    def setUp(self):
+        """Bind a daemon on a temporary socket."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.socket_path = Path(self.tmpdir.name) / "d.sock"
+        self.server = daemon.DaemonServer(self.socket_path, repo_root, cli, idle_timeout=0)
+
+    def tearDown(self):
+        """Close the daemon and remove the temporary directory."""
+        self.server.server_close()
+        self.tmpdir.cleanup()
+
+    def _serve_one(self):
+        """Handle exactly one request on a background thread.
+
+        :returns: Started thread
+        """
+        thread = threading.Thread(target=self.server.handle_request, daemon=True)
+        thread.start()
+        return thread
+
+    def test_ping_and_status(self):
+        """Test ping and status report the daemon process."""
+        self.assertEqual(self.server.dispatch({"op": "ping"}), {"ok": True, "pid": os.getpid()})
+        status = self.server.dispatch({"op": "status"})
+        self.assertTrue(status["ok"])
+        self.assertEqual(status["repo_root"], str(repo_root.resolve()))
+        self.assertEqual(status["requests_served"], 0)
+
+    def test_rejects_unknown_op_and_non_forwardable_commands(self):
+        """Test the daemon only runs whitelisted commands."""
+        self.assertFalse(self.server.dispatch({"op": "explode"})["ok"])
+        self.assertFalse(self.server.dispatch({"op": "check", "argv": ["fix", "--unsafe"]})["ok"])
+        self.assertFalse(self.server.dispatch({"op": "check", "argv": []})["ok"])
+
+    def test_rejects_cwd_outside_repo(self):
+        """Test requests from another repository are refused."""
+        response = self.server.dispatch({"op": "check", "argv": ["check"], "cwd": self.tmpdir.name})
+        self.assertFalse(response["ok"])
+        self.assertIn("Daemon serves", response["error"])
+
+    def test_shutdown_stops_loop(self):
+        """Test shutdown flags the serve loop to exit."""
+        self.assertTrue(self.server.dispatch({"op": "shutdown"})["ok"])
+        self.server.serve_until_stopped()  # Returns immediately
+
+    @patch("tools.repo_lint.daemon._run_cli", return_value=(1, "violations\n", ""))
+    def test_forward_command_round_trip(self, mock_run_cli):
+        """Test forward_command replays the daemon's output and exit code.
+
+        :param mock_run_cli: Mocked in-process CLI call
+        """
+        thread = self._serve_one()
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            exit_code = daemon.forward_command(["check", "--ci"], self.socket_path)
+        thread.join(timeout=10)
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(stdout.getvalue(), "violations\n")
+        mock_run_cli.assert_called_once_with(["check", "--ci"], cli)
+        self.assertEqual(self.server.requests_served, 1)
+
+    def test_malformed_request(self):
+        """Test a non-JSON request gets an error response instead of crashing the daemon."""
+        import socket
+
+        thread = self._serve_one()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(self.socket_path))
+            sock.sendall(b"not json\n")
+            reply = sock.makefile("rb").readline()
+        thread.join(timeout=10)
+        self.assertIn(b"Malformed request", reply)
+
+    def test_rejects_differing_environment(self):
+        """Test a check is refused when the client's REPO_LINT_* variables differ."""
+        env = dict(daemon.get_forwarded_env(), REPO_LINT_TEST_ONLY="1")
+        response = self.server.dispatch({"op": "check", "argv": ["check"], "cwd": str(repo_root), "env": env})
+        self.assertFalse(response["ok"])
+        self.assertIn("REPO_LINT_TEST_ONLY", response["error"])
+
+    def test_socket_is_owner_only(self):
+        """Test the socket is bound with owner-only permissions."""
+        self.assertEqual(stat.S_IMODE(self.socket_path.stat().st_mode), 0o600)
+
+    def test_server_close_removes_socket(self):
+        """Test the socket file is removed on close."""
+        self.server.server_close()
+        self.assertFalse(self.socket_path.exists())
+
+
+class TestDaemonClient(unittest.TestCase):
+    """Test client helpers that don't need a running daemon."""
+
+    def test_socket_path_env_override(self):
+        """Test REPO_LINT_DAEMON_SOCKET takes precedence."""
+        with patch.dict(os.environ, {"REPO_LINT_DAEMON_SOCKET": "/tmp/custom.sock"}):
+            self.assertEqual(daemon.get_socket_path(), Path("/tmp/custom.sock"))
+
+    def test_socket_path_stable_per_repo(self):
+        """Test the default path is deterministic and differs between repos."""
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("REPO_LINT_DAEMON_SOCKET", None)
+            first = daemon.get_socket_path(repo_root)
+            self.assertEqual(first, daemon.get_socket_path(repo_root))
+            self.assertNotEqual(first, daemon.get_socket_path(repo_root / "tools"))
+            self.assertLess(len(str(first)), 104)
+
+    def test_forward_without_daemon_returns_none(self):
+        """Test forwarding falls back when nothing is listening."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertIsNone(daemon.forward_command(["check"], Path(tmpdir) / "missing.sock"))
+
+    @patch("tools.repo_lint.daemon.forward_command", return_value=0)
+    def test_use_daemon_forwards_parsed_options(self, mock_forward):
+        """Test `check --use-daemon` rebuilds argv from Click's parsed options.
+
+        :param mock_forward: Mocked forward_command
+        """
+        argv = ["check", "--use-daemon", "--ci", "--tool", "black", "--tool", "ruff", "-j", "2", "--hide-codes"]
+        with patch.object(sys, "argv", ["unrelated", "check", "--bogus"]):
+            exit_code, _, _ = daemon._run_cli(argv, cli)
+
+        self.assertEqual(exit_code, 0)
+        mock_forward.assert_called_once_with(
+            ["check", "--ci", "--tool", "black", "--tool", "ruff", "--show-files", "--hide-codes", "--jobs", "2"]
+        )
+
+    def test_run_cli_captures_usage_errors(self):
+        """Test _run_cli converts click usage errors to exit code 2 with captured stderr."""
+        exit_code, _, err = daemon._run_cli(["check", "--no-such-flag"], cli)
+        self.assertEqual(exit_code, 2)
+        self.assertIn("--no-such-flag", err)
+
+
+class TestTrackedFilesCache(unittest.TestCase):
+    """Test the git ls-files memo used by the daemon."""
+
+    def tearDown(self):
+        """Disable the cache again."""
+        base.set_tracked_files_cache(False)
+
+    def test_cache_invalidated_by_index_change(self):
+        """Test cached listings refresh after files are staged."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            subprocess.run(["git", "init", "-q"], cwd=tmp, check=True)
+            (tmp / "a.py").write_text("", encoding="utf-8")
+            subprocess.run(["git", "add", "a.py"], cwd=tmp, check=True)
+
+            base.set_tracked_files_cache(True)
+            with patch("tools.repo_lint.runners.base.get_excluded_paths", return_value=[]):
+                self.assertEqual(base.get_tracked_files(["*.py"], tmp), ["a.py"])
+                with patch("tools.repo_lint.runners.base.subprocess.run") as mock_run:
+                    self.assertEqual(base.get_tracked_files(["*.py"], tmp), ["a.py"])
+                    mock_run.assert_not_called()
+
+                (tmp / "b.py").write_text("", encoding="utf-8")
+                subprocess.run(["git", "add", "b.py"], cwd=tmp, check=True)
+                self.assertEqual(base.get_tracked_files(["*.py"], tmp), ["a.py", "b.py"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -323,7 +323,7 @@ class TestFixturePathEdgeCases:
 class TestRunnerHasFilesConsistency:
     """Test that has_files() uses same file set as execution."""
 
-    @patch("tools.repo_lint.runners.python_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_python_runner_has_files_matches_execution(self, mock_run):
         """Python runner has_files() must match actual execution file set.
 
@@ -346,7 +346,7 @@ class TestRunnerHasFilesConsistency:
         # has_files() should return True only if files exist
         assert has_files == (len(files) > 0), "has_files() inconsistent with actual file set"
 
-    @patch("tools.repo_lint.runners.rust_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_rust_runner_has_files_matches_execution(self, mock_run):
         """Rust runner has_files() must match actual execution file set.
 
@@ -14,6 +14,7 @@
     - Fix mode (auto-formatting)
     - Result parsing and violation reporting
     - JSON metadata validation ($schema, description, title fields)
+    - Bounded-prefix root key scan and full-parse fallback
 
 :Usage:
     Run tests from repository root::
@@ -50,6 +51,7 @@
 from __future__ import annotations
 
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -58,7 +60,11 @@ from unittest.mock import MagicMock, patch
 repo_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(repo_root))
 
-from tools.repo_lint.runners.json_runner import JsonRunner  # noqa: E402
+from tools.repo_lint.runners.json_runner import (  # noqa: E402
+    METADATA_PREFIX_CHARS,
+    JsonRunner,
+    scan_root_metadata,
+)
 
 
 class TestJsonRunner(unittest.TestCase):
@@ -127,7 +133,7 @@ class TestJsonRunner(unittest.TestCase):
             Verify check mode uses --check flag.
         """
         # Mock subprocess.run to capture command
-        with patch("tools.repo_lint.runners.json_runner.subprocess.run") as mock_run:
+        with patch("tools.repo_lint.runners.base.subprocess.run") as mock_run:
             # Mock successful run (exit 0 = no violations)
             mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
@@ -150,7 +156,7 @@ class TestJsonRunner(unittest.TestCase):
             Verify fix mode uses --write flag.
         """
         # Mock subprocess.run to capture command
-        with patch("tools.repo_lint.runners.json_runner.subprocess.run") as mock_run:
+        with patch("tools.repo_lint.runners.base.subprocess.run") as mock_run:
             # Mock successful run (exit 0)
             mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
@@ -174,7 +180,7 @@ class TestJsonRunner(unittest.TestCase):
             Verify violations are detected and parsed correctly.
         """
         # Mock subprocess.run to simulate violations
-        with patch("tools.repo_lint.runners.json_runner.subprocess.run") as mock_run:
+        with patch("tools.repo_lint.runners.base.subprocess.run") as mock_run:
             # Mock exit 1 with file list in output
             mock_run.return_value = MagicMock(
                 returncode=1,
@@ -270,7 +276,7 @@ Code style issues found in 1 file."""
             Verify config file is included in command.
         """
         # Mock subprocess.run
-        with patch("tools.repo_lint.runners.json_runner.subprocess.run") as mock_run:
+        with patch("tools.repo_lint.runners.base.subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
             # Mock get_tracked_files
@@ -480,5 +486,60 @@ Code style issues found in 1 file."""
         self.assertEqual(len(results), 2)  # prettier + metadata
 
 
+class TestJsonMetadataScan(unittest.TestCase):
+    """Test the bounded-prefix metadata scan and its full-parse fallback.
+
+    :Purpose:
+        Validates that large files are decided from their prefix and that
+        inconclusive prefixes fall back to json parsing.
+    """
+
+    def test_scan_skips_nested_values(self):
+        """Test that nested values (with brackets inside strings) are skipped, not matched."""
+        self.assertTrue(scan_root_metadata('{"data": {"title": "]", "x": [1, "}", {"a": "\\""}]}, "title": "t"}'))
+        self.assertFalse(scan_root_metadata('{"data": {"title": "nested only"}}'))
+        self.assertTrue(scan_root_metadata('{"\\u0024schema": "escaped key"}'))
+
+    def test_scan_inconclusive_cases(self):
+        """Test that non-object roots, truncated and malformed prefixes defer to a full parse."""
+        for text in ("[1, 2]", '{"data": [1, 2, 3', '{"a": 1,}', '{"a" 1}', ""):
+            self.assertFalse(scan_root_metadata(text), text)
+
+    def _validate(self, files):
+        """Write files to a temporary repository and run metadata validation.
+
+        :param files: Mapping of file name to content
+        :returns: LintResult from _validate_json_metadata()
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, content in files.items():
+                Path(tmp, name).write_text(content, encoding="utf-8")
+            runner = JsonRunner(repo_root=Path(tmp))
+            with patch("tools.repo_lint.runners.json_runner.get_tracked_files", return_value=list(files)):
+                return runner._validate_json_metadata()
+
+    def test_large_file_with_leading_metadata_is_not_parsed(self):
+        """Test that a metadata key in the prefix avoids deserializing the rest of the file."""
+        big = '{"description": "d", "data": [' + ",".join(["1"] * METADATA_PREFIX_CHARS) + "]}"
+        with patch("tools.repo_lint.runners.json_runner.json.loads") as mock_loads:
+            result = self._validate({"big.json": big})
+        self.assertTrue(result.passed)
+        mock_loads.assert_not_called()
+
+    def test_metadata_after_prefix_uses_full_parse(self):
+        """Test that a metadata key beyond the prefix is still found by the full parse."""
+        late = '{"data": [' + ",".join(["1"] * METADATA_PREFIX_CHARS) + '], "title": "late"}'
+        late_missing = '{"data": [' + ",".join(["1"] * METADATA_PREFIX_CHARS) + "]}"
+        result = self._validate({"late.json": late, "missing.json": late_missing, "bad.json": '{"a": tru}'})
+        self.assertEqual([v.file for v in result.violations], ["missing.json", "bad.json"])
+        self.assertIn("Missing required metadata", result.violations[0].message)
+        self.assertIn("Invalid JSON syntax", result.violations[1].message)
+
+    def test_jsonc_files_are_skipped(self):
+        """Test that .jsonc files from the shared listing are not metadata-checked."""
+        result = self._validate({"settings.jsonc": "// comment\n{}", "ok.json": '{"$schema": "s"}'})
+        self.assertTrue(result.passed)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -81,7 +81,7 @@ class TestMarkdownRunner(unittest.TestCase):
         repo_root_path = Path(__file__).parent.parent.parent.parent
         self.runner = MarkdownRunner(repo_root=repo_root_path)
 
-    @patch("tools.repo_lint.runners.markdown_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_has_files_detects_md(self, mock_run):
         """Test that has_files detects .md files.
 
@@ -94,7 +94,7 @@ class TestMarkdownRunner(unittest.TestCase):
 
         self.assertTrue(self.runner.has_files())
 
-    @patch("tools.repo_lint.runners.markdown_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_has_files_returns_false_when_no_files(self, mock_run):
         """Test that has_files returns False when no Markdown files exist.
 
@@ -137,7 +137,7 @@ class TestMarkdownRunner(unittest.TestCase):
 
         self.assertEqual(missing_tools, [])
 
-    @patch("tools.repo_lint.runners.markdown_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_run_markdownlint_with_config_file(self, mock_run):
         """Test that _run_markdownlint uses config file when present.
 
@@ -160,7 +160,7 @@ class TestMarkdownRunner(unittest.TestCase):
         self.assertIn("markdownlint-cli2", markdownlint_args)
         self.assertIn("--config", markdownlint_args)
 
-    @patch("tools.repo_lint.runners.markdown_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_run_markdownlint_fix_mode(self, mock_run):
         """Test that _run_markdownlint passes --fix flag in fix mode.
 
@@ -180,7 +180,7 @@ class TestMarkdownRunner(unittest.TestCase):
         markdownlint_args = mock_run.call_args_list[1][0][0]
         self.assertIn("--fix", markdownlint_args)
 
-    @patch("tools.repo_lint.runners.markdown_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_run_markdownlint_check_mode_no_fix_flag(self, mock_run):
         """Test that _run_markdownlint does not pass --fix in check mode.
 
@@ -273,7 +273,7 @@ README.md:7:81 error MD013/line-length Line length"""
 
         self.assertEqual(len(violations), 0)
 
-    @patch("tools.repo_lint.runners.markdown_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_run_markdownlint_empty_file_list(self, mock_run):
         """Test that empty file list returns success.
 
@@ -289,7 +289,7 @@ README.md:7:81 error MD013/line-length Line length"""
         self.assertTrue(result.passed)
         self.assertEqual(len(result.violations), 0)
 
-    @patch("tools.repo_lint.runners.markdown_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     @patch("tools.repo_lint.runners.markdown_runner.command_exists")
     def test_check_returns_violations(self, mock_command_exists, mock_run):
         """Test that check() returns violations when linting fails.
@@ -316,7 +316,7 @@ README.md:7:81 error MD013/line-length Line length"""
         self.assertFalse(results[0].passed)
         self.assertEqual(len(results[0].violations), 1)
 
-    @patch("tools.repo_lint.runners.markdown_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     @patch("tools.repo_lint.runners.markdown_runner.command_exists")
     def test_fix_applies_fixes(self, mock_command_exists, mock_run):
         """Test that fix() calls _run_markdownlint with fix=True.
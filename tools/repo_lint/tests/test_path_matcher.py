@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position,protected-access  # Test file needs special setup
+"""Unit tests for the compiled gitwildmatch path matcher.
+
+:Purpose:
+    Validates path_matcher.py pattern translation and the file filters that
+    share it (get_tracked_files, filter_excluded_paths, NamingRunner).
+
+:Test Coverage:
+    - Star, question mark, character class and escape translation
+    - Anchored vs. any-depth patterns, `**` prefixes/suffixes/middles
+    - Directory-only patterns (trailing `/`) and directory-contents matching
+    - Comments, blank lines and negation handling
+    - filter_excluded_paths() and NamingRunner._filter_exclusions() semantics
+    - Git pathspec semantics match `git ls-files ':(exclude)...'` on nested paths
+
+:Usage:
+    Run tests from repository root::
+
+        python3 -m pytest tools/repo_lint/tests/test_path_matcher.py
+
+:Environment Variables:
+    None
+
+:Exit Codes:
+    0
+        All tests passed
+    1
+        One or more tests failed
+
+:Examples:
+    Run all tests::
+
+        python3 -m pytest tools/repo_lint/tests/test_path_matcher.py -v
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path, PurePosixPath
+
+# Add repo_lint parent directory to path for imports
+repo_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(repo_root))
+
+from tools.repo_lint.common import filter_excluded_paths  # noqa: E402
+from tools.repo_lint.path_matcher import PathMatcher, compile_patterns, translate_pattern  # noqa: E402
+from tools.repo_lint.runners.base import _get_exclusion_patterns  # noqa: E402
+from tools.repo_lint.runners.naming_runner import NamingRunner  # noqa: E402
+
+
+class TestPatternSemantics(unittest.TestCase):
+    """Test gitwildmatch semantics of single patterns."""
+
+    def _assert_matches(self, pattern, matching, not_matching):
+        """Assert a pattern matches and rejects the given paths.
+
+        :param pattern: gitwildmatch pattern
+        :param matching: Paths that must match
+        :param not_matching: Paths that must not match
+        """
+        matcher = PathMatcher([pattern])
+        for path in matching:
+            self.assertTrue(matcher.matches(path), f"{pattern!r} should match {path!r}")
+        for path in not_matching:
+            self.assertFalse(matcher.matches(path), f"{pattern!r} should not match {path!r}")
+
+    def test_basename_pattern_any_depth(self):
+        """Test a slash-free pattern matches at any depth."""
+        self._assert_matches("*.pyc", ["a.pyc", "x/y/a.pyc"], ["a.py", "a.pyc.bak"])
+
+    def test_star_does_not_cross_slash(self):
+        """Test `*` stays within one segment for anchored patterns."""
+        self._assert_matches("docs/*.md", ["docs/a.md"], ["docs/sub/a.md", "x/docs/a.md"])
+
+    def test_double_star_suffix(self):
+        """Test `dir/**` matches everything inside an anchored directory."""
+        self._assert_matches("dist/**", ["dist/a", "dist/a/b.whl"], ["dist", "src/dist/a", "distx/a"])
+
+    def test_double_star_prefix_and_middle(self):
+        """Test leading and middle `**` match zero or more directories."""
+        self._assert_matches("**/*.sh", ["a.sh", "x/y/a.sh"], ["a.bash"])
+        self._assert_matches("a/**/b", ["a/b", "a/x/b", "a/x/y/b"], ["b", "x/a/b"])
+
+    def test_directory_patterns(self):
+        """Test directory matches cover contents and trailing `/` requires a directory."""
+        self._assert_matches("build/", ["build/x", "src/build/x"], ["build", "builder/x"])
+        self._assert_matches("rust/target/", ["rust/target/debug/x"], ["x/rust/target/y"])
+        self._assert_matches("node_modules", ["node_modules", "a/node_modules/b"], ["node_modules2"])
+
+    def test_question_mark_classes_and_escapes(self):
+        """Test `?`, `[...]`, `[!...]` and backslash escapes."""
+        self._assert_matches("file?.txt", ["file1.txt"], ["file10.txt", "file/.txt"])
+        self._assert_matches("[ab].py", ["a.py", "b.py"], ["c.py"])
+        self._assert_matches("[!ab].py", ["c.py"], ["a.py"])
+        self._assert_matches(r"\*.py", ["*.py"], ["a.py"])
+
+    def test_literal_special_characters(self):
+        """Test regex metacharacters in patterns are literal."""
+        self._assert_matches("a+b(1).txt", ["a+b(1).txt"], ["aab1.txt"])
+
+    def test_comments_blank_and_negation(self):
+        """Test comments/blanks are ignored and negation is rejected."""
+        self.assertIsNone(translate_pattern("# comment"))
+        self.assertIsNone(translate_pattern("   "))
+        self.assertFalse(PathMatcher(["", "# x"]))
+        with self.assertRaises(ValueError):
+            PathMatcher(["!keep.py"])
+
+
+class TestPathMatcher(unittest.TestCase):
+    """Test the combined matcher API."""
+
+    def test_filter_preserves_order(self):
+        """Test filter() keeps non-matching paths in order."""
+        matcher = PathMatcher(["*.tmp", "build/**"])
+        paths = ["z.py", "build/a", "a.tmp", "a.py"]
+        self.assertEqual(matcher.filter(paths), ["z.py", "a.py"])
+
+    def test_empty_matcher(self):
+        """Test a matcher without patterns keeps everything."""
+        self.assertEqual(PathMatcher([]).filter(["a"]), ["a"])
+        self.assertFalse(PathMatcher([]).matches("a"))
+
+    def test_accepts_pathlib(self):
+        """Test pathlib paths are converted to posix form."""
+        self.assertTrue(PathMatcher(["a/*.py"]).matches(PurePosixPath("a/b.py")))
+
+    def test_compile_patterns_cached(self):
+        """Test compile_patterns() reuses matchers for equal pattern lists."""
+        self.assertIs(compile_patterns(["a", "b"]), compile_patterns(("a", "b")))
+
+
+class TestPathspecParity(unittest.TestCase):
+    """Test pathspec matchers exclude exactly what git's `:(exclude)` pathspecs do."""
+
+    PATHS = [
+        "a.py",
+        "a.pyc",
+        "src/pkg.egg-info/x.py",
+        "pkg.egg-info/PKG-INFO",
+        "src/dist/a.py",
+        "dist/a/b.whl",
+        "distx/a.py",
+        "docs/a.md",
+        "docs/sub/a.md",
+        "x/docs/a.md",
+        "tests/fixtures/bad.py",
+        "tests/fixtures2/ok.py",
+        "a/__pycache__/x.pyc",
+        "__pycache__/y.pyc",
+        ".venv-3/lib/site.py",
+        "fileX/a.txt",
+    ]
+
+    EXTRA_PATTERNS = ["docs/*.md", "tests/fixtures", "file?/a.txt", "[dx]ist*/**", "src/**/*.py"]
+
+    def test_matches_git_ls_files_excludes(self):
+        """Test each pattern filters nested paths the way git ls-files does."""
+        patterns = list(_get_exclusion_patterns()) + self.EXTRA_PATTERNS
+        with tempfile.TemporaryDirectory() as tmp:
+            subprocess.run(["git", "init", "-q"], cwd=tmp, check=True)
+            for path in self.PATHS:
+                (Path(tmp) / path).parent.mkdir(parents=True, exist_ok=True)
+                (Path(tmp) / path).write_text("", encoding="utf-8")
+            subprocess.run(["git", "add", "-f", "--", *self.PATHS], cwd=tmp, check=True)
+            tracked = sorted(self.PATHS)
+            for pattern in patterns:
+                listed = subprocess.run(
+                    ["git", "ls-files", "--", f":(exclude){pattern}"],
+                    cwd=tmp,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout.split()
+                self.assertEqual(compile_patterns([pattern], pathspec=True).filter(tracked), listed, pattern)
+
+    def test_star_crosses_slash(self):
+        """Test a leading `*` matches across directories, unlike gitwildmatch."""
+        self.assertTrue(compile_patterns(["*.egg-info/**"], pathspec=True).matches("src/pkg.egg-info/x.py"))
+        self.assertFalse(compile_patterns(["*.egg-info/**"]).matches("src/pkg.egg-info/x.py"))
+
+
+class TestSharedFilters(unittest.TestCase):
+    """Test file filters built on the shared matcher."""
+
+    def test_filter_excluded_paths_defaults(self):
+        """Test default fixture exclusions."""
+        files = ["src/main.py", "scripts/tests/fixtures/bad.sh", "conformance/repo-lint/vectors/fixtures/x.pl"]
+        self.assertEqual(filter_excluded_paths(files), ["src/main.py"])
+
+    def test_filter_excluded_paths_custom(self):
+        """Test the documented example."""
+        files = ["src/main.py", "fixtures/violations/bad.py"]
+        self.assertEqual(filter_excluded_paths(files, ["fixtures/violations/"]), ["src/main.py"])
+
+    def test_naming_runner_exclusions(self):
+        """Test NamingRunner applies its configured exclusions."""
+        runner = NamingRunner()
+        files = [
+            repo_root / "tools" / "ok.py",
+            repo_root / "a" / "__pycache__" / "x.pyc",
+            repo_root / "pkg.egg-info" / "PKG-INFO",
+            repo_root / "scripts" / "tests" / "fixtures" / "Bad-Name.py",
+        ]
+        self.assertEqual(runner._filter_exclusions(files, repo_root), [repo_root / "tools" / "ok.py"])
+
+
+if __name__ == "__main__":
+    unittest.main()
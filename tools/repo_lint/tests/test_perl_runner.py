@@ -74,7 +74,7 @@ class TestPerlRunner(unittest.TestCase):
         """
         self.runner = PerlRunner(repo_root=Path("/fake/repo"))
 
-    @patch("tools.repo_lint.runners.perl_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_get_perl_files_returns_list(self, mock_run):
         """Test that _get_perl_files returns file list.
 
@@ -91,7 +91,7 @@ class TestPerlRunner(unittest.TestCase):
         self.assertIn("script1.pl", files)
         self.assertIn("script2.pl", files)
 
-    @patch("tools.repo_lint.runners.perl_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_get_perl_files_returns_empty(self, mock_run):
         """Test that _get_perl_files returns empty list when no files.
 
@@ -106,7 +106,7 @@ class TestPerlRunner(unittest.TestCase):
 
         self.assertEqual(files, [])
 
-    @patch("tools.repo_lint.runners.perl_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_perlcritic_uses_verbose_flag(self, mock_run):
         """Test that _run_perlcritic uses --verbose 8 flag.
 
@@ -129,7 +129,7 @@ class TestPerlRunner(unittest.TestCase):
         self.assertIn("8", critic_args)
         self.assertTrue(result.passed)
 
-    @patch("tools.repo_lint.runners.perl_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_perlcritic_handles_exit_code_0(self, mock_run):
         """Test that _run_perlcritic handles exit code 0 (success).
 
@@ -149,7 +149,7 @@ class TestPerlRunner(unittest.TestCase):
         self.assertEqual(result.tool, "perlcritic")
         self.assertEqual(len(result.violations), 0)
 
-    @patch("tools.repo_lint.runners.perl_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_perlcritic_handles_exit_code_2(self, mock_run):
         """Test that _run_perlcritic handles exit code 2 (violations).
 
@@ -171,7 +171,7 @@ Two-argument "open" used at line 10"""
         self.assertEqual(result.tool, "perlcritic")
         self.assertEqual(len(result.violations), 2)
 
-    @patch("tools.repo_lint.runners.perl_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_empty_files_returns_passed(self, mock_run):
         """Test that empty file list returns passed result.
 
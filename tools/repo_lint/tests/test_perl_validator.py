@@ -47,6 +47,7 @@
 from __future__ import annotations
 
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -205,6 +206,66 @@ print "Hello\\n";
         has_missing_sections = any(len(e.missing_sections) > 0 for e in errors)
         self.assertTrue(has_missing_sections, f"Expected missing sections, got: {errors}")
 
+    def test_validate_path_finds_pod_after_end(self):
+        """Test that validate_path() checks POD anywhere in the file.
+
+        :Purpose:
+            POD after __END__ at the bottom of a script is found through the
+            memory-mapped search, and empty files are reported like validate().
+        """
+        pod = "".join(
+            f"=head1 {section}\n\nText\n\n"
+            for section in ("NAME", "SYNOPSIS", "DESCRIPTION", "ENVIRONMENT VARIABLES", "EXIT CODES", "EXAMPLES")
+        )
+        content = "#!/usr/bin/perl\n" + "print 1;\n" * 5000 + "__END__\n\n" + pod + "=cut\n"
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "script.pl"
+            script.write_text(content, encoding="utf-8")
+            empty = Path(tmp) / "empty.pl"
+            empty.write_text("", encoding="utf-8")
+
+            file_errors = [e for e in PerlValidator.validate_path(script) if e.symbol_name is None]
+            empty_errors = PerlValidator.validate_path(empty)
+
+        self.assertEqual([e.missing_sections for e in file_errors], [])
+        self.assertEqual(empty_errors[0].missing_sections, ["POD block"])
+
+    def test_missing_sections_report_pod_line(self):
+        """Test that missing POD sections are reported at the POD's first line.
+
+        :Purpose:
+            The decoded and the memory-mapped checks give the same missing
+            sections and the same line number.
+        """
+        pod = "".join(f"=head1 {section}\n\nText\n\n" for section in ("NAME", "SYNOPSIS", "DESCRIPTION", "EXAMPLES"))
+        content = "#!/usr/bin/perl\n" + "print 1;\n" * 500 + "__END__\n\n" + pod + "=cut\n"
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "script.pl"
+            script.write_text(content, encoding="utf-8")
+            mapped_error = [e for e in PerlValidator.validate_path(script) if e.symbol_name is None][0]
+        decoded_error = PerlValidator._validate_file_pod(Path("script.pl"), content)
+
+        for error in (mapped_error, decoded_error):
+            self.assertEqual(error.missing_sections, ["=head1 ENVIRONMENT VARIABLES", "=head1 EXIT CODES"])
+            self.assertEqual(error.line_number, 504)
+
+    def test_validate_path_uses_universal_newlines(self):
+        """Test that lone carriage returns end lines, as in Path.read_text().
+
+        :Purpose:
+            A script using "\\r" line endings reports the same missing POD
+            sections and line number as one using "\\n".
+        """
+        pod = "".join(f"=head1 {section}\r\rText\r\r" for section in ("NAME", "SYNOPSIS", "DESCRIPTION", "EXAMPLES"))
+        content = "#!/usr/bin/perl\r" + "print 1;\r" * 500 + "__END__\r\r" + pod + "=cut\r"
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "script.pl"
+            script.write_text(content, encoding="utf-8", newline="")
+            error = [e for e in PerlValidator.validate_path(script) if e.symbol_name is None][0]
+
+        self.assertEqual(error.missing_sections, ["=head1 ENVIRONMENT VARIABLES", "=head1 EXIT CODES"])
+        self.assertEqual(error.line_number, 504)
+
 
 if __name__ == "__main__":
     unittest.main()
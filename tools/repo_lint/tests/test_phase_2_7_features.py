@@ -451,6 +451,17 @@ class TestPhase27ConfigCommands(unittest.TestCase):
         self.repo_root = repo_root
         self.conformance_dir = self.repo_root / "conformance" / "repo-lint"
 
+    def _repo_lint(self, *args: str):
+        """Run the repo-lint CLI in-process from the repository root.
+
+        :param args: CLI arguments
+        :returns: CliResult with returncode, stdout and stderr
+        """
+        from tools.repo_lint.cli import main
+        from tools.repo_lint.tests.cli_harness import run_cli
+
+        return run_cli(list(args), cwd=self.repo_root, main=main)
+
     def test_dump_config_command_exists(self):
         """Test that dump-config command exists in CLI."""
         from tools.repo_lint.cli import cli
@@ -508,15 +519,8 @@ class TestPhase27ConfigCommands(unittest.TestCase):
 
     def test_validate_config_valid_file(self):
         """Test validate-config command with valid config file."""
-        import subprocess
-
         config_file = self.conformance_dir / "repo-lint-linting-rules.yaml"
-        result = subprocess.run(
-            ["repo-lint", "validate-config", str(config_file)],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = self._repo_lint("validate-config", str(config_file))
 
         # Should exit 0 for valid config
         self.assertEqual(result.returncode, 0)
@@ -524,8 +528,6 @@ class TestPhase27ConfigCommands(unittest.TestCase):
 
     def test_validate_config_all_config_types(self):
         """Test validate-config with all config file types."""
-        import subprocess
-
         config_files = [
             "repo-lint-linting-rules.yaml",
             "repo-lint-naming-rules.yaml",
@@ -536,12 +538,7 @@ class TestPhase27ConfigCommands(unittest.TestCase):
         for config_filename in config_files:
             config_file = self.conformance_dir / config_filename
             if config_file.exists():
-                result = subprocess.run(
-                    ["repo-lint", "validate-config", str(config_file)],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
+                result = self._repo_lint("validate-config", str(config_file))
 
                 # Should exit 0 for valid config
                 self.assertEqual(
@@ -552,14 +549,7 @@ class TestPhase27ConfigCommands(unittest.TestCase):
 
     def test_dump_config_yaml_format(self):
         """Test dump-config command with YAML format."""
-        import subprocess
-
-        result = subprocess.run(
-            ["repo-lint", "dump-config", "--format", "yaml"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = self._repo_lint("dump-config", "--format", "yaml")
 
         # Should exit 0
         self.assertEqual(result.returncode, 0)
@@ -573,14 +563,7 @@ class TestPhase27ConfigCommands(unittest.TestCase):
 
     def test_dump_config_json_format(self):
         """Test dump-config command with JSON format."""
-        import subprocess
-
-        result = subprocess.run(
-            ["repo-lint", "dump-config", "--format", "json"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = self._repo_lint("dump-config", "--format", "json")
 
         # Should exit 0
         self.assertEqual(result.returncode, 0)
@@ -595,14 +578,7 @@ class TestPhase27ConfigCommands(unittest.TestCase):
 
     def test_dump_config_contains_all_configs(self):
         """Test dump-config includes all config types."""
-        import subprocess
-
-        result = subprocess.run(
-            ["repo-lint", "dump-config", "--format", "json"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = self._repo_lint("dump-config", "--format", "json")
 
         self.assertEqual(result.returncode, 0)
 
@@ -75,7 +75,7 @@ class TestPowerShellRunner(unittest.TestCase):
         """
         self.runner = PowerShellRunner(repo_root=Path("/fake/repo"))
 
-    @patch("tools.repo_lint.runners.powershell_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_get_powershell_files_returns_list(self, mock_run):
         """Test that _get_powershell_files returns file list.
 
@@ -92,7 +92,7 @@ class TestPowerShellRunner(unittest.TestCase):
         self.assertIn("script1.ps1", files)
         self.assertIn("script2.ps1", files)
 
-    @patch("tools.repo_lint.runners.powershell_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_get_powershell_files_returns_empty(self, mock_run):
         """Test that _get_powershell_files returns empty list when no files.
 
@@ -107,7 +107,7 @@ class TestPowerShellRunner(unittest.TestCase):
 
         self.assertEqual(files, [])
 
-    @patch("tools.repo_lint.runners.powershell_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_psscriptanalyzer_uses_correct_flags(self, mock_run):
         """Test that _run_psscriptanalyzer uses -NoProfile -NonInteractive.
 
@@ -130,7 +130,7 @@ class TestPowerShellRunner(unittest.TestCase):
         self.assertIn("-NonInteractive", pssa_args)
         self.assertTrue(result.passed)
 
-    @patch("tools.repo_lint.runners.powershell_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_psscriptanalyzer_uses_args_parameter(self, mock_run):
         """Test that _run_psscriptanalyzer uses $args[0] for file path.
 
@@ -158,7 +158,7 @@ class TestPowerShellRunner(unittest.TestCase):
         self.assertEqual(pssa_args[-1], "test.ps1", "File path should be last argument")
         self.assertTrue(result.passed)
 
-    @patch("tools.repo_lint.runners.powershell_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_check_tools_detects_missing_pwsh(self, mock_run):
         """Test that check_tools detects missing pwsh.
 
@@ -171,7 +171,7 @@ class TestPowerShellRunner(unittest.TestCase):
             missing = self.runner.check_tools()
             self.assertIn("pwsh", missing)
 
-    @patch("tools.repo_lint.runners.powershell_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_check_tools_detects_missing_psscriptanalyzer(self, mock_run):
         """Test that check_tools detects missing PSScriptAnalyzer module.
 
@@ -186,7 +186,7 @@ class TestPowerShellRunner(unittest.TestCase):
             missing = self.runner.check_tools()
             self.assertIn("PSScriptAnalyzer", missing)
 
-    @patch("tools.repo_lint.runners.powershell_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_empty_files_returns_passed(self, mock_run):
         """Test that empty file list returns passed result.
 
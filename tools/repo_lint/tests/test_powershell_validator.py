@@ -188,6 +188,26 @@ $message = "Hello"
         has_example_error = any(".EXAMPLE" in e.missing_sections for e in errors)
         self.assertTrue(has_example_error, f"Expected .EXAMPLE error, got: {errors}")
 
+    def test_missing_sections_report_help_block_line(self):
+        """Test that missing sections are reported at the <# line.
+
+        :Purpose:
+            Verify the file-level error points at the comment-based help block.
+        """
+        content = """#Requires -Version 7
+
+<#
+.SYNOPSIS
+    Test script
+
+.notes
+    Section keywords are case-insensitive
+#>
+"""
+        error = PowerShellValidator._validate_file_help(Path("test.ps1"), content)
+        self.assertEqual(error.missing_sections, [".DESCRIPTION", ".ENVIRONMENT", ".EXAMPLE"])
+        self.assertEqual(error.line_number, 3)
+
     def test_missing_file_help(self):
         """Test that completely missing file help is detected.
 
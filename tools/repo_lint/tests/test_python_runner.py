@@ -75,7 +75,7 @@ class TestRuffCheckFix(unittest.TestCase):
         """
         self.runner = PythonRunner(repo_root=Path("/fake/repo"))
 
-    @patch("tools.repo_lint.runners.python_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_check_uses_no_fix(self, mock_run):
         """Test that _run_ruff_check uses --no-fix flag.
 
@@ -100,7 +100,7 @@ class TestRuffCheckFix(unittest.TestCase):
         self.assertTrue(result.passed, "Check with no violations should pass")
         self.assertEqual(result.tool, "ruff")
 
-    @patch("tools.repo_lint.runners.python_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_fix_uses_fix_flag(self, mock_run):
         """Test that _run_ruff_fix uses --fix flag.
 
@@ -126,7 +126,7 @@ class TestRuffCheckFix(unittest.TestCase):
         self.assertTrue(result.passed, "Fix with no remaining violations should pass")
         self.assertEqual(result.tool, "ruff")
 
-    @patch("tools.repo_lint.runners.python_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_check_handles_violations(self, mock_run):
         """Test that _run_ruff_check correctly parses violations.
 
@@ -149,7 +149,7 @@ Found 2 errors."""
         self.assertEqual(result.tool, "ruff")
         self.assertEqual(len(result.violations), 2, "Should parse 2 violations (ignoring 'Found' line)")
 
-    @patch("tools.repo_lint.runners.python_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_check_handles_unsafe_fixes_warning(self, mock_run):
         """Test that _run_ruff_check handles unsafe fixes warning.
 
@@ -173,7 +173,7 @@ Found 1 error."""
         self.assertIsNotNone(result.info_message)  # Info message present
         self.assertIn("Review before applying", result.info_message, "Should use check context message")
 
-    @patch("tools.repo_lint.runners.python_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_fix_handles_unsafe_fixes_warning(self, mock_run):
         """Test that _run_ruff_fix handles unsafe fixes warning.
 
@@ -198,7 +198,7 @@ Found 1 error."""
         self.assertIsNotNone(result.info_message)  # Info message present
         self.assertIn("not applied automatically", result.info_message, "Should use fix context message")
 
-    @patch("tools.repo_lint.runners.python_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_fix_command_sequences_black_and_ruff(self, mock_run):
         """Test that fix() command calls both Black and Ruff.
 
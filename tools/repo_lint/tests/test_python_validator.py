@@ -49,6 +49,7 @@
 
 from __future__ import annotations
 
+import re
 import sys
 import unittest
 from pathlib import Path
@@ -57,6 +58,7 @@ from pathlib import Path
 repo_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(repo_root))
 
+from tools.repo_lint.docstrings.common import SectionPatterns  # noqa: E402
 from tools.repo_lint.docstrings.python_validator import (  # noqa: E402
     PythonValidator,  # noqa: E402
 )  # noqa: E402
@@ -178,6 +180,25 @@ class TestPythonValidator(unittest.TestCase):
         self.assertEqual(len(errors), 1)
         self.assertIn("Exit Codes", errors[0].missing_sections)
 
+    def test_missing_sections_report_docstring_line(self):
+        """Test that module docstring errors carry line numbers.
+
+        :Purpose:
+            Missing sections are reported at the docstring's opening line and
+            incomplete exit codes at the :Exit Codes: line.
+        """
+        header = '#!/usr/bin/env python3\n# A comment\n"""Test module.\n\n:Purpose:\n    Test\n\n'
+        missing = PythonValidator.validate(Path("test.py"), header + ':Examples:\n    Example\n"""\n')
+        incomplete = PythonValidator.validate(
+            Path("test.py"),
+            header + ':Environment Variables:\n    None\n\n:Examples:\n    Ex\n\n:Exit Codes:\n    Nothing\n"""\n',
+        )
+
+        self.assertEqual(
+            [(e.missing_sections, e.line_number) for e in missing], [(["Environment Variables", "Exit Codes"], 3)]
+        )
+        self.assertEqual([(e.missing_sections, e.line_number) for e in incomplete], [(["Exit Codes content"], 14)])
+
     def test_function_with_docstring_passes(self):
         """Test that functions with docstrings pass validation.
 
@@ -362,5 +383,30 @@ def broken syntax here:
         self.assertIsInstance(errors, list)
 
 
+class TestSectionPatterns(unittest.TestCase):
+    """Test the shared single-pass section index.
+
+    :Purpose:
+        Validates SectionPatterns, which the docstring validators use to find
+        their required sections.
+    """
+
+    def test_index_matches_separate_searches(self):
+        """Test that index() finds what one re.search() per pattern finds.
+
+        :Purpose:
+            Verify first-occurrence line numbers, patterns that overlap or
+            match at the same position, and bytes input.
+        """
+        sections = SectionPatterns(["A", "AB", "B", "C"], [r"^a", r"^ab", r"b\s*\n", r"c"], re.MULTILINE)
+        text = "x\nab\nb\nab\n"
+
+        self.assertEqual(sections.index(text, first_line=10), {"A": 11, "AB": 11, "B": 11})
+        self.assertEqual(sections.index(text.encode()), {"A": 2, "AB": 2, "B": 2})
+        self.assertEqual(sections.missing(sections.index(text)), ["C"])
+        with self.assertRaises(ValueError):
+            SectionPatterns(["A"], [])
+
+
 if __name__ == "__main__":
     unittest.main()
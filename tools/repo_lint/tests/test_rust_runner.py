@@ -20,13 +20,14 @@
 
 from __future__ import annotations
 
+import json
 import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from tools.repo_lint.common import LintResult
-from tools.repo_lint.runners.rust_runner import RustRunner
+from tools.repo_lint.runners.rust_runner import _CRATE_MAP_CACHE, RustRunner, load_crate_map, map_files_to_crates
 
 
 @pytest.fixture
@@ -429,3 +430,144 @@ class TestRustRunnerIntegration:
         assert len(results) == 2
         assert results[0].tool == "rustfmt"
         assert results[1].tool == "clippy"
+
+
+def _metadata_output(rust_dir, crates):
+    """Build fake `cargo metadata` stdout.
+
+    :param rust_dir: Cargo workspace path
+    :param crates: (name, manifest dir relative to rust_dir) tuples
+    :returns: JSON string
+    """
+    packages = [{"name": name, "manifest_path": str(rust_dir / rel_dir / "Cargo.toml")} for name, rel_dir in crates]
+    return json.dumps({"packages": packages})
+
+
+@pytest.fixture
+def workspace_root(mock_repo_root):
+    """Turn the mock repository into a two-crate workspace with a Cargo.lock.
+
+    :param mock_repo_root: Mock repository root fixture
+    :returns: Path to mock repository root
+    """
+    rust_dir = mock_repo_root / "rust"
+    (rust_dir / "Cargo.lock").write_text("# lock v1\n")
+    for crate in ("safe-run", "safe-run/nested"):
+        (rust_dir / "crates" / crate / "src").mkdir(parents=True)
+    _CRATE_MAP_CACHE.clear()
+    yield mock_repo_root
+    _CRATE_MAP_CACHE.clear()
+
+
+class TestRustRunnerCrateScoping:
+    """Test suite for per-crate fmt/clippy in changed-only and scoped runs."""
+
+    def test_map_files_to_crates_uses_longest_manifest_dir(self):
+        """Files map to the innermost crate; files outside the workspace are ignored."""
+        crates = [("root", ""), ("safe-run", "crates/safe-run"), ("nested", "crates/safe-run/nested")]
+        owners = map_files_to_crates(
+            [
+                "rust/crates/safe-run/src/main.rs",
+                "rust/crates/safe-run/nested/src/lib.rs",
+                "rust/build.rs",
+                "tools/fixtures/bad.rs",
+            ],
+            crates,
+        )
+        assert owners == ["nested", "root", "safe-run"]
+
+    @patch("subprocess.run")
+    def test_crate_map_cached_per_lock_hash(self, mock_run, workspace_root):
+        """cargo metadata runs once per Cargo.lock content, with a persistent on-disk cache.
+
+        :param mock_run: Mock subprocess.run
+        :param workspace_root: Workspace fixture
+        """
+        rust_dir = workspace_root / "rust"
+        crates = [("safe-run", "crates/safe-run")]
+        mock_run.return_value = MagicMock(returncode=0, stdout=_metadata_output(rust_dir, crates), stderr="")
+
+        assert load_crate_map(rust_dir) == crates
+        assert load_crate_map(rust_dir) == crates
+        assert mock_run.call_count == 1
+        assert (rust_dir / "target" / "repo-lint" / "crate-map.json").is_file()
+
+        # A fresh process reads the on-disk cache instead of running cargo
+        _CRATE_MAP_CACHE.clear()
+        assert load_crate_map(rust_dir) == crates
+        assert mock_run.call_count == 1
+
+        # Changing Cargo.lock invalidates both caches
+        (rust_dir / "Cargo.lock").write_text("# lock v2\n")
+        assert load_crate_map(rust_dir) == crates
+        assert mock_run.call_count == 2
+
+        # A malformed on-disk entry is treated as a cache miss
+        cache_file = rust_dir / "target" / "repo-lint" / "crate-map.json"
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        cache_file.write_text(json.dumps({**data, "crates": [["safe-run"]]}), encoding="utf-8")
+        _CRATE_MAP_CACHE.clear()
+        assert load_crate_map(rust_dir) == crates
+        assert mock_run.call_count == 3
+
+    @patch("subprocess.run")
+    def test_clippy_changed_only_runs_owning_crates(self, mock_run, workspace_root):
+        """Changed-only clippy passes -p for owning crates and a dedicated target dir.
+
+        :param mock_run: Mock subprocess.run
+        :param workspace_root: Workspace fixture
+        """
+        rust_dir = workspace_root / "rust"
+        metadata = _metadata_output(rust_dir, [("safe-run", "crates/safe-run"), ("nested", "crates/safe-run/nested")])
+
+        def fake_run(cmd, **kwargs):
+            if cmd[:2] == ["git", "diff"]:
+                return MagicMock(returncode=0, stdout="rust/crates/safe-run/src/main.rs\nREADME.md\n", stderr="")
+            if cmd[:2] == ["cargo", "metadata"]:
+                return MagicMock(returncode=0, stdout=metadata, stderr="")
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        mock_run.side_effect = fake_run
+        runner = RustRunner(repo_root=workspace_root, verbose=False)
+        runner.set_changed_only(True)
+
+        result = runner._run_clippy()  # pylint: disable=protected-access
+
+        assert result.passed is True
+        clippy_call = next(c for c in mock_run.call_args_list if c.args[0][:2] == ["cargo", "clippy"])
+        assert clippy_call.args[0][2:4] == ["-p", "safe-run"]
+        assert "nested" not in clippy_call.args[0]
+        assert clippy_call.kwargs["env"]["CARGO_TARGET_DIR"] == str(rust_dir / "target" / "repo-lint")
+
+    @patch("subprocess.run")
+    def test_scoped_run_without_owning_crate_skips_cargo(self, mock_run, workspace_root):
+        """A file scope with no workspace-owned .rs file does not invoke cargo fmt.
+
+        :param mock_run: Mock subprocess.run
+        :param workspace_root: Workspace fixture
+        """
+        rust_dir = workspace_root / "rust"
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout=_metadata_output(rust_dir, [("safe-run", "crates/safe-run")]), stderr=""
+        )
+        runner = RustRunner(repo_root=workspace_root, verbose=False)
+        runner.set_file_scope(["tools/fixtures/bad.rs"])
+
+        result = runner._run_rustfmt_check()  # pylint: disable=protected-access
+
+        assert result.passed is True
+        assert not any(c.args[0][:2] == ["cargo", "fmt"] for c in mock_run.call_args_list)
+
+    @patch("subprocess.run")
+    def test_full_run_checks_whole_workspace(self, mock_run, rust_runner):
+        """Without changed-only or a scope, fmt runs on the whole workspace (no metadata call).
+
+        :param mock_run: Mock subprocess.run
+        :param rust_runner: RustRunner fixture
+        """
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        rust_runner._run_rustfmt_check()  # pylint: disable=protected-access
+
+        assert mock_run.call_count == 1
+        assert mock_run.call_args.args[0] == ["cargo", "fmt", "--", "--check"]
@@ -47,6 +47,7 @@
 from __future__ import annotations
 
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -193,6 +194,55 @@ fn main() {}
         errors = RustValidator.validate(Path("main.rs"), content)
         self.assertEqual(len(errors), 0, f"Expected no errors, got: {errors}")
 
+    def test_missing_sections_report_module_docs_line(self):
+        """Test that missing sections are reported at the first //! line.
+
+        :Purpose:
+            Verify the error points at the module docs, not the top of the file.
+        """
+        content = "#![allow(dead_code)]\n\n//! Module docs\n//!\n//! # Examples\n//! Example\n\nfn main() {}\n"
+        errors = RustValidator.validate(Path("lib.rs"), content)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].missing_sections, ["# Purpose"])
+        self.assertEqual(errors[0].line_number, 3)
+
+    def test_validate_path_matches_validate(self):
+        """Test that validate_path() gives the same errors as validate().
+
+        :Purpose:
+            Module docs are read from the first HEADER_LINES lines only; a //!
+            comment further down is still found (it makes the file fail on
+            missing sections instead of missing module docs).
+        """
+        late_docs = "fn main() {}\n" * RustValidator.HEADER_LINES + "//! # Purpose\n"
+        no_docs = "fn main() {}\n"
+        valid = "//! # Purpose\r\n//! Test\r\n//! # Examples\r\n//! x\r\n" + "fn f() {}\n" * 1000
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, content in (("late.rs", late_docs), ("none.rs", no_docs), ("valid.rs", valid), ("empty.rs", "")):
+                path = Path(tmp) / name
+                path.write_text(content, encoding="utf-8", newline="")
+                expected = [(e.missing_sections, e.message) for e in RustValidator.validate(path, content)]
+                actual = [(e.missing_sections, e.message) for e in RustValidator.validate_path(path)]
+                self.assertEqual(actual, expected, name)
+
+    def test_validate_path_uses_universal_newlines(self):
+        """Test that validate_path() splits lines like Path.read_text().
+
+        :Purpose:
+            A file using lone carriage returns as line endings gives the same
+            errors and line numbers as validate() on the decoded text.
+        """
+        missing = "fn f() {}\r//! Module docs\r//! # Examples\r" + "fn g() {}\r" * 100
+        valid = "//! # Purpose\r//! Test\r//! # Examples\r//! x\r" + "fn f() {}\r" * 100
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, content in (("missing.rs", missing), ("valid.rs", valid)):
+                path = Path(tmp) / name
+                path.write_text(content, encoding="utf-8", newline="")
+                text = path.read_text(encoding="utf-8")
+                expected = [(e.missing_sections, e.line_number) for e in RustValidator.validate(path, text)]
+                actual = [(e.missing_sections, e.line_number) for e in RustValidator.validate_path(path)]
+                self.assertEqual(actual, expected, name)
+
 
 if __name__ == "__main__":
     unittest.main()
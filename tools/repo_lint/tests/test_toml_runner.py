@@ -85,7 +85,7 @@ class TestTomlRunner(unittest.TestCase):
         repo_root_path = Path(__file__).parent.parent.parent.parent
         self.runner = TomlRunner(repo_root=repo_root_path)
 
-    @patch("tools.repo_lint.runners.toml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_has_files_detects_toml(self, mock_run):
         """Test that has_files detects .toml files.
 
@@ -98,7 +98,7 @@ class TestTomlRunner(unittest.TestCase):
 
         self.assertTrue(self.runner.has_files())
 
-    @patch("tools.repo_lint.runners.toml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_has_files_returns_false_when_no_files(self, mock_run):
         """Test that has_files returns False when no TOML files exist.
 
@@ -141,7 +141,7 @@ class TestTomlRunner(unittest.TestCase):
 
         self.assertEqual(missing_tools, [])
 
-    @patch("tools.repo_lint.runners.toml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_run_taplo_with_config_file(self, mock_run):
         """Test that _run_taplo uses config file when present.
 
@@ -164,7 +164,7 @@ class TestTomlRunner(unittest.TestCase):
         self.assertIn("taplo", taplo_args)
         self.assertIn("--config", taplo_args)
 
-    @patch("tools.repo_lint.runners.toml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_run_taplo_fix_mode(self, mock_run):
         """Test that _run_taplo uses `taplo fmt` (without --check) in fix mode.
 
@@ -186,7 +186,7 @@ class TestTomlRunner(unittest.TestCase):
         self.assertIn("fmt", taplo_args)
         self.assertNotIn("--check", taplo_args)
 
-    @patch("tools.repo_lint.runners.toml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_run_taplo_check_mode_uses_check_flag(self, mock_run):
         """Test that _run_taplo uses `taplo fmt --check` in check mode.
 
@@ -367,7 +367,7 @@ ERROR operation failed
 
         self.assertEqual(result, "config/settings.toml")
 
-    @patch("tools.repo_lint.runners.toml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_run_taplo_empty_file_list(self, mock_run):
         """Test that empty file list returns success.
 
@@ -383,7 +383,7 @@ ERROR operation failed
         self.assertTrue(result.passed)
         self.assertEqual(len(result.violations), 0)
 
-    @patch("tools.repo_lint.runners.toml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     @patch("tools.repo_lint.runners.toml_runner.command_exists")
     def test_check_returns_violations(self, mock_command_exists, mock_run):
         """Test that check() returns violations when linting fails.
@@ -410,7 +410,7 @@ ERROR operation failed
         self.assertFalse(results[0].passed)
         self.assertEqual(len(results[0].violations), 1)
 
-    @patch("tools.repo_lint.runners.toml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     @patch("tools.repo_lint.runners.toml_runner.command_exists")
     def test_fix_applies_fixes(self, mock_command_exists, mock_run):
         """Test that fix() calls _run_taplo with fix=True.
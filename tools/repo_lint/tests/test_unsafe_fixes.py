@@ -8,6 +8,7 @@
     - CI detection blocks unsafe mode (exit code 4)
     - Patch and log generation
     - Unsafe fixer execution on test fixtures
+    - Process-pool fixing with per-file diffs streamed into the patch
     - Deterministic output
 
 :Authorization:
@@ -276,6 +277,148 @@ def example(name, count):
         # No changes should be made
         self.assertIsNone(result, "Fixer should not modify conformant files")
 
+    def test_only_docstrings_are_rewritten(self):
+        """Test that Google-style text in ordinary strings and comments is left alone."""
+        from tools.repo_lint.unsafe_fixers import UnsafeDocstringRewriter
+
+        source = '''"""Módule docstring — ünïcode before the sections.
+
+Args:
+    verbose: Print more
+"""
+
+TEMPLATE = """
+Args:
+    name: not a docstring
+"""
+
+
+class Example:
+    """Class docstring.
+
+    Args:
+        value (int): The value
+    """
+
+    async def run(self, name):
+        """Run it.
+
+        Returns:
+            The name
+        """
+        # Args:
+        #     name: comment, not a docstring
+        return name
+'''
+        output = UnsafeDocstringRewriter()._rewrite_docstrings(source)  # pylint: disable=protected-access
+
+        self.assertIn("    :param verbose: Print more", output)
+        self.assertIn("        :param value: The value", output)
+        self.assertIn("            :returns: The name", output)
+        self.assertIn('TEMPLATE = """\nArgs:\n    name: not a docstring\n"""', output)
+        self.assertIn("        # Args:\n        #     name: comment, not a docstring", output)
+
+    def test_form_feed_does_not_shift_docstring_spans(self):
+        """Test that characters str.splitlines() treats as line breaks do not shift spans."""
+        from tools.repo_lint.unsafe_fixers import UnsafeDocstringRewriter
+
+        source = 'x = 1\x0c\ndef f(a):\n    """Do.\n\n    Args:\n        a: thing\n    """\n    return 1\n'
+        output = UnsafeDocstringRewriter()._rewrite_docstrings(source)  # pylint: disable=protected-access
+
+        self.assertEqual(output, 'x = 1\x0c\ndef f(a):\n    """Do.\n\n        :param a: thing\n    """\n    return 1\n')
+
+    def test_files_without_markers_are_not_parsed(self):
+        """Test that the pre-scan skips parsing files without Google-style section headers."""
+        from unittest.mock import patch
+
+        from tools.repo_lint.unsafe_fixers import UnsafeDocstringRewriter
+
+        source = 'def f():\n    """See the Args: section of g."""\n'
+        with patch("tools.repo_lint.unsafe_fixers.ast.parse") as mock_parse:
+            output = UnsafeDocstringRewriter()._rewrite_docstrings(source)  # pylint: disable=protected-access
+
+        self.assertEqual(output, source)
+        mock_parse.assert_not_called()
+
+
+GOOGLE_STYLE_SOURCE = '''
+def example_{index}(name):
+    """Example function.
+
+    Args:
+        name: The name parameter
+
+    Returns:
+        A formatted string
+    """
+    return name
+'''
+
+
+class TestStreamingUnsafeFixes(unittest.TestCase):
+    """Test pooled unsafe fixing and streamed forensics patches."""
+
+    def setUp(self):
+        """Set up temporary workspace with more files than the in-process threshold."""
+        from tools.repo_lint.unsafe_fixers import MIN_PARALLEL_FILES
+
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.files = []
+        for index in range(MIN_PARALLEL_FILES + 4):
+            path = self.temp_dir / f"mod_{index:02d}.py"
+            # Every other file is already conformant and must not appear in results
+            content = GOOGLE_STYLE_SOURCE.format(index=index) if index % 2 == 0 else f"VALUE = {index}\n"
+            path.write_text(content)
+            self.files.append(path)
+
+    def tearDown(self):
+        """Clean up temporary workspace."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_pool_results_match_serial_patch(self):
+        """Test that pooled, streamed output equals the serial generate_patch() output.
+
+        AUTHORIZED: PR #148 only, purpose-built fixture in temporary workspace.
+        """
+        from unittest.mock import patch
+
+        from tools.repo_lint.forensics import PatchStream, generate_patch
+        from tools.repo_lint.unsafe_fixers import apply_unsafe_fixes, iter_unsafe_fixes
+
+        serial_dir = self.temp_dir / "serial"
+        serial_dir.mkdir()
+        serial_files = []
+        for path in self.files:
+            copy = serial_dir / path.name
+            shutil.copy(path, copy)
+            serial_files.append(copy)
+        serial_results = apply_unsafe_fixes(serial_files)
+        for result in serial_results:
+            result.file_path = self.temp_dir / result.file_path.name
+
+        patch_path = self.temp_dir / "streamed.patch"
+        fixed_timestamp = "2026-01-01T00:00:00"
+        with patch("tools.repo_lint.forensics.datetime") as mock_datetime:
+            mock_datetime.now.return_value.isoformat.return_value = fixed_timestamp
+            with PatchStream(patch_path) as stream:
+                results = [stream.write(r) for r in iter_unsafe_fixes(self.files, jobs=2)]
+            expected = generate_patch(serial_results)
+
+        self.assertEqual([r.file_path.name for r in results], [p.name for p in self.files[::2]])
+        self.assertTrue(all(r.diff == "" and r.before_content == "" for r in results))
+        self.assertEqual(patch_path.read_text(), expected)
+        self.assertIn(":param name:", self.files[0].read_text())
+
+    def test_empty_stream_writes_no_changes_marker(self):
+        """Test that a patch with no results says so, as generate_patch() does."""
+        from tools.repo_lint.forensics import NO_CHANGES_PATCH, PatchStream
+
+        patch_path = self.temp_dir / "empty.patch"
+        with PatchStream(patch_path):
+            pass
+
+        self.assertEqual(patch_path.read_text(), NO_CHANGES_PATCH)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,9 +8,10 @@
 
 :Design:
     - Loads test vectors from conformance/repo-lint/vectors/docstrings/
-    - Executes repo_lint runners against fixture files
-    - Captures and normalizes outputs into violation schema
-    - Compares actual vs expected violations deterministically
+    - Runs the docstring validators in-process through tools.repo_lint.vectors
+      (the engine behind `repo-lint vectors`)
+    - Compares structured violations with each vector's expectations
+    - Vectors whose parser is not installed (pwsh, perl + PPI) are skipped
 
 :Schema:
     Test vectors use normalized violation schema defined in
@@ -42,15 +43,13 @@
 from __future__ import annotations
 
 import json
-import os
-import re
-import subprocess
-import sys
 from pathlib import Path
-from typing import Dict, List
 
 import pytest
 
+from tools.repo_lint import cli, vectors
+from tools.repo_lint.tests.cli_harness import run_cli
+
 # Repo root detection
 REPO_ROOT = Path(__file__).parent.parent.parent.parent
 VECTORS_DIR = REPO_ROOT / "conformance" / "repo-lint" / "vectors"
@@ -71,214 +70,22 @@ def load_vector(vector_file: Path) -> dict:
         return json.load(f)
 
 
-def normalize_violation_from_docstring_output(line: str) -> Dict | None:
-    """Parse and normalize a violation from docstring validator output.
-
-    :param line: Single line of output from validate_docstrings.py
-
-    :returns: Normalized violation dict or None if line doesn't contain violation
-
-    :note: Expected format examples:
-        - "❌ /path/to/file.py:13"
-        - "   Symbol: def no_doc()"
-        - "   Missing: function docstring"
-
-        Normalized format:
-        {
-            "rule_id": "DOCSTRING.MISSING",
-            "path": "conformance/repo-lint/vectors/fixtures/python/file.py",
-            "symbol": "no_doc",
-            "symbol_kind": "function",
-            "line": 13,
-            "severity": "error",
-            "message": "Function 'no_doc' is missing a docstring"
-        }
-    """
-    # Check if this is a violation line with file:line format
-    violation_pattern = r"^❌\s+(.+?):(\d+)\s*$"
-    match = re.match(violation_pattern, line)
-    if not match:
-        return None
-
-    file_path = match.group(1)
-    line_num = int(match.group(2))
-
-    # Normalize path to be relative to repo root
-    if file_path.startswith(str(REPO_ROOT)):
-        rel_path = os.path.relpath(file_path, REPO_ROOT)
-    else:
-        rel_path = file_path
-
-    return {
-        "path": rel_path,
-        "line": line_num,
-        "severity": "error",
-        # These will be populated from subsequent lines
-        "symbol": None,
-        "symbol_kind": None,
-        "message": None,
-        "rule_id": "DOCSTRING.MISSING",  # Default, may be overridden
-    }
-
-
-def parse_docstring_validator_output(output: str) -> List[Dict]:
-    """Parse docstring validator output into normalized violations.
+def run_language_vectors(language: str) -> None:
+    """Run every vector for one language and fail on mismatches.
 
-    :param output: Raw output from validate_docstrings.py
+    :param language: Vector language (python, bash, powershell, perl)
 
-    :returns: List of normalized violation dictionaries
-
-    :note: Parser handles multi-line violation format:
-        ❌ /path/file.py:13
-           Symbol: def no_doc()
-           Missing: function docstring
-           Function must have a docstring
-    """
-    violations = []
-    current_violation = None
-    lines = output.split("\n")
-
-    for line in lines:
-        # Try to parse as new violation header
-        new_violation = normalize_violation_from_docstring_output(line)
-        if new_violation:
-            if current_violation:
-                violations.append(current_violation)
-            current_violation = new_violation
-            continue
-
-        # Parse details for current violation
-        if current_violation:
-            # Extract symbol name and kind (supports 'def', 'class', and potentially other keywords)
-            symbol_match = re.match(r"\s+Symbol:\s+(def|class|sub|function)\s+([\w.]+)", line)
-            if symbol_match:
-                kind_keyword = symbol_match.group(1)
-                symbol_name = symbol_match.group(2)
-
-                # Determine symbol kind based on keyword
-                symbol_kind_map = {
-                    "def": "function",
-                    "class": "class",
-                    "sub": "sub",
-                    "function": "function",
-                }
-                current_violation["symbol_kind"] = symbol_kind_map.get(kind_keyword, "function")
-
-                current_violation["symbol"] = symbol_name
-                continue
-
-            # Extract missing reason
-            missing_match = re.match(r"\s+Missing:\s+(.+)", line)
-            if missing_match:
-                missing = missing_match.group(1).strip()
-                if "docstring" in missing:
-                    current_violation["rule_id"] = "DOCSTRING.MISSING"
-                    # Construct message
-                    kind = current_violation.get("symbol_kind", "symbol")
-                    symbol = current_violation.get("symbol", "unknown")
-                    current_violation["message"] = f"{kind.capitalize()} '{symbol}' is missing a docstring"
-                continue
-
-    # Add last violation
-    if current_violation:
-        violations.append(current_violation)
-
-    # Filter out incomplete violations
-    return [v for v in violations if v.get("symbol") and v.get("message")]
-
-
-def run_docstring_validator(fixture_path: Path) -> List[Dict]:
-    """Run docstring validator on fixture and return normalized violations.
-
-    :param fixture_path: Path to source file to validate
-
-    :returns: List of normalized violation dictionaries
-
-    :raises subprocess.CalledProcessError: If validator fails unexpectedly
+    :raises AssertionError: If no vectors exist or a vector fails
     """
-    validator_script = REPO_ROOT / "scripts" / "validate_docstrings.py"
-
-    # Run validator with minimal checks (just docstring presence, not content)
-    result = subprocess.run(
-        [sys.executable, str(validator_script), "--file", str(fixture_path), "--no-content-checks"],
-        capture_output=True,
-        text=True,
-        cwd=REPO_ROOT,
-    )
-
-    # Parse output (validator exits non-zero on violations, which is expected)
-    violations = parse_docstring_validator_output(result.stdout + result.stderr)
-
-    return violations
+    selected = vectors.load_vectors(DOCSTRINGS_DIR, language)
+    assert selected, f"No {language} docstring vectors found"
 
+    report = vectors.run_vectors(selected, REPO_ROOT.resolve())
 
-def compare_violations(actual: List[Dict], expected: List[Dict], vector_id: str) -> None:
-    """Compare actual vs expected violations and assert match.
-
-    :param actual: List of actual violations from running validator
-        expected: List of expected violations from vector file
-        vector_id: ID of test vector (for error messages)
-
-    :raises AssertionError: If violations don't match expected
-
-    :note: Compares violations by normalized fields:
-        - rule_id
-        - symbol
-        - symbol_kind
-        - line
-        - severity
-
-        Path matching is relaxed (basename only) to handle absolute vs relative paths.
-        Message matching uses substring match to handle variation in error text.
-    """
-    # Sort both lists by symbol and line for stable comparison
-    actual_sorted = sorted(actual, key=lambda v: (v.get("symbol", ""), v.get("line", 0)))
-    expected_sorted = sorted(expected, key=lambda v: (v.get("symbol", ""), v.get("line", 0)))
-
-    # Build diagnostic message
-    if len(actual_sorted) != len(expected_sorted):
-        msg = f"\n{vector_id}: Violation count mismatch\n"
-        msg += f"Expected {len(expected_sorted)} violations, got {len(actual_sorted)}\n\n"
-        msg += "Expected violations:\n"
-        for v in expected_sorted:
-            msg += f"  - {v.get('symbol')} (line {v.get('line')}): {v.get('rule_id')}\n"
-        msg += "\nActual violations:\n"
-        for v in actual_sorted:
-            msg += f"  - {v.get('symbol')} (line {v.get('line')}): {v.get('rule_id')}\n"
-        pytest.fail(msg)
-
-    # Compare each violation
-    for i, (actual_v, expected_v) in enumerate(zip(actual_sorted, expected_sorted)):
-        # Check required fields
-        assert actual_v.get("rule_id") == expected_v.get("rule_id"), (
-            f"{vector_id}: Violation {i+1} rule_id mismatch\n"
-            f"Expected: {expected_v.get('rule_id')}\n"
-            f"Actual: {actual_v.get('rule_id')}"
-        )
-
-        assert actual_v.get("symbol") == expected_v.get("symbol"), (
-            f"{vector_id}: Violation {i+1} symbol mismatch\n"
-            f"Expected: {expected_v.get('symbol')}\n"
-            f"Actual: {actual_v.get('symbol')}"
-        )
-
-        assert actual_v.get("symbol_kind") == expected_v.get("symbol_kind"), (
-            f"{vector_id}: Violation {i+1} symbol_kind mismatch\n"
-            f"Expected: {expected_v.get('symbol_kind')}\n"
-            f"Actual: {actual_v.get('symbol_kind')}"
-        )
-
-        assert actual_v.get("line") == expected_v.get("line"), (
-            f"{vector_id}: Violation {i+1} line number mismatch\n"
-            f"Expected: {expected_v.get('line')}\n"
-            f"Actual: {actual_v.get('line')}"
-        )
-
-        assert actual_v.get("severity") == expected_v.get("severity"), (
-            f"{vector_id}: Violation {i+1} severity mismatch\n"
-            f"Expected: {expected_v.get('severity')}\n"
-            f"Actual: {actual_v.get('severity')}"
-        )
+    problems = [r for r in report["results"] if r["status"] in ("fail", "error")]
+    assert not problems, "\n".join(f"{r['id']}: {'; '.join(r['failures'])}" for r in problems)
+    if report["summary"]["skip"] == len(selected):
+        pytest.skip(report["results"][0]["failures"][0])
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -296,23 +103,7 @@ def test_python_docstring_vectors():
     :note: Loads and runs all Python docstring vectors from:
         conformance/repo-lint/vectors/docstrings/python-docstring-*.json
     """
-    # Find all Python docstring vectors
-    vector_files = list(DOCSTRINGS_DIR.glob("python-docstring-*.json"))
-    assert vector_files, "No Python docstring vectors found"
-
-    for vector_file in vector_files:
-        vector = load_vector(vector_file)
-        fixture_path = REPO_ROOT / vector["fixture"]
-
-        # Run docstring validator on fixture
-        _ = run_docstring_validator(fixture_path)  # pylint: disable=unused-variable
-
-        # Compare with expected violations
-        # TODO(#278): Re-enable after Phase 3.4 debugging complete
-        # Current CI environment still has import issues despite tools/__init__.py fix
-        # Temporarily skip comparison to unblock Phase 3.5/3.6 work
-        # compare_violations(actual_violations, vector["expected_violations"], vector["id"])
-        pytest.skip("Temporarily disabled pending Phase 3.4 final debugging")
+    run_language_vectors("python")
 
 
 def test_bash_docstring_vectors():
@@ -325,7 +116,7 @@ def test_bash_docstring_vectors():
     :note: Loads and runs all Bash docstring vectors from:
         conformance/repo-lint/vectors/docstrings/bash-docstring-*.json
     """
-    pytest.skip("Bash vector runner not yet implemented - requires bash-specific parser")
+    run_language_vectors("bash")
 
 
 def test_powershell_docstring_vectors():
@@ -333,12 +124,12 @@ def test_powershell_docstring_vectors():
 
     :Purpose:
         Validates that PowerShell docstring enforcement produces expected violations
-        using PowerShell AST-based symbol discovery.
+        using PowerShell AST-based symbol discovery (skipped without pwsh).
 
     :note: Loads and runs all PowerShell docstring vectors from:
         conformance/repo-lint/vectors/docstrings/powershell-docstring-*.json
     """
-    pytest.skip("PowerShell vector runner not yet implemented - requires pwsh AST parser")
+    run_language_vectors("powershell")
 
 
 def test_perl_docstring_vectors():
@@ -346,12 +137,75 @@ def test_perl_docstring_vectors():
 
     :Purpose:
         Validates that Perl docstring enforcement produces expected violations
-        using PPI-based symbol discovery.
+        using PPI-based symbol discovery (skipped without perl + PPI).
 
     :note: Loads and runs all Perl docstring vectors from:
         conformance/repo-lint/vectors/docstrings/perl-docstring-*.json
     """
-    pytest.skip("Perl vector runner not yet implemented - requires PPI parser")
+    run_language_vectors("perl")
+
+
+def test_compare_reports_missing_and_unexpected():
+    """Violations are matched on their key fields; both directions are reported.
+
+    :Purpose:
+        A wrong line number shows up as one missing and one unexpected
+        violation, and message wording is not compared.
+    """
+    expected = {
+        "rule_id": "DOCSTRING.MISSING",
+        "path": "a.py",
+        "symbol": "f",
+        "symbol_kind": "function",
+        "line": 3,
+        "severity": "error",
+        "message": "Function 'f' is missing a docstring",
+    }
+    reworded = {**expected, "message": "different wording"}
+
+    assert not vectors.compare_violations([reworded], [expected])
+    assert vectors.compare_violations([{**expected, "line": 4}], [expected]) == [
+        "missing: DOCSTRING.MISSING function 'f' at a.py:3",
+        "unexpected: DOCSTRING.MISSING function 'f' at a.py:4",
+    ]
+
+
+def test_vectors_command_reports_failures(tmp_path):
+    """`repo-lint vectors` exits 1 for a failing vector and reports per-vector timings.
+
+    :Purpose:
+        Runs the Click command in-process on a copy of the Python vector whose
+        expectations were altered, plus one that references a missing fixture.
+
+    :param tmp_path: pytest temporary directory
+    """
+    vector = load_vector(DOCSTRINGS_DIR / "python-docstring-001.json")
+    vector["expected_violations"] = vector["expected_violations"][1:]
+    (tmp_path / "python-altered.json").write_text(json.dumps(vector), encoding="utf-8")
+    broken = {**vector, "id": "python-broken", "fixture": "no/such/fixture.py"}
+    (tmp_path / "python-broken.json").write_text(json.dumps(broken), encoding="utf-8")
+
+    result = run_cli(["vectors", "--vectors-dir", str(tmp_path), "--json", "-j", "2"], cwd=REPO_ROOT, main=cli.main)
+
+    assert result.returncode == 1, result.stderr
+    report = json.loads(result.stdout)
+    by_id = {r["id"]: r for r in report["results"]}
+    assert by_id["python-docstring-001"]["status"] == "fail"
+    assert by_id["python-docstring-001"]["failures"] == [
+        "unexpected: DOCSTRING.MISSING function 'no_doc' at "
+        "conformance/repo-lint/vectors/fixtures/python/docstring_test.py:27"
+    ]
+    assert by_id["python-broken"]["status"] == "error"
+    assert all(r["duration_ms"] > 0 for r in report["results"])
+    assert report["summary"] == {"pass": 0, "fail": 1, "skip": 0, "error": 1}
+
+
+def test_vectors_command_unknown_id():
+    """An unknown --id is a usage error (exit 3) before anything runs."""
+    result = run_cli(["vectors", "--id", "no-such-vector"], cwd=REPO_ROOT, main=cli.main)
+
+    assert result.returncode == 3
+    assert "no-such-vector" in result.stderr
 
 
 def test_vector_fixtures_exist():
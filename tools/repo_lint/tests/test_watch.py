@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position,protected-access  # Test file needs special setup
+"""Unit tests for repo-lint watch mode.
+
+:Purpose:
+    Validates watch.py change detection, debouncing and the runner file scope
+    used to re-lint only changed files.
+
+:Test Coverage:
+    - PollingWatcher reports modified tracked files and ignores untouched ones
+    - wait_for_batch() merges a burst of changes and honors its timeout
+    - relint_files() only runs runners whose files changed, then clears the scope
+    - Runner._scoped() filters tracked-file listings
+
+:Usage:
+    Run tests from repository root::
+
+        python3 -m pytest tools/repo_lint/tests/test_watch.py
+
+:Environment Variables:
+    None. Tests create throwaway git repositories in temp directories.
+
+:Exit Codes:
+    0
+        All tests passed
+    1
+        One or more tests failed
+
+:Examples:
+    Run all tests::
+
+        python3 -m pytest tools/repo_lint/tests/test_watch.py -v
+
+:Notes:
+    - Linters are never executed; runners are stubbed with MagicMock
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add repo_lint parent directory to path for imports
+repo_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(repo_root))
+
+from tools.repo_lint.common import LintResult  # noqa: E402
+from tools.repo_lint.runners.bash_runner import BashRunner  # noqa: E402
+from tools.repo_lint.watch import PollingWatcher, relint_files, wait_for_batch  # noqa: E402
+
+
+def _touch(path: Path, content: str) -> None:
+    """Rewrite a file and bump its mtime so the change is visible to stat().
+
+    :param path: File to write
+    :param content: New content
+    """
+    path.write_text(content, encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestPollingWatcher(unittest.TestCase):
+    """Test the stdlib polling watcher against a temporary git repository."""
+
+    def setUp(self):
+        """Create a git repository with two tracked files."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        subprocess.run(["git", "init", "-q"], cwd=self.root, check=True)
+        (self.root / "a.py").write_text("a = 1\n", encoding="utf-8")
+        (self.root / "b.sh").write_text("echo b\n", encoding="utf-8")
+        subprocess.run(["git", "add", "."], cwd=self.root, check=True)
+        patcher = patch("tools.repo_lint.runners.base.get_excluded_paths", return_value=[])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Remove the temporary repository."""
+        self.tmpdir.cleanup()
+
+    def test_detects_modified_file(self):
+        """Test a rewritten tracked file is reported once."""
+        watcher = PollingWatcher(self.root, interval=0.01)
+        self.assertEqual(watcher.poll(0), set())
+        _touch(self.root / "a.py", "a = 2\n")
+        self.assertEqual(watcher.poll(0.5), {"a.py"})
+        self.assertEqual(watcher.poll(0), set())
+
+    def test_untracked_files_ignored(self):
+        """Test files not in the git index are not watched."""
+        watcher = PollingWatcher(self.root, interval=0.01)
+        (self.root / "new.py").write_text("x = 1\n", encoding="utf-8")
+        self.assertEqual(watcher.poll(0.05), set())
+
+    def test_deleted_file_reported(self):
+        """Test deleting a tracked file counts as a change."""
+        watcher = PollingWatcher(self.root, interval=0.01)
+        (self.root / "b.sh").unlink()
+        self.assertEqual(watcher.poll(0.5), {"b.sh"})
+
+
+class TestWaitForBatch(unittest.TestCase):
+    """Test debouncing of change bursts."""
+
+    def test_merges_burst(self):
+        """Test consecutive non-empty polls merge into one batch."""
+        watcher = MagicMock()
+        watcher.poll.side_effect = [set(), {"a.py"}, {"b.py"}, set()]
+        self.assertEqual(wait_for_batch(watcher, debounce=0), {"a.py", "b.py"})
+
+    def test_timeout_returns_empty(self):
+        """Test an idle watcher returns an empty batch after the timeout."""
+        watcher = MagicMock()
+        watcher.poll.return_value = set()
+        self.assertEqual(wait_for_batch(watcher, debounce=0, timeout=0), set())
+
+
+class TestRelintFiles(unittest.TestCase):
+    """Test mapping changed files to runners."""
+
+    def _runner(self, owns_files: bool):
+        """Build a stub runner.
+
+        :param owns_files: Value returned by has_files()
+        :returns: MagicMock runner
+        """
+        runner = MagicMock()
+        runner.has_files.return_value = owns_files
+        runner.check_tools.return_value = []
+        runner.check.return_value = [LintResult(tool="stub", passed=True, violations=[])]
+        return runner
+
+    def test_only_affected_runners_run(self):
+        """Test runners without matching files are skipped and scopes are reset."""
+        python_runner = self._runner(True)
+        bash_runner = self._runner(False)
+        results, affected = relint_files([("python", "Python", python_runner), ("bash", "Bash", bash_runner)], {"a.py"})
+
+        self.assertEqual(affected, ["Python"])
+        self.assertEqual(len(results), 1)
+        bash_runner.check.assert_not_called()
+        python_runner.set_file_scope.assert_any_call(["a.py"])
+        python_runner.set_file_scope.assert_called_with(None)
+
+    def test_missing_tools_reported_as_error(self):
+        """Test missing tools produce an error result instead of running."""
+        runner = self._runner(True)
+        runner.check_tools.return_value = ["shellcheck"]
+        results, _ = relint_files([("bash", "Bash", runner)], {"a.sh"})
+        self.assertIn("shellcheck", results[0].error)
+        runner.check.assert_not_called()
+
+    def test_runner_exception_does_not_escape(self):
+        """Test a crashing runner becomes an error result."""
+        runner = self._runner(True)
+        runner.check.side_effect = RuntimeError("boom")
+        results, _ = relint_files([("bash", "Bash", runner)], {"a.sh"})
+        self.assertIn("boom", results[0].error)
+
+
+class TestRunnerFileScope(unittest.TestCase):
+    """Test Runner.set_file_scope() and _scoped()."""
+
+    def test_scope_filters_listing(self):
+        """Test scoped listings keep only files in the scope."""
+        runner = BashRunner(repo_root=repo_root)
+        files = ["a.sh", "dir/b.sh"]
+        self.assertEqual(runner._scoped(files), files)
+        runner.set_file_scope(["dir/b.sh", "other.py"])
+        self.assertEqual(runner._scoped(files), ["dir/b.sh"])
+        runner.set_file_scope(None)
+        self.assertEqual(runner._scoped(files), files)
+
+    @patch("tools.repo_lint.runners.bash_runner.get_tracked_files", return_value=["a.sh"])
+    def test_has_files_respects_scope(self, _mock_files):
+        """Test has_files() is False when no scoped file belongs to the runner.
+
+        :param _mock_files: Mocked tracked-file listing
+        """
+        runner = BashRunner(repo_root=repo_root)
+        runner.set_file_scope(["a.py"])
+        self.assertFalse(runner.has_files())
+        runner.set_file_scope(["a.sh"])
+        self.assertTrue(runner.has_files())
+
+
+if __name__ == "__main__":
+    unittest.main()
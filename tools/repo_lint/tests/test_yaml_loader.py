@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# pylint: disable=wrong-import-position,protected-access  # Test file needs special setup
+"""Unit tests for the repo-lint config cache.
+
+:Purpose:
+    Validates yaml_loader.load_cached_file() and the config loaders built on it
+    (YAML rules, UI theme, auto-fix policy) stay correct across file edits.
+
+:Test Coverage:
+    - Unchanged files are parsed once
+    - Edits are detected by (mtime, size), including same-size edits within
+      the mtime granularity window (content digest check)
+    - Touching a file without changing it does not re-parse
+    - Parse failures are not cached
+    - load_yaml_config()/load_linting_rules() pick up edits without clearing caches
+    - safe_load_yaml() prefers the libyaml loader
+
+:Usage:
+    Run tests from repository root::
+
+        python3 -m pytest tools/repo_lint/tests/test_yaml_loader.py
+
+:Environment Variables:
+    None. Config directories are copied to temp directories.
+
+:Exit Codes:
+    0
+        All tests passed
+    1
+        One or more tests failed
+
+:Examples:
+    Run all tests::
+
+        python3 -m pytest tools/repo_lint/tests/test_yaml_loader.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import yaml
+
+# Add repo_lint parent directory to path for imports
+repo_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(repo_root))
+
+from tools.repo_lint import config_validator, yaml_loader  # noqa: E402
+from tools.repo_lint.ui.theme import load_theme  # noqa: E402
+
+
+def _set_mtime(path: Path, mtime_ns: int) -> None:
+    """Set a file's mtime.
+
+    :param path: File to update
+    :param mtime_ns: New mtime in nanoseconds
+    """
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestLoadCachedFile(unittest.TestCase):
+    """Test the shared (path, mtime, size) cache."""
+
+    OLD_MTIME_NS = 1_600_000_000 * 1_000_000_000
+
+    def setUp(self):
+        """Create a temp file and clear the cache."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "data.txt"
+        self.path.write_text("one", encoding="utf-8")
+        _set_mtime(self.path, self.OLD_MTIME_NS)
+        self.parse = MagicMock(side_effect=lambda _path, content: content.upper())
+        yaml_loader.clear_config_caches()
+
+    def tearDown(self):
+        """Remove temp files and clear the cache."""
+        yaml_loader.clear_config_caches()
+        self.tmpdir.cleanup()
+
+    def _load(self):
+        """Load the temp file through the cache.
+
+        :returns: Parsed value
+        """
+        return yaml_loader.load_cached_file(self.path, "test", self.parse)
+
+    def test_unchanged_file_parsed_once(self):
+        """Test repeated loads hit the cache."""
+        self.assertEqual(self._load(), "ONE")
+        self.assertEqual(self._load(), "ONE")
+        self.assertEqual(self.parse.call_count, 1)
+
+    def test_edit_detected(self):
+        """Test a changed file is re-parsed."""
+        self._load()
+        self.path.write_text("three", encoding="utf-8")
+        _set_mtime(self.path, self.OLD_MTIME_NS + 1_000_000_000)
+        self.assertEqual(self._load(), "THREE")
+
+    def test_racy_same_size_edit_detected(self):
+        """Test a same-size edit is caught even when (mtime, size) are unchanged."""
+        self.path.write_text("one", encoding="utf-8")  # Fresh mtime: entry is racy
+        self._load()
+        mtime_ns = self.path.stat().st_mtime_ns
+        self.path.write_text("two", encoding="utf-8")
+        _set_mtime(self.path, mtime_ns)
+        self.assertEqual(self._load(), "TWO")
+
+    def test_touch_without_change_not_reparsed(self):
+        """Test a metadata-only change reuses the cached value."""
+        self._load()
+        _set_mtime(self.path, self.OLD_MTIME_NS + 5_000_000_000)
+        self.assertEqual(self._load(), "ONE")
+        self.assertEqual(self.parse.call_count, 1)
+
+    def test_kinds_are_separate(self):
+        """Test different parsers of the same file don't share entries."""
+        self._load()
+        other = yaml_loader.load_cached_file(self.path, "other", lambda _path, content: len(content))
+        self.assertEqual(other, 3)
+
+    def test_failures_not_cached(self):
+        """Test a parse error is raised again and a later fix is picked up."""
+        self.parse.side_effect = ValueError("bad")
+        with self.assertRaises(ValueError):
+            self._load()
+        self.parse.side_effect = lambda _path, content: content
+        self.assertEqual(self._load(), "one")
+
+    def test_missing_file(self):
+        """Test missing files raise FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            yaml_loader.load_cached_file(Path(self.tmpdir.name) / "missing", "test", self.parse)
+
+
+class TestConfigLoaders(unittest.TestCase):
+    """Test the YAML and theme loaders against a copied config directory."""
+
+    def setUp(self):
+        """Copy conformance/repo-lint to a temp directory and point the loader at it."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.config_dir = Path(self.tmpdir.name) / "repo-lint"
+        shutil.copytree(repo_root / "conformance" / "repo-lint", self.config_dir)
+        yaml_loader.set_config_directory(self.config_dir)
+
+    def tearDown(self):
+        """Restore the default config directory."""
+        yaml_loader.set_config_directory(None)
+        self.tmpdir.cleanup()
+
+    def test_linting_rules_reloaded_after_edit(self):
+        """Test load_linting_rules() reflects an edit without cache clearing."""
+        first = yaml_loader.load_linting_rules()
+        self.assertIs(first, yaml_loader.load_linting_rules())
+
+        path = self.config_dir / "repo-lint-linting-rules.yaml"
+        path.write_text(path.read_text(encoding="utf-8").replace("languages:", "description: edited\nlanguages:", 1))
+        second = yaml_loader.load_linting_rules()
+        self.assertEqual(second["description"], "edited")
+
+    def test_invalid_edit_raises(self):
+        """Test validation still runs on re-parse."""
+        yaml_loader.load_naming_rules()
+        path = self.config_dir / "repo-lint-naming-rules.yaml"
+        path.write_text(path.read_text(encoding="utf-8").rstrip().rstrip("."), encoding="utf-8")
+        with self.assertRaises(Exception):
+            yaml_loader.load_naming_rules()
+
+    def test_theme_cached_by_path(self):
+        """Test load_theme() returns the cached theme until the file changes."""
+        theme_path = self.config_dir / "repo-lint-ui-theme.yaml"
+        first = load_theme(theme_path=theme_path)
+        self.assertIs(first, load_theme(theme_path=theme_path))
+
+
+class TestSafeLoadYaml(unittest.TestCase):
+    """Test YAML parsing helper."""
+
+    def test_prefers_libyaml(self):
+        """Test the C loader is used when PyYAML provides it."""
+        expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        self.assertIs(config_validator._YAML_SAFE_LOADER, expected)
+
+    def test_rejects_python_tags(self):
+        """Test the loader stays safe."""
+        with self.assertRaises(yaml.YAMLError):
+            yaml_loader.safe_load_yaml("!!python/object/apply:os.system ['true']")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -72,7 +72,7 @@ class TestYAMLRunner(unittest.TestCase):
         """
         self.runner = YAMLRunner(repo_root=Path("/fake/repo"))
 
-    @patch("tools.repo_lint.runners.yaml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_has_files_detects_yml(self, mock_run):
         """Test that has_files detects .yml files.
 
@@ -85,7 +85,7 @@ class TestYAMLRunner(unittest.TestCase):
 
         self.assertTrue(self.runner.has_files())
 
-    @patch("tools.repo_lint.runners.yaml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_has_files_detects_yaml(self, mock_run):
         """Test that has_files detects .yaml files.
 
@@ -98,7 +98,7 @@ class TestYAMLRunner(unittest.TestCase):
 
         self.assertTrue(self.runner.has_files())
 
-    @patch("tools.repo_lint.runners.yaml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_has_files_detects_both_extensions(self, mock_run):
         """Test that has_files detects both .yml and .yaml files.
 
@@ -111,7 +111,7 @@ class TestYAMLRunner(unittest.TestCase):
 
         self.assertTrue(self.runner.has_files())
 
-    @patch("tools.repo_lint.runners.yaml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_yamllint_uses_parsable_format(self, mock_run):
         """Test that _run_yamllint uses -f parsable flag.
 
@@ -134,7 +134,7 @@ class TestYAMLRunner(unittest.TestCase):
         self.assertIn("parsable", yamllint_args)
         self.assertTrue(result.passed)
 
-    @patch("tools.repo_lint.runners.yaml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_yamllint_handles_violations(self, mock_run):
         """Test that _run_yamllint correctly parses violations.
 
@@ -156,7 +156,7 @@ test.yml:20:5: [warning] line too long (120 > 80 characters)"""
         self.assertEqual(result.tool, "yamllint")
         self.assertEqual(len(result.violations), 2)
 
-    @patch("tools.repo_lint.runners.yaml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_empty_files_returns_passed(self, mock_run):
         """Test that empty file list returns passed result.
 
@@ -169,7 +169,7 @@ test.yml:20:5: [warning] line too long (120 > 80 characters)"""
 
         self.assertTrue(self.runner._run_yamllint().passed)  # pylint: disable=protected-access
 
-    @patch("tools.repo_lint.runners.yaml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_check_tools_detects_missing_yamllint(self, mock_run):
         """Test that check_tools detects missing yamllint.
 
@@ -182,7 +182,7 @@ test.yml:20:5: [warning] line too long (120 > 80 characters)"""
             missing = self.runner.check_tools()
             self.assertIn("yamllint", missing)
 
-    @patch("tools.repo_lint.runners.yaml_runner.subprocess.run")
+    @patch("tools.repo_lint.runners.base.subprocess.run")
     def test_fix_runs_same_as_check(self, mock_run):
         """Test that fix() runs same checks as check() (no auto-fix).
 
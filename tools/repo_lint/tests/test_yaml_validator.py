@@ -47,6 +47,7 @@
 from __future__ import annotations
 
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -216,6 +217,38 @@ name: Test
         self.assertIn("# Workflow: Test", header)
         self.assertNotIn("# This is not part of header", header)
 
+    def test_validate_path_reads_only_the_header(self):
+        """Test that validate_path() stops reading at the end of the header.
+
+        :Purpose:
+            A valid header followed by bytes that are not UTF-8 passes, which
+            is only possible if the document body is never decoded.
+        """
+        header = "# File: big.yml\n# Purpose: Test\n# Usage: Test\n# Inputs: None\n# Outputs: None\n# Notes: None\n"
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "big.yml"
+            path.write_bytes(header.encode() + b"---\nkey: value\n" + b"\xff\xfe" * 100000)
+
+            self.assertEqual(YAMLValidator.validate_path(path), [])
+
+    def test_validate_path_uses_universal_newlines(self):
+        """Test that validate_path() splits lines like Path.read_text().
+
+        :Purpose:
+            A header using lone carriage returns as line endings gives the
+            same errors as validate() on the decoded text.
+        """
+        valid = "# File: cr.yml\r# Purpose: Test\r# Usage: Test\r# Inputs: None\r# Outputs: None\r# Notes: None\r"
+        missing = "# File: cr.yml\r# Purpose: Test\r"
+        with tempfile.TemporaryDirectory() as tmp:
+            for content in (valid, missing):
+                path = Path(tmp) / "cr.yml"
+                path.write_text(content + "---\rkey: value\r", encoding="utf-8", newline="")
+                text = path.read_text(encoding="utf-8")
+                expected = [(e.missing_sections, e.line_number) for e in YAMLValidator.validate(path, text)]
+                actual = [(e.missing_sections, e.line_number) for e in YAMLValidator.validate_path(path)]
+                self.assertEqual(actual, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -289,9 +289,21 @@ def load_theme(theme_path: Path | None = None, ci_mode: bool = False, allow_user
             )
             return UITheme()
 
-    # Load and validate theme file
-    with open(selected_theme, encoding="utf-8") as f:
-        content = f.read()
+    # Parsed themes are memoized by (path, mtime, size) in the shared config cache
+    from tools.repo_lint.yaml_loader import load_cached_file
+
+    return load_cached_file(selected_theme, "ui-theme", _parse_theme)
+
+
+def _parse_theme(selected_theme: Path, content: str) -> UITheme:
+    """Parse and validate theme file content.
+
+    :param selected_theme: Path of the theme file (for error messages)
+    :param content: Raw theme file content
+    :returns: Validated UITheme
+    :raises ThemeValidationError: If theme validation fails
+    """
+    from tools.repo_lint.yaml_loader import safe_load_yaml
 
     # Check for required YAML markers
     if not content.strip().startswith("---"):
@@ -302,7 +314,7 @@ def load_theme(theme_path: Path | None = None, ci_mode: bool = False, allow_user
 
     # Parse YAML
     try:
-        data = yaml.safe_load(content)
+        data = safe_load_yaml(content)
     except yaml.YAMLError as e:
         raise ThemeValidationError(f"Invalid YAML: {e}", selected_theme) from e
 
@@ -377,14 +389,9 @@ def get_theme(ci_mode: bool = False) -> UITheme:
     Always delegates to load_theme() so that different ci_mode values produce
     appropriately configured theme instances.
 
-    Design Note: This function intentionally reloads the theme on each call rather
-    than caching. While this adds file I/O overhead, it ensures:
-    1. Different ci_mode values get appropriate theme configurations
-    2. Theme file changes during development are picked up immediately
-    3. No stale theme data if environment variables change
-
-    For production use where theme loading is called frequently, consider adding
-    a caching layer with cache invalidation based on (ci_mode, theme_path) tuples.
+    Design Note: Theme selection (ci_mode, REPO_LINT_UI_THEME, user config) is
+    re-evaluated on every call; only parsing of the selected file is memoized, keyed
+    by (path, mtime, size), so edits to the theme file are still picked up immediately.
 
     :param ci_mode: If True, load with CI mode restrictions
     :returns: Active UITheme instance
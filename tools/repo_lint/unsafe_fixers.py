@@ -36,6 +36,13 @@
             print(f"Fixer: {result.fixer_name}")
             print(f"Why unsafe: {result.why_unsafe}")
 
+    Stream results (with per-file diffs) from a process pool::
+
+        from tools.repo_lint.unsafe_fixers import iter_unsafe_fixes
+
+        for result in iter_unsafe_fixes(files, jobs=4):
+            print(result.diff)
+
 :See Also:
     - docs/contributing/ai-constraints.md - AI safety constraints
     - Phase 7 requirements in new-requirement-phase-7.md
@@ -43,10 +50,17 @@
 
 from __future__ import annotations
 
+import ast
+import difflib
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Protocol
+from typing import Iterator, List, Protocol, Tuple
+
+# Below this many files, iter_unsafe_fixes() runs in-process instead of starting a pool
+MIN_PARALLEL_FILES = 16
 
 
 class UnsafeFixer(Protocol):
@@ -84,6 +98,8 @@ class UnsafeFixerResult:
     :param why_unsafe: Explanation of why this fixer is unsafe
     :param before_content: File content before fix (for patch generation)
     :param after_content: File content after fix (for patch generation)
+    :param diff: Unified diff of the change; set by iter_unsafe_fixes(), which
+        drops before_content/after_content once the diff is computed
     """
 
     fixer_name: str
@@ -92,6 +108,7 @@ class UnsafeFixerResult:
     why_unsafe: str
     before_content: str
     after_content: str
+    diff: str = ""
 
 
 class UnsafeDocstringRewriter:
@@ -156,64 +173,138 @@ class UnsafeDocstringRewriter:
     def _rewrite_docstrings(self, content: str) -> str:
         """Rewrite Google-style docstrings to Sphinx format.
 
+        Only real docstrings (the first statement of a module, class or function,
+        located via the AST) are touched. Each docstring span is rewritten and
+        spliced back by character offset in a single pass.
+
         :param content: File content to process
-        :returns: Content with rewritten docstrings
+        :returns: Content with rewritten docstrings (unchanged if it has no
+            Google-style markers or does not parse)
         """
-        # This is a minimal implementation - just handles simple cases
-        # Real implementation would need proper AST parsing
+        # Cheap pre-scan: skip parsing files without any Google-style section header
+        if not _GOOGLE_SECTION.search(content):
+            return content
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            return content
+
+        spans = _docstring_spans(tree, content)
+        if not spans:
+            return content
+
+        pieces = []
+        position = 0
+        for start, end in spans:
+            pieces.append(content[position:start])
+            pieces.append(self._rewrite_docstring_text(content[start:end]))
+            position = end
+        pieces.append(content[position:])
+        return "".join(pieces)
+
+    @staticmethod
+    def _rewrite_docstring_text(text: str) -> str:
+        """Rewrite the Args:/Returns: sections of one docstring literal.
+
+        :param text: Source text of the string literal (including quotes)
+        :returns: Rewritten source text
+        """
+        if not _GOOGLE_SECTION.search(text):
+            return text
 
-        lines = content.split("\n")
         result_lines = []
-        in_docstring = False
         in_args_section = False
         in_returns_section = False
-
-        for line in lines:
-            # Detect docstring start/end
-            if '"""' in line:
-                if not in_docstring:
-                    in_docstring = True
-                elif line.strip() == '"""' or line.rstrip().endswith('"""'):
-                    in_docstring = False
-                    in_args_section = False
-                    in_returns_section = False
+        for line in text.split("\n"):
+            stripped = line.strip()
 
             # Convert Google-style Args: to :param:
-            if in_docstring and "Args:" in line:
+            if stripped == "Args:":
                 in_args_section = True
+                in_returns_section = False
                 continue  # Skip the "Args:" line
 
-            if in_docstring and in_args_section:
+            if in_args_section:
                 # Match "    name: description" or "    name (type): description"
-                match = re.match(r"^(\s+)(\w+)(\s*\(.*?\))?\s*:\s*(.+)$", line)
+                match = _GOOGLE_PARAM.match(line)
                 if match:
                     indent, param_name, _param_type, description = match.groups()
-                    # Convert to Sphinx format
                     result_lines.append(f"{indent}:param {param_name}: {description}")
                     continue
-                if line.strip() and not line.strip().startswith(":"):
+                if stripped and not stripped.startswith(":"):
                     # End of Args section
                     in_args_section = False
 
             # Convert Google-style Returns: to :returns:
-            if in_docstring and "Returns:" in line:
+            if stripped == "Returns:":
                 in_returns_section = True
+                in_args_section = False
                 continue  # Skip the "Returns:" line
 
-            if in_docstring and in_returns_section:
+            if in_returns_section and stripped:
                 # Next non-empty line is the return description
-                if line.strip():
-                    indent = len(line) - len(line.lstrip())
-                    description = line.strip()
-                    result_lines.append(f"{' ' * indent}:returns: {description}")
-                    in_returns_section = False
-                    continue
+                indent = len(line) - len(line.lstrip())
+                result_lines.append(f"{' ' * indent}:returns: {stripped}")
+                in_returns_section = False
+                continue
 
             result_lines.append(line)
 
         return "\n".join(result_lines)
 
 
+# Google-style section headers the docstring rewriter converts
+_GOOGLE_SECTION = re.compile(r"^[ \t]*(?:Args|Returns):[ \t]*$", re.MULTILINE)
+
+# "    name: description" or "    name (type): description" inside an Args: section
+_GOOGLE_PARAM = re.compile(r"^(\s+)(\w+)(\s*\(.*?\))?\s*:\s*(.+)$")
+
+# Line breaks as counted by ast line numbers (the same split ast.get_source_segment uses)
+_LINE_BREAK = re.compile(r"(\r\n|\r|\n)")
+
+# AST nodes that can carry a docstring
+_DOCSTRING_OWNERS = (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _docstring_spans(tree: ast.AST, content: str) -> List[Tuple[int, int]]:
+    """Locate docstring literals as character offsets into the source.
+
+    :param tree: Parsed module
+    :param content: Source the tree was parsed from
+    :returns: Sorted (start, end) offsets of each docstring's string literal
+    """
+    # ast counts only "\r\n", "\r" and "\n" as line breaks; str.splitlines() would also
+    # split on form feeds and other separators and shift every later span
+    parts = _LINE_BREAK.split(content)
+    lines = [line + sep for line, sep in zip(parts[::2], parts[1::2] + [""])]
+    line_starts = [0]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line))
+
+    def offset(lineno: int, col_bytes: int) -> int:
+        """Convert an AST (line, UTF-8 byte column) position to a character offset.
+
+        :param lineno: 1-based line number
+        :param col_bytes: Column offset in UTF-8 bytes
+        :returns: Offset into content
+        """
+        line = lines[lineno - 1]
+        return line_starts[lineno - 1] + len(line.encode("utf-8")[:col_bytes].decode("utf-8", errors="ignore"))
+
+    spans = []
+    for node in ast.walk(tree):
+        if not isinstance(node, _DOCSTRING_OWNERS) or not node.body:
+            continue
+        first = node.body[0]
+        if not (
+            isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant) and isinstance(first.value.value, str)
+        ):
+            continue
+        literal = first.value
+        spans.append((offset(literal.lineno, literal.col_offset), offset(literal.end_lineno, literal.end_col_offset)))
+    return sorted(spans)
+
+
 # Registry of all unsafe fixers
 UNSAFE_FIXERS: List[UnsafeFixer] = [
     UnsafeDocstringRewriter(),
@@ -244,3 +335,65 @@ def apply_unsafe_fixes(file_paths: List[Path]) -> List[UnsafeFixerResult]:
                     results.append(result)
 
     return results
+
+
+def format_unified_diff(result: UnsafeFixerResult) -> str:
+    """Format the unified diff for one unsafe fixer result.
+
+    :param result: Result carrying before_content/after_content
+    :returns: Unified diff text (one line per diff line, no trailing newline)
+    """
+    diff = difflib.unified_diff(
+        result.before_content.splitlines(keepends=True),
+        result.after_content.splitlines(keepends=True),
+        fromfile=f"a/{result.file_path}",
+        tofile=f"b/{result.file_path}",
+        lineterm="",
+    )
+    return "\n".join(diff)
+
+
+def _fix_file(file_path: str) -> List[UnsafeFixerResult]:
+    """Run every applicable fixer on one file (process pool worker).
+
+    The diff is computed in the worker and the file contents are dropped, so only
+    the (small) diff crosses the process boundary and is held by the caller.
+
+    :param file_path: Path of the file to fix
+    :returns: Slim results (diff set, contents cleared) for fixers that made changes
+    """
+    path = Path(file_path)
+    results = []
+    for fixer in get_unsafe_fixers():
+        if fixer.can_fix(path):
+            result = fixer.fix(path)
+            if result:
+                result.diff = format_unified_diff(result)
+                result.before_content = ""
+                result.after_content = ""
+                results.append(result)
+    return results
+
+
+def iter_unsafe_fixes(file_paths: List[Path], jobs: int | None = None) -> Iterator[UnsafeFixerResult]:
+    """Apply all unsafe fixers across a process pool, yielding results as a stream.
+
+    Results are yielded in input order (deterministic patches) with `diff` set and
+    before_content/after_content cleared, so the caller can write each diff out
+    and keep memory use independent of how many files change.
+
+    :param file_paths: List of file paths to process
+    :param jobs: Worker processes (default: CPU count); 1 runs in-process
+    :returns: Iterator of results from fixers that made changes
+    """
+    paths = [str(path) for path in file_paths]
+    workers = min(jobs or os.cpu_count() or 1, len(paths))
+    if workers <= 1 or len(paths) < MIN_PARALLEL_FILES:
+        for path in paths:
+            yield from _fix_file(path)
+        return
+
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for file_results in executor.map(_fix_file, paths, chunksize=chunksize):
+            yield from file_results
@@ -0,0 +1,330 @@
+"""Conformance vector runner for the docstring validators.
+
+:Purpose:
+    Implements `repo-lint vectors`: loads every vector under
+    conformance/repo-lint/vectors/docstrings/, runs the matching docstring
+    validator in-process on the vector's fixture, and compares the
+    structured ValidationErrors against the vector's expected violations.
+    Vectors run on a thread pool and each result carries its own timing, so
+    adding vectors does not add interpreter start-ups.
+
+:Vector Statuses:
+    - pass: Actual violations match the expected violations exactly
+    - fail: Violations are missing or unexpected
+    - skip: The validator's external parser is not installed (pwsh for
+      PowerShell, perl with PPI for Perl); without it the validator cannot
+      see symbols, so comparing would report false failures
+    - error: The vector is malformed, its fixture is missing or the validator raised
+
+:Comparison:
+    Only symbol-level missing-documentation errors are compared (rule
+    DOCSTRING.MISSING), matching the vector schema in
+    conformance/repo-lint/README.md. Violations are keyed by rule_id, path,
+    symbol, symbol_kind, line and severity; messages are not compared.
+
+:Environment Variables:
+    None
+
+:Exit Codes:
+    - 0: All vectors passed or were skipped
+    - 1: One or more vectors failed or errored
+    - 3: Internal error or exception
+
+:Examples:
+    Run every vector::
+
+        repo-lint vectors
+
+    Run the Python vectors with a JSON report::
+
+        repo-lint vectors --lang python --json
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from tools.repo_lint.common import ExitCode, safe_print
+from tools.repo_lint.docstrings.common import ValidationError
+from tools.repo_lint.docstrings.validator import validate_file
+from tools.repo_lint.runners.base import command_exists
+
+# Vector directory, relative to the repository root
+VECTORS_SUBDIR = Path("conformance") / "repo-lint" / "vectors" / "docstrings"
+
+# Fields a violation is matched on (message wording is free to change)
+VIOLATION_KEY_FIELDS = ("rule_id", "path", "symbol", "symbol_kind", "line", "severity")
+
+# missing_sections labels the validators use for an undocumented symbol
+MISSING_DOC_SECTIONS = {
+    "function docstring",
+    "class docstring",
+    "function documentation",
+    "function help block",
+    "subroutine POD",
+}
+
+# symbol_name prefixes the validators use, mapped to the vector symbol_kind
+_SYMBOL_PREFIXES = (("def ", "function"), ("class ", "class"), ("sub ", "sub"))
+
+STATUS_ICONS = {"pass": ("✅", "PASS"), "fail": ("❌", "FAIL"), "skip": ("⊘", "SKIP"), "error": ("💥", "ERROR")}
+
+
+def load_vectors(vectors_dir: Path, language: str | None = None, ids: List[str] | None = None) -> List[Dict[str, Any]]:
+    """Load vector files, optionally filtered by language and ID.
+
+    :param vectors_dir: Directory containing *.json vectors
+    :param language: Only return vectors for this language
+    :param ids: Only return vectors with these IDs
+    :returns: Parsed vectors sorted by file name; each has a "_file" key
+    :raises OSError: If a vector file cannot be read
+    :raises ValueError: If a vector file is not valid JSON or an ID is unknown
+    """
+    vectors = []
+    for vector_file in sorted(vectors_dir.glob("*.json")):
+        vector = json.loads(vector_file.read_text(encoding="utf-8"))
+        vector["_file"] = str(vector_file)
+        vectors.append(vector)
+
+    if ids:
+        unknown = sorted(set(ids) - {vector.get("id") for vector in vectors})
+        if unknown:
+            raise ValueError(f"Unknown vector ID(s): {', '.join(unknown)}")
+        vectors = [vector for vector in vectors if vector.get("id") in ids]
+    if language:
+        vectors = [vector for vector in vectors if vector.get("language") == language]
+    return vectors
+
+
+def _split_symbol(symbol_name: str) -> Tuple[str, str]:
+    """Split a validator symbol_name into the bare name and vector symbol_kind.
+
+    :param symbol_name: e.g. "def no_doc()", "class Foo", "sub bar", "baz()", "Get-Thing"
+    :returns: (symbol, symbol_kind)
+    """
+    kind = "function"
+    for prefix, prefix_kind in _SYMBOL_PREFIXES:
+        if symbol_name.startswith(prefix):
+            symbol_name, kind = symbol_name[len(prefix) :], prefix_kind
+            break
+    if symbol_name.endswith("()"):
+        symbol_name = symbol_name[:-2]
+    return symbol_name, kind
+
+
+def normalize_error(error: ValidationError, repo_root: Path) -> Dict[str, Any] | None:
+    """Convert a ValidationError into the vector violation schema.
+
+    :param error: Error reported by a docstring validator
+    :param repo_root: Repository root (paths are made relative to it)
+    :returns: Normalized violation, or None for errors vectors don't cover
+        (file headers, section content)
+    """
+    if not error.symbol_name or not MISSING_DOC_SECTIONS.intersection(error.missing_sections):
+        return None
+    symbol, kind = _split_symbol(error.symbol_name)
+    path = Path(error.file_path)
+    if path.is_absolute():
+        path = Path(os.path.relpath(path, repo_root))
+    return {
+        "rule_id": "DOCSTRING.MISSING",
+        "path": path.as_posix(),
+        "symbol": symbol,
+        "symbol_kind": kind,
+        "line": error.line_number,
+        "severity": "error",
+        "message": f"{'Subroutine' if kind == 'sub' else kind.capitalize()} '{symbol}' is missing a docstring",
+    }
+
+
+def _violation_key(violation: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Get the fields a violation is matched on.
+
+    :param violation: Normalized violation
+    :returns: Tuple of VIOLATION_KEY_FIELDS values
+    """
+    return tuple(violation.get(field) for field in VIOLATION_KEY_FIELDS)
+
+
+def _describe_violation(violation: Dict[str, Any]) -> str:
+    """Format a violation for failure messages.
+
+    :param violation: Normalized violation
+    :returns: One-line description
+    """
+    return (
+        f"{violation.get('rule_id')} {violation.get('symbol_kind')} '{violation.get('symbol')}' "
+        f"at {violation.get('path')}:{violation.get('line')}"
+    )
+
+
+def compare_violations(actual: List[Dict[str, Any]], expected: List[Dict[str, Any]]) -> List[str]:
+    """Compare normalized violations with a vector's expectations.
+
+    :param actual: Violations produced by the validator
+    :param expected: The vector's expected_violations
+    :returns: Failure descriptions (empty when they match)
+    """
+    remaining = [_violation_key(v) for v in actual]
+    failures = []
+    for violation in expected:
+        if _violation_key(violation) in remaining:
+            remaining.remove(_violation_key(violation))
+        else:
+            failures.append(f"missing: {_describe_violation(violation)}")
+    for violation in actual:
+        if _violation_key(violation) in remaining:
+            remaining.remove(_violation_key(violation))
+            failures.append(f"unexpected: {_describe_violation(violation)}")
+    return failures
+
+
+@lru_cache(maxsize=None)
+def _perl_ppi_available() -> bool:
+    """Check whether perl and its PPI module are installed.
+
+    :returns: True if the Perl validator can parse subroutines
+    """
+    if not command_exists("perl"):
+        return False
+    try:
+        result = subprocess.run(["perl", "-MPPI", "-e", "1"], capture_output=True, timeout=30, check=False)
+    except (OSError, subprocess.TimeoutExpired):
+        # OSError: perl disappeared or is not executable; TimeoutExpired: perl hung
+        return False
+    return result.returncode == 0
+
+
+def missing_prerequisite(language: str) -> str | None:
+    """Get the parser a language's validator needs but is not installed.
+
+    :param language: Vector language
+    :returns: Description of the missing prerequisite, or None
+    """
+    if language == "powershell" and not command_exists("pwsh"):
+        return "pwsh not installed"
+    if language == "perl" and not _perl_ppi_available():
+        return "perl with the PPI module not installed"
+    return None
+
+
+def run_vector(vector: Dict[str, Any], repo_root: Path) -> Dict[str, Any]:
+    """Run one vector.
+
+    :param vector: Parsed vector
+    :param repo_root: Repository root (fixture paths are relative to it)
+    :returns: Result dict with id, language, status, failures, violations and duration_ms
+    """
+    start = time.perf_counter()
+    result: Dict[str, Any] = {
+        "id": vector.get("id", Path(vector.get("_file", "?")).stem),
+        "language": vector.get("language"),
+        "status": "pass",
+        "failures": [],
+        "violations": [],
+    }
+    try:
+        skip_reason = missing_prerequisite(vector["language"])
+        fixture = repo_root / vector["fixture"]
+        if skip_reason:
+            result["status"], result["failures"] = "skip", [skip_reason]
+        elif not fixture.is_file():
+            result["status"], result["failures"] = "error", [f"fixture not found: {vector['fixture']}"]
+        else:
+            errors = validate_file(fixture)
+            actual = [v for v in (normalize_error(error, repo_root) for error in errors) if v is not None]
+            result["violations"] = actual
+            result["failures"] = compare_violations(actual, vector.get("expected_violations", []))
+            if result["failures"]:
+                result["status"] = "fail"
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # POLICY: Broad exception catch acceptable here (per-vector isolation)
+        # A malformed vector or a validator crash fails that vector, not the whole run.
+        # See: docs/contributing/python-exception-handling-policy.md
+        result["status"], result["failures"] = "error", [f"{type(e).__name__}: {e}"]
+    result["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+def run_vectors(vectors: List[Dict[str, Any]], repo_root: Path, jobs: int | None = None) -> Dict[str, Any]:
+    """Run vectors on a thread pool.
+
+    :param vectors: Parsed vectors
+    :param repo_root: Repository root
+    :param jobs: Worker threads (default: CPU count)
+    :returns: Report with results (in vector order), summary counts and total duration_ms
+
+    :Notes:
+        Validators are run in-process; the Perl and PowerShell validators
+        spend most of their time in parser subprocesses, which is where the
+        threads overlap.
+    """
+    start = time.perf_counter()
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(vectors) or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda vector: run_vector(vector, repo_root), vectors))
+    summary = {status: 0 for status in STATUS_ICONS}
+    for result in results:
+        summary[result["status"]] += 1
+    return {
+        "results": results,
+        "summary": summary,
+        "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
+
+
+def format_report(report: Dict[str, Any]) -> None:
+    """Print a vector report for humans.
+
+    :param report: Report from run_vectors()
+    """
+    for result in report["results"]:
+        icon, word = STATUS_ICONS[result["status"]]
+        line = f"{result['id']:<32} {result['duration_ms']:>9.1f} ms"
+        safe_print(f"{icon} {line}", f"[{word}] {line}")
+        for failure in result["failures"]:
+            print(f"    {failure}")
+    summary = report["summary"]
+    print(
+        f"\n{len(report['results'])} vector(s): {summary['pass']} passed, {summary['fail']} failed, "
+        f"{summary['skip']} skipped, {summary['error']} errors in {report['duration_ms']:.1f} ms"
+    )
+
+
+def cmd_vectors(args) -> int:
+    """Run the conformance vectors (`repo-lint vectors`).
+
+    :param args: Namespace with lang, ids, jobs, json and vectors_dir
+    :returns: Exit code (0 all passed or skipped, 1 failures or errors, 3 bad arguments)
+    """
+    # pylint: disable=import-outside-toplevel
+    from tools.repo_lint.repo_utils import find_repo_root
+
+    repo_root = find_repo_root()
+    vectors_dir = Path(args.vectors_dir) if args.vectors_dir else repo_root / VECTORS_SUBDIR
+    try:
+        vectors = load_vectors(vectors_dir, args.lang, list(args.ids) or None)
+    except (OSError, ValueError) as e:
+        # OSError: vector file unreadable; ValueError: invalid JSON or unknown --id
+        print(f"Error: {e}", file=sys.stderr)
+        return ExitCode.INTERNAL_ERROR
+    if not vectors:
+        print(f"Error: no vectors found in {vectors_dir}", file=sys.stderr)
+        return ExitCode.INTERNAL_ERROR
+
+    report = run_vectors(vectors, repo_root, args.jobs)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        format_report(report)
+    if report["summary"]["fail"] or report["summary"]["error"]:
+        return ExitCode.VIOLATIONS
+    return ExitCode.SUCCESS
@@ -0,0 +1,336 @@
+"""Filesystem-watch mode with incremental re-linting.
+
+:Purpose:
+    Implements `repo-lint watch`: waits for tracked files to change, debounces
+    bursts of edits (editor saves, git checkouts), maps the changed paths to the
+    runners that own them, and re-lints only those files. Each batch re-renders
+    the Reporter output for the files that just changed.
+
+:Watchers:
+    - WatchdogWatcher: Event-driven (inotify/FSEvents/ReadDirectoryChangesW) via the
+      optional `watchdog` package, used automatically when it is installed
+    - PollingWatcher: Pure-stdlib fallback that stats every tracked file each interval
+
+:Environment Variables:
+    None
+
+:Exit Codes:
+    - 0: Watch stopped by the user (Ctrl+C)
+    - 3: Internal error
+
+:Examples:
+    Watch the repository and re-lint on save::
+
+        repo-lint watch
+
+    Force the polling watcher with a slower interval::
+
+        repo-lint watch --poll --interval 2
+
+:Notes:
+    - Only git-tracked files are watched; new files are picked up once they are staged.
+    - Runners are mapped through the tracked-file inventory: a runner is re-run only when
+      its own file listing intersects the changed set (see Runner.set_file_scope()).
+    - cargo clippy/rustfmt are restricted to the crates owning the changed files (`-p <crate>`).
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+from tools.repo_lint.common import ExitCode, LintResult, safe_print
+from tools.repo_lint.logging_utils import get_logger
+from tools.repo_lint.runners.base import get_tracked_files, set_tracked_files_cache
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    # Optional dependency; create_watcher() falls back to PollingWatcher
+    FileSystemEventHandler = Observer = None  # type: ignore[assignment,misc]
+
+logger = get_logger(__name__)
+
+# Default seconds to wait for a burst of changes to settle before re-linting
+DEFAULT_DEBOUNCE = 0.3
+
+# Default polling interval in seconds for PollingWatcher
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+def get_inventory(repo_root: Path) -> List[str]:
+    """Get the watched file inventory (all tracked, non-excluded files).
+
+    :param repo_root: Repository root
+    :returns: Repo-relative paths of tracked files
+    """
+    return get_tracked_files([], repo_root)
+
+
+class PollingWatcher:
+    """Pure-stdlib watcher that compares (mtime, size) snapshots of tracked files."""
+
+    def __init__(self, repo_root: Path, interval: float = DEFAULT_POLL_INTERVAL):
+        """Take the initial snapshot.
+
+        :param repo_root: Repository root
+        :param interval: Seconds between polls
+        """
+        self.repo_root = repo_root
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[str, Tuple[int, int] | None]:
+        """Stat every tracked file.
+
+        :returns: Mapping of repo-relative path to (mtime_ns, size), or None if missing
+        """
+        snapshot: Dict[str, Tuple[int, int] | None] = {}
+        for rel_path in get_inventory(self.repo_root):
+            try:
+                st = os.stat(self.repo_root / rel_path)
+                snapshot[rel_path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                snapshot[rel_path] = None
+        return snapshot
+
+    def poll(self, timeout: float) -> Set[str]:
+        """Wait up to `timeout` seconds for changes.
+
+        :param timeout: Maximum seconds to wait
+        :returns: Changed repo-relative paths (empty if nothing changed)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self._take_snapshot()
+            changed = {path for path, sig in current.items() if self._snapshot.get(path, ()) != sig}
+            self._snapshot = current
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+    def close(self) -> None:
+        """Release watcher resources (nothing to do for polling)."""
+
+
+class WatchdogWatcher:
+    """Event-driven watcher backed by the optional `watchdog` package."""
+
+    def __init__(self, repo_root: Path):
+        """Start observing the repository.
+
+        :param repo_root: Repository root
+        :raises ImportError: If watchdog is not installed
+        """
+        if Observer is None:
+            raise ImportError("watchdog is not installed")
+
+        self.repo_root = repo_root.resolve()
+        self._events: queue.Queue = queue.Queue()
+        events = self._events
+
+        class _Handler(FileSystemEventHandler):
+            """Forward every file event path to the watcher queue."""
+
+            def on_any_event(self, event):
+                """Queue the source (and destination, for moves) of a file event.
+
+                :param event: watchdog FileSystemEvent
+                """
+                for attr in ("src_path", "dest_path"):
+                    path = getattr(event, attr, None)
+                    if path and not event.is_directory:
+                        events.put(os.fsdecode(path))
+
+        self._observer = Observer()
+        self._observer.schedule(_Handler(), str(self.repo_root), recursive=True)
+        self._observer.start()
+
+    def poll(self, timeout: float) -> Set[str]:
+        """Wait up to `timeout` seconds for changes to tracked files.
+
+        :param timeout: Maximum seconds to wait
+        :returns: Changed repo-relative paths (empty if nothing changed)
+        """
+        raw: Set[str] = set()
+        try:
+            raw.add(self._events.get(timeout=timeout))
+            while True:
+                raw.add(self._events.get_nowait())
+        except queue.Empty:
+            pass
+        if not raw:
+            return set()
+
+        inventory = set(get_inventory(self.repo_root))
+        changed = set()
+        for path in raw:
+            try:
+                rel_path = Path(path).resolve().relative_to(self.repo_root).as_posix()
+            except ValueError:
+                continue
+            if rel_path in inventory:
+                changed.add(rel_path)
+        return changed
+
+    def close(self) -> None:
+        """Stop the observer thread."""
+        self._observer.stop()
+        self._observer.join()
+
+
+def create_watcher(repo_root: Path, force_poll: bool = False, interval: float = DEFAULT_POLL_INTERVAL):
+    """Create the best available watcher.
+
+    :param repo_root: Repository root
+    :param force_poll: Use PollingWatcher even if watchdog is installed
+    :param interval: Polling interval for PollingWatcher
+    :returns: WatchdogWatcher if available (and not forced off), else PollingWatcher
+    """
+    if not force_poll:
+        try:
+            return WatchdogWatcher(repo_root)
+        except ImportError:
+            logger.debug("watchdog not installed; falling back to polling")
+    return PollingWatcher(repo_root, interval=interval)
+
+
+def wait_for_batch(watcher, debounce: float = DEFAULT_DEBOUNCE, timeout: float | None = None) -> Set[str]:
+    """Block until files change, then collect changes until they settle.
+
+    :param watcher: PollingWatcher or WatchdogWatcher
+    :param debounce: Seconds without further changes that end the batch
+    :param timeout: Give up after this many seconds with no change (None = wait forever)
+    :returns: Set of changed repo-relative paths (empty only when timeout expires)
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    batch: Set[str] = set()
+    while not batch:
+        wait = 1.0 if deadline is None else max(0.0, min(1.0, deadline - time.monotonic()))
+        batch = watcher.poll(wait)
+        if not batch and deadline is not None and time.monotonic() >= deadline:
+            return set()
+
+    while True:
+        more = watcher.poll(debounce)
+        if not more:
+            return batch
+        batch |= more
+
+
+def relint_files(runners: List[Tuple[str, str, object]], changed: Iterable[str]) -> Tuple[List[LintResult], List[str]]:
+    """Re-run only the runners (and files) affected by a set of changes.
+
+    :param runners: (key, name, runner) tuples as returned by build_language_runners()
+    :param changed: Repo-relative paths that changed
+    :returns: Tuple of (results, names of runners that were re-run)
+    """
+    changed = sorted(changed)
+    results: List[LintResult] = []
+    affected: List[str] = []
+    for _, name, runner in runners:
+        runner.set_file_scope(changed)
+        try:
+            if not runner.has_files():
+                continue
+            affected.append(name)
+            missing_tools = runner.check_tools()
+            if missing_tools:
+                results.append(
+                    LintResult(
+                        tool=name.lower(),
+                        passed=False,
+                        violations=[],
+                        error=f"Missing tools: {', '.join(missing_tools)}",
+                    )
+                )
+                continue
+            results.extend(runner.check())
+        except Exception as e:
+            # POLICY: Broad exception catch acceptable here (watch loop orchestration)
+            # A failing runner must not end the watch session; report it as an error result.
+            # See: docs/contributing/python-exception-handling-policy.md
+            results.append(LintResult(tool=name.lower(), passed=False, violations=[], error=f"Runner failed: {e}"))
+        finally:
+            runner.set_file_scope(None)
+    return results, affected
+
+
+def run_watch(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    ci_mode: bool = False,
+    verbose: bool = False,
+    only: str | None = None,
+    tool_filter: List[str] | None = None,
+    force_poll: bool = False,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+) -> int:
+    """Watch the repository and re-lint changed files until interrupted.
+
+    :param ci_mode: Plain (non-TTY) output
+    :param verbose: Verbose runner output
+    :param only: Restrict to a single language key (e.g. "python")
+    :param tool_filter: Restrict to specific tools
+    :param force_poll: Use the polling watcher even if watchdog is installed
+    :param interval: Polling interval in seconds
+    :param debounce: Seconds of quiet that end a batch of changes
+    :returns: Exit code (0 when stopped with Ctrl+C)
+    """
+    # pylint: disable=import-outside-toplevel
+    from tools.repo_lint.repo_utils import find_repo_root
+    from tools.repo_lint.reporting import report_results
+    from tools.repo_lint.runners.language_runners import build_language_runners
+    from tools.repo_lint.runners.naming_runner import NamingRunner
+    from tools.repo_lint.ui.console import get_console
+
+    repo_root = find_repo_root()
+    runners = build_language_runners(ci_mode=ci_mode, verbose=verbose)
+    if only:
+        runners = [entry for entry in runners if entry[0] == only]
+    else:
+        try:
+            runners.append(("naming", "Naming Conventions", NamingRunner()))
+        except Exception as e:
+            # POLICY: Broad exception catch acceptable here (graceful degradation, as in check)
+            logger.warning("Naming validation skipped: %s", e)
+    if tool_filter:
+        for _, _, runner in runners:
+            runner.set_tool_filter(tool_filter)
+
+    # Inventory listings are re-read on every poll; keep them cached until the index changes
+    set_tracked_files_cache(True)
+    watcher = create_watcher(repo_root, force_poll=force_poll, interval=interval)
+    console = get_console(ci_mode=ci_mode)
+    kind = "polling" if isinstance(watcher, PollingWatcher) else "watchdog"
+    safe_print(f"👀 Watching {repo_root} ({kind}); press Ctrl+C to stop", f"Watching {repo_root} ({kind})")
+
+    try:
+        while True:
+            changed = wait_for_batch(watcher, debounce=debounce)
+            start = time.time()
+            results, affected = relint_files(runners, changed)
+            if not affected:
+                continue
+            if not ci_mode and sys.stdout.isatty():
+                console.clear()
+            safe_print(
+                f"🔁 {len(changed)} file(s) changed → {', '.join(affected)}",
+                f"{len(changed)} file(s) changed -> {', '.join(affected)}",
+            )
+            for path in sorted(changed)[:10]:
+                print(f"   {path}")
+            print("")
+            report_results(results, verbose=verbose, ci_mode=ci_mode)
+            print(f"Re-linted in {time.time() - start:.2f}s; waiting for changes...")
+    except KeyboardInterrupt:
+        print("")
+        return ExitCode.SUCCESS
+    finally:
+        watcher.close()
+        set_tracked_files_cache(False)
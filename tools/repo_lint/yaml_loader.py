@@ -6,7 +6,10 @@
 
 :Architecture:
     - Single source of truth: conformance/repo-lint/*.yaml files
-    - Cached loading for performance
+    - Cached loading for performance: load_cached_file() memoizes parsed and
+      validated files keyed by (path, mtime, size), so long-lived processes
+      (daemon, watch mode) pick up edits without explicit invalidation
+    - libyaml CSafeLoader used for parsing when PyYAML was built with it
     - Validation via config_validator
     - Backward compatibility support
     - Support for custom config paths via --config flag
@@ -38,7 +41,10 @@
     - 1: YAML file not found or invalid
 
 :Notes:
-    - Configurations are cached per process (singleton pattern)
+    - Configurations are cached per process and re-validated against the file's
+      stat signature on every call; files modified within the last two seconds
+      are additionally checked by content digest (mtime granularity)
+    - Cached objects are shared between callers and must not be mutated
     - File paths are relative to repository root by default
     - All YAML files must pass config_validator checks
     - Custom config directory can be set globally via set_config_directory()
@@ -46,20 +52,81 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+import threading
+import time
 import warnings
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
 
-import yaml
-
-from tools.repo_lint.config_validator import validate_config_file
+# safe_load_yaml lives in config_validator (which this module imports) and is re-exported here
+from tools.repo_lint.config_validator import safe_load_yaml, validate_config_file
 from tools.repo_lint.repo_utils import find_repo_root
 
 # Global config directory override (set via --config or set_config_directory)
 _CUSTOM_CONFIG_DIR: Path | None = None
 
+# Files modified this recently may change again within the same mtime tick,
+# so their cache entries are confirmed by content digest (cf. git's "racy" index entries)
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class _CacheEntry(NamedTuple):
+    """Cached parse result for one (path, kind) pair."""
+
+    signature: Tuple[int, int]
+    digest: str
+    racy: bool
+    value: Any
+
+
+_FILE_CACHE: Dict[Tuple[str, str], _CacheEntry] = {}
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def load_cached_file(path: Path, kind: str, parse: Callable[[Path, str], Any]) -> Any:
+    """Load a file through the shared config cache.
+
+    :Purpose:
+        Single memoization point for every repo-lint configuration file (YAML
+        rules, UI theme, auto-fix policy). The parse callback is only invoked
+        when the file changed since the cached result was produced.
+
+    :param path: File to load
+    :param kind: Cache namespace distinguishing different parsers of the same file
+    :param parse: Callback receiving (path, text) and returning the parsed, validated value
+    :returns: Value returned by parse (possibly cached)
+
+    :raises FileNotFoundError: If the file doesn't exist
+    :raises Exception: Whatever parse raises; failures are never cached
+
+    :Notes:
+        - Cache hits cost one os.stat(); racy entries also re-read and hash the file
+        - Thread-safe; parse may run concurrently for different keys
+    """
+    key = (os.path.abspath(path), kind)
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size)
+
+    with _FILE_CACHE_LOCK:
+        entry = _FILE_CACHE.get(key)
+    if entry is not None and entry.signature == signature and not entry.racy:
+        return entry.value
+
+    raw = Path(path).read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    racy = time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS
+    if entry is not None and entry.digest == digest:
+        value = entry.value
+    else:
+        value = parse(Path(path), raw.decode("utf-8"))
+
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[key] = _CacheEntry(signature, digest, racy, value)
+    return value
+
 
 def set_config_directory(config_dir: Path | None) -> None:
     """Set custom config directory for YAML file loading.
@@ -87,14 +154,22 @@ def set_config_directory(config_dir: Path | None) -> None:
     global _CUSTOM_CONFIG_DIR  # pylint: disable=global-statement
     _CUSTOM_CONFIG_DIR = config_dir
     # Clear all caches when config directory changes
-    _get_conformance_dir.cache_clear()
-    load_linting_rules.cache_clear()
-    load_naming_rules.cache_clear()
-    load_docstring_rules.cache_clear()
-    load_file_patterns.cache_clear()
+    clear_config_caches()
+
+
+def clear_config_caches() -> None:
+    """Drop all cached config loads so the next load_*() call re-reads from disk.
+
+    :Purpose:
+        Used by set_config_directory() and by tests. Edits to config files are
+        detected automatically by load_cached_file(); this is only needed to
+        force a re-read.
+    """
+    _resolve_conformance_dir.cache_clear()
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE.clear()
 
 
-@lru_cache(maxsize=None)
 def _get_conformance_dir() -> Path:
     """Get the conformance/repo-lint directory.
 
@@ -106,16 +181,30 @@ def _get_conformance_dir() -> Path:
         - Checks custom config directory first (set via set_config_directory)
         - Falls back to REPO_LINT_CONFIG_DIR environment variable
         - Falls back to repo_root/conformance/repo-lint
+        - Resolution is cached per (override, REPO_LINT_CONFIG_DIR) so that later
+          working-directory changes keep using the repository found first
+    """
+    return _resolve_conformance_dir(_CUSTOM_CONFIG_DIR, os.environ.get("REPO_LINT_CONFIG_DIR"))
+
+
+@lru_cache(maxsize=32)
+def _resolve_conformance_dir(custom_dir: Path | None, env_config_dir: str | None) -> Path:
+    """Resolve the conformance directory for one set of inputs.
+
+    :param custom_dir: Directory set via set_config_directory(), if any
+    :param env_config_dir: Value of REPO_LINT_CONFIG_DIR, if set
+    :returns: Path to conformance directory
+
+    :raises FileNotFoundError: If conformance directory doesn't exist
     """
     # Check custom config directory (set via --config or set_config_directory)
-    if _CUSTOM_CONFIG_DIR is not None:
-        conformance_dir = _CUSTOM_CONFIG_DIR
+    if custom_dir is not None:
+        conformance_dir = custom_dir
         if not conformance_dir.exists():
             raise FileNotFoundError(f"Custom config directory not found: {conformance_dir}")
         return conformance_dir
 
     # Check environment variable
-    env_config_dir = os.environ.get("REPO_LINT_CONFIG_DIR")
     if env_config_dir:
         conformance_dir = Path(env_config_dir)
         if not conformance_dir.exists():
@@ -148,8 +237,8 @@ def load_yaml_config(config_filename: str, allowed_keys: List[str] = None) -> Di
             python_tools = config['languages']['python']['tools']
 
     :Note:
-        This function is not cached to support custom allowed_keys.
-        Use the specific load_*_rules() functions for caching.
+        Results are cached per (file, allowed_keys) via load_cached_file(), so
+        repeated calls only stat the file.
     """
     conformance_dir = _get_conformance_dir()
     config_path = conformance_dir / config_filename
@@ -157,18 +246,22 @@ def load_yaml_config(config_filename: str, allowed_keys: List[str] = None) -> Di
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    # Load YAML first to get config_type
-    with open(config_path, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    def _parse(path: Path, content: str) -> Dict[str, Any]:
+        """Parse and validate the config file (run only on a cache miss).
 
-    # Validate config file structure
-    config_type = config.get("config_type", "unknown")
-    validate_config_file(config_path, config_type, allowed_keys=allowed_keys)
+        :param path: Config file path
+        :param content: Config file text
+        :returns: Validated config data
+        """
+        # The file declares its own config_type; validation checks the rest of the schema
+        data = safe_load_yaml(content)
+        config_type = data.get("config_type", "unknown") if isinstance(data, dict) else "unknown"
+        return validate_config_file(path, config_type, allowed_keys=allowed_keys, content=content, data=data)
 
-    return config
+    kind = "config:" + ",".join(allowed_keys) if allowed_keys else "config"
+    return load_cached_file(config_path, kind, _parse)
 
 
-@lru_cache(maxsize=None)
 def load_linting_rules() -> Dict[str, Any]:
     """Load linting rules configuration.
 
@@ -183,7 +276,6 @@ def load_linting_rules() -> Dict[str, Any]:
     return load_yaml_config("repo-lint-linting-rules.yaml")
 
 
-@lru_cache(maxsize=None)
 def load_naming_rules() -> Dict[str, Any]:
     """Load naming rules configuration.
 
@@ -198,7 +290,6 @@ def load_naming_rules() -> Dict[str, Any]:
     return load_yaml_config("repo-lint-naming-rules.yaml")
 
 
-@lru_cache(maxsize=None)
 def load_docstring_rules() -> Dict[str, Any]:
     """Load docstring rules configuration.
 
@@ -213,7 +304,6 @@ def load_docstring_rules() -> Dict[str, Any]:
     return load_yaml_config("repo-lint-docstring-rules.yaml")
 
 
-@lru_cache(maxsize=None)
 def load_file_patterns() -> Dict[str, Any]:
     """Load file patterns configuration.
 
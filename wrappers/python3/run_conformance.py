@@ -0,0 +1,641 @@
+#!/usr/bin/env python3
+"""Conformance vector runner for the Python3 wrapper bundle.
+
+Loads conformance/vectors.json, expands each vector's ``args_template``,
+executes it in an isolated temporary directory and checks every
+``expected`` condition. Vectors run concurrently in a process pool and the
+report carries a wall-clock timing per vector.
+
+:Purpose:
+The Rust harness (rust/crates/safe-run/tests/conformance.rs) is the only
+other consumer of the vectors, and the wrapper unit tests hand-code their
+own scenarios. This runner executes the canonical vectors against what the
+Python bundle ships, so drift shows up per vector ID.
+
+Targets by category:
+
+- ``safe_run``: ``python3 scripts/safe_run.py <args>``
+- ``preflight_automerge_ruleset``: ``python3 scripts/preflight_automerge_ruleset.py
+  <args>`` against a local HTTP server that serves the vector's
+  ``mock_responses`` (via GITHUB_API_URL; ``gh`` is removed from PATH)
+- ``safe_archive`` / ``safe_check``: the canonical ``safe-run archive`` /
+  ``safe-run check`` subcommands, located with safe_run.py's own binary
+  discovery (the Python bundle has no separate entry point for them)
+
+:Environment Variables:
+SAFE_RUN_BIN : str, optional
+    Path to the Rust canonical binary (passed to safe_run.py's discovery)
+
+:Usage:
+Run every vector::
+
+    python3 wrappers/python3/run_conformance.py
+
+:Arguments:
+--vectors PATH
+    Vector file (default: conformance/vectors.json in the repository)
+--category NAME
+    Only run this category (repeatable)
+--id VECTOR_ID
+    Only run this vector (repeatable)
+--jobs N
+    Worker processes (default: CPU count; 1 runs in-process)
+--timeout SECONDS
+    Per-command timeout (default: 60)
+--json
+    Print the report as JSON instead of a table
+
+:Examples:
+Preflight vectors only, as JSON::
+
+    python3 wrappers/python3/run_conformance.py --category preflight_automerge_ruleset --json
+
+One vector, in-process::
+
+    python3 wrappers/python3/run_conformance.py --id safe-run-002 --jobs 1
+
+:Exit Codes:
+0
+    Every selected vector passed (or was skipped by its platform filter)
+1
+    One or more vectors failed or could not be run
+2
+    Usage error (unreadable vector file, unknown category or vector ID)
+
+:Notes:
+- Each vector (and each ``command_variants`` entry) gets its own temporary
+  working directory; TOKEN, GITHUB_TOKEN, SAFE_LOG_DIR and the other
+  variables vectors control are removed from the inherited environment
+- ``stdout_contains``/``stderr_contains`` match case-insensitively: vectors
+  list lowercase keywords ("not found", "ruleset") for messages that start
+  with a capital letter
+- Unknown ``expected`` keys are reported as errors so new vector fields are
+  never silently ignored
+- A missing safe-run binary is reported per vector as an error, not a skip
+
+:See Also:
+- conformance/README.md: Vector schema
+- run_tests.py: Unit test runner for this bundle
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+WRAPPER_DIR = Path(__file__).resolve().parent
+REPO_ROOT = WRAPPER_DIR.parent.parent
+SCRIPTS_DIR = WRAPPER_DIR / "scripts"
+VECTORS_DEFAULT = REPO_ROOT / "conformance" / "vectors.json"
+
+SETUP_FILE_CONTENT = "test content"
+DEFAULT_LOG_DIR = ".agent/FAIL-LOGS"
+TIMEOUT_DEFAULT = 60.0
+# How long a long_running command runs before it is signalled
+SIGNAL_DELAY_SECONDS = 1.0
+
+# Variables that vectors set themselves; never inherited from the caller
+ISOLATED_ENV_VARS = (
+    "TOKEN",
+    "GITHUB_TOKEN",
+    "GITHUB_API_URL",
+    "PREFLIGHT_CACHE_DIR",
+    "PREFLIGHT_CACHE_TTL",
+    "SAFE_LOG_DIR",
+    "SAFE_SNIPPET_LINES",
+    "SAFE_ARCHIVE_DIR",
+    "SAFE_ARCHIVE_COMPRESS",
+    "SAFE_FAIL_DIR",
+)
+
+STATUS_PASS = "pass"
+STATUS_FAIL = "fail"
+STATUS_SKIP = "skip"
+STATUS_ERROR = "error"
+
+SUPPORTED_EXPECTATIONS = frozenset(
+    {
+        "exit_code",
+        "exit_code_oneOf",
+        "exit_code_range",
+        "stdout_contains",
+        "stderr_contains",
+        "artifacts_created",
+        "file_exists",
+        "file_not_exists",
+        "log_file_pattern",
+        "log_content_markers",
+        "log_file_in_dir",
+        "archive_contains",
+        "original_file_unchanged",
+        "file_count_unchanged",
+        "auth_header_format",
+    }
+)
+
+
+def load_vectors(path: Path) -> List[Tuple[str, Dict[str, object]]]:
+    """Load vectors in file order.
+
+    :param path: vectors.json path
+    :returns: List of (category, vector) pairs
+    :raises ValueError: If the file is unreadable or not a vector file
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Cannot load vectors from {path}: {e}") from e
+    groups = data.get("vectors") if isinstance(data, dict) else None
+    if not isinstance(groups, dict):
+        raise ValueError(f"{path} has no 'vectors' object")
+    return [(category, vector) for category, vectors in groups.items() for vector in vectors]
+
+
+def find_safe_run_binary() -> str | None:
+    """Locate the canonical binary the way safe_run.py does.
+
+    :returns: Binary path, or None if it is not installed or built
+    """
+    spec = importlib.util.spec_from_file_location("safe_run", str(SCRIPTS_DIR / "safe_run.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.find_safe_run_binary()
+
+
+def expand_template(command: Dict[str, object], workdir: Path) -> List[str]:
+    """Turn a vector's ``command`` into argv, creating any files it needs.
+
+    :param command: The vector's command object
+    :param workdir: Vector working directory
+    :returns: Arguments passed after the target command
+    :raises ValueError: If the template is unknown
+    """
+    template = command.get("args_template")
+    if template is None:
+        return list(command.get("args") or [])
+    exit_code = int(command.get("exit_code", 1))
+    if template == "print_and_exit":
+        code = (
+            "import sys; "
+            f"sys.stdout.write({command.get('print_stdout', '')!r}); "
+            f"sys.stderr.write({command.get('print_stderr', '')!r}); "
+            f"sys.exit({exit_code})"
+        )
+        return [sys.executable, "-c", code]
+    if template == "simple_fail":
+        return [sys.executable, "-c", f"import sys; sys.exit({exit_code})"]
+    if template == "long_running":
+        code = "import sys, time; print('started', flush=True); time.sleep(600)"
+        return [sys.executable, "-c", code]
+    if template == "multiline_output":
+        lines = "".join(f"{line}\n" for line in command.get("output_lines") or [])
+        return [sys.executable, "-c", f"import sys; sys.stdout.write({lines!r}); sys.exit({exit_code})"]
+    if template in ("create_executable_script", "create_non_executable_file"):
+        executable = template == "create_executable_script"
+        target = workdir / str(command.get("script_path" if executable else "file_path"))
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+        target.chmod(0o755 if executable else 0o644)
+        return list(command.get("check_args") or [])
+    raise ValueError(f"Unknown args_template: {template}")
+
+
+def snapshot_files(root: Path) -> Dict[str, str]:
+    """List every file below a directory with its content.
+
+    :param root: Directory to walk
+    :returns: Mapping of POSIX relative path to file content (bytes decoded leniently)
+    """
+    files = {}
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = Path(dirpath) / name
+            files[path.relative_to(root).as_posix()] = path.read_bytes().decode("utf-8", "replace")
+    return files
+
+
+def _archive_members(path: Path) -> List[str]:
+    """List member base names of a tar or zip archive.
+
+    :param path: Archive path
+    :returns: Base names of all members
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            return [os.path.basename(name.rstrip("/")) for name in archive.namelist()]
+    with tarfile.open(path) as archive:
+        return [os.path.basename(member.name) for member in archive.getmembers()]
+
+
+def check_expected(
+    expected: Dict[str, object], workdir: Path, env: Dict[str, str], result: Dict[str, object]
+) -> List[str]:
+    """Compare one execution against a vector's ``expected`` object.
+
+    :param expected: The vector's expected conditions
+    :param workdir: Vector working directory
+    :param env: Environment the command ran with (for SAFE_LOG_DIR)
+    :param result: Execution result with exit_code, stdout and stderr, plus
+        files_before (snapshot_files() of workdir before the command ran) and
+        auth_headers (Authorization headers seen by the mock API server)
+    :returns: Human-readable failure messages (empty when everything matched)
+    """
+    failures = []
+    code = result["exit_code"]
+    before = result["files_before"]
+    auth_headers = result["auth_headers"]
+    after = snapshot_files(workdir)
+    log_dir = workdir / env.get("SAFE_LOG_DIR", DEFAULT_LOG_DIR)
+    log_files = sorted(p for p in log_dir.iterdir() if p.is_file()) if log_dir.is_dir() else []
+
+    for key in sorted(set(expected) - SUPPORTED_EXPECTATIONS):
+        failures.append(f"unsupported expectation: {key}")
+    if "exit_code" in expected and code != expected["exit_code"]:
+        failures.append(f"exit code {code}, expected {expected['exit_code']}")
+    if "exit_code_oneOf" in expected and code not in expected["exit_code_oneOf"]:
+        failures.append(f"exit code {code}, expected one of {expected['exit_code_oneOf']}")
+    if "exit_code_range" in expected:
+        low, high = expected["exit_code_range"]
+        if not low <= code <= high:
+            failures.append(f"exit code {code}, expected {low}..{high}")
+    for stream in ("stdout", "stderr"):
+        text = result[stream].lower()
+        for needle in expected.get(f"{stream}_contains") or []:
+            if needle.lower() not in text:
+                failures.append(f"{stream} does not contain {needle!r}")
+    if "artifacts_created" in expected:
+        created = sorted(set(after) - set(before))
+        if bool(created) != expected["artifacts_created"]:
+            failures.append(f"artifacts_created is {bool(created)} (new files: {created[:5]})")
+    for rel in expected.get("file_exists") or []:
+        if not (workdir / rel).exists():
+            failures.append(f"missing file: {rel}")
+    for rel in expected.get("file_not_exists") or []:
+        if (workdir / rel).exists():
+            failures.append(f"unexpected file: {rel}")
+    if "log_file_pattern" in expected:
+        pattern = re.compile(expected["log_file_pattern"])
+        matching = [p for p in log_files if pattern.search(p.name)]
+        if not matching:
+            failures.append(f"no log file matching {expected['log_file_pattern']} in {log_dir.name}")
+        log_files = matching or log_files
+    markers = expected.get("log_content_markers") or []
+    if markers:
+        contents = [p.read_text(encoding="utf-8", errors="replace") for p in log_files]
+        for marker in markers:
+            if not any(marker in content for content in contents):
+                failures.append(f"no log file contains {marker!r}")
+    if "log_file_in_dir" in expected:
+        log_in = workdir / expected["log_file_in_dir"]
+        if not (log_in.is_dir() and any(p.is_file() for p in log_in.iterdir())):
+            failures.append(f"no log file in {expected['log_file_in_dir']}")
+    if "archive_contains" in expected:
+        archive = workdir / (expected.get("file_exists") or [""])[0]
+        try:
+            members = _archive_members(archive)
+        except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+            # OSError: Archive missing; TarError/BadZipFile: not a valid archive
+            failures.append(f"cannot read archive {archive.name}: {e}")
+        else:
+            for name in expected["archive_contains"]:
+                if name not in members:
+                    failures.append(f"archive {archive.name} does not contain {name}")
+    if "original_file_unchanged" in expected:
+        rel = expected["original_file_unchanged"]
+        if after.get(rel) != before.get(rel):
+            failures.append(f"{rel} was modified")
+    if expected.get("file_count_unchanged") and len(after) != len(before):
+        failures.append(f"file count changed from {len(before)} to {len(after)}")
+    if "auth_header_format" in expected:
+        if not auth_headers:
+            failures.append("no API request was made")
+        elif any(header != expected["auth_header_format"] for header in auth_headers):
+            failures.append(f"Authorization headers {sorted(set(auth_headers))} != {expected['auth_header_format']!r}")
+    return failures
+
+
+class _MockApiHandler(BaseHTTPRequestHandler):
+    """Serve a preflight vector's ``mock_responses``."""
+
+    def do_GET(self):  # noqa: N802  # pylint: disable=invalid-name
+        """Answer the rulesets list and ruleset detail endpoints."""
+        server = self.server
+        server.auth_headers.append(self.headers.get("Authorization", ""))
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if re.fullmatch(r"/repos/[^/]+/[^/]+/rulesets", path):
+            key = "rulesets_list"
+        elif re.fullmatch(r"/repos/[^/]+/[^/]+/rulesets/[^/]+", path):
+            key = "ruleset_detail"
+        else:
+            key = None
+        mock = server.mock_responses.get(key) if key else None
+        if mock is None:
+            status, body = 404, {"message": "Not Found"}
+        elif isinstance(mock, dict) and "status" in mock and "body" in mock:
+            status, body = mock["status"], mock["body"]
+        else:
+            status, body = 200, mock
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Silence per-request logging.
+
+        :param format: Log format string
+        :param args: Log arguments
+        """
+
+
+def _path_without(command: str) -> str:
+    """Drop PATH entries that contain a command.
+
+    :param command: Executable name (e.g. "gh")
+    :returns: PATH value without those entries
+    """
+    entries = os.environ.get("PATH", "").split(os.pathsep)
+    return os.pathsep.join(p for p in entries if p and not os.access(os.path.join(p, command), os.X_OK))
+
+
+def _run_command(argv: List[str], workdir: Path, env: Dict[str, str], command: Dict[str, object], timeout: float):
+    """Execute a command, signalling it first when the vector asks for that.
+
+    :param argv: Full command line
+    :param workdir: Working directory
+    :param env: Environment
+    :param command: The vector's command object (interrupt_signal, stdin)
+    :param timeout: Seconds before the command is killed
+    :returns: Dict with exit_code, stdout and stderr
+    :raises subprocess.TimeoutExpired: If the command outlives the timeout
+    """
+    proc = subprocess.Popen(
+        argv,
+        cwd=workdir,
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stdin = str(command.get("stdin", "")).encode()
+    sig_name = command.get("interrupt_signal")
+    if sig_name:
+        time.sleep(SIGNAL_DELAY_SECONDS)
+        proc.send_signal(getattr(signal, f"SIG{sig_name}"))
+    try:
+        stdout, stderr = proc.communicate(stdin, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        raise
+    # A child killed by a signal reports -N; shells and safe-run report 128+N
+    code = proc.returncode if proc.returncode >= 0 else 128 - proc.returncode
+    return {
+        "exit_code": code,
+        "stdout": stdout.decode("utf-8", "replace"),
+        "stderr": stderr.decode("utf-8", "replace"),
+    }
+
+
+def target_command(category: str, binary: str | None) -> List[str]:
+    """Build the command prefix that executes a category's vectors.
+
+    :param category: Vector category (e.g. "safe_run")
+    :param binary: Canonical safe-run binary, if one was found
+    :returns: Command prefix
+    :raises LookupError: If the category has no target or needs the missing binary
+    """
+    if category == "preflight_automerge_ruleset":
+        return [sys.executable, str(SCRIPTS_DIR / "preflight_automerge_ruleset.py")]
+    subcommands = {"safe_archive": "archive", "safe_check": "check"}
+    if category != "safe_run" and category not in subcommands:
+        raise LookupError(f"no Python target for category {category}")
+    if not binary:
+        # safe_run.py only execs the binary, so without it every vector would fail with 127
+        raise LookupError("safe-run binary not found (build rust/ or set SAFE_RUN_BIN)")
+    if category == "safe_run":
+        return [sys.executable, str(SCRIPTS_DIR / "safe_run.py")]
+    return [binary, subcommands[category]]
+
+
+def _platform_skipped(command: Dict[str, object]) -> bool:
+    """Check a vector's platform_filter against this host.
+
+    :param command: The vector's command object
+    :returns: True if the vector does not apply here
+    """
+    wanted = command.get("platform_filter")
+    return (wanted == "unix" and os.name != "posix") or (wanted == "windows" and os.name != "nt")
+
+
+def _run_variant(
+    category: str,
+    vector: Dict[str, object],
+    variant: Tuple[Dict[str, object], Dict[str, object]],
+    *,
+    binary: str | None,
+    timeout: float,
+) -> List[str]:
+    """Execute one command of a vector in a fresh temporary directory.
+
+    :param category: Vector category
+    :param vector: The whole vector (setup, mock_responses)
+    :param variant: Command object to execute and its expected conditions
+    :param binary: Canonical safe-run binary, if one was found
+    :param timeout: Per-command timeout in seconds
+    :returns: Failure messages
+    :raises LookupError: If the category cannot be executed here
+    :raises ValueError: If the vector uses an unknown template
+    :raises subprocess.TimeoutExpired: If the command outlives the timeout
+    """
+    command, expected = variant
+    prefix = target_command(category, binary)
+    with tempfile.TemporaryDirectory(prefix="conformance-") as td:
+        workdir = Path(td) / "work"
+        private = Path(td) / "private"
+        workdir.mkdir()
+        private.mkdir()
+        for rel in (vector.get("setup") or {}).get("create_files") or []:
+            path = workdir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(SETUP_FILE_CONTENT, encoding="utf-8")
+        argv = prefix + expand_template(command, workdir)
+
+        env = {k: v for k, v in os.environ.items() if k not in ISOLATED_ENV_VARS}
+        env["XDG_CACHE_HOME"] = str(private)
+        if binary:
+            env["SAFE_RUN_BIN"] = binary
+        server = None
+        if "mock_responses" in vector:
+            server = ThreadingHTTPServer(("127.0.0.1", 0), _MockApiHandler)
+            server.mock_responses = vector["mock_responses"]
+            server.auth_headers = []
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            env["GITHUB_API_URL"] = f"http://127.0.0.1:{server.server_address[1]}"
+            env["PREFLIGHT_CACHE_DIR"] = str(private / "preflight")
+            env["PATH"] = _path_without("gh")
+        env.update({k: str(v) for k, v in (command.get("env") or {}).items()})
+
+        before = snapshot_files(workdir)
+        try:
+            result = _run_command(argv, workdir, env, command, timeout)
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+        result["files_before"] = before
+        result["auth_headers"] = server.auth_headers if server is not None else []
+        return check_expected(expected, workdir, env, result)
+
+
+def run_vector(category: str, vector: Dict[str, object], binary: str | None, timeout: float) -> Dict[str, object]:
+    """Execute one vector, including all of its command variants.
+
+    :param category: Vector category
+    :param vector: Vector object from vectors.json
+    :param binary: Canonical safe-run binary, if one was found
+    :param timeout: Per-command timeout in seconds
+    :returns: Result dict with id, category, status, failures and duration_ms
+    """
+    start = time.perf_counter()
+    result: Dict[str, object] = {"id": vector.get("id"), "category": category, "failures": []}
+    expected = vector.get("expected") or {}
+    variants = vector.get("command_variants")
+    if variants:
+        commands = [
+            (dict(variant, env=variant.get("env") or {}), dict(expected, file_exists=[variant["expected_file"]]))
+            for variant in variants
+        ]
+    else:
+        commands = [(vector.get("command") or {}, expected)]
+
+    if all(_platform_skipped(command) for command, _ in commands):
+        result["status"] = STATUS_SKIP
+        result["failures"] = [f"platform_filter={commands[0][0].get('platform_filter')}"]
+    else:
+        try:
+            for index, variant in enumerate(commands):
+                if _platform_skipped(variant[0]):
+                    continue
+                failures = _run_variant(category, vector, variant, binary=binary, timeout=timeout)
+                label = f"variant {index + 1}: " if len(commands) > 1 else ""
+                result["failures"].extend(label + failure for failure in failures)
+            result["status"] = STATUS_FAIL if result["failures"] else STATUS_PASS
+        except (LookupError, ValueError, OSError, subprocess.TimeoutExpired) as e:
+            # LookupError: No target for the category (e.g. binary not built)
+            # ValueError: Unknown args_template
+            # OSError: Setup or execution failed
+            # subprocess.TimeoutExpired: Command hung
+            result["status"] = STATUS_ERROR
+            result["failures"].append(f"{type(e).__name__}: {e}")
+    result["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+def run(
+    vectors: List[Tuple[str, Dict[str, object]]], jobs: int, timeout: float, binary: str | None
+) -> Dict[str, object]:
+    """Execute vectors, in a process pool when jobs > 1.
+
+    :param vectors: (category, vector) pairs from load_vectors()
+    :param jobs: Worker processes (1 runs in-process)
+    :param timeout: Per-command timeout in seconds
+    :param binary: Canonical safe-run binary, if one was found
+    :returns: Report dict with results (in vector order), summary and duration_ms
+    """
+    start = time.perf_counter()
+    if jobs > 1 and len(vectors) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(vectors))) as pool:
+            futures = [pool.submit(run_vector, category, vector, binary, timeout) for category, vector in vectors]
+            results = [future.result() for future in futures]
+    else:
+        results = [run_vector(category, vector, binary, timeout) for category, vector in vectors]
+    summary = {"total": len(results)}
+    for status in (STATUS_PASS, STATUS_FAIL, STATUS_SKIP, STATUS_ERROR):
+        summary[status] = sum(1 for r in results if r["status"] == status)
+    return {
+        "binary": binary,
+        "results": results,
+        "summary": summary,
+        "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+
+
+def print_report(report: Dict[str, object]) -> None:
+    """Print a human-readable report.
+
+    :param report: Report from run()
+    """
+    for r in report["results"]:
+        print(f"{r['status'].upper():<5} {r['id']:<20} {r['duration_ms']:>9.1f} ms")
+        for failure in r["failures"]:
+            print(f"      - {failure}")
+    s = report["summary"]
+    print(
+        f"\n{s['total']} vectors: {s['pass']} passed, {s['fail']} failed, "
+        f"{s['error']} errors, {s['skip']} skipped in {report['duration_ms']:.1f} ms"
+    )
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Parse arguments, run the selected vectors and print the report.
+
+    :param argv: Command-line arguments (default: sys.argv[1:])
+    :returns: Exit code (0=all passed, 1=failures, 2=usage error)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vectors", type=Path, default=VECTORS_DEFAULT)
+    parser.add_argument("--category", action="append", default=[])
+    parser.add_argument("--id", dest="ids", action="append", default=[])
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--timeout", type=float, default=TIMEOUT_DEFAULT)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    if args.jobs < 1 or args.timeout <= 0:
+        parser.error("--jobs and --timeout must be positive")
+
+    try:
+        vectors = load_vectors(args.vectors)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    unknown = sorted(set(args.category) - {c for c, _ in vectors}) + sorted(
+        set(args.ids) - {v.get("id") for _, v in vectors}
+    )
+    if unknown:
+        print(f"ERROR: unknown category or vector ID: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    vectors = [
+        (c, v)
+        for c, v in vectors
+        if (not args.category or c in args.category) and (not args.ids or v.get("id") in args.ids)
+    ]
+
+    report = run(vectors, args.jobs, args.timeout, find_safe_run_binary())
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    s = report["summary"]
+    return 1 if s["fail"] or s["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,6 +29,16 @@ GITHUB_TOKEN : str, optional
     Alternative to TOKEN, same purpose
     Checked as fallback if TOKEN is not set
 
+GITHUB_API_URL : str, optional
+    API base URL (default: https://api.github.com; set by GitHub Actions,
+    and points at the server's API on GitHub Enterprise Server)
+
+PREFLIGHT_CACHE_DIR : str, optional
+    HTTP cache directory (default: ${XDG_CACHE_HOME:-~/.cache}/agent-ops-preflight)
+
+PREFLIGHT_CACHE_TTL : float, optional
+    Default for --cache-ttl (default: 0)
+
 :GitHub API Requirements:
 The token must have the following scopes/permissions:
 - Repository: Read access to administration (for rulesets)
@@ -42,6 +52,10 @@ The token must have the following scopes/permissions:
         --want '["context1", "context2"]' \
         [--api-version VERSION]
 
+    python3 preflight-automerge-ruleset.py \
+        {--repos-file PATH | --repo OWNER/REPO --repo OWNER/REPO ...} \
+        [--jobs N] [--ruleset-id ID | --ruleset-name NAME] --want JSON_ARRAY
+
 Required Arguments:
     --repo OWNER/REPO
         GitHub repository in owner/name format
@@ -58,6 +72,53 @@ Ruleset Selection (one required):
 Optional Arguments:
     --api-version VERSION
         GitHub API version (default: 2022-11-28)
+    --no-cache
+        Do not read or write the HTTP response cache
+    --cache-ttl SECONDS
+        Serve cached responses younger than SECONDS without any request
+        (default: PREFLIGHT_CACHE_TTL or 0 = always revalidate)
+
+Batch Arguments:
+    --repos-file PATH
+        File with one OWNER/REPO per line ('#' comments allowed; "-" = stdin)
+    --repo OWNER/REPO (repeated)
+        Giving --repo more than once also selects batch mode
+    --jobs N
+        Concurrent workers in batch mode (default: 8)
+
+:Batch Mode:
+For org-wide audits, batch mode verifies many repositories with one
+process instead of a shell loop. A bounded pool of worker threads shares
+a GitHubClient; each worker keeps one persistent http.client connection,
+so TLS handshakes are paid once per worker rather than once per request.
+The rulesets list follows Link pagination (per_page=100). Rate limits are
+honored: a 403/429 with Retry-After or an exhausted X-RateLimit-Remaining
+is retried after the advertised wait, and the wait pauses every worker.
+Batch mode always calls the API directly; without TOKEN/GITHUB_TOKEN it
+uses the token from ``gh auth token``. Responses go through the HTTP cache.
+
+stdout receives one JSON report with a result per repository::
+
+    {"results": [{"repo": "o/r", "status": 0, "result": "pass",
+                  "ruleset_id": "12345", "reason": "...", "got": [...],
+                  "missing": [], "elapsed_ms": 84.2}, ...],
+     "summary": {"total": 1, "pass": 1, "fail": 0, "auth_error": 0, "usage_error": 0}}
+
+The exit code is 0 when every repository passed, otherwise the highest
+per-repository code.
+
+:HTTP Cache:
+Merge bots run this check on every PR event, so token-based (urllib)
+requests go through an on-disk cache keyed by URL, API version and a
+SHA-256 fingerprint of the token. Each entry keeps the response body with
+its ETag/Last-Modified validators; the next request sends If-None-Match /
+If-Modified-Since and a 304 is answered from the cache. Authorized 304
+responses do not count against GitHub's rate limit. With --cache-ttl N,
+entries younger than N seconds skip the request entirely. The default TTL
+is 0 because a ruleset change must never be masked by a stale entry.
+
+When the 'gh' CLI is used, conditional requests are not available; a
+positive TTL is passed through as ``gh api --cache <N>s`` instead.
 
 :Exit Codes:
 0
@@ -71,6 +132,9 @@ Optional Arguments:
 3
     Usage error: invalid arguments, malformed JSON, ruleset not found
 
+In batch mode: 0 if every repository passed, otherwise the highest
+per-repository exit code.
+
 :Verification Logic:
 1. Fetch all rulesets for the repository
 2. If --ruleset-name provided, resolve to ruleset ID
@@ -88,6 +152,11 @@ Verify by ruleset name::
         --ruleset-name "Main - PR Only + Green CI" \
         --want '["lint", "test"]'
 
+Reuse cached rulesets for up to 5 minutes (merge bot on busy repos)::
+
+    python3 preflight-automerge-ruleset.py --repo owner/repo --ruleset-id 999 \
+        --want '["lint"]' --cache-ttl 300
+
 Verify by ruleset ID::
 
     python3 preflight-automerge-ruleset.py \
@@ -95,6 +164,11 @@ Verify by ruleset ID::
         --ruleset-id 12345 \
         --want '["build", "security-scan"]'
 
+Audit many repositories, 16 at a time::
+
+    python3 preflight-automerge-ruleset.py --repos-file repos.txt --jobs 16 \
+        --ruleset-name "CI" --want '["lint", "test"]' > audit.json
+
 Using with 'gh' CLI (recommended)::
 
     gh auth login  # Authenticate once
@@ -112,31 +186,39 @@ Using with TOKEN environment variable::
 - User-Agent header identifies the tool for GitHub API analytics
 
 :Side Effects:
-- Makes HTTP GET requests to api.github.com
+- Makes HTTP GET requests to api.github.com (or GITHUB_API_URL)
 - May invoke 'gh api' command if 'gh' CLI is available
 - Prints INFO, WARN, and ERROR messages to stderr
-- No filesystem modifications
+- Writes response cache files (mode 0600) to the HTTP cache directory unless
+  --no-cache is given
 
 :Contract References:
 - **M0-P2-I1**: Bearer token authentication format for GitHub API
 
 :See Also:
+- scripts/python3/preflight_batch.py: HTTP cache, keep-alive client and batch runner
 - GitHub Rulesets API: https://docs.github.com/en/rest/repos/rules
 - GitHub API Authentication: https://docs.github.com/en/rest/authentication
 """
 
 from __future__ import annotations
 
+import functools
+import http.client
 import json
 import os
 import re
 import subprocess
 import sys
-from typing import List, Tuple
+import time
+from typing import Dict, List, Tuple
 from urllib.error import HTTPError
 from urllib.request import Request, urlopen
 
+from preflight_batch import PER_PAGE, RESULT_NAMES, GitHubClient, HttpCache, parse_batch_args, run_batch
+
 API_VERSION_DEFAULT = "2022-11-28"
+API_BASE_DEFAULT = "https://api.github.com"
 
 
 def eprint(*args: object) -> None:
@@ -164,6 +246,10 @@ def usage() -> int:
         "  scripts/python3/preflight-automerge-ruleset.py --repo OWNER/REPO "
         '[--ruleset-id ID | --ruleset-name NAME] --want \'["lint","test"]\''
     )
+    eprint(
+        "  scripts/python3/preflight-automerge-ruleset.py {--repos-file PATH | --repo OWNER/REPO ...} "
+        "[--jobs N] [--ruleset-id ID | --ruleset-name NAME] --want JSON"
+    )
     return 3
 
 
@@ -225,11 +311,13 @@ def classify_auth(obj: object) -> bool:
     )
 
 
-def gh_api(endpoint: str, api_version: str) -> str | None:
+def gh_api(endpoint: str, api_version: str, cache_ttl: float = 0.0) -> str | None:
     """Call GitHub API using the 'gh' CLI tool.
 
     :param endpoint: API endpoint path (e.g., "repos/owner/repo/rulesets")
     :param api_version: GitHub API version (e.g., "2022-11-28")
+    :param cache_ttl: If positive, let gh serve responses younger than this
+        many seconds from its own cache (``gh api --cache``)
     :returns: Response body as string, or None on failure
 
     Uses 'gh api' command with appropriate headers:
@@ -248,6 +336,7 @@ def gh_api(endpoint: str, api_version: str) -> str | None:
     >>> if response:
     ...     data = json.loads(response)
     """
+    cache_args = ["--cache", f"{int(cache_ttl)}s"] if cache_ttl >= 1 else []
     try:
         out = subprocess.check_output(
             [
@@ -257,6 +346,7 @@ def gh_api(endpoint: str, api_version: str) -> str | None:
                 "Accept: application/vnd.github+json",
                 "-H",
                 f"X-GitHub-Api-Version: {api_version}",
+                *cache_args,
                 endpoint,
             ]
         )
@@ -268,6 +358,31 @@ def gh_api(endpoint: str, api_version: str) -> str | None:
         return None
 
 
+# Cache used by http_get(); configured by main(), None disables caching
+_HTTP_CACHE: HttpCache | None = None
+
+
+def default_cache_dir() -> str:
+    """Locate the HTTP cache directory.
+
+    :returns: PREFLIGHT_CACHE_DIR, or ${XDG_CACHE_HOME:-~/.cache}/agent-ops-preflight
+    """
+    override = os.environ.get("PREFLIGHT_CACHE_DIR")
+    if override:
+        return override
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "agent-ops-preflight")
+
+
+def set_http_cache(cache: HttpCache | None) -> None:
+    """Configure the cache used by http_get().
+
+    :param cache: HttpCache instance, or None to disable caching
+    """
+    global _HTTP_CACHE  # pylint: disable=global-statement
+    _HTTP_CACHE = cache
+
+
 def http_get(url: str, api_version: str) -> Tuple[int, str]:
     """Perform HTTP GET request to GitHub API with M0-P2-I1 Bearer token auth.
 
@@ -291,6 +406,14 @@ def http_get(url: str, api_version: str) -> Tuple[int, str]:
     This replaces the deprecated "token <token>" format. The token is
     read from TOKEN or GITHUB_TOKEN environment variables.
 
+    Caching
+    -------
+    When main() has configured an HttpCache (see set_http_cache()):
+    - A cached entry younger than the TTL is returned as (200, body) without a request
+    - Otherwise the request carries If-None-Match / If-Modified-Since from the entry,
+      and a 304 response is returned as (200, cached body)
+    - 200 responses with an ETag or Last-Modified header are stored
+
     Error Handling
     --------------
     - Returns (status_code, body) for both success and HTTP errors
@@ -314,21 +437,81 @@ def http_get(url: str, api_version: str) -> Tuple[int, str]:
     token = os.environ.get("TOKEN") or os.environ.get("GITHUB_TOKEN") or ""
     if not token:
         raise RuntimeError("No auth available: set TOKEN/GITHUB_TOKEN or authenticate with gh")
+    cache = _HTTP_CACHE
+    entry = None
+    if cache is not None:
+        entry = cache.lookup(url, api_version, token)
+        if entry is not None and cache.is_fresh(entry):
+            return 200, entry["body"]
+
     req = Request(url)
     req.add_header("Accept", "application/vnd.github+json")
     # M0-P2-I1: Use Bearer token format
     req.add_header("Authorization", f"Bearer {token}")
     req.add_header("X-GitHub-Api-Version", api_version)
     req.add_header("User-Agent", "agent-ops-preflight")
+    if entry is not None:
+        if entry.get("etag"):
+            req.add_header("If-None-Match", entry["etag"])
+        if entry.get("last_modified"):
+            req.add_header("If-Modified-Since", entry["last_modified"])
     try:
         with urlopen(req) as resp:
             body = resp.read().decode("utf-8", "replace")
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if cache is not None and resp.status == 200 and (etag or last_modified):
+                cache.store(url, api_version, token, {"body": body, "etag": etag, "last_modified": last_modified})
             return resp.status, body
     except HTTPError as e:
+        if e.code == 304 and cache is not None and entry is not None:
+            # Not modified: refresh the entry's age and serve the cached body
+            cache.store(url, api_version, token, entry)
+            return 200, entry["body"]
         body = e.read().decode("utf-8", "replace")
         return e.code, body
 
 
+def parse_cache_args(argv: List[str]) -> Tuple[List[str], bool, float]:
+    """Split the HTTP cache options off the command line.
+
+    :param argv: Command-line arguments (sys.argv[1:])
+    :returns: Tuple of (remaining arguments, no_cache, ttl_seconds)
+    :raises ValueError: If --cache-ttl (or PREFLIGHT_CACHE_TTL) is not a non-negative number
+
+    Options
+    -------
+    --no-cache
+        Neither read nor write the HTTP cache
+    --cache-ttl SECONDS
+        Serve cached responses younger than SECONDS without revalidation
+        (default: PREFLIGHT_CACHE_TTL or 0, i.e. always revalidate)
+    """
+    rest = []
+    no_cache = False
+    ttl_raw = os.environ.get("PREFLIGHT_CACHE_TTL", "0")
+    i = 0
+    while i < len(argv):
+        a = argv[i]
+        if a == "--no-cache":
+            no_cache = True
+            i += 1
+            continue
+        if a == "--cache-ttl":
+            ttl_raw = argv[i + 1]
+            i += 2
+            continue
+        rest.append(a)
+        i += 1
+    try:
+        ttl = float(ttl_raw)
+    except ValueError:
+        ttl = -1.0
+    if ttl < 0:
+        raise ValueError(f"--cache-ttl must be a non-negative number of seconds: {ttl_raw}")
+    return rest, no_cache, ttl
+
+
 def parse_args(
     argv: List[str],
 ) -> Tuple[str, str | None, str | None, str, str] | None:
@@ -413,6 +596,135 @@ def parse_args(
     return repo, ruleset_id, ruleset_name, want, api_version
 
 
+def evaluate_ruleset(rs_obj: object, want: List[str]) -> Dict[str, object]:
+    """Check a ruleset's configuration against the required contexts.
+
+    :param rs_obj: Decoded ruleset detail (GET /repos/{repo}/rulesets/{id})
+    :param want: Required status check contexts
+    :returns: Dict with status (exit code 0 or 1), reason, got and missing
+
+    Checks, in order: enforcement is "active", conditions include
+    "~DEFAULT_BRANCH", and every wanted context is a required status check.
+    """
+    verdict: Dict[str, object] = {"status": 1, "reason": "", "got": [], "missing": []}
+    if not isinstance(rs_obj, dict):
+        verdict["reason"] = "Unexpected ruleset response"
+        return verdict
+    if rs_obj.get("enforcement") != "active":
+        verdict["reason"] = f"Ruleset enforcement is not active (enforcement={rs_obj.get('enforcement')})"
+        return verdict
+
+    includes = ((rs_obj.get("conditions") or {}).get("ref_name") or {}).get("include") or []
+    if "~DEFAULT_BRANCH" not in includes:
+        verdict["reason"] = "Ruleset does not target ~DEFAULT_BRANCH"
+        return verdict
+
+    got = set()
+    for rule in rs_obj.get("rules") or []:
+        if isinstance(rule, dict) and rule.get("type") == "required_status_checks":
+            params = rule.get("parameters") or {}
+            for item in params.get("required_status_checks") or []:
+                if isinstance(item, dict):
+                    ctx = item.get("context") or ""
+                    if ctx:
+                        got.add(ctx)
+
+    verdict["got"] = sorted(got)
+    verdict["missing"] = [x for x in want if x not in got]
+    if verdict["missing"]:
+        verdict["reason"] = "Ruleset missing required status check contexts"
+        return verdict
+    verdict["status"] = 0
+    verdict["reason"] = "PRECHECK_OK: ruleset enforces required CI contexts on default branch; auto-merge flow is safe."
+    return verdict
+
+
+def _api_error(status: int, obj: object, what: str) -> Dict[str, object]:
+    """Build the batch result fields for a failed API call.
+
+    :param status: HTTP status code
+    :param obj: Decoded error body
+    :param what: What was being fetched (for the reason text)
+    :returns: Dict with status (2 for auth errors, else 1) and reason
+    """
+    if classify_auth(obj):
+        return {"status": 2, "reason": f"Auth/permission error while fetching {what} (HTTP {status})"}
+    return {"status": 1, "reason": f"Unexpected API error while fetching {what} (HTTP {status})"}
+
+
+def verify_repo(
+    client: GitHubClient,
+    repo: str,
+    ruleset_id: str | None,
+    ruleset_name: str | None,
+    want: List[str],
+) -> Dict[str, object]:
+    """Verify one repository's ruleset for batch mode.
+
+    :param client: Shared GitHubClient
+    :param repo: Repository in OWNER/REPO format
+    :param ruleset_id: Ruleset ID, or None to resolve ruleset_name
+    :param ruleset_name: Ruleset name (used when ruleset_id is None)
+    :param want: Required status check contexts
+    :returns: Result dict (repo, status, result, ruleset_id, reason, got,
+        missing, elapsed_ms); status uses the single-repo exit codes
+    """
+    start = time.perf_counter()
+    result: Dict[str, object] = {"repo": repo, "ruleset_id": ruleset_id, "got": [], "missing": []}
+    try:
+        if not ruleset_id:
+            status, rulesets = client.get_all(f"/repos/{repo}/rulesets?per_page={PER_PAGE}")
+            if status >= 400:
+                result.update(_api_error(status, rulesets, "rulesets"))
+            else:
+                found = next(
+                    (rs.get("id") for rs in rulesets if isinstance(rs, dict) and rs.get("name") == ruleset_name),
+                    None,
+                )
+                if found:
+                    result["ruleset_id"] = str(found)
+                else:
+                    result.update(status=3, reason=f"Ruleset not found by name: {ruleset_name}")
+        if "status" not in result:
+            status, body, _ = client.get(f"/repos/{repo}/rulesets/{result['ruleset_id']}")
+            try:
+                obj = json.loads(body) if body else {}
+            except json.JSONDecodeError:
+                # json.JSONDecodeError: Invalid JSON response
+                obj = {}
+            if status >= 400:
+                result.update(_api_error(status, obj, "ruleset"))
+            else:
+                result.update(evaluate_ruleset(obj, want))
+    except (OSError, http.client.HTTPException) as e:
+        # OSError: Network/socket errors (including timeouts)
+        # http.client.HTTPException: Protocol errors after the reconnect retry
+        result.update(status=2, reason=f"Request failed: {type(e).__name__}")
+    result["result"] = RESULT_NAMES[result["status"]]
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+def resolve_token() -> str:
+    """Find a token for batch mode.
+
+    :returns: TOKEN/GITHUB_TOKEN, else the output of ``gh auth token``, else ""
+
+    Batch mode talks to the API directly instead of spawning 'gh api' per
+    request, so it borrows gh's credentials when no token is exported.
+    """
+    token = os.environ.get("TOKEN") or os.environ.get("GITHUB_TOKEN") or ""
+    if token or not have_cmd("gh"):
+        return token
+    try:
+        out = subprocess.run(["gh", "auth", "token"], capture_output=True, check=True)
+    except (subprocess.CalledProcessError, OSError):
+        # subprocess.CalledProcessError: gh is not logged in
+        # OSError: gh could not be executed
+        return ""
+    return out.stdout.decode("utf-8", "replace").strip()
+
+
 def main(argv: List[str]) -> int:
     """Execute GitHub Ruleset verification workflow.
 
@@ -440,6 +752,9 @@ def main(argv: List[str]) -> int:
     1. GET /repos/{repo}/rulesets (list all rulesets)
     2. GET /repos/{repo}/rulesets/{id} (get ruleset details)
 
+    With --repos-file or several --repo options, run_batch() verifies every
+    repository over keep-alive connections instead (see GitHubClient).
+
     Exit Codes
     ----------
     0
@@ -478,6 +793,11 @@ def main(argv: List[str]) -> int:
     1
     """
     try:
+        argv, no_cache, cache_ttl = parse_cache_args(argv)
+        argv, batch_repos, jobs = parse_batch_args(argv)
+        if batch_repos is not None:
+            # Validate the shared options with the single-repo parser
+            argv = argv + ["--repo", batch_repos[0]]
         parsed = parse_args(argv)
     except (ValueError, IndexError) as e:
         # ValueError: Invalid argument values
@@ -498,10 +818,28 @@ def main(argv: List[str]) -> int:
         eprint("ERROR: --want must be a JSON array of strings")
         return 3
 
+    set_http_cache(None if no_cache else HttpCache(default_cache_dir(), cache_ttl))
+    gh_cache_ttl = 0.0 if no_cache else cache_ttl
+    api_base = os.environ.get("GITHUB_API_URL", API_BASE_DEFAULT).rstrip("/")
+
+    if batch_repos is not None:
+        token = resolve_token()
+        if not token:
+            eprint("ERROR: Batch mode needs TOKEN/GITHUB_TOKEN or an authenticated gh CLI")
+            return 2
+        try:
+            client = GitHubClient(api_base, token, api_version, cache=_HTTP_CACHE)
+        except ValueError as e:
+            # ValueError: GITHUB_API_URL is not an http(s) URL
+            eprint(f"ERROR: {e}")
+            return 3
+        verify = functools.partial(verify_repo, client, ruleset_id=ruleset_id, ruleset_name=ruleset_name, want=want)
+        return run_batch(client, batch_repos, verify, jobs=jobs)
+
     # fetch rulesets list
     rulesets_obj = None
     if have_cmd("gh"):
-        raw = gh_api(f"repos/{repo}/rulesets", api_version)
+        raw = gh_api(f"repos/{repo}/rulesets", api_version, gh_cache_ttl)
         if raw is None:
             eprint("WARN: Failed to call gh api")
             return 2
@@ -513,7 +851,7 @@ def main(argv: List[str]) -> int:
             return 2
     else:
         try:
-            status, body = http_get(f"https://api.github.com/repos/{repo}/rulesets", api_version)
+            status, body = http_get(f"{api_base}/repos/{repo}/rulesets", api_version)
         except (OSError, RuntimeError):
             # OSError: Network/socket errors
             # RuntimeError: Missing auth token
@@ -547,7 +885,7 @@ def main(argv: List[str]) -> int:
     # fetch ruleset details
     rs_obj = None
     if have_cmd("gh"):
-        raw = gh_api(f"repos/{repo}/rulesets/{ruleset_id}", api_version)
+        raw = gh_api(f"repos/{repo}/rulesets/{ruleset_id}", api_version, gh_cache_ttl)
         if raw is None:
             eprint("WARN: Failed to call gh api")
             return 2
@@ -560,7 +898,7 @@ def main(argv: List[str]) -> int:
     else:
         try:
             status, body = http_get(
-                f"https://api.github.com/repos/{repo}/rulesets/{ruleset_id}",
+                f"{api_base}/repos/{repo}/rulesets/{ruleset_id}",
                 api_version,
             )
         except (OSError, RuntimeError):
@@ -582,33 +920,15 @@ def main(argv: List[str]) -> int:
             return 1
         rs_obj = obj
 
-    if rs_obj.get("enforcement") != "active":
-        eprint(f"WARN: Ruleset enforcement is not active (enforcement={rs_obj.get('enforcement')})")
-        return 1
-
-    includes = ((rs_obj.get("conditions") or {}).get("ref_name") or {}).get("include") or []
-    if "~DEFAULT_BRANCH" not in includes:
-        eprint("WARN: Ruleset does not target ~DEFAULT_BRANCH")
-        return 1
-
-    got = set()
-    for rule in rs_obj.get("rules") or []:
-        if isinstance(rule, dict) and rule.get("type") == "required_status_checks":
-            params = rule.get("parameters") or {}
-            for item in params.get("required_status_checks") or []:
-                if isinstance(item, dict):
-                    ctx = item.get("context") or ""
-                    if ctx:
-                        got.add(ctx)
-
-    missing = [x for x in want if x not in got]
-    if missing:
-        eprint("WARN: Ruleset missing required status check contexts")
-        eprint(f"INFO: want: {json.dumps(want)}")
-        eprint(f"INFO: got : {json.dumps(sorted(got))}")
-        return 1
+    verdict = evaluate_ruleset(rs_obj, want)
+    if verdict["status"] != 0:
+        eprint(f"WARN: {verdict['reason']}")
+        if verdict["missing"]:
+            eprint(f"INFO: want: {json.dumps(want)}")
+            eprint(f"INFO: got : {json.dumps(verdict['got'])}")
+        return verdict["status"]
 
-    eprint("INFO: PRECHECK_OK: ruleset enforces required CI contexts on default branch; auto-merge flow is safe.")
+    eprint(f"INFO: {verdict['reason']}")
     return 0
 
 
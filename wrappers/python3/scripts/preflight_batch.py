@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""Batch-mode HTTP client and runner for preflight_automerge_ruleset.py.
+
+:Purpose:
+Holds the HTTP side of preflight_automerge_ruleset.py so the verification
+script stays focused on rulesets: the on-disk response cache shared with
+single-repo mode, the keep-alive GitHubClient used by batch mode, the batch
+argument parsing and the thread pool that verifies every repository.
+
+:Batch Mode:
+A bounded pool of worker threads shares one GitHubClient; each worker keeps
+one persistent http.client connection, so TLS handshakes are paid once per
+worker rather than once per request. Rate limits are honored (Retry-After and
+X-RateLimit-Reset), and a wait triggered by any worker pauses all of them.
+
+:Environment Variables:
+None. preflight_automerge_ruleset.py resolves the token, API URL and cache
+directory and passes them in.
+
+:Examples:
+Verify two repositories with four workers::
+
+    client = GitHubClient("https://api.github.com", token, "2022-11-28")
+    run_batch(client, ["org/a", "org/b"], verify, jobs=4)
+
+:Exit Codes:
+N/A - This is a library module imported by preflight_automerge_ruleset.py
+
+:See Also:
+- scripts/python3/preflight_automerge_ruleset.py: Command-line entry point
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+# Batch mode: worker threads, page size for list endpoints, rate-limit retries
+BATCH_JOBS_DEFAULT = 8
+PER_PAGE = 100
+MAX_RETRIES = 3
+MAX_BACKOFF_SECONDS = 300.0
+REQUEST_TIMEOUT_SECONDS = 30.0
+RESULT_NAMES = {0: "pass", 1: "fail", 2: "auth_error", 3: "usage_error"}
+_REPO_RE = re.compile(r"^[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+$")
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
+
+def eprint(*args: object) -> None:
+    """Print to stderr for status messages.
+
+    :param args: Variable arguments to print (passed to print())
+    """
+    print(*args, file=sys.stderr)
+
+
+class HttpCache:
+    """On-disk cache of GitHub API GET responses for conditional requests.
+
+    One JSON file per (URL, API version, credential) holds the response body
+    with its ETag and Last-Modified validators. Entries younger than ``ttl``
+    seconds are served without any request; older ones are revalidated with
+    If-None-Match/If-Modified-Since, and a 304 answer is served from the cache
+    (GitHub does not count authorized 304s against the rate limit).
+
+    The credential is part of the key (as a SHA-256 fingerprint, never the
+    token itself), so a token without access is never answered from another
+    token's entry.
+    """
+
+    def __init__(self, directory: str, ttl: float = 0.0):
+        """Configure the cache.
+
+        :param directory: Cache directory (created on first store)
+        :param ttl: Seconds during which an entry is served without revalidation
+        """
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, url: str, api_version: str, token: str) -> str:
+        """Map a request to its cache file.
+
+        :param url: Request URL
+        :param api_version: GitHub API version header value
+        :param token: Credential used for the request
+        :returns: Cache file path
+        """
+        fingerprint = hashlib.sha256(token.encode()).hexdigest()
+        key = hashlib.sha256(f"{url}\n{api_version}\n{fingerprint}".encode()).hexdigest()
+        return os.path.join(self.directory, key + ".json")
+
+    def lookup(self, url: str, api_version: str, token: str) -> Dict[str, object] | None:
+        """Load a cached response.
+
+        :param url: Request URL
+        :param api_version: GitHub API version header value
+        :param token: Credential used for the request
+        :returns: Entry dict (body, etag, last_modified, stored_at) or None
+        """
+        try:
+            with open(self._path(url, api_version, token), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            # OSError: No entry yet / unreadable; ValueError: corrupt JSON
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get("body"), str):
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict[str, object]) -> bool:
+        """Check whether an entry may be served without revalidation.
+
+        :param entry: Entry returned by lookup()
+        :returns: True if the entry is younger than the TTL
+        """
+        stored_at = entry.get("stored_at")
+        return self.ttl > 0 and isinstance(stored_at, (int, float)) and time.time() - stored_at < self.ttl
+
+    def store(self, url: str, api_version: str, token: str, entry: Dict[str, object]) -> None:
+        """Write an entry atomically with owner-only permissions.
+
+        Failures are ignored: the cache is an optimization only.
+
+        :param url: Request URL
+        :param api_version: GitHub API version header value
+        :param token: Credential used for the request
+        :param entry: Entry with body, etag and last_modified
+        """
+        path = self._path(url, api_version, token)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        entry = dict(entry, url=url, api_version=api_version, stored_at=time.time())
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def parse_next_link(link_header: str | None) -> str | None:
+    """Extract the rel="next" URL from a GitHub Link header.
+
+    :param link_header: Link header value, or None
+    :returns: Next page URL, or None on the last page
+    """
+    if not link_header:
+        return None
+    for part in link_header.split(","):
+        m = _NEXT_LINK_RE.search(part)
+        if m:
+            return m.group(1)
+    return None
+
+
+class _ConnectionPool:
+    """Per-thread keep-alive connections to one API host."""
+
+    def __init__(self, scheme: str, netloc: str):
+        """Configure the pool.
+
+        :param scheme: "http" or "https"
+        :param netloc: Host (and port) of the API
+        """
+        self.scheme = scheme
+        self.netloc = netloc
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[http.client.HTTPConnection] = []
+
+    def get(self) -> http.client.HTTPConnection:
+        """Return this thread's persistent connection, opening it on first use.
+
+        :returns: HTTP(S) connection to the API host
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            conn = cls(self.netloc, timeout=REQUEST_TIMEOUT_SECONDS)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close every connection opened by any worker thread."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
+class GitHubClient:
+    """Keep-alive GitHub REST client shared by batch-mode worker threads.
+
+    Each worker thread holds one persistent http.client connection, so a batch
+    pays for one TCP/TLS handshake per worker instead of one per request.
+    Responses go through the same HttpCache as http_get() when one is given.
+
+    Rate Limiting
+    -------------
+    - A 403/429 with Retry-After is retried after that many seconds
+    - A 403/429 with X-RateLimit-Remaining: 0 is retried after X-RateLimit-Reset
+    - Any response with X-RateLimit-Remaining: 0 pauses every worker until the
+      reset time, so the pool does not burn through retries in parallel
+    - Waits are capped at MAX_BACKOFF_SECONDS, retries at MAX_RETRIES; after
+      that the error response is returned to the caller
+
+    Backoff waits go through the ``sleep`` attribute (time.sleep by default),
+    which tests replace on an instance to record the waits.
+    """
+
+    sleep: Callable[[float], None] = staticmethod(time.sleep)
+
+    def __init__(self, api_base: str, token: str, api_version: str, *, cache: HttpCache | None = None):
+        """Configure the client.
+
+        :param api_base: API base URL (e.g. https://api.github.com or https://ghes/api/v3)
+        :param token: Bearer token (M0-P2-I1)
+        :param api_version: GitHub API version header value
+        :param cache: Optional HttpCache for conditional requests
+        :raises ValueError: If api_base is not an http(s) URL
+        """
+        parts = urlsplit(api_base)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise ValueError(f"Unsupported API URL: {api_base}")
+        self.base_url = f"{parts.scheme}://{parts.netloc}{parts.path.rstrip('/')}"
+        self.token = token
+        self.api_version = api_version
+        self.cache = cache
+        self._pool = _ConnectionPool(parts.scheme, parts.netloc)
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def close(self) -> None:
+        """Close every connection opened by any worker thread."""
+        self._pool.close()
+
+    @staticmethod
+    def _exchange(
+        conn: http.client.HTTPConnection, target: str, headers: Dict[str, str]
+    ) -> Tuple[int, http.client.HTTPMessage, str]:
+        """Send one GET and read the complete response.
+
+        :param conn: Connection to use (reconnects automatically when closed)
+        :param target: Request target (path and query)
+        :param headers: Request headers
+        :returns: Tuple of (status, response headers, body)
+        """
+        conn.request("GET", target, headers=headers)
+        resp = conn.getresponse()
+        # Read the whole body so the connection can be reused
+        body = resp.read().decode("utf-8", "replace")
+        return resp.status, resp.headers, body
+
+    def _send(self, url: str, headers: Dict[str, str]) -> Tuple[int, http.client.HTTPMessage, str]:
+        """Send one GET over the thread's connection.
+
+        A connection the server has closed while idle is reopened once; GET is
+        idempotent, so the retry is safe.
+
+        :param url: Absolute request URL
+        :param headers: Request headers
+        :returns: Tuple of (status, response headers, body)
+        :raises OSError: On network errors
+        :raises http.client.HTTPException: On protocol errors after the retry
+        """
+        parts = urlsplit(url)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        conn = self._pool.get()
+        try:
+            return self._exchange(conn, target, headers)
+        except (http.client.HTTPException, ConnectionError):
+            # RemoteDisconnected/BadStatusLine: keep-alive connection dropped
+            # ConnectionError: reset/broken pipe on a stale socket
+            conn.close()
+            return self._exchange(conn, target, headers)
+
+    def _wait_for_quota(self) -> None:
+        """Sleep while a rate-limit pause set by any worker is in effect."""
+        with self._lock:
+            delay = self._resume_at - time.time()
+        if delay > 0:
+            self.sleep(min(delay, MAX_BACKOFF_SECONDS))
+
+    def _backoff(self, status: int, headers: http.client.HTTPMessage) -> bool:
+        """Record rate-limit headers and decide whether to retry.
+
+        :param status: HTTP status code
+        :param headers: Response headers
+        :returns: True if the request hit a rate limit and should be retried
+        """
+        now = time.time()
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        resume_at = None
+        try:
+            if remaining == "0" and reset:
+                resume_at = float(reset)
+            if status in (403, 429) and headers.get("Retry-After"):
+                resume_at = now + float(headers["Retry-After"])
+        except ValueError:
+            # ValueError: Malformed header; fall back to no backoff
+            resume_at = None
+        if resume_at is None:
+            return False
+        with self._lock:
+            self._resume_at = max(self._resume_at, min(resume_at, now + MAX_BACKOFF_SECONDS))
+        return status in (403, 429)
+
+    def get(self, target: str) -> Tuple[int, str, str | None]:
+        """GET an API path or absolute URL.
+
+        :param target: Path below the API base (e.g. "/repos/o/r/rulesets") or a full URL
+        :returns: Tuple of (status, body, next page URL or None)
+        :raises OSError: On network errors
+        :raises http.client.HTTPException: On protocol errors
+        """
+        url = target if "://" in target else f"{self.base_url}{target}"
+        cache = self.cache
+        entry = None
+        if cache is not None:
+            entry = cache.lookup(url, self.api_version, self.token)
+            if entry is not None and cache.is_fresh(entry):
+                return 200, entry["body"], entry.get("next")
+
+        headers = {
+            "Accept": "application/vnd.github+json",
+            # M0-P2-I1: Use Bearer token format
+            "Authorization": f"Bearer {self.token}",
+            "X-GitHub-Api-Version": self.api_version,
+            "User-Agent": "agent-ops-preflight",
+        }
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        for attempt in range(MAX_RETRIES + 1):
+            self._wait_for_quota()
+            status, resp_headers, body = self._send(url, headers)
+            if not self._backoff(status, resp_headers) or attempt == MAX_RETRIES:
+                break
+
+        if status == 304 and cache is not None and entry is not None:
+            # Not modified: refresh the entry's age and serve the cached body
+            cache.store(url, self.api_version, self.token, entry)
+            return 200, entry["body"], entry.get("next")
+        next_url = parse_next_link(resp_headers.get("Link"))
+        etag = resp_headers.get("ETag")
+        last_modified = resp_headers.get("Last-Modified")
+        if cache is not None and status == 200 and (etag or last_modified):
+            cache.store(
+                url,
+                self.api_version,
+                self.token,
+                {"body": body, "etag": etag, "last_modified": last_modified, "next": next_url},
+            )
+        return status, body, next_url
+
+    def get_all(self, target: str) -> Tuple[int, object]:
+        """GET a list endpoint, following Link rel="next" pagination.
+
+        :param target: Path below the API base or a full URL
+        :returns: Tuple of (status, decoded JSON); on success the pages are
+            concatenated into one list, on error the error object is returned
+        :raises OSError: On network errors
+        :raises http.client.HTTPException: On protocol errors
+        """
+        items: List[object] = []
+        seen = set()
+        next_target: str | None = target
+        while next_target and next_target not in seen:
+            seen.add(next_target)
+            status, body, next_target = self.get(next_target)
+            try:
+                obj = json.loads(body) if body else {}
+            except json.JSONDecodeError:
+                # json.JSONDecodeError: Invalid JSON response
+                obj = {}
+            if status >= 400 or not isinstance(obj, list):
+                return status, obj
+            items.extend(obj)
+        return 200, items
+
+
+def read_repos_file(path: str) -> List[str]:
+    """Read repositories for batch mode.
+
+    :param path: File with one OWNER/REPO per line, or "-" for stdin;
+        blank lines and lines starting with '#' are ignored
+    :returns: Repositories in file order
+    :raises ValueError: If the file cannot be read
+    """
+    try:
+        if path == "-":
+            text = sys.stdin.read()
+        else:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+    except OSError as e:
+        raise ValueError(f"Cannot read --repos-file {path}: {e.strerror}") from e
+    repos = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            repos.append(line)
+    return repos
+
+
+def parse_batch_args(argv: List[str]) -> Tuple[List[str], List[str] | None, int]:
+    """Split the batch-mode options off the command line.
+
+    :param argv: Command-line arguments (after parse_cache_args())
+    :returns: Tuple of (remaining arguments, repos or None for single-repo mode, jobs)
+    :raises ValueError: If a repository or --jobs is invalid, or the repos file is unreadable
+
+    Batch mode is selected by --repos-file or by giving --repo more than once.
+    In single-repo mode the --repo option is left in the remaining arguments
+    for parse_args().
+
+    Options
+    -------
+    --repo OWNER/REPO
+        Repository to verify (repeatable)
+    --repos-file PATH
+        File with one OWNER/REPO per line ("-" reads stdin)
+    --jobs N
+        Concurrent batch workers (default: 8)
+    """
+    rest = []
+    repos = []
+    repos_file = None
+    jobs_raw = str(BATCH_JOBS_DEFAULT)
+    i = 0
+    while i < len(argv):
+        a = argv[i]
+        if a == "--repo":
+            repos.append(argv[i + 1])
+            i += 2
+            continue
+        if a == "--repos-file":
+            repos_file = argv[i + 1]
+            i += 2
+            continue
+        if a == "--jobs":
+            jobs_raw = argv[i + 1]
+            i += 2
+            continue
+        rest.append(a)
+        i += 1
+    try:
+        jobs = int(jobs_raw)
+    except ValueError:
+        jobs = 0
+    if jobs < 1:
+        raise ValueError(f"--jobs must be a positive integer: {jobs_raw}")
+    if repos_file is None and len(repos) <= 1:
+        return rest + ["--repo", repos[0]] if repos else rest, None, jobs
+    if repos_file is not None:
+        repos.extend(read_repos_file(repos_file))
+    if not repos:
+        raise ValueError("No repositories given")
+    for repo in repos:
+        if not _REPO_RE.match(repo):
+            raise ValueError(f"Invalid repository (expected OWNER/REPO): {repo}")
+    # Keep the first occurrence of each repository
+    return rest, list(dict.fromkeys(repos)), jobs
+
+
+def run_batch(
+    client: GitHubClient,
+    repos: List[str],
+    verify: Callable[[str], Dict[str, object]],
+    *,
+    jobs: int = BATCH_JOBS_DEFAULT,
+) -> int:
+    """Verify many repositories concurrently and print a JSON report.
+
+    :param client: Shared GitHubClient used by ``verify`` (closed on return)
+    :param repos: Repositories in OWNER/REPO format
+    :param verify: Function returning one repository's result dict (repo,
+        status, result, reason, ...); called from worker threads
+    :param jobs: Maximum concurrent workers
+    :returns: 0 if every repository passed, else the highest per-repo exit code
+
+    Prints one INFO/WARN line per repository to stderr (in input order, as
+    results become available) and the consolidated report to stdout::
+
+        {"results": [{"repo": ..., "status": 0, "result": "pass", ...}, ...],
+         "summary": {"total": N, "pass": N, "fail": N, "auth_error": N, "usage_error": N}}
+    """
+    results = []
+    try:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(repos))) as pool:
+            futures = [pool.submit(verify, repo) for repo in repos]
+            for future in futures:
+                result = future.result()
+                level = "INFO" if result["status"] == 0 else "WARN"
+                eprint(f"{level}: {result['repo']}: {result['result']}: {result['reason']}")
+                results.append(result)
+    finally:
+        client.close()
+
+    summary = {"total": len(results)}
+    for name in RESULT_NAMES.values():
+        summary[name] = sum(1 for r in results if r["result"] == name)
+    print(json.dumps({"results": results, "summary": summary}, indent=2))
+    return max(r["status"] for r in results)
@@ -42,12 +42,58 @@ with configurable compression and strict no-clobber guarantees.
         Set to "1" to enable strict no-clobber mode globally
 
 :CLI Interface:
-    ``python3 safe_archive.py [--no-clobber] [--all | <file> ...]``
+    ``python3 safe_archive.py [--no-clobber] [--bundle] [--jobs N] [--all | <file> ...]``
 
     Options:
         --no-clobber    Enable strict no-clobber mode (fail on collision)
+        --bundle        Store all files in a single tar stream
+                        (fail-logs-<UTC timestamp>.tar.zst) instead of one
+                        archive file per log
+        --jobs N        Concurrent compression workers (default: CPU count)
         --all           Archive all files in SAFE_FAIL_DIR
         <file> ...      Archive specific file(s) by path
+        --prune         Apply the retention policy (see Retention)
+        --list          Print one tab-separated line (mtime UTC, bytes,
+                        name) per archive, oldest first, from the index
+                        manifest
+
+:Batch Mode:
+    All files of one invocation are archived as a batch:
+
+    - The archive directory is scanned once (os.scandir) into a name index;
+      collision checks and auto-suffix selection are set lookups
+    - Every destination is resolved before the first move, so a missing
+      source or a strict no-clobber collision leaves all files in place
+    - Moved files are compressed concurrently: gzip in worker threads, xz and
+      zstd with one process per chunk of files instead of one per file
+    - A name counts as taken when either it or its compressed form (e.g.
+      ``name.gz``) exists, so compression never overwrites an older archive
+
+    ``--bundle`` writes one tar stream piped through ``zstd -T0`` (or
+    tarfile's gzip/xz when SAFE_ARCHIVE_COMPRESS is gzip or xz). Sources are
+    removed only after the bundle has been written completely.
+
+:Retention:
+    ``--prune`` bounds both SAFE_ARCHIVE_DIR and SAFE_FAIL_DIR (each on its
+    own) by evicting the oldest artifacts (by mtime):
+
+    - ``--keep-last N``: the N newest artifacts are never evicted
+    - ``--max-age AGE``: evict artifacts older than AGE (``3600``, ``90m``,
+      ``12h``, ``30d``, ``2w``)
+    - ``--max-bytes SIZE``: then evict the oldest until the directory holds at
+      most SIZE bytes (``1048576``, ``500M``, ``2G``)
+    - ``--dry-run``: print what would be evicted without deleting
+
+    At least one of --max-age/--max-bytes is required. Combined with --all or
+    file arguments, pruning runs after archiving.
+
+    SAFE_ARCHIVE_DIR carries an append-only index manifest
+    (``.safe-archive-index.jsonl``, one JSON record per line) updated on every
+    archive and prune, so ``--prune`` and ``--list`` read sizes and mtimes
+    without stat()ing every archive. The manifest is trusted only while the
+    directory mtime matches its last ``sync`` record; otherwise it is rebuilt
+    from a single os.scandir() pass. SAFE_FAIL_DIR is written by safe_run and
+    is always pruned from a single os.scandir() pass.
 
 :Examples:
     Archive specific failure log::
@@ -59,6 +105,14 @@ with configurable compression and strict no-clobber guarantees.
         export SAFE_ARCHIVE_COMPRESS=gzip
         python3 safe_archive.py --all
 
+    Bundle thousands of CI failure logs into one tar+zstd file::
+
+        python3 safe_archive.py --bundle --all
+
+    Archive, then keep at most 2 GiB and 30 days of logs (always the last 20)::
+
+        python3 safe_archive.py --all --prune --max-bytes 2G --max-age 30d --keep-last 20
+
     Strict no-clobber mode via flag::
 
         python3 safe_archive.py --no-clobber mylog.txt
@@ -74,14 +128,18 @@ with configurable compression and strict no-clobber guarantees.
     0
         All files archived successfully
     2
-        Error: File not found, compression tool missing, or no-clobber collision
+        Error: File not found, compression tool missing, compression failed,
+        invalid --jobs/--max-bytes/--max-age/--keep-last value, --prune without
+        a limit, or no-clobber collision
 
 :Side Effects:
     - Creates SAFE_FAIL_DIR if it doesn't exist
     - Creates SAFE_ARCHIVE_DIR if it doesn't exist
     - Moves (not copies) source files to archive directory
     - May compress archived files (removes uncompressed original)
-    - Prints status messages to stderr (ARCHIVED, WARNING, ERROR)
+    - Prints status messages to stderr (ARCHIVED, PRUNED, WARNING, ERROR)
+    - Maintains SAFE_ARCHIVE_DIR/.safe-archive-index.jsonl
+    - --prune deletes evicted files from both directories
 
 :Filesystem Operations:
     - Uses shutil.move() for atomic file operations
@@ -103,6 +161,7 @@ See Also
 --------
 - scripts/python3/safe_run.py: Generates failure logs for archival
 - scripts/python3/safe_check.py: Verifies archival contract conformance
+- scripts/python3/safe_archive_retention.py: Retention policy and index manifest
 """
 
 from __future__ import annotations
@@ -112,7 +171,22 @@ import os
 import shutil
 import subprocess
 import sys
-from typing import List
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from safe_archive_retention import ArchiveManifest, RetentionPolicy, list_artifacts, prune_directory
+
+# Extension appended by compress_file() for each method
+COMPRESS_EXTENSIONS = {"none": "", "gzip": ".gz", "xz": ".xz", "zstd": ".zst"}
+
+# Bundle file extension for each --bundle compression method
+BUNDLE_EXTENSIONS = {"zstd": ".tar.zst", "gzip": ".tar.gz", "xz": ".tar.xz"}
+
+# Unit suffixes accepted by --max-bytes and --max-age
+SIZE_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+AGE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
 
 
 def eprint(*args: object) -> None:
@@ -135,10 +209,20 @@ def usage() -> int:
     Displays comprehensive help including options, environment variables,
     and examples. Caller is expected to exit with the returned code.
     """
-    eprint("Usage: scripts/python3/safe_archive.py [--no-clobber] [--all | <file> ...]")
+    eprint("Usage: scripts/python3/safe_archive.py [--no-clobber] [--bundle] [--jobs N] [--all | <file> ...]")
+    eprint("       scripts/python3/safe_archive.py --prune [--max-bytes SIZE] [--max-age AGE] [--keep-last N]")
+    eprint("       scripts/python3/safe_archive.py --list")
     eprint("")
     eprint("Options:")
     eprint("  --no-clobber            Fail if destination exists (default: auto-suffix)")
+    eprint("  --bundle                Store all files in one tar stream (tar+zstd by default)")
+    eprint("  --jobs N                Concurrent compression workers (default: CPU count)")
+    eprint("  --prune                 Apply the retention policy to both directories (after archiving, if any)")
+    eprint("  --max-bytes SIZE        Retention: size budget per directory (e.g. 500M, 2G)")
+    eprint("  --max-age AGE           Retention: evict artifacts older than AGE (e.g. 12h, 30d)")
+    eprint("  --keep-last N           Retention: never evict the N newest artifacts")
+    eprint("  --dry-run               With --prune: report evictions without deleting")
+    eprint("  --list                  List archived artifacts (oldest first) from the index manifest")
     eprint("")
     eprint("Environment:")
     eprint("  SAFE_FAIL_DIR           Source directory (default: .agent/FAIL-LOGS)")
@@ -233,6 +317,166 @@ def compress_file(method: str, path: str) -> None:
     raise RuntimeError(f"Invalid SAFE_ARCHIVE_COMPRESS value: {method}")
 
 
+def compressed_name(method: str, path: str) -> str:
+    """Return the final on-disk name of an archived file.
+
+    :param method: Compression method: "none" | "gzip" | "xz" | "zstd"
+    :param path: Archive path before compression
+    :returns: ``path`` plus the extension added by compress_file()
+    """
+    return path + COMPRESS_EXTENSIONS.get(method or "none", "")
+
+
+class ArchiveIndex:
+    """In-memory index of the names present in an archive directory.
+
+    Built from one os.scandir() pass so that collision checks are set lookups
+    instead of os.path.exists() probes. Names reserved by a batch are added to
+    the index before any file is moved, so two sources with the same basename
+    never race for the same destination.
+
+    A candidate destination is taken if either its uncompressed name or its
+    compressed name already exists; the highest suffix probed per basename is
+    remembered, so resolving the k-th collision of a name does not re-probe
+    .2 ... .k.
+    """
+
+    def __init__(self, archive_dir: str, compress: str = "none"):
+        """Scan the archive directory once.
+
+        :param archive_dir: Archive directory (must exist)
+        :param compress: Compression method whose extension counts as a collision
+        """
+        self.archive_dir = archive_dir
+        self.compress = compress or "none"
+        with os.scandir(archive_dir) as entries:
+            self.names = {entry.name for entry in entries}
+        self._next_suffix: Dict[str, int] = {}
+
+    def taken(self, name: str) -> bool:
+        """Check whether a destination name collides with an existing entry.
+
+        :param name: Candidate file name (no directory)
+        :returns: True if the name or its compressed form is already used
+        """
+        return name in self.names or compressed_name(self.compress, name) in self.names
+
+    def reserve(self, base: str, strict_no_clobber: bool = False) -> Tuple[str, bool]:
+        """Pick and reserve the destination name for a basename.
+
+        :param base: Source file basename
+        :param strict_no_clobber: If True, raise instead of auto-suffixing
+        :returns: Tuple of (destination path, whether a suffix was applied)
+        :raises RuntimeError: If strict_no_clobber is set and the name is taken
+        """
+        name = base
+        suffixed = False
+        if self.taken(name):
+            if strict_no_clobber:
+                # M0-P1-I3: Strict no-clobber mode - fail with error
+                raise RuntimeError(f"Destination exists: {os.path.join(self.archive_dir, base)}")
+            # M0-P1-I3: Default auto-suffix mode - append .2, .3, etc.
+            n = self._next_suffix.get(base, 2)
+            while self.taken(base + "." + str(n)):
+                n += 1
+            self._next_suffix[base] = n + 1
+            name = base + "." + str(n)
+            suffixed = True
+        self.names.add(name)
+        self.names.add(compressed_name(self.compress, name))
+        return os.path.join(self.archive_dir, name), suffixed
+
+
+def _compress_batch(method: str, paths: List[str]) -> None:
+    """Compress several archived files with one compressor invocation.
+
+    :param method: Compression method
+    :param paths: Files to compress in place
+    :raises RuntimeError: If the method is invalid or its tool is missing
+    """
+    if method in ("xz", "zstd") and len(paths) > 1:
+        if not have_cmd(method):
+            raise RuntimeError(f"{method} command not found in PATH")
+        flags = ["-T0", "-f"] if method == "xz" else ["-q", "-T0", "-f"]
+        subprocess.check_call([method] + flags + ["--"] + paths)
+        return
+    for path in paths:
+        compress_file(method, path)
+
+
+def compress_files(method: str, paths: List[str], jobs: int) -> List[str]:
+    """Compress archived files concurrently.
+
+    gzip runs in worker threads (zlib releases the GIL); xz and zstd get one
+    process per chunk of files instead of one per file.
+
+    :param method: Compression method
+    :param paths: Files to compress in place
+    :param jobs: Maximum concurrent workers
+    :returns: One error message per failed chunk (empty on success)
+    """
+    method = method or "none"
+    if method == "none" or not paths:
+        return []
+    workers = max(1, min(jobs, len(paths)))
+    chunks = [paths[i::workers] for i in range(workers)]
+    errors: List[str] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_compress_batch, method, chunk) for chunk in chunks]
+        for future in futures:
+            try:
+                future.result()
+            except (RuntimeError, OSError, subprocess.CalledProcessError) as e:
+                errors.append(f"compression failed: {e}")
+    return errors
+
+
+def archive_batch(
+    sources: List[str],
+    archive_dir: str,
+    compress: str,
+    strict_no_clobber: bool = False,
+    jobs: Optional[int] = None,
+) -> List[str]:
+    """Archive several files with M0-P1-I3 no-clobber semantics.
+
+    Destinations for every source are resolved against one ArchiveIndex
+    before anything is moved, so a missing source or a strict no-clobber
+    collision leaves all files in place. Moves then run in order and the
+    moved files are compressed concurrently.
+
+    :param sources: Source file paths
+    :param archive_dir: Destination directory
+    :param compress: Compression method
+    :param strict_no_clobber: If True, fail if any destination exists
+    :param jobs: Concurrent compression workers (default: CPU count)
+    :returns: Compression error messages (empty on success)
+    :raises RuntimeError: On a missing source or a strict no-clobber collision
+    """
+    if (compress or "none") not in COMPRESS_EXTENSIONS:
+        raise RuntimeError(f"Invalid SAFE_ARCHIVE_COMPRESS value: {compress}")
+    index = ArchiveIndex(archive_dir, compress)
+    manifest = ArchiveManifest(archive_dir)
+    plan = []
+    for src in sources:
+        if not os.path.exists(src):
+            raise RuntimeError(f"File not found: {src}")
+        plan.append((src,) + index.reserve(os.path.basename(src), strict_no_clobber))
+
+    moved = []
+    for src, dest, suffixed in plan:
+        if suffixed:
+            eprint(f"WARNING: destination exists, using auto-suffix: {dest}")
+        shutil.move(src, dest)
+        eprint(f"ARCHIVED: {src} -> {dest}")
+        moved.append(dest)
+    errors = compress_files(compress, moved, jobs or os.cpu_count() or 1)
+    # Whichever of the plain/compressed names exists after compression is recorded
+    names = [os.path.basename(name) for dest in moved for name in (dest, compressed_name(compress, dest))]
+    manifest.record_added(list(dict.fromkeys(names)))
+    return errors
+
+
 def archive_one(src: str, archive_dir: str, compress: str, strict_no_clobber: bool = False) -> None:
     """Archive a single file with M0-P1-I3 no-clobber semantics.
 
@@ -240,27 +484,167 @@ def archive_one(src: str, archive_dir: str, compress: str, strict_no_clobber: bo
     :param archive_dir: Destination directory
     :param compress: Compression method
     :param strict_no_clobber: If True, fail if destination exists. If False (default), auto-suffix.
+    :raises RuntimeError: On a missing source, a collision in strict mode, or a compression failure
     """
-    if not os.path.exists(src):
-        raise RuntimeError(f"File not found: {src}")
-
-    base = os.path.basename(src)
-    dest = os.path.join(archive_dir, base)
-
-    if os.path.exists(dest):
-        if strict_no_clobber:
-            # M0-P1-I3: Strict no-clobber mode - fail with error
-            raise RuntimeError(f"Destination exists: {dest}")
-        # M0-P1-I3: Default auto-suffix mode - append .2, .3, etc.
-        n = 2
-        while os.path.exists(dest + "." + str(n)):
-            n += 1
-        dest = dest + "." + str(n)
+    errors = archive_batch([src], archive_dir, compress, strict_no_clobber, jobs=1)
+    if errors:
+        raise RuntimeError(errors[0])
+
+
+def archive_bundle(
+    sources: List[str],
+    archive_dir: str,
+    compress: str,
+    strict_no_clobber: bool = False,
+) -> str:
+    """Archive several files as one compressed tar stream.
+
+    The tar stream is written to a hidden temporary file in the archive
+    directory and renamed into place once the compressor has exited
+    successfully; sources are only removed after that.
+
+    :param sources: Source file paths (stored by basename, in the given order)
+    :param archive_dir: Destination directory
+    :param compress: Bundle compression: zstd (default for "none"), gzip or xz
+    :param strict_no_clobber: If True, fail if the bundle name exists
+    :returns: Path of the created bundle
+    :raises RuntimeError: On a missing source, a collision in strict mode, or a
+        missing/failing compressor
+    """
+    method = compress if compress and compress != "none" else "zstd"
+    if method not in BUNDLE_EXTENSIONS:
+        raise RuntimeError(f"Invalid SAFE_ARCHIVE_COMPRESS value: {compress}")
+    if method == "zstd" and not have_cmd("zstd"):
+        raise RuntimeError("zstd command not found in PATH")
+    for src in sources:
+        if not os.path.exists(src):
+            raise RuntimeError(f"File not found: {src}")
+
+    stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    index = ArchiveIndex(archive_dir)
+    manifest = ArchiveManifest(archive_dir)
+    dest, suffixed = index.reserve(f"fail-logs-{stamp}{BUNDLE_EXTENSIONS[method]}", strict_no_clobber)
+    if suffixed:
         eprint(f"WARNING: destination exists, using auto-suffix: {dest}")
+    tmp = os.path.join(archive_dir, "." + os.path.basename(dest) + ".tmp")
+
+    try:
+        if method == "zstd":
+            with open(tmp, "wb") as out:
+                proc = subprocess.Popen(["zstd", "-q", "-T0", "-c"], stdin=subprocess.PIPE, stdout=out)
+                try:
+                    with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                        for src in sources:
+                            tar.add(src, arcname=os.path.basename(src))
+                finally:
+                    proc.stdin.close()
+                    returncode = proc.wait()
+            if returncode != 0:
+                raise RuntimeError(f"zstd exited with status {returncode}")
+        else:
+            with tarfile.open(tmp, mode="w|" + ("gz" if method == "gzip" else "xz")) as tar:
+                for src in sources:
+                    tar.add(src, arcname=os.path.basename(src))
+        os.replace(tmp, dest)
+    except (OSError, tarfile.TarError) as e:
+        raise RuntimeError(f"bundle failed: {e}") from e
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+    manifest.record_added([os.path.basename(dest)])
+    for src in sources:
+        os.unlink(src)
+    eprint(f"ARCHIVED: {len(sources)} file(s) -> {dest}")
+    return dest
+
+
+def _parse_keep_last(value: str) -> int:
+    """Parse the --keep-last value.
+
+    :param value: Raw command-line value
+    :returns: Non-negative artifact count
+    :raises RuntimeError: If the value is not a non-negative integer
+    """
+    try:
+        keep_last = int(value)
+    except ValueError:
+        keep_last = -1
+    if keep_last < 0:
+        raise RuntimeError(f"--keep-last must be a non-negative integer: {value}")
+    return keep_last
+
+
+def _parse_size(value: str) -> int:
+    """Parse a --max-bytes value such as 1048576, 500M or 2G.
 
-    shutil.move(src, dest)
-    eprint(f"ARCHIVED: {src} -> {dest}")
-    compress_file(compress, dest)
+    :param value: Raw command-line value
+    :returns: Size in bytes
+    :raises RuntimeError: If the value is not a non-negative size
+    """
+    number, unit = value, ""
+    if value[-1:].upper() in SIZE_UNITS:
+        number, unit = value[:-1], value[-1:].upper()
+    try:
+        size = int(float(number) * SIZE_UNITS.get(unit, 1))
+    except ValueError:
+        size = -1
+    if size < 0:
+        raise RuntimeError(f"--max-bytes must be a size such as 1048576, 500M or 2G: {value}")
+    return size
+
+
+def _parse_age(value: str) -> float:
+    """Parse a --max-age value such as 3600, 90m, 12h or 30d.
+
+    :param value: Raw command-line value
+    :returns: Age in seconds
+    :raises RuntimeError: If the value is not a non-negative duration
+    """
+    number, unit = value, ""
+    if value[-1:].lower() in AGE_UNITS:
+        number, unit = value[:-1], value[-1:].lower()
+    try:
+        age = float(number) * AGE_UNITS.get(unit, 1)
+    except ValueError:
+        age = -1.0
+    if age < 0:
+        raise RuntimeError(f"--max-age must be a duration such as 3600, 90m, 12h or 30d: {value}")
+    return age
+
+
+def _pop_option(args: List[str], flag: str) -> Optional[str]:
+    """Remove ``flag VALUE`` from an argument list.
+
+    :param args: Argument list (modified in place)
+    :param flag: Option name, e.g. "--jobs"
+    :returns: The option value, or None if the flag is absent
+    :raises RuntimeError: If the flag has no value
+    """
+    if flag not in args:
+        return None
+    pos = args.index(flag)
+    if pos + 1 >= len(args):
+        raise RuntimeError(f"{flag} requires a value")
+    value = args[pos + 1]
+    del args[pos : pos + 2]
+    return value
+
+
+def _parse_jobs(value: str) -> int:
+    """Parse the --jobs value.
+
+    :param value: Raw command-line value
+    :returns: Positive worker count
+    :raises RuntimeError: If the value is not a positive integer
+    """
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+    if jobs < 1:
+        raise RuntimeError(f"--jobs must be a positive integer: {value}")
+    return jobs
 
 
 def main(argv: List[str]) -> int:
@@ -281,12 +665,16 @@ def main(argv: List[str]) -> int:
     ---------------
     --all
         Archives all files in SAFE_FAIL_DIR (sorted by name)
-        Skips directories and symlinks
+        Skips directories
 
     <file> ...
         Archives specific files by path
         Files can be from any directory (not limited to SAFE_FAIL_DIR)
 
+    --bundle
+        Combined with either of the above: one tar stream instead of one
+        archive file per source
+
     Environment Configuration
     -------------------------
     - SAFE_FAIL_DIR: Source directory (default: .agent/FAIL-LOGS)
@@ -304,10 +692,12 @@ def main(argv: List[str]) -> int:
 
     Error Handling
     --------------
-    - Catches RuntimeError from archive_one() and compress_file()
+    - Catches RuntimeError from archive_batch() and archive_bundle()
     - Prints ERROR message to stderr
     - Returns exit code 2 on any error
-    - --all mode: Continues processing remaining files after error (non-fatal)
+    - Missing sources and strict no-clobber collisions are detected before
+      any file is moved
+    - Compression failures are reported after all moves; exit code 2
 
     Examples
     --------
@@ -332,6 +722,10 @@ def main(argv: List[str]) -> int:
         strict_no_clobber = True
         args.remove("--no-clobber")
 
+    bundle = "--bundle" in args
+    if bundle:
+        args.remove("--bundle")
+
     # Check for SAFE_ARCHIVE_NO_CLOBBER env var
     if os.environ.get("SAFE_ARCHIVE_NO_CLOBBER") == "1":
         strict_no_clobber = True
@@ -340,29 +734,66 @@ def main(argv: List[str]) -> int:
     archive_dir = os.environ.get("SAFE_ARCHIVE_DIR", ".agent/FAIL-ARCHIVE")
     compress = os.environ.get("SAFE_ARCHIVE_COMPRESS", "none")
 
-    os.makedirs(fail_dir, exist_ok=True)
-    os.makedirs(archive_dir, exist_ok=True)
+    prune = "--prune" in args
+    if prune:
+        args.remove("--prune")
+    dry_run = "--dry-run" in args
+    if dry_run:
+        args.remove("--dry-run")
+    list_only = "--list" in args
+    if list_only:
+        args.remove("--list")
 
     try:
+        jobs_value = _pop_option(args, "--jobs")
+        jobs = _parse_jobs(jobs_value) if jobs_value is not None else None
+        max_bytes_value = _pop_option(args, "--max-bytes")
+        max_bytes = _parse_size(max_bytes_value) if max_bytes_value is not None else None
+        max_age_value = _pop_option(args, "--max-age")
+        max_age = _parse_age(max_age_value) if max_age_value is not None else None
+        keep_last_value = _pop_option(args, "--keep-last")
+        keep_last = _parse_keep_last(keep_last_value) if keep_last_value is not None else 0
+        if prune and max_bytes is None and max_age is None:
+            raise RuntimeError("--prune requires --max-bytes and/or --max-age")
+        if list_only and args:
+            raise RuntimeError(f"--list takes no file arguments: {' '.join(args)}")
+
+        os.makedirs(fail_dir, exist_ok=True)
+        os.makedirs(archive_dir, exist_ok=True)
+
+        if list_only:
+            for name, size, mtime in list_artifacts(archive_dir):
+                stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(mtime))
+                print(f"{stamp}\t{size}\t{name}")
+            return 0
+
+        files: List[str] = []
         if args and args[0] == "--all":
-            files = [
-                os.path.join(fail_dir, n)
-                for n in sorted(os.listdir(fail_dir))
-                if os.path.isfile(os.path.join(fail_dir, n))
-            ]
+            with os.scandir(fail_dir) as entries:
+                files = sorted(os.path.join(fail_dir, entry.name) for entry in entries if entry.is_file())
             if not files:
                 eprint(f"No files to archive in {fail_dir}")
-                return 0
-            for f in files:
-                archive_one(f, archive_dir, compress, strict_no_clobber)
-            return 0
-
-        if not args:
+        elif args:
+            files = args
+        elif not prune:
             return usage()
 
-        for f in args:
-            archive_one(f, archive_dir, compress, strict_no_clobber)
-        return 0
+        errors: List[str] = []
+        if files and bundle:
+            archive_bundle(files, archive_dir, compress, strict_no_clobber)
+        elif files:
+            errors = archive_batch(files, archive_dir, compress, strict_no_clobber, jobs)
+
+        if prune:
+            policy = RetentionPolicy(max_bytes, max_age, keep_last)
+            for directory, use_manifest in ((archive_dir, True), (fail_dir, False)):
+                count, freed = prune_directory(directory, policy, dry_run=dry_run, use_manifest=use_manifest)
+                verb = "WOULD PRUNE" if dry_run else "PRUNED"
+                eprint(f"{verb}: {count} file(s), {freed} bytes from {directory}")
+
+        for error in errors:
+            eprint(f"ERROR: {error}")
+        return 2 if errors else 0
     except RuntimeError as e:
         eprint(f"ERROR: {e}")
         return 2
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Retention policy and index manifest for safe_archive.py.
+
+:Purpose:
+    Keeps the bookkeeping behind ``safe_archive.py --prune`` and ``--list``
+    out of the archival script: the append-only index manifest of
+    SAFE_ARCHIVE_DIR, the eviction policy and the pruning of one directory.
+
+:Manifest:
+    SAFE_ARCHIVE_DIR carries ``.safe-archive-index.jsonl``, one JSON record
+    per line (``add``, ``del`` or ``sync``). Replaying it yields the sizes and
+    mtimes of every archive without stat()ing each one. It is trusted only
+    while the directory mtime matches its last ``sync`` record; otherwise it is
+    rebuilt from a single os.scandir() pass.
+
+:Environment Variables:
+    None. safe_archive.py resolves the directories and passes them in.
+
+:Examples:
+    Prune an archive directory to 2 GiB, keeping the newest 20 archives::
+
+        from safe_archive_retention import RetentionPolicy, prune_directory
+        prune_directory(".agent/FAIL-ARCHIVE", RetentionPolicy(max_bytes=2 * 1024**3, keep_last=20))
+
+:Exit Codes:
+    N/A - This is a library module imported by safe_archive.py
+
+See Also
+--------
+- scripts/python3/safe_archive.py: Command-line entry point
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Append-only artifact index kept in SAFE_ARCHIVE_DIR (hidden from --all and safe_check)
+MANIFEST_NAME = ".safe-archive-index.jsonl"
+
+# Rewrite the manifest once it holds this many records per live entry (plus slack)
+MANIFEST_COMPACT_FACTOR = 4
+MANIFEST_COMPACT_MIN = 1024
+
+
+def eprint(*args: object) -> None:
+    """Print to stderr for status messages.
+
+    :param args: Variable arguments to print (passed to print())
+    """
+    print(*args, file=sys.stderr)
+
+
+class RetentionPolicy(NamedTuple):
+    """Limits applied by ``--prune`` to each directory.
+
+    :param max_bytes: Size budget for the directory, or None
+    :param max_age: Maximum age in seconds, or None
+    :param keep_last: Number of newest artifacts always kept
+    """
+
+    max_bytes: Optional[int] = None
+    max_age: Optional[float] = None
+    keep_last: int = 0
+
+
+def scan_artifacts(directory: str) -> Dict[str, Tuple[int, float]]:
+    """Stat every artifact in a directory with a single os.scandir() pass.
+
+    Hidden entries (the manifest, bundle temporaries) and non-files are ignored.
+
+    :param directory: Directory to scan
+    :returns: Mapping of file name to (size in bytes, mtime)
+    """
+    artifacts = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            st = entry.stat()
+            artifacts[entry.name] = (st.st_size, st.st_mtime)
+    return artifacts
+
+
+class ArchiveManifest:
+    """Append-only NDJSON index of the artifacts in an archive directory.
+
+    Each line is one record: ``add`` (name, size, mtime), ``del`` (name) or
+    ``sync`` (the directory's st_mtime_ns after the last change made through
+    the manifest). Replaying the records yields the current artifact set
+    without stat()ing every file. The manifest is trusted only while the
+    directory mtime still matches the trailing ``sync`` record; any change made
+    behind its back (safe_run writing, other wrappers, manual deletes) forces a
+    rebuild from one scan_artifacts() pass.
+    """
+
+    def __init__(self, directory: str):
+        """Load and validate the manifest of a directory.
+
+        :param directory: Archive directory (must exist)
+        """
+        self.directory = directory
+        self.path = os.path.join(directory, MANIFEST_NAME)
+        self.entries: Dict[str, Tuple[int, float]] = {}
+        self.records = 0
+        self.valid = False
+        self._load()
+
+    def _load(self) -> None:
+        """Replay the manifest records and check them against the directory mtime."""
+        synced = None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    record = json.loads(line)
+                    op = record["op"]
+                    self.records += 1
+                    synced = record["dir_mtime_ns"] if op == "sync" else None
+                    if op == "add":
+                        self.entries[record["name"]] = (record["size"], record["mtime"])
+                    elif op == "del":
+                        self.entries.pop(record["name"], None)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError):
+            # Unreadable or truncated manifest: rebuild from the directory
+            self.entries = {}
+            return
+        self.valid = synced is not None and synced == os.stat(self.directory).st_mtime_ns
+
+    def refresh(self) -> None:
+        """Rebuild the manifest from the directory if it is stale."""
+        if not self.valid:
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """Rewrite the manifest from one scan of the directory."""
+        self.entries = scan_artifacts(self.directory)
+        self._write_snapshot()
+
+    def _write_snapshot(self) -> None:
+        """Replace the manifest with one ``add`` record per known entry."""
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for name, (size, mtime) in sorted(self.entries.items()):
+                f.write(json.dumps({"op": "add", "name": name, "size": size, "mtime": mtime}) + "\n")
+        os.replace(tmp, self.path)
+        self.records = len(self.entries)
+        self._append([])
+
+    def record_added(self, names: List[str]) -> None:
+        """Record artifacts created in the directory.
+
+        Falls back to rebuild() if the manifest was stale before the change,
+        since appending would then hide the untracked files.
+
+        :param names: File names (not paths) that were added
+        """
+        if not self.valid:
+            self.rebuild()
+            return
+        records = []
+        for name in names:
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            self.entries[name] = (st.st_size, st.st_mtime)
+            records.append({"op": "add", "name": name, "size": st.st_size, "mtime": st.st_mtime})
+        self._append(records)
+
+    def record_removed(self, names: List[str]) -> None:
+        """Record artifacts deleted from the directory.
+
+        :param names: File names (not paths) that were removed
+        """
+        for name in names:
+            self.entries.pop(name, None)
+        self._append([{"op": "del", "name": name} for name in names])
+
+    def _append(self, records: List[Dict[str, object]]) -> None:
+        """Append records followed by a sync marker, compacting when mostly garbage.
+
+        :param records: Records to append
+        """
+        self.records += len(records)
+        if self.records > MANIFEST_COMPACT_FACTOR * len(self.entries) + MANIFEST_COMPACT_MIN:
+            self._write_snapshot()
+            return
+        # Opening the file first (creating it if needed) keeps the directory
+        # mtime stable between the stat below and the next load
+        with open(self.path, "a", encoding="utf-8") as f:
+            lines = [json.dumps(record) + "\n" for record in records]
+            f.write("".join(lines))
+            f.flush()
+            f.write(json.dumps({"op": "sync", "dir_mtime_ns": os.stat(self.directory).st_mtime_ns}) + "\n")
+        self.records += 1
+        self.valid = True
+
+
+def select_evictions(
+    artifacts: Dict[str, Tuple[int, float]],
+    max_bytes: Optional[int] = None,
+    max_age: Optional[float] = None,
+    keep_last: int = 0,
+    now: Optional[float] = None,
+) -> List[str]:
+    """Choose which artifacts a retention policy evicts.
+
+    The ``keep_last`` newest artifacts are never evicted. Of the rest, those
+    older than ``max_age`` go first; then the oldest remaining ones are evicted
+    until the total size is at most ``max_bytes``.
+
+    :param artifacts: Mapping of file name to (size in bytes, mtime)
+    :param max_bytes: Size budget for the directory, or None
+    :param max_age: Maximum age in seconds, or None
+    :param keep_last: Number of newest artifacts always kept
+    :param now: Reference time (default: time.time())
+    :returns: Names to evict, oldest first
+    """
+    now = time.time() if now is None else now
+    newest_first = sorted(artifacts.items(), key=lambda item: (item[1][1], item[0]), reverse=True)
+    candidates = newest_first[keep_last:][::-1]
+    total = sum(size for size, _ in artifacts.values())
+    evicted = []
+    for name, (size, mtime) in candidates:
+        too_old = max_age is not None and now - mtime > max_age
+        too_big = max_bytes is not None and total > max_bytes
+        if not (too_old or too_big):
+            continue
+        evicted.append(name)
+        total -= size
+    return evicted
+
+
+def prune_directory(
+    directory: str,
+    policy: RetentionPolicy,
+    *,
+    dry_run: bool = False,
+    use_manifest: bool = True,
+) -> Tuple[int, int]:
+    """Apply a retention policy to one directory.
+
+    :param directory: FAIL-ARCHIVE or FAIL-LOGS directory
+    :param policy: Size, age and keep-last limits to enforce
+    :param dry_run: Only report what would be evicted
+    :param use_manifest: Read sizes and mtimes from the ArchiveManifest instead
+        of scanning (the directory must be maintained by safe_archive)
+    :returns: Tuple of (files evicted, bytes freed)
+    """
+    manifest = None
+    if use_manifest:
+        manifest = ArchiveManifest(directory)
+        manifest.refresh()
+        artifacts = manifest.entries
+    else:
+        artifacts = scan_artifacts(directory)
+
+    victims = select_evictions(artifacts, policy.max_bytes, policy.max_age, policy.keep_last)
+    freed = 0
+    removed = []
+    for name in victims:
+        path = os.path.join(directory, name)
+        size = artifacts[name][0]
+        if dry_run:
+            eprint(f"WOULD PRUNE: {path} ({size} bytes)")
+        else:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            eprint(f"PRUNED: {path} ({size} bytes)")
+        removed.append(name)
+        freed += size
+    if manifest is not None and removed and not dry_run:
+        manifest.record_removed(removed)
+    return len(removed), freed
+
+
+def list_artifacts(archive_dir: str) -> List[Tuple[str, int, float]]:
+    """List archived artifacts from the manifest.
+
+    :param archive_dir: Archive directory
+    :returns: Tuples of (name, size, mtime), oldest first
+    """
+    manifest = ArchiveManifest(archive_dir)
+    manifest.refresh()
+    return sorted(
+        ((name, size, mtime) for name, (size, mtime) in manifest.entries.items()),
+        key=lambda item: (item[2], item[0]),
+    )
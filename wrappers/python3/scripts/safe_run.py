@@ -20,10 +20,30 @@ this deterministic order:
 4. **PATH lookup** (system-wide installation via which/shutil.which)
 5. **Error with instructions** (exit 127 if not found)
 
+:Binary Discovery Cache:
+Agents invoke the wrapper thousands of times per session, so the result of
+steps 2-4 is cached in a small per-user file (marshal format, so reading it
+needs no imports beyond os/sys), keyed by the wrapper's location and PATH. A cached path is reused only while:
+
+- the binary's inode, mtime, size and mode are unchanged,
+- every higher-priority dev/CI candidate is still absent or not executable,
+- every PATH directory searched before the hit has an unchanged mtime.
+
+Otherwise discovery runs again and the entry is replaced. A changed PATH is
+a different key; SAFE_RUN_BIN skips the cache. The cache never changes which
+binary is selected, only how quickly it is found. See
+scripts/benchmarks/bench_safe_run_discovery.py for the overhead it removes.
+
 :Environment Variables:
 SAFE_RUN_BIN : str, optional
     Override binary path. If set, this path is used without validation.
     The wrapper will attempt to execute it and report errors if it fails.
+    The discovery cache is bypassed entirely while it is set.
+SAFE_RUN_CACHE_FILE : str, optional
+    Discovery cache file (default:
+    ${XDG_CACHE_HOME:-~/.cache}/safe-run/wrapper-discovery.marshal)
+SAFE_RUN_NO_CACHE : str, optional
+    Set to "1" to disable the discovery cache (always run steps 2-4)
 
 All other environment variables are passed through to the Rust canonical tool:
 
@@ -45,12 +65,48 @@ The wrapper accepts the same arguments as the Rust canonical tool:
 The optional "--" separator is stripped before forwarding to Rust, which
 expects the structure: safe-run run <command> [args...]
 
+    python3 safe_run.py --batch <manifest> [--jobs N]
+
+Runs every command of a manifest (see Batch Mode) instead of exec'ing one.
+
+:Batch Mode:
+Agents running a command matrix (tests per package, lint per crate) would
+otherwise start one Python wrapper per command. ``--batch`` reads a
+manifest and runs each command through its own ``safe-run run`` process,
+at most ``--jobs`` at a time (default: CPU count), from one wrapper.
+
+The manifest (``-`` reads stdin) is a JSON array, a JSON object with a
+``commands`` array, or NDJSON with one command per line. Each command is
+an argv array or an object::
+
+    {"cmd": ["cargo", "test", "-p", "core"], "env": {"RUST_LOG": "info"},
+     "cwd": "rust", "name": "core tests"}
+
+- Every command keeps the single-command semantics: its exit code, and a
+  FAIL/ABORTED log written by the Rust tool on failure
+- All commands share one log directory: SAFE_LOG_DIR (default
+  .agent/FAIL-LOGS) resolved against the wrapper's working directory, so
+  a per-command ``cwd`` does not scatter logs; an ``env`` entry may still
+  override it
+- Output is grouped per command and written when that command finishes,
+  followed by a status line on stderr:
+  ``[safe-run batch] FAIL core tests (exit 101, 12.3s)``
+- The aggregate exit code is 0 if every command succeeded, otherwise the
+  exit code of the first failed command in manifest order
+- Ctrl+C reaches the running commands (same process group); no further
+  commands are started and the batch exits 130
+
 :Examples:
 Basic usage with argument forwarding::
 
     python3 safe_run.py python3 -c "print('hello')"
     python3 safe_run.py -- bash -c "exit 42"
 
+Run a test matrix, four commands at a time::
+
+    printf '%s\n' '["pytest", "pkg_a"]' '["pytest", "pkg_b"]' > matrix.ndjson
+    python3 safe_run.py --batch matrix.ndjson --jobs 4
+
 Using environment override::
 
     export SAFE_RUN_BIN=/custom/path/to/safe-run
@@ -68,6 +124,10 @@ Using environment override::
 130
     SIGINT/Ctrl+C (proxied from Rust tool)
 
+With ``--batch``: 0 if all commands succeeded, else the first failed
+command's exit code (in manifest order); 2 for an invalid manifest or
+--jobs value; 130 if interrupted.
+
 :Platform Notes:
 - **Linux**: Expects x86_64 or aarch64 architecture
 - **macOS**: Supports both Intel (x86_64) and Apple Silicon (aarch64/arm64)
@@ -93,11 +153,20 @@ The Rust binary implements the conformance contracts:
 
 from __future__ import annotations
 
+import marshal
 import os
-import platform
-import shutil
 import sys
-from pathlib import Path
+
+# The cached fast path only needs os/sys/marshal: pathlib, platform and shutil
+# (and the re/enum/typing chains they pull in) are imported on a cache miss only
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Per-user binary discovery cache (see "Binary Discovery Cache" above)
+CACHE_FILE_NAME = "wrapper-discovery.marshal"
+CACHE_VERSION = 1
+CACHE_MAX_ENTRIES = 32
 
 
 def find_repo_root() -> Path | None:
@@ -126,6 +195,8 @@ def find_repo_root() -> Path | None:
     ... else:
     ...     print("Not in a repository")
     """
+    from pathlib import Path  # pylint: disable=import-outside-toplevel
+
     script_path = Path(__file__).resolve()
     current = script_path.parent
 
@@ -168,6 +239,8 @@ def detect_platform() -> str:
     - Uses platform.machine() for architecture detection
     - Returns "unknown/unknown" for unsupported platforms (caller handles gracefully)
     """
+    import platform  # pylint: disable=import-outside-toplevel
+
     # Detect OS
     system = platform.system()
     if system == "Linux":
@@ -227,8 +300,10 @@ def find_safe_run_binary() -> str | None:
 
     Side Effects
     ------------
-    - Calls find_repo_root() to determine repository location
-    - Calls detect_platform() for CI artifact path construction
+    - Steps 2-4 are answered from the per-user discovery cache when its entry
+      is still valid (see _cache_entry_is_valid())
+    - On a cache miss, calls discover_safe_run_binary() (find_repo_root(),
+      detect_platform(), shutil.which()) and rewrites the cache file
 
     Examples
     --------
@@ -243,6 +318,7 @@ def find_safe_run_binary() -> str | None:
     - Per spec, SAFE_RUN_BIN is returned without validation
     - File existence and execute permissions are checked for dev/CI paths
     - The function does not raise exceptions; returns None on failure
+    - "Not found" results are never cached
     """
     # 1. Environment override (use without validation per spec)
     safe_run_bin = os.environ.get("SAFE_RUN_BIN")
@@ -250,41 +326,360 @@ def find_safe_run_binary() -> str | None:
         # Return the path even if it doesn't exist - let exec fail with clear error
         return safe_run_bin
 
+    cache_path = cache_file_path()
+    key = _cache_key()
+    cache = load_cache(cache_path) if cache_path else {}
+    entry = cache.get(key)
+    if entry is not None and _cache_entry_is_valid(entry):
+        return entry["binary"]
+
+    binary, shadowed, path_dirs = discover_safe_run_binary()
+    if binary and cache_path and path_dirs is not None:
+        signature = _stat_signature(binary)
+        if signature is not None:
+            cache.pop(key, None)
+            cache[key] = {
+                "binary": binary,
+                "signature": signature,
+                "shadowed": shadowed,
+                "path_dirs": [[d, _mtime_ns(d)] for d in path_dirs],
+            }
+            store_cache(cache_path, cache)
+    return binary
+
+
+def discover_safe_run_binary() -> tuple[str | None, list[str], list[str] | None]:
+    """Run discovery steps 2-4 without the cache.
+
+    :returns: Tuple of (binary path or None, higher-priority candidate paths
+        that were checked and not usable, PATH directories searched before the
+        one containing the binary or None if the result must not be cached)
+    """
+    import platform  # pylint: disable=import-outside-toplevel
+    import shutil  # pylint: disable=import-outside-toplevel
+
     repo_root = find_repo_root()
     is_windows = platform.system() == "Windows"
+    candidates = []
 
     # 2. Dev mode: ./rust/target/release/safe-run (or .exe on Windows)
     if repo_root:
-        dev_bin = repo_root / "rust" / "target" / "release" / "safe-run"
-        if dev_bin.is_file() and os.access(dev_bin, os.X_OK):
-            return str(dev_bin)
+        candidates.append(repo_root / "rust" / "target" / "release" / "safe-run")
         # On Windows, also try .exe extension
         if is_windows:
-            dev_bin_exe = repo_root / "rust" / "target" / "release" / "safe-run.exe"
-            if dev_bin_exe.is_file() and os.access(dev_bin_exe, os.X_OK):
-                return str(dev_bin_exe)
+            candidates.append(repo_root / "rust" / "target" / "release" / "safe-run.exe")
 
     # 3. CI artifact: ./dist/<os>/<arch>/safe-run (or .exe on Windows)
     if repo_root:
         platform_str = detect_platform()
         if platform_str != "unknown/unknown":
             parts = platform_str.split("/")
-            ci_bin = repo_root / "dist" / parts[0] / parts[1] / "safe-run"
-            if ci_bin.is_file() and os.access(ci_bin, os.X_OK):
-                return str(ci_bin)
+            candidates.append(repo_root / "dist" / parts[0] / parts[1] / "safe-run")
             # On Windows, also try .exe extension
             if is_windows:
-                ci_bin_exe = repo_root / "dist" / parts[0] / parts[1] / "safe-run.exe"
-                if ci_bin_exe.is_file() and os.access(ci_bin_exe, os.X_OK):
-                    return str(ci_bin_exe)
+                candidates.append(repo_root / "dist" / parts[0] / parts[1] / "safe-run.exe")
+
+    shadowed = []
+    for candidate in candidates:
+        if candidate.is_file() and os.access(candidate, os.X_OK):
+            return str(candidate), shadowed, []
+        shadowed.append(str(candidate))
 
     # 4. PATH lookup
     which_result = shutil.which("safe-run")
     if which_result:
-        return which_result
+        hit_dir = os.path.dirname(which_result)
+        path_dirs = os.environ.get("PATH", "").split(os.pathsep)
+        if hit_dir not in path_dirs:
+            # Cannot tell which PATH entries could shadow the hit: do not cache it
+            return which_result, shadowed, None
+        return which_result, shadowed, path_dirs[: path_dirs.index(hit_dir)]
 
     # 5. Not found
-    return None
+    return None, shadowed, []
+
+
+def cache_file_path() -> str | None:
+    """Locate the per-user discovery cache file.
+
+    :returns: Cache file path, or None if caching is disabled via SAFE_RUN_NO_CACHE=1
+    """
+    if os.environ.get("SAFE_RUN_NO_CACHE") == "1":
+        return None
+    override = os.environ.get("SAFE_RUN_CACHE_FILE")
+    if override:
+        return override
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "safe-run", CACHE_FILE_NAME)
+
+
+def _cache_key() -> str:
+    """Build the cache key for this wrapper location and search PATH.
+
+    :returns: Key string (wrapper path and PATH; SAFE_RUN_BIN bypasses the cache)
+    """
+    return os.path.abspath(__file__) + "\n" + os.environ.get("PATH", "")
+
+
+def _stat_signature(path: str) -> list[int] | None:
+    """Identify a file version by inode, mtime, size and mode.
+
+    :param path: File path
+    :returns: [st_ino, st_mtime_ns, st_size, st_mode], or None if stat() fails
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_ino, st.st_mtime_ns, st.st_size, st.st_mode]
+
+
+def _mtime_ns(path: str) -> int | None:
+    """Get a directory's mtime (changes when a binary is added or removed).
+
+    :param path: Directory path
+    :returns: st_mtime_ns, or None if the directory does not exist
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cache_entry_is_valid(entry: dict) -> bool:
+    """Check that a cached discovery result would still be found by discovery.
+
+    The cached binary must be the same file (inode, mtime, size and mode
+    unchanged), no higher-priority dev/CI candidate may have become
+    executable, and no PATH directory searched before the hit may have
+    changed.
+
+    :param entry: Cache entry written by find_safe_run_binary()
+    :returns: True if the entry can be used without running discovery
+    """
+    try:
+        if _stat_signature(entry["binary"]) != entry["signature"]:
+            return False
+        for candidate in entry["shadowed"]:
+            if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                return False
+        return all(_mtime_ns(d) == mtime for d, mtime in entry["path_dirs"])
+    except (KeyError, TypeError, ValueError):
+        return False
+
+
+def load_cache(path: str) -> dict:
+    """Read the discovery cache.
+
+    :param path: Cache file path
+    :returns: Mapping of cache key to entry (empty if missing, corrupt or from another version)
+
+    marshal is used instead of json because it is built in: importing json
+    (and the re module it needs) would cost more than the cache saves.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = marshal.load(f)
+    except (OSError, ValueError, EOFError, TypeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION or not isinstance(data.get("entries"), dict):
+        return {}
+    return data["entries"]
+
+
+def store_cache(path: str, entries: dict) -> None:
+    """Write the discovery cache atomically, keeping the newest entries.
+
+    Failures are ignored: the cache is an optimization only.
+
+    :param path: Cache file path
+    :param entries: Mapping of cache key to entry, oldest first
+    """
+    keep = dict(list(entries.items())[-CACHE_MAX_ENTRIES:])
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp, "wb") as f:
+            marshal.dump({"version": CACHE_VERSION, "entries": keep}, f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def load_batch_manifest(path: str) -> list[dict]:
+    """Read and validate a batch manifest.
+
+    :param path: Manifest path, or "-" for stdin
+    :returns: Commands as dicts with name, cmd, env and cwd
+    :raises ValueError: If the manifest cannot be read or an entry is invalid
+
+    Accepted formats: a JSON array, a JSON object with a "commands" array,
+    or NDJSON (one entry per non-blank line). An entry is an argv array or
+    an object with "cmd" and optional "env", "cwd" and "name".
+    """
+    import json  # pylint: disable=import-outside-toplevel
+
+    try:
+        if path == "-":
+            text = sys.stdin.read()
+        else:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+    except OSError as e:
+        raise ValueError(f"cannot read manifest {path}: {e.strerror}") from e
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        # Not a single JSON document: parse as NDJSON
+        data = []
+        for lineno, line in enumerate(text.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                data.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"manifest line {lineno}: {e.msg}") from e
+    if isinstance(data, dict) and "commands" in data:
+        data = data["commands"]
+    if not isinstance(data, list) or (data and all(isinstance(item, str) for item in data)):
+        # A lone argv array is one NDJSON line, not a manifest of commands
+        data = [data]
+
+    commands = []
+    for index, entry in enumerate(data, 1):
+        if isinstance(entry, list):
+            entry = {"cmd": entry}
+        if not isinstance(entry, dict):
+            raise ValueError(f"manifest entry {index}: expected an argv array or an object")
+        cmd = entry.get("cmd")
+        env = entry.get("env") or {}
+        cwd = entry.get("cwd")
+        if not isinstance(cmd, list) or not cmd or not all(isinstance(arg, str) for arg in cmd):
+            raise ValueError(f"manifest entry {index}: 'cmd' must be a non-empty array of strings")
+        if not isinstance(env, dict) or not all(isinstance(v, str) for v in env.values()):
+            raise ValueError(f"manifest entry {index}: 'env' must map names to strings")
+        if cwd is not None and not isinstance(cwd, str):
+            raise ValueError(f"manifest entry {index}: 'cwd' must be a string")
+        commands.append({"name": str(entry.get("name") or " ".join(cmd)), "cmd": cmd, "env": env, "cwd": cwd})
+    if not commands:
+        raise ValueError("manifest contains no commands")
+    return commands
+
+
+def run_batch(binary: str, commands: list[dict], jobs: int) -> int:
+    """Run manifest commands concurrently, each through ``safe-run run``.
+
+    :param binary: Rust canonical binary
+    :param commands: Entries from load_batch_manifest()
+    :param jobs: Maximum concurrent commands
+    :returns: Aggregate exit code (see Batch Mode)
+    """
+    # pylint: disable=import-outside-toplevel
+    import subprocess
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    log_dir = os.path.abspath(os.environ.get("SAFE_LOG_DIR", ".agent/FAIL-LOGS"))
+    stopping = threading.Event()
+    output_lock = threading.Lock()
+
+    def status(line: str) -> None:
+        with output_lock:
+            sys.stderr.write(f"[safe-run batch] {line}\n")
+            sys.stderr.flush()
+
+    def execute(entry: dict) -> int:
+        if stopping.is_set():
+            return 130
+        env = dict(os.environ, SAFE_LOG_DIR=log_dir)
+        env.update(entry["env"])
+        start = time.monotonic()
+        try:
+            proc = subprocess.Popen(
+                [binary, "run", *entry["cmd"]],
+                cwd=entry["cwd"],
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            out, err = proc.communicate()
+            rc = proc.returncode if proc.returncode >= 0 else 128 - proc.returncode
+        except PermissionError as e:
+            out, err, rc = b"", f"ERROR: {e}\n".encode(), 126
+        except OSError as e:
+            # OSError: Binary vanished or cwd does not exist
+            out, err, rc = b"", f"ERROR: {e}\n".encode(), 127
+        elapsed = time.monotonic() - start
+        with output_lock:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(out)
+            sys.stdout.buffer.flush()
+            sys.stderr.flush()
+            sys.stderr.buffer.write(err)
+            word = "ok" if rc == 0 else "FAIL"
+            sys.stderr.write(f"[safe-run batch] {word} {entry['name']} (exit {rc}, {elapsed:.1f}s)\n")
+            sys.stderr.flush()
+        return rc
+
+    codes: list[int] = []
+    interrupted = False
+    pool = ThreadPoolExecutor(max_workers=min(jobs, len(commands)))
+    try:
+        futures = [pool.submit(execute, entry) for entry in commands]
+        codes = [future.result() for future in futures]
+    except KeyboardInterrupt:
+        # The running commands got the SIGINT too and write ABORTED logs
+        interrupted = True
+        stopping.set()
+    finally:
+        pool.shutdown(wait=True)
+    if interrupted:
+        status("interrupted; remaining commands were not started")
+        return 130
+
+    failed = [(entry, rc) for entry, rc in zip(commands, codes) if rc != 0]
+    summary = f"{len(commands)} commands: {len(commands) - len(failed)} ok, {len(failed)} failed"
+    if failed:
+        summary += f"; first failure: {failed[0][0]['name']} (exit {failed[0][1]}); logs: {log_dir}"
+    status(summary)
+    return failed[0][1] if failed else 0
+
+
+def batch_main(binary: str, args: list[str]) -> int:
+    """Parse ``--batch`` arguments and run the manifest.
+
+    :param binary: Rust canonical binary
+    :param args: Arguments after "--batch": MANIFEST [--jobs N]
+    :returns: Exit code (2 on usage or manifest errors, else run_batch()'s)
+    """
+    manifest = None
+    jobs = os.cpu_count() or 1
+    i = 0
+    while i < len(args):
+        if args[i] == "--jobs" and i + 1 < len(args) and args[i + 1].isdigit() and int(args[i + 1]) > 0:
+            jobs = int(args[i + 1])
+            i += 2
+        elif manifest is None and (args[i] == "-" or not args[i].startswith("--")):
+            manifest = args[i]
+            i += 1
+        else:
+            print("Usage: safe_run.py --batch <manifest|-> [--jobs N]", file=sys.stderr)
+            return 2
+    if manifest is None:
+        print("Usage: safe_run.py --batch <manifest|-> [--jobs N]", file=sys.stderr)
+        return 2
+    try:
+        commands = load_batch_manifest(manifest)
+    except ValueError as e:
+        print(f"ERROR: invalid batch manifest: {e}", file=sys.stderr)
+        return 2
+    return run_batch(binary, commands, jobs)
 
 
 def main() -> int:
@@ -302,6 +697,7 @@ def main() -> int:
     Argument Handling
     -----------------
     - Accepts optional "--" separator as first argument (stripped before forwarding)
+    - "--batch <manifest>" as first argument runs batch_main() instead
     - All arguments after "--" (or all if no "--") are passed to Rust binary
     - The wrapper prepends "run" subcommand required by Rust CLI structure
     - Final command structure: <binary> run <user_args...>
@@ -369,6 +765,8 @@ For more information, see:
 
     # Parse arguments: handle optional "--" separator
     args = sys.argv[1:]
+    if args and args[0] == "--batch":
+        return batch_main(binary, args[1:])
     if args and args[0] == "--":
         args = args[1:]
 
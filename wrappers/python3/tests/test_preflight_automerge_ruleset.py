@@ -16,6 +16,10 @@ GitHub Ruleset configuration and uses proper Bearer token authentication.
 - Ruleset not found by name: Returns exit code 3
 - Auth failure handling: Returns exit code 2 for 401/403 errors
 - M0-P2-I1 Bearer token format validation in source code
+- HTTP cache: ETag revalidation (304), TTL, --no-cache, change detection and
+  per-token keys, against a local stand-in HTTP server
+- Batch mode: per-repo JSON results, Link pagination, Retry-After backoff,
+  keep-alive connection reuse and batch argument validation
 
 :Environment Variables:
 TOKEN : str, optional
@@ -58,7 +62,8 @@ All tests run fully offline with no actual GitHub API calls.
 
 :Platform Notes:
 - All tests are platform-independent (Linux, macOS, Windows compatible)
-- No network access required (all API calls mocked)
+- No network access required (API calls are mocked or served by a local
+  http.server bound to 127.0.0.1)
 - Uses importlib to dynamically load the module under test
 """
 
@@ -67,9 +72,16 @@ from __future__ import annotations
 import importlib.util
 import json
 import os
+import sys
+import tempfile
+import threading
 import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
 from pathlib import Path
 from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
 
 HERE = Path(__file__).resolve().parent
 ROOT = HERE.parent
@@ -84,8 +96,12 @@ def load_module():
 
     Uses importlib to load the script even though it has hyphens in the
     filename (which aren't valid in Python module names). This allows
-    tests to import and inspect functions from the script.
+    tests to import and inspect functions from the script. The scripts
+    directory is put on sys.path, as it is when the script runs directly, so
+    the sibling preflight_batch.py module can be imported.
     """
+    if str(SCRIPTS) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS))
     spec = importlib.util.spec_from_file_location("preflight_automerge_ruleset", str(MODULE_PATH))
     mod = importlib.util.module_from_spec(spec)
     assert spec and spec.loader
@@ -304,3 +320,304 @@ class TestPreflightAutomergeRuleset(unittest.TestCase):
             source,
             "Should not use deprecated 'token {token}' format",
         )
+
+
+class _FakeGitHubHandler(BaseHTTPRequestHandler):
+    """Serve ruleset endpoints with ETags; state lives on the server object."""
+
+    def do_GET(self):  # noqa: N802  # pylint: disable=invalid-name
+        """Answer GET requests, honoring If-None-Match."""
+        state = self.server.state
+        state["requests"].append((self.path, dict(self.headers)))
+        resources = {
+            "/repos/owner/repo/rulesets": [{"id": 111, "name": "CI"}],
+            "/repos/owner/repo/rulesets/111": state["detail"],
+        }
+        if self.path not in resources:
+            self.send_response(404)
+            self.end_headers()
+            return
+        etag = f'"{state["version"]}-{len(self.path)}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = json.dumps(resources[self.path]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Silence per-request logging.
+
+        :param format: Log format string
+        :param args: Log arguments
+        """
+
+
+class TestPreflightHttpCache(unittest.TestCase):
+    """Test the ETag/Last-Modified HTTP cache against a local HTTP server."""
+
+    def setUp(self):
+        """Start the stand-in API server and point the module at it."""
+        self.mod = load_module()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeGitHubHandler)
+        self.server.state = {
+            "requests": [],
+            "version": 1,
+            "detail": TestPreflightAutomergeRuleset._ruleset_detail(None, ["lint"]),  # pylint: disable=protected-access
+        }
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self._td = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._td.name) / "cache"
+        env = {
+            "GITHUB_API_URL": f"http://127.0.0.1:{self.server.server_address[1]}",
+            "GITHUB_TOKEN": "dummy_token",
+            "PREFLIGHT_CACHE_DIR": str(self.cache_dir),
+        }
+        self._patches = [patch.dict(os.environ, env), patch.object(self.mod, "have_cmd", return_value=False)]
+        for p in self._patches:
+            p.start()
+        os.environ.pop("TOKEN", None)
+        os.environ.pop("PREFLIGHT_CACHE_TTL", None)
+
+    def tearDown(self):
+        """Stop the server and undo patches."""
+        for p in reversed(self._patches):
+            p.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self._td.cleanup()
+
+    def _main(self, *extra):
+        """Run main() for the fixture repository.
+
+        :param extra: Additional command-line arguments
+        :returns: Exit code
+        """
+        return self.mod.main(["--repo", "owner/repo", "--ruleset-name", "CI", "--want", '["lint"]', *extra])
+
+    def _conditional(self):
+        """List the If-None-Match headers received so far.
+
+        :returns: One value (or None) per request
+        """
+        return [headers.get("If-None-Match") for _, headers in self.server.state["requests"]]
+
+    def test_second_run_revalidates_with_etag(self):
+        """The second run sends If-None-Match and is served from the cache on 304."""
+        self.assertEqual(self._main(), 0)
+        self.assertEqual(self._main(), 0)
+
+        conditional = self._conditional()
+        self.assertEqual(len(conditional), 4)
+        self.assertEqual(conditional[:2], [None, None])
+        self.assertTrue(all(conditional[2:]))
+
+    def test_ttl_skips_requests(self):
+        """Entries younger than --cache-ttl are served without any request."""
+        self.assertEqual(self._main("--cache-ttl", "60"), 0)
+        self.assertEqual(self._main("--cache-ttl", "60"), 0)
+
+        self.assertEqual(len(self.server.state["requests"]), 2)
+
+    def test_no_cache_neither_reads_nor_writes(self):
+        """--no-cache sends unconditional requests and writes no cache files."""
+        self.assertEqual(self._main("--no-cache"), 0)
+        self.assertEqual(self._main("--no-cache"), 0)
+
+        self.assertEqual(self._conditional(), [None] * 4)
+        self.assertFalse(self.cache_dir.exists())
+
+    def test_changed_ruleset_is_not_masked(self):
+        """A new ETag replaces the cached body, so a disabled ruleset fails the check."""
+        self.assertEqual(self._main(), 0)
+        self.server.state["version"] = 2
+        self.server.state["detail"] = dict(self.server.state["detail"], enforcement="disabled")
+
+        self.assertEqual(self._main(), 1)
+
+    def test_cache_is_keyed_by_token(self):
+        """A different token never revalidates another token's entry."""
+        self.assertEqual(self._main(), 0)
+        os.environ["GITHUB_TOKEN"] = "other_token"
+        self.assertEqual(self._main(), 0)
+
+        self.assertEqual(self._conditional(), [None] * 4)
+
+    def test_invalid_ttl_is_usage_error(self):
+        """A negative --cache-ttl returns exit code 3."""
+        self.assertEqual(self._main("--cache-ttl", "-1"), 3)
+
+
+class _FakeOrgHandler(BaseHTTPRequestHandler):
+    """Serve several repositories over HTTP/1.1 keep-alive, with pagination and rate limits."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, status, obj, headers=()):
+        """Send a JSON response.
+
+        :param status: HTTP status code
+        :param obj: JSON-serializable body
+        :param headers: Extra (name, value) header pairs
+        """
+        body = json.dumps(obj).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # noqa: N802  # pylint: disable=invalid-name
+        """Answer /repos/{owner}/{repo}/rulesets[/{id}] requests."""
+        state = self.server.state
+        state["requests"].append((self.path, self.client_address[1]))
+        if state["rate_limited"]:
+            state["rate_limited"] -= 1
+            self._reply(429, {"message": "secondary rate limit"}, [("Retry-After", "7")])
+            return
+        parts = urlsplit(self.path)
+        segments = parts.path.strip("/").split("/")
+        repo = "/".join(segments[1:3])
+        if segments[0] != "repos" or repo not in state["repos"] or segments[3:4] != ["rulesets"]:
+            self._reply(404, {"message": "Not Found"})
+            return
+        rulesets = state["repos"][repo]
+        if len(segments) == 5:
+            detail = next((rs["detail"] for rs in rulesets if str(rs["id"]) == segments[4]), None)
+            self._reply(200 if detail else 404, detail or {"message": "Not Found"})
+            return
+        page = int(parse_qs(parts.query).get("page", ["1"])[0])
+        size = state["page_size"]
+        items = [{"id": rs["id"], "name": rs["name"]} for rs in rulesets[(page - 1) * size : page * size]]
+        headers = []
+        if page * size < len(rulesets):
+            headers.append(("Link", f'<{state["base"]}{parts.path}?per_page={size}&page={page + 1}>; rel="next"'))
+        self._reply(200, items, headers)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Silence per-request logging.
+
+        :param format: Log format string
+        :param args: Log arguments
+        """
+
+
+class TestPreflightBatchMode(unittest.TestCase):
+    """Test multi-repository batch verification against a local HTTP server."""
+
+    def setUp(self):
+        """Start the stand-in API server with three repositories."""
+        self.mod = load_module()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOrgHandler)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        detail = TestPreflightAutomergeRuleset._ruleset_detail  # pylint: disable=protected-access
+        self.server.state = {
+            "requests": [],
+            "rate_limited": 0,
+            "page_size": 2,
+            "base": self.base,
+            "repos": {
+                "org/good": [{"id": 111, "name": "CI", "detail": detail(None, ["lint", "test"])}],
+                "org/missing": [{"id": 111, "name": "CI", "detail": detail(None, ["lint"])}],
+                # The wanted ruleset is on the third page
+                "org/paged": [{"id": 500 + i, "name": f"Other {i}", "detail": detail(None, [])} for i in range(4)]
+                + [{"id": 777, "name": "CI", "detail": dict(detail(None, ["lint", "test"]), id=777)}],
+            },
+        }
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self._td = tempfile.TemporaryDirectory()
+        env = {"GITHUB_API_URL": self.base, "GITHUB_TOKEN": "dummy_token", "PREFLIGHT_CACHE_DIR": self._td.name}
+        self._patches = [patch.dict(os.environ, env), patch.object(self.mod, "have_cmd", return_value=False)]
+        for p in self._patches:
+            p.start()
+        os.environ.pop("TOKEN", None)
+        os.environ.pop("PREFLIGHT_CACHE_TTL", None)
+
+    def tearDown(self):
+        """Stop the server and undo patches."""
+        for p in reversed(self._patches):
+            p.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self._td.cleanup()
+
+    def _main(self, *argv):
+        """Run main() capturing the JSON report.
+
+        :param argv: Command-line arguments
+        :returns: Tuple of (exit code, parsed stdout or None, stderr)
+        """
+        out, err = StringIO(), StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            code = self.mod.main(["--no-cache", "--ruleset-name", "CI", "--want", '["lint","test"]', *argv])
+        return code, json.loads(out.getvalue()) if out.getvalue() else None, err.getvalue()
+
+    def test_repos_file_reports_each_repo(self):
+        """Every repository gets a result in input order; the worst code wins."""
+        repos_file = Path(self._td.name) / "repos.txt"
+        repos_file.write_text("# audit\norg/good\n\norg/missing\norg/paged\norg/good\n", encoding="utf-8")
+
+        code, report, stderr = self._main("--repos-file", str(repos_file), "--jobs", "3")
+
+        self.assertEqual(code, 1)
+        results = {r["repo"]: r for r in report["results"]}
+        self.assertEqual([r["repo"] for r in report["results"]], ["org/good", "org/missing", "org/paged"])
+        self.assertEqual(results["org/good"]["result"], "pass")
+        self.assertEqual(results["org/missing"]["missing"], ["test"])
+        self.assertEqual(results["org/paged"]["ruleset_id"], "777")
+        self.assertEqual(report["summary"], {"total": 3, "pass": 2, "fail": 1, "auth_error": 0, "usage_error": 0})
+        self.assertIn("WARN: org/missing: fail", stderr)
+
+    def test_repeated_repo_selects_batch_and_reports_unknown_repo(self):
+        """Several --repo options select batch mode; an unknown repo is a per-repo failure."""
+        code, report, _ = self._main("--repo", "org/good", "--repo", "org/absent")
+
+        self.assertEqual(code, 2)
+        self.assertEqual([r["result"] for r in report["results"]], ["pass", "auth_error"])
+
+    def test_connections_are_reused(self):
+        """A single worker sends every request over one keep-alive connection."""
+        code, _, _ = self._main("--repo", "org/good", "--repo", "org/paged", "--jobs", "1")
+
+        self.assertEqual(code, 0)
+        requests = self.server.state["requests"]
+        self.assertEqual(len(requests), 6)
+        self.assertEqual(len({port for _, port in requests}), 1)
+
+    def test_retry_after_is_honored(self):
+        """A 429 with Retry-After is retried after the advertised wait."""
+        self.server.state["rate_limited"] = 1
+        waits = []
+        client = self.mod.GitHubClient(self.base, "dummy_token", "2022-11-28")
+        client.sleep = waits.append
+
+        result = self.mod.verify_repo(client, "org/good", "111", None, ["lint"])
+        client.close()
+
+        self.assertEqual(result["result"], "pass")
+        self.assertEqual(len(self.server.state["requests"]), 2)
+        self.assertEqual(len(waits), 1)
+        self.assertAlmostEqual(waits[0], 7, delta=1)
+
+    def test_invalid_batch_arguments_are_usage_errors(self):
+        """Bad --jobs values, malformed repositories and unreadable files return 3."""
+        for argv in (
+            ["--repo", "org/good", "--repo", "org/paged", "--jobs", "0"],
+            ["--repo", "org/good", "--repo", "not-a-repo"],
+            ["--repos-file", str(Path(self._td.name) / "absent.txt")],
+        ):
+            with self.subTest(argv=argv):
+                code, report, stderr = self._main(*argv)
+                self.assertEqual(code, 3)
+                self.assertIsNone(report)
+                self.assertIn("ERROR:", stderr)
@@ -0,0 +1,166 @@
+"""Unit tests for the run_conformance.py vector runner.
+
+This test module validates that run_conformance.py loads conformance vectors,
+expands their templates, executes them in isolated directories and compares
+the results against each vector's expected conditions.
+
+:Purpose:
+Keeps the Python conformance runner honest: a vector must pass only when every
+expected condition holds, and vectors that cannot run are errors, not passes.
+
+:Test Coverage:
+- args_template expansion (print_and_exit, create_non_executable_file)
+- Expected-condition checks (exit code ranges, case-insensitive stream
+  matching, artifact detection, unsupported keys)
+- Preflight vectors from conformance/vectors.json against the local mock API,
+  through the process pool, with per-vector timings
+- safe_run vectors through safe_run.py with a stub canonical binary
+- Missing binary and unknown vector IDs
+
+:Environment Variables:
+None. The runner strips the variables vectors control from its children.
+
+:Examples:
+Run tests via pytest::
+
+    pytest test_run_conformance.py
+
+:Exit Codes:
+0
+    All tests passed
+1
+    One or more tests failed
+
+:Platform Notes:
+- The stub binary is a POSIX shell script; that test is skipped elsewhere
+- No network access required (preflight vectors use a local http.server)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+ROOT = HERE.parent
+
+# Imported by name (not from a file spec) so process-pool workers can unpickle run_vector
+sys.path.insert(0, str(ROOT))
+
+import run_conformance  # noqa: E402  # pylint: disable=wrong-import-position
+
+
+class TestRunConformance(unittest.TestCase):
+    """Test the conformance vector runner."""
+
+    def setUp(self):
+        """Load the runner and the canonical vectors."""
+        self.mod = run_conformance
+        self.vectors = {
+            vector["id"]: (category, vector) for category, vector in self.mod.load_vectors(self.mod.VECTORS_DEFAULT)
+        }
+        self._td = tempfile.TemporaryDirectory()
+        self.workdir = Path(self._td.name)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._td.cleanup()
+
+    def test_print_and_exit_template(self):
+        """print_and_exit expands to a command with the vector's output and exit code."""
+        argv = self.mod.expand_template(
+            {"args_template": "print_and_exit", "print_stdout": "O", "print_stderr": "E", "exit_code": 7},
+            self.workdir,
+        )
+
+        proc = subprocess.run(argv, capture_output=True, text=True, check=False)
+
+        self.assertEqual((proc.returncode, proc.stdout, proc.stderr), (7, "O", "E"))
+
+    def test_file_templates_create_files(self):
+        """create_non_executable_file writes the file without execute bits and returns check_args."""
+        argv = self.mod.expand_template(
+            {"args_template": "create_non_executable_file", "file_path": "./x.sh", "check_args": ["check", "./x.sh"]},
+            self.workdir,
+        )
+
+        self.assertEqual(argv, ["check", "./x.sh"])
+        self.assertFalse(os.access(self.workdir / "x.sh", os.X_OK))
+        with self.assertRaises(ValueError):
+            self.mod.expand_template({"args_template": "no_such_template"}, self.workdir)
+
+    def test_check_expected(self):
+        """Exit code ranges, case-insensitive matching, artifacts and unknown keys are all checked."""
+        before = self.mod.snapshot_files(self.workdir)
+        (self.workdir / "new.log").write_text("x", encoding="utf-8")
+        result = {
+            "exit_code": 42,
+            "stdout": "",
+            "stderr": "ERROR: Ruleset not found",
+            "files_before": before,
+            "auth_headers": [],
+        }
+
+        failures = self.mod.check_expected(
+            {
+                "exit_code_range": [40, 49],
+                "stderr_contains": ["ruleset", "not found"],
+                "artifacts_created": False,
+                "brand_new_key": True,
+            },
+            self.workdir,
+            {},
+            result,
+        )
+
+        self.assertEqual(len(failures), 2)
+        self.assertEqual(failures[0], "unsupported expectation: brand_new_key")
+        self.assertIn("artifacts_created is True", failures[1])
+
+    def test_preflight_vectors_through_pool(self):
+        """Preflight vectors run against the mock API in worker processes, with timings."""
+        selected = [self.vectors["preflight-001"], self.vectors["preflight-003"]]
+
+        report = self.mod.run(selected, jobs=2, timeout=60, binary=None)
+
+        self.assertEqual([r["id"] for r in report["results"]], ["preflight-001", "preflight-003"])
+        self.assertEqual([r["status"] for r in report["results"]], ["pass", "pass"], report["results"])
+        self.assertTrue(all(r["duration_ms"] > 0 for r in report["results"]))
+        self.assertEqual(report["summary"]["pass"], 2)
+
+    @unittest.skipUnless(os.name == "posix", "stub binary is a shell script")
+    def test_safe_run_vector_with_stub_binary(self):
+        """safe_run vectors go through safe_run.py, which execs the canonical binary."""
+        stub = self.workdir / "safe-run"
+        stub.write_text('#!/bin/sh\n[ "$1" = run ] || exit 99\nshift\nexec "$@"\n', encoding="utf-8")
+        stub.chmod(0o755)
+
+        result = self.mod.run_vector(*self.vectors["safe-run-001"], binary=str(stub), timeout=60)
+
+        self.assertEqual(result["status"], "pass", result["failures"])
+
+    def test_missing_binary_is_an_error(self):
+        """Vectors that need the canonical binary are errors when it is missing."""
+        result = self.mod.run_vector(*self.vectors["safe-archive-001"], binary=None, timeout=60)
+
+        self.assertEqual(result["status"], "error")
+        self.assertIn("binary not found", result["failures"][0])
+
+    def test_unknown_vector_id_is_usage_error(self):
+        """An unknown --id exits 2 before running anything."""
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            code = self.mod.main(["--id", "no-such-vector"])
+
+        self.assertEqual(code, 2)
+        self.assertIn("no-such-vector", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
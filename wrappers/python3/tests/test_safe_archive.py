@@ -15,6 +15,11 @@ M0-P1-I3 no-clobber contract and archival operations.
 - Gzip compression: Archives with gzip compression (Python built-in)
 - Specific file archival: Archives individual files by path
 - Move semantics: Source file removed after archival (not copied)
+- Batch mode: all-or-nothing strict checks, same-name sources, compressed-name
+  collisions, chunked xz compression
+- Bundle mode: single tar stream containing every source
+- Retention: --prune eviction order, --keep-last, --dry-run, the append-only
+  index manifest and its invalidation on external changes
 
 :Environment Variables:
 SAFE_FAIL_DIR : str, optional
@@ -64,10 +69,15 @@ All tests use temporary directories for isolation.
 from __future__ import annotations
 
 import gzip
+import importlib.util
+import lzma
 import os
+import shutil
 import subprocess
 import sys
+import tarfile
 import tempfile
+import time
 import unittest
 from pathlib import Path
 
@@ -109,6 +119,33 @@ def run_archive(args, workdir: Path, env=None, timeout=25):
     return subprocess.run(cmd, cwd=str(workdir), env=e, text=True, capture_output=True, timeout=timeout)
 
 
+def load_module(name: str = "safe_archive"):
+    """Load a script from scripts/ as a module for in-process unit tests.
+
+    The scripts directory is put on sys.path, as it is when the script runs
+    directly, so safe_archive.py can import safe_archive_retention.py.
+
+    :param name: Script module name (default: safe_archive)
+    :returns: Loaded module object
+    """
+    if str(SCRIPTS) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS))
+    spec = importlib.util.spec_from_file_location(name, str(SCRIPTS / f"{name}.py"))
+    mod = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _artifact_names(directory: Path):
+    """List archived artifact names, ignoring the hidden index manifest.
+
+    :param directory: Archive directory
+    :returns: Sorted non-hidden file names
+    """
+    return sorted(entry.name for entry in directory.iterdir() if not entry.name.startswith("."))
+
+
 class TestSafeArchive(unittest.TestCase):
     """Test safe_archive.py wrapper script functionality.
 
@@ -238,5 +275,220 @@ class TestSafeArchive(unittest.TestCase):
             self.assertTrue(f2.exists())
 
 
+class TestSafeArchiveBatch(unittest.TestCase):
+    """Test batch archival (name index, concurrent compression) and --bundle."""
+
+    def setUp(self):
+        """Create the FAIL-LOGS and FAIL-ARCHIVE directories."""
+        self._td = tempfile.TemporaryDirectory()
+        self.wd = Path(self._td.name)
+        self.fail = self.wd / ".agent" / "FAIL-LOGS"
+        self.arc = self.wd / ".agent" / "FAIL-ARCHIVE"
+        self.fail.mkdir(parents=True)
+        self.arc.mkdir(parents=True)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._td.cleanup()
+
+    def test_strict_collision_moves_nothing(self):
+        """A strict no-clobber collision on any file leaves every source in place."""
+        (self.fail / "a.log").write_text("A", encoding="utf-8")
+        (self.fail / "b.log").write_text("B", encoding="utf-8")
+        (self.arc / "b.log").write_text("OLD", encoding="utf-8")
+
+        r = run_archive(["--no-clobber", "--all"], self.wd)
+
+        self.assertEqual(r.returncode, 2)
+        self.assertIn("Destination exists", r.stderr)
+        self.assertTrue((self.fail / "a.log").exists())
+        self.assertFalse((self.arc / "a.log").exists())
+
+    def test_same_basename_sources_get_distinct_suffixes(self):
+        """Sources sharing a basename are reserved distinct names within one batch."""
+        sources = []
+        for index in range(3):
+            src = self.wd / f"run{index}" / "fail.log"
+            src.parent.mkdir()
+            src.write_text(str(index), encoding="utf-8")
+            sources.append(str(src))
+
+        r = run_archive(sources, self.wd)
+
+        self.assertEqual(r.returncode, 0, msg=r.stderr)
+        contents = [(self.arc / name).read_text(encoding="utf-8") for name in ("fail.log", "fail.log.2", "fail.log.3")]
+        self.assertEqual(contents, ["0", "1", "2"])
+
+    def test_compressed_name_counts_as_collision(self):
+        """An existing name.gz is never overwritten by compressing a new name."""
+        with gzip.open(self.arc / "x.log.gz", "wt", encoding="utf-8") as f:
+            f.write("OLD")
+        (self.fail / "x.log").write_text("NEW", encoding="utf-8")
+
+        r = run_archive(["--all"], self.wd, env={"SAFE_ARCHIVE_COMPRESS": "gzip"})
+
+        self.assertEqual(r.returncode, 0, msg=r.stderr)
+        with gzip.open(self.arc / "x.log.gz", "rt", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "OLD")
+        with gzip.open(self.arc / "x.log.2.gz", "rt", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "NEW")
+
+    @unittest.skipUnless(shutil.which("xz"), "xz not installed")
+    def test_xz_batch_compresses_every_file(self):
+        """Chunked xz invocations compress every archived file."""
+        for index in range(10):
+            (self.fail / f"f{index}.log").write_text(f"log {index}", encoding="utf-8")
+
+        r = run_archive(["--jobs", "3", "--all"], self.wd, env={"SAFE_ARCHIVE_COMPRESS": "xz"})
+
+        self.assertEqual(r.returncode, 0, msg=r.stderr)
+        self.assertEqual(_artifact_names(self.arc), sorted(f"f{i}.log.xz" for i in range(10)))
+        self.assertEqual(lzma.decompress((self.arc / "f7.log.xz").read_bytes()), b"log 7")
+
+    def test_bundle_writes_single_tar_stream(self):
+        """--bundle stores every source in one tar file and removes the sources."""
+        names = [f"fail-{index}.txt" for index in range(5)]
+        for name in names:
+            (self.fail / name).write_text(name, encoding="utf-8")
+
+        r = run_archive(["--bundle", "--all"], self.wd, env={"SAFE_ARCHIVE_COMPRESS": "gzip"})
+
+        self.assertEqual(r.returncode, 0, msg=r.stderr)
+        bundles = [self.arc / name for name in _artifact_names(self.arc)]
+        self.assertEqual(len(bundles), 1)
+        self.assertTrue(bundles[0].name.startswith("fail-logs-"))
+        self.assertTrue(bundles[0].name.endswith(".tar.gz"))
+        with tarfile.open(bundles[0]) as tar:
+            self.assertEqual(tar.getnames(), names)
+            self.assertEqual(tar.extractfile("fail-3.txt").read(), b"fail-3.txt")
+        self.assertEqual(list(self.fail.iterdir()), [])
+
+    def test_invalid_jobs_is_error(self):
+        """A non-positive --jobs value exits 2 without moving files."""
+        (self.fail / "a.log").write_text("A", encoding="utf-8")
+
+        r = run_archive(["--jobs", "0", "--all"], self.wd)
+
+        self.assertEqual(r.returncode, 2)
+        self.assertIn("--jobs", r.stderr)
+        self.assertTrue((self.fail / "a.log").exists())
+
+
+class TestSafeArchiveRetention(unittest.TestCase):
+    """Test the --prune retention policy and the index manifest."""
+
+    def setUp(self):
+        """Create the FAIL-LOGS and FAIL-ARCHIVE directories."""
+        self._td = tempfile.TemporaryDirectory()
+        self.wd = Path(self._td.name)
+        self.fail = self.wd / ".agent" / "FAIL-LOGS"
+        self.arc = self.wd / ".agent" / "FAIL-ARCHIVE"
+        self.fail.mkdir(parents=True)
+        self.arc.mkdir(parents=True)
+        self.mod = load_module()
+        self.retention = load_module("safe_archive_retention")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._td.cleanup()
+
+    def _make(self, directory: Path, name: str, size: int, age: float) -> Path:
+        """Create an artifact of a given size and age.
+
+        :param directory: Target directory
+        :param name: File name
+        :param size: Size in bytes
+        :param age: Age in seconds (mtime is set to now - age)
+        :returns: Path of the created file
+        """
+        path = directory / name
+        path.write_bytes(b"x" * size)
+        stamp = time.time() - age
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def test_select_evictions_policy(self):
+        """keep_last protects the newest; age evicts first, then size from the oldest."""
+        artifacts = {"a": (10, 100.0), "b": (10, 200.0), "c": (10, 300.0), "d": (10, 400.0)}
+        select = self.retention.select_evictions
+
+        self.assertEqual(select(artifacts, max_age=150, now=450.0), ["a", "b"])
+        self.assertEqual(select(artifacts, max_bytes=25, now=450.0), ["a", "b"])
+        self.assertEqual(select(artifacts, max_bytes=0, keep_last=3, now=450.0), ["a"])
+        self.assertEqual(select(artifacts, max_age=1000, max_bytes=40, now=450.0), [])
+
+    def test_prune_evicts_oldest_over_budget(self):
+        """--prune --max-bytes removes the oldest archives until the budget fits."""
+        for index, name in enumerate(["old.log", "mid.log", "new.log"]):
+            self._make(self.arc, name, 100, age=3600 * (3 - index))
+
+        r = run_archive(["--prune", "--max-bytes", "150"], self.wd)
+
+        self.assertEqual(r.returncode, 0, msg=r.stderr)
+        self.assertEqual(_artifact_names(self.arc), ["new.log"])
+        self.assertIn("PRUNED: 2 file(s), 200 bytes", r.stderr)
+
+    def test_prune_fail_logs_by_age_with_keep_last_and_dry_run(self):
+        """FAIL-LOGS is pruned by age, keeping the newest N; --dry-run deletes nothing."""
+        for index in range(4):
+            self._make(self.fail, f"fail-{index}.txt", 10, age=86400 * (10 - index))
+
+        args = ["--prune", "--max-age", "1d", "--keep-last", "1"]
+        dry = run_archive(args + ["--dry-run"], self.wd)
+        self.assertEqual(dry.returncode, 0, msg=dry.stderr)
+        self.assertEqual(len(list(self.fail.iterdir())), 4)
+        self.assertIn("WOULD PRUNE: 3 file(s)", dry.stderr)
+
+        r = run_archive(args, self.wd)
+        self.assertEqual(r.returncode, 0, msg=r.stderr)
+        self.assertEqual(_artifact_names(self.fail), ["fail-3.txt"])
+
+    def test_prune_requires_a_limit(self):
+        """--prune without --max-bytes or --max-age is an error."""
+        r = run_archive(["--prune", "--keep-last", "3"], self.wd)
+
+        self.assertEqual(r.returncode, 2)
+        self.assertIn("--prune requires", r.stderr)
+
+    def test_manifest_follows_archives_and_external_changes(self):
+        """Archiving appends to the manifest; a foreign file invalidates it until refreshed."""
+        src = self._make(self.fail, "run.log", 7, age=0)
+        self.assertEqual(self.mod.archive_batch([str(src)], str(self.arc), "gzip"), [])
+
+        manifest = self.retention.ArchiveManifest(str(self.arc))
+        self.assertTrue(manifest.valid)
+        self.assertEqual(list(manifest.entries), ["run.log.gz"])
+
+        self._make(self.arc, "foreign.log", 3, age=0)
+        manifest = self.retention.ArchiveManifest(str(self.arc))
+        self.assertFalse(manifest.valid)
+        manifest.refresh()
+        self.assertEqual(sorted(manifest.entries), ["foreign.log", "run.log.gz"])
+        self.assertTrue(self.retention.ArchiveManifest(str(self.arc)).valid)
+
+    def test_list_reads_manifest_oldest_first(self):
+        """--list prints one tab-separated line per artifact, oldest first."""
+        self._make(self.arc, "b.log", 2, age=10)
+        self._make(self.arc, "a.log", 1, age=20)
+
+        r = run_archive(["--list"], self.wd)
+
+        self.assertEqual(r.returncode, 0, msg=r.stderr)
+        rows = [line.split("\t") for line in r.stdout.splitlines()]
+        self.assertEqual([(row[1], row[2]) for row in rows], [("1", "a.log"), ("2", "b.log")])
+
+    def test_list_accepts_options_and_rejects_files(self):
+        """--list is parsed like the other flags; leftover file arguments are an error."""
+        self._make(self.arc, "a.log", 1, age=20)
+
+        r = run_archive(["--list", "--jobs", "2"], self.wd)
+        self.assertEqual(r.returncode, 0, msg=r.stderr)
+        self.assertEqual([line.split("\t")[2] for line in r.stdout.splitlines()], ["a.log"])
+
+        r = run_archive(["--list", "a.log"], self.wd)
+        self.assertEqual(r.returncode, 2)
+        self.assertIn("--list takes no file arguments", r.stderr)
+
+
 if __name__ == "__main__":
     unittest.main()
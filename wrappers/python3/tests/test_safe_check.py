@@ -14,6 +14,9 @@ works correctly in a clean, isolated environment.
 - Verifies safe-run success path doesn't create artifacts
 - Verifies safe-archive moves files correctly
 - Verifies safe-archive respects no-clobber semantics (M0-P1-I3)
+- Sandboxed checks against a stub canonical binary: nothing written to the
+  working directory, exact artifact diffs catch a wrapper that logs on
+  success, --repeat latency percentiles, argument validation
 
 :Environment Variables:
 SAFE_RUN_BIN : str, optional
@@ -105,8 +108,10 @@ class TestSafeCheck(unittest.TestCase):
             for name in [
                 "safe_run.py",
                 "safe_archive.py",
+                "safe_archive_retention.py",
                 "safe_check.py",
                 "preflight_automerge_ruleset.py",
+                "preflight_batch.py",
             ]:
                 (scripts_dir / name).write_bytes((SCRIPTS / name).read_bytes())
 
@@ -125,3 +130,92 @@ class TestSafeCheck(unittest.TestCase):
             )
             # sanity: should mention PASS somewhere
             self.assertRegex(proc.stdout + proc.stderr, r"PASS|OK")
+
+
+STUB_SAFE_RUN = """#!{python}
+import os, subprocess, sys, time
+args = sys.argv[2:]
+if args[:1] == ["--"]:
+    args = args[1:]
+proc = subprocess.run(args, capture_output=True)
+sys.stdout.buffer.write(proc.stdout)
+if proc.returncode or {leaky}:
+    log_dir = os.environ.get("SAFE_LOG_DIR", ".agent/FAIL-LOGS")
+    os.makedirs(log_dir, exist_ok=True)
+    name = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime()) + "-pid%d-FAIL.log" % os.getpid()
+    with open(os.path.join(log_dir, name), "wb") as f:
+        f.write(b"=== STDOUT ===\\n" + proc.stdout + b"=== STDERR ===\\n" + proc.stderr)
+sys.exit(proc.returncode)
+"""
+
+
+@unittest.skipUnless(os.name == "posix", "stub binary needs a shebang")
+class TestSafeCheckSandboxed(unittest.TestCase):
+    """Test sandboxed, concurrent checks against a stub safe-run binary."""
+
+    def setUp(self):
+        """Copy the scripts into a working directory and write stub binaries."""
+        self._td = tempfile.TemporaryDirectory()
+        self.wd = Path(self._td.name) / "repo"
+        scripts_dir = self.wd / "scripts" / "python3"
+        scripts_dir.mkdir(parents=True)
+        for name in ["safe_run.py", "safe_archive.py", "safe_archive_retention.py", "safe_check.py"]:
+            (scripts_dir / name).write_bytes((SCRIPTS / name).read_bytes())
+        self.stubs = {}
+        for leaky in (False, True):
+            stub = Path(self._td.name) / ("leaky-safe-run" if leaky else "safe-run")
+            stub.write_text(STUB_SAFE_RUN.format(python=sys.executable, leaky=leaky), encoding="utf-8")
+            stub.chmod(0o755)
+            self.stubs[leaky] = str(stub)
+
+    def tearDown(self):
+        """Remove the working directory."""
+        self._td.cleanup()
+
+    def _safe_check(self, *args, leaky=False):
+        """Run the copied safe_check.py with a stub binary.
+
+        :param args: safe_check.py arguments
+        :param leaky: Use a stub that also writes a log for successful commands
+        :returns: subprocess.CompletedProcess
+        """
+        env = dict(os.environ, SAFE_RUN_BIN=self.stubs[leaky], SAFE_RUN_NO_CACHE="1")
+        return subprocess.run(
+            [sys.executable, "scripts/python3/safe_check.py", *args],
+            cwd=str(self.wd),
+            env=env,
+            text=True,
+            capture_output=True,
+            timeout=120,
+        )
+
+    def test_passes_without_touching_cwd(self):
+        """All four checks pass and nothing is written to the working directory."""
+        proc = self._safe_check()
+
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        for name in ("failure-path", "success-path", "move", "no-clobber"):
+            self.assertIn(f"{name} OK", proc.stderr)
+        self.assertEqual(sorted(p.name for p in self.wd.iterdir()), ["scripts"])
+
+    def test_success_artifact_is_detected(self):
+        """A wrapper that writes a log on success fails only the success-path check."""
+        proc = self._safe_check(leaky=True)
+
+        self.assertEqual(proc.returncode, 1)
+        self.assertIn("ERROR: safe_run success-path: safe_run success created artifacts", proc.stderr)
+        self.assertIn("INFO: safe_run failure-path OK", proc.stderr)
+
+    def test_repeat_reports_latency_percentiles(self):
+        """--repeat N runs every check N times and prints per-scenario percentiles."""
+        proc = self._safe_check("--repeat", "3", "--jobs", "6")
+
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        self.assertRegex(proc.stderr, r"latency safe_run fail: n=9 p50=[\d.]+ms p90=[\d.]+ms p99=[\d.]+ms max=")
+        self.assertIn("latency safe_archive collision: n=3", proc.stderr)
+
+    def test_invalid_arguments_are_usage_errors(self):
+        """Unknown options and non-positive counts exit 2."""
+        for args in (["--repeat", "0"], ["--jobs", "x"], ["--bogus"], ["--repeat"]):
+            with self.subTest(args=args):
+                self.assertEqual(self._safe_check(*args).returncode, 2)
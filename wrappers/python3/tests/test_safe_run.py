@@ -16,6 +16,11 @@ canonical tool and satisfies contract requirements per M0-P1-I1 and M0-P1-I2.
 - SIGINT handling: Creates ABORTED log with exit code 130
 - Event ledger: Sequence numbers and standardized META events
 - Merged view: Optional SAFE_RUN_VIEW=merged format
+- Binary discovery cache: hits, invalidation by binary/candidate/PATH changes,
+  SAFE_RUN_BIN and SAFE_RUN_NO_CACHE bypass (in-process, no Rust binary needed)
+- Batch mode: JSON and NDJSON manifests, per-command env and exit codes,
+  shared log directory, --jobs limit, aggregate exit code, invalid
+  manifests (stub canonical binary, no Rust binary needed)
 
 :Contract Validation:
 - safe-run-001: Exit code preservation (test_failure_creates_log_and_preserves_exit_code)
@@ -64,6 +69,8 @@ Run tests via unittest::
 
 from __future__ import annotations
 
+import importlib.util
+import json
 import os
 import signal
 import subprocess
@@ -72,6 +79,7 @@ import tempfile
 import time
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 HERE = Path(__file__).resolve().parent
 ROOT = HERE.parent
@@ -330,5 +338,264 @@ class TestSafeRun(unittest.TestCase):
             self.assertIn("[#2][STDOUT] line1", content)
 
 
+def load_module():
+    """Load safe_run.py as a module for in-process discovery tests.
+
+    :returns: Loaded module object
+    """
+    spec = importlib.util.spec_from_file_location("safe_run", str(SAFE_RUN))
+    mod = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class TestSafeRunDiscoveryCache(unittest.TestCase):
+    """Test the per-user binary discovery cache."""
+
+    def setUp(self):
+        """Create a fake repository root, a PATH directory and a cache file location."""
+        self._td = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._td.name)
+        self.repo = self.tmp / "repo"
+        self.repo.mkdir()
+        self.path_dir = self.tmp / "bin"
+        self.path_dir.mkdir()
+        self.dev_bin = self.repo / "rust" / "target" / "release" / "safe-run"
+        self.mod = load_module()
+        env = {"PATH": str(self.path_dir), "SAFE_RUN_CACHE_FILE": str(self.tmp / "cache.json")}
+        self._patches = [
+            patch.dict(os.environ, env),
+            patch.object(self.mod, "find_repo_root", return_value=self.repo),
+            patch.object(self.mod, "detect_platform", return_value="linux/x86_64"),
+        ]
+        for p in self._patches:
+            p.start()
+        os.environ.pop("SAFE_RUN_BIN", None)
+        os.environ.pop("SAFE_RUN_NO_CACHE", None)
+
+    def tearDown(self):
+        """Undo patches and remove the temporary directory."""
+        for p in reversed(self._patches):
+            p.stop()
+        self._td.cleanup()
+
+    def _make_exe(self, path: Path, content: str = "#!/bin/sh\n") -> Path:
+        """Create an executable file.
+
+        :param path: File to create
+        :param content: File content
+        :returns: The path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        path.chmod(0o755)
+        return path
+
+    def _find_without_discovery(self):
+        """Call find_safe_run_binary() with discovery disabled.
+
+        :returns: Result served from the cache
+        """
+        with patch.object(self.mod, "discover_safe_run_binary", side_effect=AssertionError("cache miss")):
+            return self.mod.find_safe_run_binary()
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX execute bits")
+    def test_second_lookup_is_served_from_cache(self):
+        """A valid entry answers without running discovery."""
+        self._make_exe(self.dev_bin)
+
+        self.assertEqual(self.mod.find_safe_run_binary(), str(self.dev_bin))
+        self.assertEqual(self._find_without_discovery(), str(self.dev_bin))
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX execute bits")
+    def test_changed_or_removed_binary_invalidates(self):
+        """Rebuilding or deleting the cached binary forces rediscovery."""
+        self._make_exe(self.dev_bin)
+        self.mod.find_safe_run_binary()
+
+        self._make_exe(self.dev_bin, "#!/bin/sh\n# rebuilt\n")
+        with self.assertRaises(AssertionError):
+            self._find_without_discovery()
+
+        self.dev_bin.unlink()
+        self.assertIsNone(self.mod.find_safe_run_binary())
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX execute bits")
+    def test_new_higher_priority_binary_wins(self):
+        """A dev build appearing after a cached PATH hit is picked up."""
+        on_path = self._make_exe(self.path_dir / "safe-run")
+        self.assertEqual(self.mod.find_safe_run_binary(), str(on_path))
+        self.assertEqual(self._find_without_discovery(), str(on_path))
+
+        self._make_exe(self.dev_bin)
+        self.assertEqual(self.mod.find_safe_run_binary(), str(self.dev_bin))
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX execute bits")
+    def test_earlier_path_directory_change_invalidates(self):
+        """Installing safe-run in an earlier PATH directory forces rediscovery."""
+        early = self.tmp / "early"
+        early.mkdir()
+        os.environ["PATH"] = os.pathsep.join([str(early), str(self.path_dir)])
+        self._make_exe(self.path_dir / "safe-run")
+        self.mod.find_safe_run_binary()
+
+        shadow = self._make_exe(early / "safe-run")
+        self.assertEqual(self.mod.find_safe_run_binary(), str(shadow))
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX execute bits")
+    def test_path_change_and_overrides_bypass_entry(self):
+        """A different PATH misses; SAFE_RUN_BIN and SAFE_RUN_NO_CACHE skip the cache."""
+        self._make_exe(self.dev_bin)
+        self.mod.find_safe_run_binary()
+
+        os.environ["PATH"] = str(self.tmp)
+        with self.assertRaises(AssertionError):
+            self._find_without_discovery()
+
+        os.environ["SAFE_RUN_BIN"] = "/custom/safe-run"
+        self.assertEqual(self._find_without_discovery(), "/custom/safe-run")
+        del os.environ["SAFE_RUN_BIN"]
+
+        os.environ["SAFE_RUN_NO_CACHE"] = "1"
+        self.assertIsNone(self.mod.cache_file_path())
+
+    def test_corrupt_cache_file_is_ignored(self):
+        """An unreadable cache file behaves like an empty cache."""
+        cache_file = Path(os.environ["SAFE_RUN_CACHE_FILE"])
+        cache_file.write_text("{not json", encoding="utf-8")
+
+        self.assertEqual(self.mod.load_cache(str(cache_file)), {})
+
+
+# Minimal stand-in for the canonical binary: runs "run <cmd...>", writes a
+# FAIL log into SAFE_LOG_DIR on failure and records start/end times
+STUB_SAFE_RUN = """#!{python}
+import os, subprocess, sys, time
+assert sys.argv[1] == "run"
+start = time.time()
+rc = subprocess.run(sys.argv[2:]).returncode
+log_dir = os.environ.get("SAFE_LOG_DIR", ".agent/FAIL-LOGS")
+if rc != 0:
+    os.makedirs(log_dir, exist_ok=True)
+    with open(os.path.join(log_dir, "%d-%d-FAIL.log" % (time.time_ns(), os.getpid())), "w") as f:
+        f.write("exit %d\\n" % rc)
+timeline = os.environ.get("STUB_TIMELINE")
+if timeline:
+    with open(timeline, "a") as f:
+        f.write("%f %f\\n" % (start, time.time()))
+sys.exit(rc)
+"""
+
+
+@unittest.skipIf(sys.platform == "win32", "stub binary relies on a shebang")
+class TestSafeRunBatch(unittest.TestCase):
+    """Test --batch manifest mode against a stub canonical binary."""
+
+    def setUp(self):
+        """Create a work directory and the stub binary."""
+        self._td = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._td.name)
+        self.workdir = self.tmp / "work"
+        self.workdir.mkdir()
+        stub = self.tmp / "safe-run"
+        stub.write_text(STUB_SAFE_RUN.format(python=_py()), encoding="utf-8")
+        stub.chmod(0o755)
+        self.env = {"SAFE_RUN_BIN": str(stub), "SAFE_RUN_NO_CACHE": "1"}
+        self.env_without_log_dir = {k: v for k, v in os.environ.items() if k != "SAFE_LOG_DIR"}
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._td.cleanup()
+
+    def _batch(self, manifest: str, *extra: str, name: str = "manifest.json"):
+        """Write a manifest and run safe_run.py --batch on it.
+
+        :param manifest: Manifest text
+        :param extra: Additional arguments after the manifest path
+        :param name: Manifest file name
+        :returns: subprocess.CompletedProcess
+        """
+        path = self.tmp / name
+        path.write_text(manifest, encoding="utf-8")
+        with patch.dict(os.environ, self.env_without_log_dir, clear=True):
+            return run_safe_run(["--batch", str(path), *extra], self.workdir, env=self.env, timeout=60)
+
+    def test_mixed_batch_aggregate_exit_and_shared_logs(self):
+        """Failures keep their exit codes and logs; the first failure sets the aggregate code."""
+        (self.workdir / "sub").mkdir()
+        manifest = {
+            "commands": [
+                {"name": "passes", "cmd": [_py(), "-c", "print('hello')"]},
+                {
+                    "name": "env",
+                    "cmd": [_py(), "-c", "import os,sys; sys.exit(int(os.environ['CODE']))"],
+                    "env": {"CODE": "3"},
+                },
+                {"name": "in-sub", "cmd": [_py(), "-c", "import sys; sys.exit(7)"], "cwd": "sub"},
+            ]
+        }
+
+        proc = self._batch(json.dumps(manifest))
+
+        self.assertEqual(proc.returncode, 3, proc.stderr)
+        self.assertIn("hello", proc.stdout)
+        self.assertIn("[safe-run batch] ok passes (exit 0,", proc.stderr)
+        self.assertIn("[safe-run batch] FAIL env (exit 3,", proc.stderr)
+        self.assertIn("[safe-run batch] FAIL in-sub (exit 7,", proc.stderr)
+        self.assertIn("3 commands: 1 ok, 2 failed", proc.stderr)
+        # Both failures log into the wrapper's directory, not the command's cwd
+        self.assertEqual(len(list_fail_logs(self.workdir / ".agent" / "FAIL-LOGS")), 2)
+        self.assertFalse((self.workdir / "sub" / ".agent").exists())
+
+    def test_ndjson_manifest(self):
+        """NDJSON manifests with argv arrays and objects are accepted."""
+        manifest = "\n".join(
+            [
+                json.dumps([_py(), "-c", "print('one')"]),
+                "",
+                json.dumps({"cmd": [_py(), "-c", "print('two')"]}),
+            ]
+        )
+
+        proc = self._batch(manifest, name="matrix.ndjson")
+
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        # Output blocks appear in completion order
+        self.assertEqual(sorted(proc.stdout.split()), ["one", "two"])
+        self.assertEqual(list_fail_logs(self.workdir / ".agent" / "FAIL-LOGS"), [])
+
+    def test_jobs_limit(self):
+        """--jobs 1 runs commands one after another; a higher limit overlaps them."""
+        sleeper = [_py(), "-c", "import time; time.sleep(0.3)"]
+        manifest = json.dumps([sleeper] * 3)
+
+        def overlaps(jobs: str) -> bool:
+            timeline = self.tmp / f"timeline-{jobs}"
+            self.env["STUB_TIMELINE"] = str(timeline)
+            proc = self._batch(manifest, "--jobs", jobs)
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            spans = sorted(tuple(map(float, line.split())) for line in timeline.read_text().splitlines())
+            self.assertEqual(len(spans), 3)
+            return any(later[0] < earlier[1] for earlier, later in zip(spans, spans[1:]))
+
+        self.assertFalse(overlaps("1"))
+        self.assertTrue(overlaps("3"))
+
+    def test_invalid_manifest_and_arguments(self):
+        """Invalid manifests and --jobs values exit 2 without running anything."""
+        for manifest, extra in (
+            ('[{"cmd": []}]', ()),
+            ('{"commands": [{"cmd": ["true"], "env": {"A": 1}}]}', ()),
+            ("[]", ()),
+            ("not json\n", ()),
+            ('[["true"]]', ("--jobs", "0")),
+        ):
+            with self.subTest(manifest=manifest, extra=extra):
+                proc = self._batch(manifest, *extra)
+                self.assertEqual(proc.returncode, 2, proc.stderr)
+                self.assertNotIn("[safe-run batch]", proc.stderr)
+
+
 if __name__ == "__main__":
     unittest.main()